@@ -52,7 +52,7 @@ from .evaluation import (
 )
 
 # LLM integrations
-from .llm import LLMProvider, OpenAIProvider, AzureOpenAIProvider
+from .llm import LLMProvider, LLMResponse, OpenAICompatibleProvider, OpenAIProvider, AzureOpenAIProvider
 
 # Configuration
 from .core.config import SprintLensConfig
@@ -246,6 +246,8 @@ __all__ = [
     
     # LLM integrations
     "LLMProvider",
+    "LLMResponse",
+    "OpenAICompatibleProvider",
     "OpenAIProvider", 
     "AzureOpenAIProvider",
     
@@ -0,0 +1,5 @@
+"""Command line interface for Sprint Lens SDK."""
+
+from .main import cli
+
+__all__ = ["cli"]
@@ -0,0 +1,122 @@
+"""
+Sprint Lens command line entry point.
+
+Connection options fall back to the usual ``SPRINTLENS_*`` environment
+variables when not given on the command line.
+"""
+
+import asyncio
+from typing import Optional, Tuple
+
+import click
+
+from ..version import __version__
+
+
+@click.group()
+@click.version_option(__version__, prog_name="sprintlens")
+def cli() -> None:
+    """Sprint Agent Lens SDK command line tools."""
+
+
+@cli.command()
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--url", default=None, help="Sprint Agent Lens backend URL.")
+@click.option("--username", default=None, help="Username for authentication.")
+@click.option("--password", default=None, help="Password for authentication.")
+@click.option("--api-key", default=None, help="API key for authentication.")
+@click.option("--workspace-id", default=None, help="Target workspace ID.")
+@click.option("--batch-size", default=100, show_default=True, type=click.IntRange(1), help="Traces per batch request.")
+@click.option("--rate", default=None, type=click.FloatRange(min=0, min_open=True), help="Maximum traces per second.")
+@click.option("--max-retries", default=3, show_default=True, type=click.IntRange(0), help="Retries per failed batch.")
+@click.option("--dry-run", is_flag=True, help="Read and count traces without sending them.")
+def replay(
+    paths: Tuple[str, ...],
+    url: Optional[str],
+    username: Optional[str],
+    password: Optional[str],
+    api_key: Optional[str],
+    workspace_id: Optional[str],
+    batch_size: int,
+    rate: Optional[float],
+    max_retries: int,
+    dry_run: bool
+) -> None:
+    """Replay exported trace files or directories into a backend."""
+    from ..core.client import SprintLensClient
+    from ..tracing.replay import TraceReplayer
+
+    def report(stats) -> None:
+        click.echo(
+            f"\rsent={stats.traces_sent} failed={stats.traces_failed} "
+            f"rate={stats.traces_per_second:.1f}/s",
+            nl=False
+        )
+
+    async def run():
+        if dry_run:
+            # Dry runs only read the files, so no backend credentials are needed
+            replayer = TraceReplayer(None, batch_size=batch_size, rate_limit=rate)
+            return await replayer.replay(paths, dry_run=True)
+
+        client = SprintLensClient(
+            url=url,
+            username=username,
+            password=password,
+            api_key=api_key,
+            workspace_id=workspace_id
+        )
+        try:
+            await client.initialize()
+            replayer = TraceReplayer(
+                client,
+                batch_size=batch_size,
+                rate_limit=rate,
+                max_retries=max_retries,
+                progress_callback=report
+            )
+            return await replayer.replay(paths)
+        finally:
+            await client.close()
+
+    stats = asyncio.run(run())
+    click.echo()
+    click.echo(
+        f"Replayed {stats.traces_sent} traces from {stats.files} files "
+        f"in {stats.duration_seconds:.1f}s ({stats.traces_failed} failed)"
+    )
+    if stats.traces_failed:
+        raise SystemExit(1)
+
+
+@cli.command("eval-worker")
+@click.argument("queue")
+@click.option("--prefix", default=None, help="Key prefix (Redis) or table prefix (SQLite) of the queue.")
+@click.option("--job-id", default=None, help="Only work on this job and stop once it finishes.")
+@click.option("--max-tasks", default=None, type=click.IntRange(1), help="Stop after this many tasks.")
+@click.option("--idle-timeout", default=None, type=click.FloatRange(min=0), help="Stop after this many idle seconds.")
+@click.option("--poll-interval", default=0.5, show_default=True, type=click.FloatRange(min=0, min_open=True), help="Seconds between polls of an empty queue.")
+def eval_worker(
+    queue: str,
+    prefix: Optional[str],
+    job_id: Optional[str],
+    max_tasks: Optional[int],
+    idle_timeout: Optional[float],
+    poll_interval: float
+) -> None:
+    """Process distributed evaluation tasks from QUEUE (sqlite:///path or redis:// URL)."""
+    from ..evaluation.distributed import EvaluationWorker, open_work_queue
+
+    worker = EvaluationWorker(open_work_queue(queue, prefix=prefix), poll_interval=poll_interval)
+    click.echo(f"Worker {worker.worker_id} polling {worker.queue.url}")
+    try:
+        processed = worker.run(job_id=job_id, max_tasks=max_tasks, idle_timeout=idle_timeout)
+    except KeyboardInterrupt:
+        processed = worker.completed_tasks
+    finally:
+        worker.queue.close()
+    click.echo(f"Processed {processed} tasks")
+
+
+if __name__ == "__main__":
+    cli()
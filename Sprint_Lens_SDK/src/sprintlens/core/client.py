@@ -22,10 +22,52 @@ from ..rest_client.endpoints import Endpoints
 from ..rest_client.client import HTTPClient
 from ..client.datasets import DatasetClient
 from .auth import AuthManager
+from ..utils.codecs import Codec, get_codec, negotiate_codec, JSON_CONTENT_TYPE
 
 logger = logging.getLogger(__name__)
 
 
+def build_trace_payload(
+    trace_data: Dict[str, Any],
+    default_project_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the backend ingestion payload for a trace.
+    
+    This is the exact body posted to the traces endpoint, and is also what
+    the file exporter writes so exported traces can be replayed unchanged.
+    
+    Args:
+        trace_data: Trace dictionary from ``Trace.to_dict()``
+        default_project_name: Project used when the trace has none
+        
+    Returns:
+        Payload dictionary with None values removed
+    """
+    # Extract agent_id from tags if available
+    trace_tags = trace_data.get("tags", {})
+    agent_id = trace_data.get("agent_id") or trace_tags.get("agent_id")
+    
+    payload = {
+        "operationName": trace_data.get("name"),
+        "startTime": trace_data.get("start_time"),
+        "endTime": trace_data.get("end_time"),
+        "inputData": trace_data.get("input"),
+        "outputData": trace_data.get("output"),
+        "tags": trace_tags,
+        "metadata": trace_data.get("metadata", {}),
+        "feedback_scores": trace_data.get("metrics", {}),
+        "projectId": trace_data.get("project_name") or default_project_name,
+        "agentId": agent_id,
+        "traceType": "function_call",
+        "status": "success",
+        "spans": trace_data.get("spans", []),
+    }
+    
+    # Remove None values
+    return {k: v for k, v in payload.items() if v is not None}
+
+
 class SprintLensClient:
     """
     Main Sprint Lens SDK client for interacting with Sprint Agent Lens backend.
@@ -53,6 +95,7 @@ class SprintLensClient:
         project_name: Optional[str] = None,
         api_key: Optional[str] = None,
         config: Optional[SprintLensConfig] = None,
+        exporter: Optional[Any] = None,
         **kwargs
     ):
         """
@@ -66,6 +109,7 @@ class SprintLensClient:
             project_name: Default project name for traces
             api_key: API key for authentication (alternative to username/password)
             config: Pre-configured SprintLensConfig instance
+            exporter: Trace exporter (e.g. FileTraceExporter) used instead of HTTP
             **kwargs: Additional configuration parameters
             
         Raises:
@@ -144,6 +188,24 @@ class SprintLensClient:
         # Initialize endpoints
         self._endpoints = Endpoints(self._config.url)
         
+        # Overhead governor for tracing (process-wide)
+        if self._config.overhead_budget:
+            from ..tracing.governor import configure_governor
+            configure_governor(budget=self._config.overhead_budget)
+        
+        # Wire codec for trace payloads
+        self._codec = self._select_codec(self._config.wire_format)
+        
+        # Local trace export (replaces sending traces over HTTP)
+        self._exporter = exporter
+        if self._exporter is None and self._config.export_path:
+            from ..tracing.exporters import FileTraceExporter
+            self._exporter = FileTraceExporter(
+                self._config.export_path,
+                export_format=self._config.export_format,
+                batch_size=self._config.batch_size
+            )
+        
         logger.info(
             "Sprint Lens client initialized",
             extra={
@@ -154,6 +216,14 @@ class SprintLensClient:
             }
         )
     
+    @staticmethod
+    def _select_codec(wire_format: str) -> Codec:
+        """Pick the trace codec for a configured wire format."""
+        if wire_format == "auto":
+            # Prefer msgpack when installed; the backend can refuse it with a 415
+            return negotiate_codec(["*/*"])
+        return get_codec(wire_format)
+    
     def _validate_config(self) -> None:
         """Validate client configuration."""
         try:
@@ -367,6 +437,10 @@ class SprintLensClient:
             await self._raw_client.aclose()
             self._raw_client = None
         
+        if self._exporter is not None:
+            # Closing waits for pending disk writes; keep that off the loop
+            await asyncio.get_running_loop().run_in_executor(None, self._exporter.close)
+        
         self._initialized = False
         
         logger.info(
@@ -419,6 +493,11 @@ class SprintLensClient:
         """Get default project name."""
         return self._config.project_name
     
+    @property
+    def exporter(self) -> Optional[Any]:
+        """Get the trace exporter, if traces are exported locally."""
+        return self._exporter
+    
     @property
     def datasets(self) -> Optional[DatasetClient]:
         """Get dataset client for managing datasets."""
@@ -476,6 +555,14 @@ class SprintLensClient:
             )
             raise
     
+    async def send_trace_batch(self, payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send already-built trace payloads to the batch ingest endpoint."""
+        if not self._http_client or not self._endpoints:
+            raise SprintLensError("Client not properly initialized")
+        
+        await self._check_and_reinitialize_client()
+        return await self._http_client.post(self._endpoints.traces_batch(), json={"traces": payloads})
+    
     def __repr__(self) -> str:
         """String representation of client."""
         return (
@@ -490,6 +577,12 @@ class SprintLensClient:
     
     async def _add_trace_to_buffer(self, trace_data: Dict[str, Any]) -> None:
         """Add trace data to buffer for sending to backend."""
+        if self._exporter is not None:
+            # Exported traces never touch the network, so no initialization needed
+            payload = build_trace_payload(trace_data, self._config.project_name)
+            await self._exporter.export_async(payload)
+            return
+        
         if not self._initialized:
             raise SprintLensError("Client not initialized")
         
@@ -606,34 +699,7 @@ class SprintLensClient:
                 "client_project_name": self._config.project_name
             })
             
-            # Extract agent_id from tags if available
-            trace_tags = trace_data.get("tags", {})
-            agent_id = trace_data.get("agent_id") or trace_tags.get("agent_id")
-            
-            # Debug logging for agent_id extraction
-            logger.info(f"Debug: trace_data.agent_id = {trace_data.get('agent_id')}")
-            logger.info(f"Debug: trace_tags = {trace_tags}")
-            logger.info(f"Debug: final agent_id = {agent_id}")
-            
-            # Prepare trace data for API
-            payload = {
-                "operationName": trace_data.get("name"),
-                "startTime": trace_data.get("start_time"),
-                "endTime": trace_data.get("end_time"),
-                "inputData": trace_data.get("input"),
-                "outputData": trace_data.get("output"),
-                "tags": trace_tags,
-                "metadata": trace_data.get("metadata", {}),
-                "feedback_scores": trace_data.get("metrics", {}),
-                "projectId": trace_data.get("project_name") or self._config.project_name,
-                "agentId": agent_id,
-                "traceType": "function_call",
-                "status": "success",
-                "spans": trace_data.get("spans", []),
-            }
-            
-            # Remove None values
-            payload = {k: v for k, v in payload.items() if v is not None}
+            payload = build_trace_payload(trace_data, self._config.project_name)
             
             # Debug logging for final payload
             logger.info(f"Sending payload structure: {list(payload.keys())}")
@@ -643,7 +709,18 @@ class SprintLensClient:
             
             # Send to backend
             traces_url = self._endpoints.traces()
-            response = await self._http_client.post(traces_url, json=payload)
+            try:
+                response = await self._http_client.post(traces_url, json=payload, codec=self._codec)
+            except SprintLensConnectionError as e:
+                if e.details.get("status_code") != 415 or self._codec.content_type == JSON_CONTENT_TYPE:
+                    raise
+                # Backend does not accept this encoding: fall back to JSON for good
+                logger.warning(
+                    "Backend rejected trace encoding, falling back to JSON",
+                    extra={"content_type": self._codec.content_type}
+                )
+                self._codec = get_codec("json")
+                response = await self._http_client.post(traces_url, json=payload, codec=self._codec)
             
             logger.info(
                 "Trace sent to backend successfully",
@@ -145,6 +145,28 @@ class SprintLensConfig(BaseSettings):
         description="Enable request/response compression"
     )
     
+    overhead_budget: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        le=1.0,
+        description="Maximum SDK time per second (e.g. 0.01 = 1% of a core); capture detail is reduced above it"
+    )
+    
+    wire_format: str = Field(
+        default="json",
+        description="Trace wire encoding: json, msgpack, or auto (msgpack with JSON fallback)"
+    )
+    
+    export_path: Optional[str] = Field(
+        default=None,
+        description="Write traces to rotating files in this directory instead of sending them"
+    )
+    
+    export_format: str = Field(
+        default="ndjson",
+        description="Trace export file format (ndjson or msgpack)"
+    )
+    
     # Security settings
     verify_ssl: bool = Field(
         default=True,
@@ -240,6 +262,16 @@ class SprintLensConfig(BaseSettings):
             raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
         return v_upper
     
+    @field_validator('wire_format')
+    @classmethod
+    def validate_wire_format(cls, v: str) -> str:
+        """Validate trace wire format."""
+        valid_formats = {'json', 'stdlib-json', 'orjson', 'msgpack', 'auto'}
+        v_lower = v.lower()
+        if v_lower not in valid_formats:
+            raise ValueError(f"Invalid wire format: {v}. Must be one of {valid_formats}")
+        return v_lower
+    
     @field_validator('ca_cert_path', 'client_cert_path', 'client_key_path')
     @classmethod
     def validate_cert_paths(cls, v: Optional[str]) -> Optional[str]:
@@ -12,8 +12,8 @@ Comprehensive evaluation capabilities for AI applications including:
 from .evaluator import Evaluator, EvaluationResult
 from .metrics import (
     # Built-in metrics
-    AccuracyMetric, PrecisionMetric, RecallMetric, F1Metric,
-    BleuMetric, RougeMetric, BertScoreMetric,
+    AccuracyMetric, PrecisionMetric, RecallMetric, F1Metric, ClassificationReportMetric,
+    BleuMetric, RougeMetric, BertScoreMetric, SemanticSimilarityMetric,
     ExactMatchMetric, LevenshteinDistanceMetric,
     SimilarityMetric, ContainmentMetric,
     
@@ -30,7 +30,27 @@ from .metrics import (
 )
 from .dataset import EvaluationDataset, DatasetItem
 from .batch import BatchEvaluator
+from .streaming import StreamingBatchResult
+from .columnar import ColumnarResults
+from .process_pool import ProcessPoolBackend, ProcessPoolStats, get_shard_trace_context
+from .distributed import (
+    EvaluationCoordinator, EvaluationWorker, WorkQueue, SQLiteWorkQueue, RedisWorkQueue, open_work_queue
+)
+from .result_store import ResultStore, ResultStoreStats, ResultStoreDiff, metric_config_hash
+from .judge_cache import JudgeCache, JudgeCacheStats, configure_judge_cache, get_judge_cache
+from .embeddings import (
+    TextEncoder, HashingEncoder, SentenceTransformerEncoder, get_default_encoder,
+    EmbeddingCache, EmbeddingCacheStats, configure_embedding_cache, get_embedding_cache,
+    embed_texts, embed_tokens
+)
+from .rate_limiter import (
+    JudgeRateLimiter, RateLimiterStats, Priority, priority_scope,
+    configure_rate_limits, get_rate_limiter
+)
 from .statistical import StatisticalAnalyzer
+from .sequential import (
+    SequentialABEvaluator, SequentialTest, SequentialResult, SequentialLook, stratified_order
+)
 
 # Advanced metrics with backend integration
 from .advanced_metrics import (
@@ -43,6 +63,8 @@ from .advanced_metrics import (
     evaluate_context_recall, evaluate_context_recall_sync, evaluate_conversational_coherence, evaluate_conversational_coherence_sync,
     evaluate_session_completeness_quality, evaluate_session_completeness_quality_sync, evaluate_user_frustration, evaluate_user_frustration_sync
 )
+from .judge_fusion import JudgeFusionClient, JudgeFusionStats, fuse_judge_metrics
+from .judge_batching import JudgeMicroBatcher, MicroBatchStats, JudgeBatchError, enable_micro_batching
 
 # Custom model integration
 from .models import (
@@ -55,8 +77,8 @@ __all__ = [
     "Evaluator", "EvaluationResult",
     
     # Built-in metrics
-    "AccuracyMetric", "PrecisionMetric", "RecallMetric", "F1Metric",
-    "BleuMetric", "RougeMetric", "BertScoreMetric",
+    "AccuracyMetric", "PrecisionMetric", "RecallMetric", "F1Metric", "ClassificationReportMetric",
+    "BleuMetric", "RougeMetric", "BertScoreMetric", "SemanticSimilarityMetric",
     "ExactMatchMetric", "LevenshteinDistanceMetric",
     "SimilarityMetric", "ContainmentMetric",
     
@@ -72,11 +94,34 @@ __all__ = [
     "BaseMetric", "MetricResult", "ScoreResult",
     
     # Dataset and batch processing
-    "EvaluationDataset", "DatasetItem", "BatchEvaluator",
+    "EvaluationDataset", "DatasetItem", "BatchEvaluator", "StreamingBatchResult",
+    "ColumnarResults", "ProcessPoolBackend", "ProcessPoolStats", "get_shard_trace_context",
+    
+    # Distributed evaluation
+    "EvaluationCoordinator", "EvaluationWorker", "WorkQueue", "SQLiteWorkQueue", "RedisWorkQueue",
+    "open_work_queue",
+    
+    # Incremental re-evaluation
+    "ResultStore", "ResultStoreStats", "ResultStoreDiff", "metric_config_hash",
+    
+    # Judge response cache
+    "JudgeCache", "JudgeCacheStats", "configure_judge_cache", "get_judge_cache",
+    
+    # Local embeddings
+    "TextEncoder", "HashingEncoder", "SentenceTransformerEncoder", "get_default_encoder",
+    "EmbeddingCache", "EmbeddingCacheStats", "configure_embedding_cache", "get_embedding_cache",
+    "embed_texts", "embed_tokens",
+    
+    # Judge rate limiting
+    "JudgeRateLimiter", "RateLimiterStats", "Priority", "priority_scope",
+    "configure_rate_limits", "get_rate_limiter",
     
     # Statistical analysis
     "StatisticalAnalyzer",
     
+    # Sequential A/B evaluation
+    "SequentialABEvaluator", "SequentialTest", "SequentialResult", "SequentialLook", "stratified_order",
+    
     # Advanced metrics with backend integration
     "AdvancedMetricsClient", "MetricType", "EvaluationModel",
     "BatchEvaluationConfig", "EnhancedHallucinationMetric",
@@ -87,6 +132,12 @@ __all__ = [
     "evaluate_context_recall", "evaluate_context_recall_sync", "evaluate_conversational_coherence", "evaluate_conversational_coherence_sync",
     "evaluate_session_completeness_quality", "evaluate_session_completeness_quality_sync", "evaluate_user_frustration", "evaluate_user_frustration_sync",
     
+    # Multi-metric judge fusion
+    "JudgeFusionClient", "JudgeFusionStats", "fuse_judge_metrics",
+    
+    # Judge micro-batching
+    "JudgeMicroBatcher", "MicroBatchStats", "JudgeBatchError", "enable_micro_batching",
+    
     # Custom model integration
     "AgentLensBaseModel", "ModelResponse", "LiteLLMChatModel", 
     "CustomOpenAICompatibleModel", "HuggingFaceModel"
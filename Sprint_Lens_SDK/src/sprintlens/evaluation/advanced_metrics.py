@@ -15,10 +15,15 @@ from enum import Enum
 import httpx
 
 from .metrics.base import BaseMetric, MetricResult
+from .judge_batching import JudgeMicroBatcher
+from .judge_cache import JudgeCache, judge_cache_key, judge_provider_id, get_judge_cache
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Bump when judge prompts or response handling change, to invalidate cached judgements
+JUDGE_PROMPT_VERSION = "1"
+
 
 class MetricType(Enum):
     """Supported advanced metric types."""
@@ -61,10 +66,35 @@ class BatchEvaluationConfig:
 class AdvancedMetricsClient:
     """Client for advanced LLM-based metrics evaluation."""
     
-    def __init__(self, base_url: Optional[str] = None):
-        """Initialize the advanced metrics client."""
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        cache: Optional[JudgeCache] = None,
+        batcher: Optional[JudgeMicroBatcher] = None,
+        batch_endpoint: Optional[str] = None,
+        max_connections: int = 20
+    ):
+        """
+        Initialize the advanced metrics client.
+        
+        The client keeps its HTTP connection pool between calls; create it
+        once and share it between metrics and evaluation runs.
+        
+        Args:
+            base_url: Backend URL (defaults to the global client's URL)
+            cache: Judge response cache (defaults to the global judge cache)
+            batcher: Micro-batcher packing concurrent custom-model judge items
+            batch_endpoint: Backend route accepting many evaluations in one
+                request, if the deployment provides one
+            max_connections: Size of the HTTP connection pool
+        """
         self.base_url = base_url
+        self.cache = cache
+        self.batcher = batcher
+        self.batch_endpoint = batch_endpoint
+        self.max_connections = max_connections
         self.session = None
+        self._session_loop = None
         self._client = None
     
     def _get_client(self):
@@ -82,6 +112,14 @@ class AdvancedMetricsClient:
     
     async def _get_session(self) -> httpx.AsyncClient:
         """Get or create HTTP session."""
+        loop = asyncio.get_running_loop()
+        if self.session is not None and self._session_loop is not loop:
+            # Connections belong to the loop that opened them (e.g. an earlier asyncio.run)
+            stale, self.session = self.session, None
+            try:
+                await stale.aclose()
+            except Exception as e:
+                logger.debug(f"Closing the session of a previous event loop failed: {e}")
         if self.session is None:
             client = self._get_client()
             headers = {
@@ -93,8 +131,13 @@ class AdvancedMetricsClient:
             self.session = httpx.AsyncClient(
                 base_url=self._get_base_url(),
                 timeout=httpx.Timeout(30.0),
-                headers=headers
+                headers=headers,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
             )
+            self._session_loop = loop
         return self.session
     
     async def evaluate_single(
@@ -130,7 +173,57 @@ class AdvancedMetricsClient:
         
         # Use standard backend evaluation
         session = await self._get_session()
+        payload = self._build_payload(
+            input_text=input_text,
+            output_text=output_text,
+            metric_type=metric_type,
+            context=context,
+            reference=reference,
+            model=model,
+            task_introduction=task_introduction,
+            evaluation_criteria=evaluation_criteria,
+            evaluation_steps=evaluation_steps
+        )
         
+        async def request() -> Dict[str, Any]:
+            response = await session.post("/api/v1/llm/evaluate", json=payload)
+            response.raise_for_status()
+            return response.json()
+        
+        try:
+            cache = self.cache or get_judge_cache()
+            if cache is None:
+                return await request()
+            
+            key = judge_cache_key(
+                model=payload.get("model"),
+                provider=f"backend:{self._get_base_url()}",
+                prompt=payload,
+                metric=metric_type.value,
+                metric_version=JUDGE_PROMPT_VERSION
+            )
+            return await cache.get_or_compute(
+                key, request,
+                should_cache=lambda value: bool(value.get("data") or value.get("success"))
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Evaluation request failed: {e}")
+            raise
+    
+    def _build_payload(
+        self,
+        input_text: str,
+        output_text: str,
+        metric_type: MetricType,
+        context: Optional[List[str]] = None,
+        reference: Optional[str] = None,
+        model: Optional[EvaluationModel] = None,
+        task_introduction: Optional[str] = None,
+        evaluation_criteria: Optional[str] = None,
+        evaluation_steps: Optional[List[str]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build the backend request payload for one evaluation."""
         payload = {
             "providerId": "span_1758599279713_5c9x432u",  # Use existing Azure OpenAI provider
             "metricType": metric_type.value,
@@ -153,13 +246,65 @@ class AdvancedMetricsClient:
             if model.temperature is not None:
                 payload["temperature"] = model.temperature
         
+        return payload
+    
+    async def evaluate_many(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate many responses, concurrently and over one connection pool.
+        
+        Uses the backend batch endpoint when one is configured and every
+        request goes to the backend; otherwise runs evaluate_single() with
+        at most ``max_concurrency`` requests in flight. A failed request
+        yields ``{"success": False, "error": ...}`` instead of raising.
+        
+        Args:
+            requests: Keyword arguments for evaluate_single(), one per item
+            max_concurrency: Maximum requests in flight
+        
+        Returns:
+            Responses in request order
+        """
+        if self.batch_endpoint and requests and not any(
+            request.get("model") and request["model"].custom_model for request in requests
+        ):
+            responses = await self._evaluate_server_batch(requests)
+            if responses is not None:
+                return responses
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run(request: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.evaluate_single(**request)
+                except Exception as e:
+                    return {"success": False, "error": str(e)}
+        
+        return await asyncio.gather(*(run(request) for request in requests))
+    
+    async def _evaluate_server_batch(self, requests: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """Submit requests to the batch endpoint; None if it is unavailable."""
+        session = await self._get_session()
+        payload = {"items": [self._build_payload(**request) for request in requests]}
         try:
-            response = await session.post("/api/v1/llm/evaluate", json=payload)
+            response = await session.post(self.batch_endpoint, json=payload)
+            if response.status_code in (404, 405, 501):
+                logger.info(f"Batch endpoint {self.batch_endpoint} unavailable; using concurrent requests")
+                self.batch_endpoint = None
+                return None
             response.raise_for_status()
-            return response.json()
+            results = response.json().get("data")
         except httpx.HTTPError as e:
-            logger.error(f"Evaluation request failed: {e}")
-            raise
+            logger.warning(f"Batch evaluation request failed, using concurrent requests: {e}")
+            return None
+        if not isinstance(results, list) or len(results) != len(requests):
+            logger.warning("Batch endpoint returned a mismatched result list; using concurrent requests")
+            return None
+        return [item if isinstance(item, dict) and "data" in item else {"data": item} for item in results]
     
     async def start_batch_evaluation(
         self,
@@ -294,38 +439,78 @@ class AdvancedMetricsClient:
                 )
             
             # Call custom model
-            start_time = time.time()
-            response = await custom_model.generate_provider_response(
-                messages=[{"role": "user", "content": prompt}],
-                temperature=model.temperature,
-                max_tokens=model.max_tokens
-            )
+            messages = [{"role": "user", "content": prompt}]
+            called = []
+            
+            async def send(prompt_text: str, max_tokens: Optional[int]):
+                return await custom_model.generate_provider_response(
+                    messages=[{"role": "user", "content": prompt_text}],
+                    temperature=model.temperature,
+                    max_tokens=max_tokens
+                )
+            
+            async def generate() -> Dict[str, Any]:
+                called.append(True)
+                if self.batcher is not None:
+                    # Items are self-contained prompts, so different metrics can share a call
+                    response = await self.batcher.submit(
+                        prompt, send,
+                        key=(id(custom_model), model.name, model.temperature),
+                        max_tokens=model.max_tokens
+                    )
+                else:
+                    response = await send(prompt, model.max_tokens)
+                return {
+                    "content": response.content,
+                    "cost": response.cost or 0.0,
+                    "latency": response.latency or 0.0
+                }
+            
+            cache = self.cache or get_judge_cache()
+            if cache is None:
+                generated = await generate()
+            else:
+                key = judge_cache_key(
+                    model=model.name,
+                    provider="custom:" + judge_provider_id(custom_model),
+                    prompt=messages,
+                    metric=metric_type.value,
+                    metric_version=JUDGE_PROMPT_VERSION,
+                    params={"temperature": model.temperature, "max_tokens": model.max_tokens}
+                )
+                generated = await cache.get_or_compute(
+                    key, generate, should_cache=lambda value: bool(value.get("content"))
+                )
+            cached = not called
+            content = generated["content"]
             
             # Parse response
             try:
                 # Try to parse as JSON first
                 import json
-                if response.content.strip().startswith('{'):
-                    parsed_response = json.loads(response.content)
+                if content.strip().startswith('{'):
+                    parsed_response = json.loads(content)
                     score = parsed_response.get("score", 0.0)
                     reasoning = parsed_response.get("reasoning", "No reasoning provided")
                     confidence = parsed_response.get("confidence", 1.0)
                 else:
                     # Fallback: extract score from text
-                    score, reasoning, confidence = self._extract_score_from_text(response.content)
+                    score, reasoning, confidence = self._extract_score_from_text(content)
             except (json.JSONDecodeError, ValueError):
                 # Fallback parsing
-                score, reasoning, confidence = self._extract_score_from_text(response.content)
+                score, reasoning, confidence = self._extract_score_from_text(content)
             
             return {
                 "data": {
                     "score": score,
                     "reasoning": reasoning,
                     "confidence": confidence,
-                    "cost": response.cost or 0.0,
-                    "latency": int((response.latency or 0.0) * 1000),  # Convert to ms
+                    # A cached judgement costs nothing this time
+                    "cost": 0.0 if cached else generated["cost"],
+                    "latency": 0 if cached else int(generated["latency"] * 1000),  # Convert to ms
                     "model": model.name,
-                    "provider": "custom"
+                    "provider": "custom",
+                    "cached": cached
                 }
             }
             
@@ -433,15 +618,51 @@ Provide your evaluation in JSON format.
             self.session = None
 
 
-class EnhancedHallucinationMetric(BaseMetric):
+class _ModelJudgedMetric(BaseMetric):
+    """Base for metrics scored by the judge described in ``self.model``."""
+    
+    model: Optional[EvaluationModel] = None
+    
+    def fingerprint_extra(self) -> Dict[str, Any]:
+        """Identify the judge model (never its API key)."""
+        if self.model is None:
+            return {"judge": None}
+        return {
+            "judge": {
+                "name": self.model.name,
+                "provider": self.model.provider,
+                "base_url": self.model.base_url,
+                "temperature": self.model.temperature,
+                "max_tokens": self.model.max_tokens,
+                "custom_model": (
+                    judge_provider_id(self.model.custom_model)
+                    if self.model.custom_model is not None else None
+                )
+            }
+        }
+
+
+class EnhancedHallucinationMetric(_ModelJudgedMetric):
     """Enhanced hallucination detection metric with backend integration."""
     
     def __init__(
         self,
         model: Optional[EvaluationModel] = None,
         custom_prompt: Optional[str] = None,
+        metrics_client: Optional[AdvancedMetricsClient] = None,
+        max_concurrency: int = 8,
         **kwargs
     ):
+        """
+        Initialize the metric.
+        
+        Args:
+            model: Judge model configuration
+            custom_prompt: Prompt overriding the default judge prompt
+            metrics_client: Client to share with other metrics (one is
+                created otherwise and kept open between evaluations)
+            max_concurrency: Maximum items judged at once
+        """
         super().__init__(
             name="enhanced_hallucination",
             description="Advanced LLM-based hallucination detection with backend integration",
@@ -449,7 +670,8 @@ class EnhancedHallucinationMetric(BaseMetric):
         )
         self.model = model
         self.custom_prompt = custom_prompt
-        self.metrics_client = AdvancedMetricsClient()
+        self.metrics_client = metrics_client or AdvancedMetricsClient()
+        self.max_concurrency = max_concurrency
     
     async def evaluate_async(
         self,
@@ -464,11 +686,10 @@ class EnhancedHallucinationMetric(BaseMetric):
         try:
             self._validate_inputs(predictions, ground_truth)
             
-            results = []
+            requests = []
             for i, (pred, gt) in enumerate(zip(predictions, ground_truth)):
                 context = contexts[i] if contexts and i < len(contexts) else None
-                
-                response = await self.metrics_client.evaluate_single(
+                requests.append(dict(
                     input_text=gt,
                     output_text=pred,
                     metric_type=MetricType.HALLUCINATION,
@@ -477,8 +698,15 @@ class EnhancedHallucinationMetric(BaseMetric):
                     custom_prompt=self.custom_prompt,
                     trace_id=kwargs.get("trace_id"),
                     experiment_id=kwargs.get("experiment_id")
-                )
-                
+                ))
+            
+            # Items are judged concurrently; responses come back in item order
+            responses = await self.metrics_client.evaluate_many(
+                requests, max_concurrency=self.max_concurrency
+            )
+            
+            results = []
+            for response in responses:
                 # Handle both backend and custom model responses
                 if response.get("data"):
                     result_data = response["data"]
@@ -509,9 +737,16 @@ class EnhancedHallucinationMetric(BaseMetric):
                         "confidence": 0.0
                     })
             
-            # Calculate aggregate metrics
-            scores = [r["score"] for r in results if "score" in r]
-            avg_score = sum(scores) / len(scores) if scores else 0.0
+            # Failed judge calls are reported, not averaged in as a score of 0
+            failed = [i for i, r in enumerate(results) if "error" in r]
+            scores = [r["score"] for r in results if "error" not in r]
+            if not scores:
+                return self._create_result(
+                    error=f"All {len(results)} judge calls failed: {results[0]['error']}",
+                    details={"individual_results": results, "failed_items": failed},
+                    start_time=start_time
+                )
+            avg_score = sum(scores) / len(scores)
             
             # Higher score means less hallucination, so invert for traditional hallucination metric
             hallucination_score = 1.0 - avg_score
@@ -521,7 +756,8 @@ class EnhancedHallucinationMetric(BaseMetric):
                 "average_score": avg_score,
                 "hallucination_score": hallucination_score,
                 "total_items": len(predictions),
-                "successful_evaluations": len([r for r in results if "error" not in r]),
+                "successful_evaluations": len(scores),
+                "failed_items": failed,
                 "total_cost": sum(r.get("cost", 0) for r in results),
                 "avg_latency": sum(r.get("latency", 0) for r in results) / len(results),
                 "model_used": self.model.name if self.model else "default"
@@ -536,8 +772,10 @@ class EnhancedHallucinationMetric(BaseMetric):
         except Exception as e:
             logger.error(f"Enhanced hallucination evaluation failed: {e}")
             return self._create_result(error=str(e), start_time=start_time)
-        finally:
-            await self.metrics_client.close()
+    
+    async def close(self):
+        """Close the metric's client and its connection pool."""
+        await self.metrics_client.close()
     
     def evaluate(
         self,
@@ -550,15 +788,27 @@ class EnhancedHallucinationMetric(BaseMetric):
         return asyncio.run(self.evaluate_async(predictions, ground_truth, contexts, **kwargs))
 
 
-class EnhancedRelevanceMetric(BaseMetric):
+class EnhancedRelevanceMetric(_ModelJudgedMetric):
     """Enhanced relevance metric with backend integration."""
     
     def __init__(
         self,
         model: Optional[EvaluationModel] = None,
         custom_prompt: Optional[str] = None,
+        metrics_client: Optional[AdvancedMetricsClient] = None,
+        max_concurrency: int = 8,
         **kwargs
     ):
+        """
+        Initialize the metric.
+        
+        Args:
+            model: Judge model configuration
+            custom_prompt: Prompt overriding the default judge prompt
+            metrics_client: Client to share with other metrics (one is
+                created otherwise and kept open between evaluations)
+            max_concurrency: Maximum items judged at once
+        """
         super().__init__(
             name="enhanced_relevance",
             description="Advanced LLM-based relevance assessment with backend integration",
@@ -566,7 +816,8 @@ class EnhancedRelevanceMetric(BaseMetric):
         )
         self.model = model
         self.custom_prompt = custom_prompt
-        self.metrics_client = AdvancedMetricsClient()
+        self.metrics_client = metrics_client or AdvancedMetricsClient()
+        self.max_concurrency = max_concurrency
     
     async def evaluate_async(
         self,
@@ -581,11 +832,10 @@ class EnhancedRelevanceMetric(BaseMetric):
         try:
             self._validate_inputs(predictions, ground_truth)
             
-            results = []
+            requests = []
             for i, (pred, gt) in enumerate(zip(predictions, ground_truth)):
                 context = contexts[i] if contexts and i < len(contexts) else None
-                
-                response = await self.metrics_client.evaluate_single(
+                requests.append(dict(
                     input_text=gt,
                     output_text=pred,
                     metric_type=MetricType.RELEVANCE,
@@ -595,8 +845,15 @@ class EnhancedRelevanceMetric(BaseMetric):
                     custom_prompt=self.custom_prompt,
                     trace_id=kwargs.get("trace_id"),
                     experiment_id=kwargs.get("experiment_id")
-                )
-                
+                ))
+            
+            # Items are judged concurrently; responses come back in item order
+            responses = await self.metrics_client.evaluate_many(
+                requests, max_concurrency=self.max_concurrency
+            )
+            
+            results = []
+            for response in responses:
                 # Handle both backend and custom model responses
                 if response.get("data"):
                     result_data = response["data"]
@@ -626,15 +883,23 @@ class EnhancedRelevanceMetric(BaseMetric):
                         "confidence": 0.0
                     })
             
-            # Calculate aggregate metrics
-            scores = [r["score"] for r in results if "score" in r]
-            avg_score = sum(scores) / len(scores) if scores else 0.0
+            # Failed judge calls are reported, not averaged in as a score of 0
+            failed = [i for i, r in enumerate(results) if "error" in r]
+            scores = [r["score"] for r in results if "error" not in r]
+            if not scores:
+                return self._create_result(
+                    error=f"All {len(results)} judge calls failed: {results[0]['error']}",
+                    details={"individual_results": results, "failed_items": failed},
+                    start_time=start_time
+                )
+            avg_score = sum(scores) / len(scores)
             
             details = {
                 "individual_results": results,
                 "average_score": avg_score,
                 "total_items": len(predictions),
-                "successful_evaluations": len([r for r in results if "error" not in r]),
+                "successful_evaluations": len(scores),
+                "failed_items": failed,
                 "total_cost": sum(r.get("cost", 0) for r in results),
                 "avg_latency": sum(r.get("latency", 0) for r in results) / len(results),
                 "model_used": self.model.name if self.model else "default"
@@ -649,8 +914,10 @@ class EnhancedRelevanceMetric(BaseMetric):
         except Exception as e:
             logger.error(f"Enhanced relevance evaluation failed: {e}")
             return self._create_result(error=str(e), start_time=start_time)
-        finally:
-            await self.metrics_client.close()
+    
+    async def close(self):
+        """Close the metric's client and its connection pool."""
+        await self.metrics_client.close()
     
     def evaluate(
         self,
@@ -690,44 +957,56 @@ class BatchEvaluator:
         experiment_id: str,
         job_id: str,
         timeout_seconds: int = 300,
-        poll_interval: int = 5
+        poll_interval: float = 5,
+        initial_poll_interval: float = 0.5,
+        backoff: float = 1.5
     ) -> Dict[str, Any]:
-        """Wait for batch evaluation to complete."""
-        start_time = time.time()
+        """
+        Wait for batch evaluation to complete.
         
-        while time.time() - start_time < timeout_seconds:
-            try:
-                response = await self.metrics_client.get_evaluation_status(experiment_id, job_id)
-                # Handle both backend and custom model responses
-                if response.get("data"):
-                    result_data = response["data"]
-                    results.append({
-                        "score": result_data.get("score", 0.0),
-                        "reasoning": result_data.get("reasoning", "No reasoning provided"),
-                        "confidence": result_data.get("confidence", 1.0),
-                        "cost": result_data.get("cost", 0.0),
-                        "latency": result_data.get("latency", 0),
-                        "model": result_data.get("model", "unknown")
-                    })
-                elif response.get("success"):
-                    job_data = response["data"]
-                    status = job_data["status"]
-                    
-                    if status == "completed":
-                        return job_data
-                    elif status == "failed":
-                        raise ValueError(f"Evaluation job failed: {job_data.get('errorMessage')}")
-                    
-                    # Still running, wait before next poll
-                    await asyncio.sleep(poll_interval)
-                else:
-                    raise ValueError(f"Status check failed: {response.get('error')}")
-                    
-            except Exception as e:
-                logger.error(f"Error checking evaluation status: {e}")
-                raise
+        Polls quickly at first, so short jobs return promptly, then backs
+        off towards ``poll_interval``. Progress reported by the backend
+        shortens the wait when the job is nearly done.
+        
+        Args:
+            experiment_id: Experiment the job belongs to
+            job_id: Evaluation job ID
+            timeout_seconds: Maximum seconds to wait
+            poll_interval: Longest delay between status checks
+            initial_poll_interval: Delay before the second status check
+            backoff: Growth factor of the delay between checks
         
-        raise TimeoutError(f"Evaluation job {job_id} did not complete within {timeout_seconds} seconds")
+        Returns:
+            Job data of the completed job
+        """
+        start_time = time.time()
+        delay = min(initial_poll_interval, poll_interval)
+        
+        while True:
+            response = await self.metrics_client.get_evaluation_status(experiment_id, job_id)
+            if not response.get("success") or not isinstance(response.get("data"), dict):
+                raise ValueError(f"Status check failed: {response.get('error')}")
+            
+            job_data = response["data"]
+            status = job_data.get("status")
+            if status == "completed":
+                return job_data
+            elif status == "failed":
+                raise ValueError(f"Evaluation job failed: {job_data.get('errorMessage')}")
+            
+            remaining = timeout_seconds - (time.time() - start_time)
+            if remaining <= 0:
+                raise TimeoutError(f"Evaluation job {job_id} did not complete within {timeout_seconds} seconds")
+            
+            # Estimate the time left from reported progress (0-100) when available
+            wait = delay
+            progress = job_data.get("progress")
+            elapsed = time.time() - start_time
+            if isinstance(progress, (int, float)) and 0 < progress < 100 and elapsed > 0:
+                wait = min(wait, max(initial_poll_interval, elapsed * (100 - progress) / progress))
+            
+            await asyncio.sleep(min(wait, remaining))
+            delay = min(delay * backoff, poll_interval)
     
     async def get_results(
         self,
@@ -791,7 +1070,7 @@ def evaluate_hallucination_sync(
     ))
 
 
-class GEvalMetric(BaseMetric):
+class GEvalMetric(_ModelJudgedMetric):
     """G-Eval metric with Chain of Thought reasoning for task-agnostic evaluation."""
     
     def __init__(
@@ -961,7 +1240,7 @@ def evaluate_g_eval_sync(
     ))
 
 
-class ModerationMetric(BaseMetric):
+class ModerationMetric(_ModelJudgedMetric):
     """Content moderation metric with backend integration."""
     
     def __init__(
@@ -1118,7 +1397,7 @@ def evaluate_moderation_sync(
     ))
 
 
-class UsefulnessMetric(BaseMetric):
+class UsefulnessMetric(_ModelJudgedMetric):
     """Usefulness assessment metric with backend integration."""
     
     def __init__(
@@ -1277,7 +1556,7 @@ def evaluate_usefulness_sync(
     ))
 
 
-class AnswerRelevanceMetric(BaseMetric):
+class AnswerRelevanceMetric(_ModelJudgedMetric):
     """
     Answer Relevance Metric for evaluating how relevant and appropriate 
     the LLM's response is to the given input question or prompt.
@@ -1468,7 +1747,7 @@ def evaluate_answer_relevance_sync(
     ))
 
 
-class ContextPrecisionMetric(BaseMetric):
+class ContextPrecisionMetric(_ModelJudgedMetric):
     """
     Context Precision Metric for evaluating the accuracy and relevance
     of an LLM's response based on provided context.
@@ -1670,7 +1949,7 @@ def evaluate_context_precision_sync(
     ))
 
 
-class ContextRecallMetric(BaseMetric):
+class ContextRecallMetric(_ModelJudgedMetric):
     """
     Context Recall Metric for evaluating how well an LLM's response
     recalls and utilizes the relevant information from provided context.
@@ -1875,7 +2154,7 @@ def evaluate_context_recall_sync(
 # ======================== Conversation Thread Metrics ========================
 
 
-class ConversationalCoherenceMetric(BaseMetric):
+class ConversationalCoherenceMetric(_ModelJudgedMetric):
     """
     Conversational Coherence Metric for evaluating the coherence and logical
     flow of a conversation thread between user and assistant.
@@ -2043,7 +2322,7 @@ class ConversationalCoherenceMetric(BaseMetric):
         return "\n".join(formatted_lines)
 
 
-class SessionCompletenessQuality(BaseMetric):
+class SessionCompletenessQuality(_ModelJudgedMetric):
     """
     Session Completeness Quality Metric for evaluating how thoroughly a conversation
     session addresses the user's intentions and requirements.
@@ -2222,7 +2501,7 @@ class SessionCompletenessQuality(BaseMetric):
         return "\n".join(formatted_lines)
 
 
-class UserFrustrationMetric(BaseMetric):
+class UserFrustrationMetric(_ModelJudgedMetric):
     """
     User Frustration Metric for detecting and evaluating user frustration levels
     during conversation sessions.
@@ -7,14 +7,21 @@ with progress tracking, parallel processing, and result aggregation.
 
 import asyncio
 import time
-from typing import List, Dict, Any, Optional, Callable, Union
+from typing import List, Dict, Any, Optional, Callable, Union, Tuple, Iterable, Iterator, AsyncIterable, AsyncIterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 import uuid
 
 from .evaluator import Evaluator, EvaluationResult
 from .dataset import EvaluationDataset, DatasetItem
-from .metrics import BaseMetric
+from .metrics import BaseMetric, MetricResult
+from .columnar import ColumnarResults
+from .streaming import MetricStreamStats, Reservoir, StreamingBatchResult
+from .checkpoint import CheckpointSession, CheckpointStore, open_checkpoint_store, item_hash
+from .result_store import ResultStore, open_result_store
+from .process_pool import ProcessPoolBackend
+from .rate_limiter import Priority, priority_scope
 from ..tracing.trace import Trace
 from ..utils.logging import get_logger
 
@@ -68,6 +75,8 @@ class BatchResult:
     start_time: str
     end_time: str
     metadata: Dict[str, Any] = field(default_factory=dict)
+    metric_scores: Dict[str, List[Optional[float]]] = field(default_factory=dict)
+    columns: Optional[ColumnarResults] = None
     
     @property
     def success_rate(self) -> float:
@@ -78,10 +87,17 @@ class BatchResult:
     
     def get_metric_scores(self, metric_name: str) -> List[Optional[float]]:
         """Get all scores for a specific metric."""
+        if self.columns is not None and metric_name in self.columns.metric_names:
+            return self.columns.scores(metric_name)
+        if metric_name in self.metric_scores:
+            return list(self.metric_scores[metric_name])
         return [result.get_metric_score(metric_name) for result in self.results]
     
     def get_metric_statistics(self, metric_name: str) -> Dict[str, float]:
         """Get statistics for a specific metric."""
+        if self.columns is not None and metric_name in self.columns.metric_names:
+            return self.columns.aggregate(metric_name)
+        
         scores = [score for score in self.get_metric_scores(metric_name) if score is not None]
         
         if not scores:
@@ -97,6 +113,64 @@ class BatchResult:
             "std": statistics.stdev(scores) if len(scores) > 1 else 0.0
         }
     
+    def iter_item_results(self) -> Iterator[EvaluationResult]:
+        """
+        Per-item EvaluationResults.
+        
+        Yields the stored results when the batch kept them, otherwise
+        rebuilds them one at a time from the result columns.
+        """
+        if self.results or self.columns is None:
+            yield from self.results
+            return
+        
+        columns = self.columns
+        metric_names = columns.metric_names
+        for row in range(len(columns)):
+            metrics = {name: columns.get_result(name, row) for name in metric_names}
+            valid_scores = [
+                result.value for result in metrics.values()
+                if result.value is not None and result.error is None
+            ]
+            yield EvaluationResult(
+                evaluation_id=str(uuid.uuid4()),
+                metrics=metrics,
+                overall_score=sum(valid_scores) / len(valid_scores) if valid_scores else None,
+                item_count=1,
+                metadata={
+                    "item_idx": row,
+                    "item_id": columns.row_ids[row] if columns.row_ids is not None else None
+                }
+            )
+    
+    def item_results(self) -> List[EvaluationResult]:
+        """Per-item EvaluationResults as a list (see iter_item_results())."""
+        return list(self.iter_item_results())
+    
+    def to_columnar(self) -> ColumnarResults:
+        """
+        Per-item scores as a ColumnarResults container.
+        
+        Returns the container built during evaluation, or converts the
+        per-item results of a BatchResult created elsewhere.
+        """
+        if self.columns is not None:
+            return self.columns
+        
+        columns = ColumnarResults()
+        if self.results:
+            metric_names = list(dict.fromkeys(name for result in self.results for name in result.metrics))
+            columns.append_batch(
+                {
+                    name: [result.metrics.get(name) or MetricResult(name=name) for result in self.results]
+                    for name in metric_names
+                },
+                [result.metadata.get("item_id") for result in self.results]
+            )
+        elif self.metric_scores:
+            columns.append_scores(self.metric_scores)
+        return columns
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
         return {
@@ -111,7 +185,7 @@ class BatchResult:
             "start_time": self.start_time,
             "end_time": self.end_time,
             "metadata": self.metadata,
-            "results": [result.to_dict() for result in self.results]
+            "results": [result.to_dict() for result in self.iter_item_results()]
         }
 
 
@@ -132,7 +206,14 @@ class BatchEvaluator:
         batch_size: int = 100,
         max_concurrent: int = 10,
         progress_callback: Optional[Callable[[BatchProgress], None]] = None,
-        trace: Optional[Trace] = None
+        trace: Optional[Trace] = None,
+        keep_item_results: bool = False,
+        keep_details: bool = True,
+        checkpoint: Union[str, Path, CheckpointStore, None] = None,
+        checkpoint_interval: float = 30.0,
+        result_store: Union[str, Path, ResultStore, None] = None,
+        model_id: str = "",
+        process_pool: Union[int, ProcessPoolBackend, None] = None
     ):
         """
         Initialize batch evaluator.
@@ -143,19 +224,44 @@ class BatchEvaluator:
             max_concurrent: Maximum concurrent evaluations
             progress_callback: Optional callback for progress updates
             trace: Optional trace for capturing batch evaluation
+            keep_item_results: Also build a per-item EvaluationResult list in
+                BatchResult.results; otherwise per-item results are kept only
+                in BatchResult.columns and rebuilt on demand by
+                BatchResult.iter_item_results()
+            keep_details: Keep MetricResult details in the result columns
+            checkpoint: Checkpoint file (``.db``/``.sqlite`` for SQLite,
+                otherwise JSON) or store used to persist dataset evaluation
+                progress
+            checkpoint_interval: Minimum seconds between checkpoint saves
+            result_store: Result store file or store; items whose scores are
+                stored for the current metric configuration are not scored
+                again, across runs and dataset versions
+            model_id: Model the evaluated predictions come from, part of the
+                result store key
+            process_pool: Number of worker processes, or a backend, used to
+                run synchronous (CPU-bound) metrics outside the GIL
         """
         self.evaluator = evaluator
         self.batch_size = batch_size
         self.max_concurrent = max_concurrent
         self.progress_callback = progress_callback
         self.trace = trace
+        self.keep_item_results = keep_item_results
+        self.keep_details = keep_details
+        self.checkpoint_store = open_checkpoint_store(checkpoint) if checkpoint is not None else None
+        self.checkpoint_interval = checkpoint_interval
+        self.result_store = open_result_store(result_store) if result_store is not None else None
+        self.model_id = model_id
+        self._owns_pool = isinstance(process_pool, int)
+        self.process_pool = ProcessPoolBackend(process_pool) if self._owns_pool else process_pool
         
         logger.debug(f"Initialized batch evaluator with batch_size={batch_size}, max_concurrent={max_concurrent}")
     
     def evaluate_dataset(
         self, 
         dataset: EvaluationDataset,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        resume: bool = False
     ) -> BatchResult:
         """
         Synchronously evaluate an entire dataset.
@@ -163,29 +269,48 @@ class BatchEvaluator:
         Args:
             dataset: Dataset to evaluate
             metadata: Optional metadata for the batch
+            resume: Reuse scores from the checkpoint (see evaluate_dataset_async)
             
         Returns:
             BatchResult with aggregated results
         """
-        return asyncio.run(self.evaluate_dataset_async(dataset, metadata))
+        return asyncio.run(self.evaluate_dataset_async(dataset, metadata, resume))
     
     async def evaluate_dataset_async(
         self, 
         dataset: EvaluationDataset,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        resume: bool = False
     ) -> BatchResult:
         """
         Asynchronously evaluate an entire dataset.
         
+        With a checkpoint configured, progress is saved every
+        ``checkpoint_interval`` seconds and when the run ends. With
+        ``resume=True``, items whose inputs were already scored successfully
+        under the same metric configuration are not evaluated again.
+        
         Args:
             dataset: Dataset to evaluate
             metadata: Optional metadata for the batch
+            resume: Reuse scores from a matching checkpoint; otherwise an
+                existing checkpoint is discarded
             
         Returns:
             BatchResult with aggregated results
         """
         batch_id = str(uuid.uuid4())
         start_time = datetime.now()
+        store_hits = self.result_store.stats.hits if self.result_store is not None else 0
+        
+        checkpoint = None
+        if self.checkpoint_store is not None:
+            checkpoint = CheckpointSession(
+                self.checkpoint_store,
+                self.evaluator.metrics.values(),
+                resume=resume,
+                interval=self.checkpoint_interval
+            )
         
         # Initialize progress tracking
         progress = BatchProgress(
@@ -215,34 +340,50 @@ class BatchEvaluator:
             results = []
             semaphore = asyncio.Semaphore(self.max_concurrent)
             
-            # Create batches
+            # Create batches, numbered like the streaming and distributed paths
             batches = []
             for i in range(0, len(dataset), self.batch_size):
                 batch_items = dataset.items[i:i + self.batch_size]
-                batches.append((i, batch_items))
+                batches.append((i // self.batch_size, batch_items))
             
             # Process batches concurrently
             tasks = [
-                self._evaluate_batch_async(batch_idx, items, semaphore, progress)
+                self._evaluate_batch_async(batch_idx, items, semaphore, progress, checkpoint=checkpoint)
                 for batch_idx, items in batches
             ]
             
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Judge calls from bulk runs yield to interactive evaluations
+            with priority_scope(Priority.BATCH, replace=False):
+                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # Collect results
+            # Collect results into per-metric columns, aggregating on the way
             successful_items = 0
             failed_items = 0
+            columns = ColumnarResults(keep_details=self.keep_details)
+            score_sums: Dict[str, float] = {}
+            score_counts: Dict[str, int] = {}
             
-            for batch_result in batch_results:
+            for (_, items), batch_result in zip(batches, batch_results):
                 if isinstance(batch_result, Exception):
                     logger.error(f"Batch failed: {str(batch_result)}")
-                    failed_items += self.batch_size  # Assume entire batch failed
-                else:
-                    results.extend(batch_result)
-                    successful_items += len(batch_result)
+                    failed_items += len(items)
+                    continue
+                
+                batch_columns, item_results = batch_result
+                results.extend(item_results)
+                successful_items += len(items)
+                columns.append_batch(batch_columns, [item.id for item in items])
+                
+                for metric_name, column in batch_columns.items():
+                    for metric_result in column:
+                        if metric_result.value is not None and metric_result.error is None:
+                            score_sums[metric_name] = score_sums.get(metric_name, 0.0) + metric_result.value
+                            score_counts[metric_name] = score_counts.get(metric_name, 0) + 1
             
             # Calculate aggregated metrics
-            aggregated_metrics = self._aggregate_metrics(results)
+            aggregated_metrics = self._aggregate_scores(
+                columns.metric_names, score_sums, score_counts, successful_items
+            )
             
             end_time = datetime.now()
             duration_ms = (end_time - start_time).total_seconds() * 1000
@@ -259,8 +400,19 @@ class BatchEvaluator:
                 duration_ms=duration_ms,
                 start_time=start_time.isoformat(),
                 end_time=end_time.isoformat(),
-                metadata=metadata or {}
+                metadata=metadata or {},
+                columns=columns
             )
+            if checkpoint is not None:
+                batch_result.metadata = {
+                    **batch_result.metadata,
+                    "resumed_items": checkpoint.resumed_items
+                }
+            if self.result_store is not None:
+                batch_result.metadata = {
+                    **batch_result.metadata,
+                    "cached_scores": self.result_store.stats.hits - store_hits
+                }
             
             # Set trace output
             if batch_trace:
@@ -283,6 +435,8 @@ class BatchEvaluator:
             raise
             
         finally:
+            if checkpoint is not None:
+                checkpoint.save()
             if batch_trace:
                 batch_trace.__exit__(None, None, None)
     
@@ -291,71 +445,399 @@ class BatchEvaluator:
         batch_idx: int,
         items: List[DatasetItem],
         semaphore: asyncio.Semaphore,
-        progress: BatchProgress
-    ) -> List[EvaluationResult]:
-        """Evaluate a single batch of items."""
+        progress: BatchProgress,
+        keep_item_results: Optional[bool] = None,
+        checkpoint: Optional[CheckpointSession] = None
+    ) -> Tuple[Dict[str, List[MetricResult]], List[EvaluationResult]]:
+        """
+        Evaluate a single batch of items.
+        
+        Every metric scores the whole batch in one call. Returns the
+        per-metric results and, if enabled, per-item EvaluationResults.
+        """
         async with semaphore:
             try:
-                # Extract predictions and ground truths
-                predictions = [item.prediction for item in items]
-                ground_truths = [item.ground_truth for item in items]
-                contexts = [item.context for item in items]
-                
-                # Create metadata for batch
-                batch_metadata = {
-                    "batch_idx": batch_idx,
-                    "batch_size": len(items),
-                    "item_ids": [item.id for item in items]
-                }
+                if checkpoint is None:
+                    columns = await self._score_items(items, batch_idx)
+                else:
+                    columns = await self._evaluate_with_checkpoint(batch_idx, items, checkpoint)
                 
-                # Evaluate batch
-                results = []
+                item_results = []
+                if self.keep_item_results if keep_item_results is None else keep_item_results:
+                    item_results = self._build_item_results(batch_idx, items, columns)
                 
-                # For now, evaluate items individually to get per-item results
-                for i, (pred, gt, context) in enumerate(zip(predictions, ground_truths, contexts)):
-                    try:
-                        item_metadata = {
-                            **batch_metadata,
-                            "item_idx": i,
-                            "item_id": items[i].id,
-                            "context": context
-                        }
-                        
-                        result = await self.evaluator.evaluate_single_async(
-                            pred, gt, metadata=item_metadata
-                        )
-                        results.append(result)
-                        
-                        # Update progress
-                        progress.update(completed=1)
-                        
-                    except Exception as e:
-                        logger.error(f"Item evaluation failed: {str(e)}")
-                        progress.update(failed=1)
-                        
-                        # Create error result
-                        error_result = EvaluationResult(
-                            evaluation_id=str(uuid.uuid4()),
-                            dataset_name=f"batch_{batch_idx}",
-                            item_count=1,
-                            metadata={
-                                **item_metadata,
-                                "error": str(e)
-                            }
-                        )
-                        results.append(error_result)
+                progress.update(completed=len(items))
                 
                 # Call progress callback if provided
                 if self.progress_callback:
                     self.progress_callback(progress)
                 
-                return results
+                return columns, item_results
                 
             except Exception as e:
                 logger.error(f"Batch {batch_idx} failed: {str(e)}")
                 progress.update(failed=len(items))
                 raise
     
+    def evaluate_stream(
+        self,
+        items: Iterable[Any],
+        dataset_name: str = "stream",
+        metadata: Optional[Dict[str, Any]] = None,
+        quantiles: Sequence[float] = (0.5, 0.9, 0.99),
+        reservoir_size: int = 1000,
+        seed: Optional[int] = None
+    ) -> StreamingBatchResult:
+        """
+        Synchronously evaluate a stream of items in constant memory.
+        
+        See evaluate_stream_async() for details.
+        """
+        return asyncio.run(self.evaluate_stream_async(
+            items, dataset_name, metadata, quantiles, reservoir_size, seed
+        ))
+    
+    async def evaluate_stream_async(
+        self,
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        dataset_name: str = "stream",
+        metadata: Optional[Dict[str, Any]] = None,
+        quantiles: Sequence[float] = (0.5, 0.9, 0.99),
+        reservoir_size: int = 1000,
+        seed: Optional[int] = None
+    ) -> StreamingBatchResult:
+        """
+        Evaluate an (async) iterator of items in constant memory.
+        
+        Items are pulled one batch at a time with at most ``max_concurrent``
+        batches in flight. Scores are folded into online aggregates (mean,
+        variance, min/max and P-square quantiles) and a bounded reservoir
+        sample, so memory does not grow with the number of items.
+        
+        Args:
+            items: DatasetItems, dicts with prediction/ground_truth keys, or
+                (prediction, ground_truth[, context]) tuples
+            dataset_name: Name reported in the result
+            metadata: Optional metadata for the run
+            quantiles: Quantiles to estimate per metric
+            reservoir_size: Number of item samples kept for inspection
+            seed: Random seed for the reservoir sample
+            
+        Returns:
+            StreamingBatchResult with aggregates and sampled item scores
+        """
+        batch_id = str(uuid.uuid4())
+        start_time = datetime.now()
+        progress = BatchProgress(batch_id=batch_id, total_items=0)
+        metric_stats = {
+            name: MetricStreamStats(name, quantiles)
+            for name in self.evaluator.get_metric_names()
+        }
+        reservoir = Reservoir(reservoir_size, seed=seed)
+        counts = {"successful": 0, "failed": 0}
+        # Never contended: in-flight batches are bounded below instead
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        def absorb(task: "asyncio.Task[Any]", start_index: int, batch: List[DatasetItem]) -> None:
+            if task.exception() is not None:
+                logger.error(f"Batch failed: {str(task.exception())}")
+                counts["failed"] += len(batch)
+                return
+            
+            columns, _ = task.result()
+            counts["successful"] += len(batch)
+            for name, column in columns.items():
+                if name not in metric_stats:
+                    metric_stats[name] = MetricStreamStats(name, quantiles)
+                stats = metric_stats[name]
+                for metric_result in column:
+                    stats.add(metric_result.value, metric_result.error)
+            for i, item in enumerate(batch):
+                reservoir.add({
+                    "index": start_index + i,
+                    "item_id": item.id,
+                    "scores": {name: column[i].value for name, column in columns.items()}
+                })
+        
+        pending: Dict["asyncio.Task[Any]", Tuple[int, List[DatasetItem]]] = {}
+        
+        async def wait_for_slot(limit: int) -> None:
+            while len(pending) > limit:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    absorb(task, *pending.pop(task))
+        
+        start_index = 0
+        batch_idx = 0
+        with priority_scope(Priority.BATCH, replace=False):
+            async for batch in self._iter_batches(items):
+                await wait_for_slot(self.max_concurrent - 1)
+                progress.total_items += len(batch)
+                task = asyncio.ensure_future(self._evaluate_batch_async(
+                    batch_idx, batch, semaphore, progress, keep_item_results=False
+                ))
+                pending[task] = (start_index, batch)
+                start_index += len(batch)
+                batch_idx += 1
+            await wait_for_slot(0)
+        
+        aggregated_metrics = self._aggregate_scores(
+            metric_stats,
+            {name: stats.stats.mean * stats.stats.count for name, stats in metric_stats.items()},
+            {name: stats.stats.count for name, stats in metric_stats.items()},
+            counts["successful"]
+        )
+        
+        end_time = datetime.now()
+        result = StreamingBatchResult(
+            batch_id=batch_id,
+            dataset_name=dataset_name,
+            total_items=start_index,
+            successful_items=counts["successful"],
+            failed_items=counts["failed"],
+            metric_stats=metric_stats,
+            samples=sorted(reservoir.samples, key=lambda sample: sample["index"]),
+            aggregated_metrics=aggregated_metrics,
+            duration_ms=(end_time - start_time).total_seconds() * 1000,
+            start_time=start_time.isoformat(),
+            end_time=end_time.isoformat(),
+            metadata=metadata or {}
+        )
+        
+        logger.info(
+            f"Streaming evaluation completed: {batch_id}, items: {start_index}, "
+            f"success_rate: {result.success_rate:.1f}%"
+        )
+        return result
+    
+    async def _iter_batches(
+        self,
+        items: Union[Iterable[Any], AsyncIterable[Any]]
+    ) -> AsyncIterator[List[DatasetItem]]:
+        """Group a sync or async iterable into batches of DatasetItems."""
+        batch: List[DatasetItem] = []
+        
+        if hasattr(items, "__aiter__"):
+            async for item in items:
+                batch.append(self._to_dataset_item(item))
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        else:
+            for item in items:
+                batch.append(self._to_dataset_item(item))
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        
+        if batch:
+            yield batch
+    
+    @staticmethod
+    def _to_dataset_item(item: Any) -> DatasetItem:
+        """Normalize a streamed item."""
+        if isinstance(item, DatasetItem):
+            return item
+        if isinstance(item, dict):
+            return DatasetItem.from_dict(item)
+        if isinstance(item, (tuple, list)) and 2 <= len(item) <= 3:
+            return DatasetItem(
+                prediction=item[0],
+                ground_truth=item[1],
+                context=item[2] if len(item) == 3 else None
+            )
+        raise ValueError(f"Unsupported stream item: {type(item).__name__}")
+    
+    async def _evaluate_with_checkpoint(
+        self,
+        batch_idx: int,
+        items: List[DatasetItem],
+        checkpoint: CheckpointSession
+    ) -> Dict[str, List[MetricResult]]:
+        """Evaluate only the items of a batch missing from the checkpoint."""
+        keys = [item_hash(item.prediction, item.ground_truth, item.context) for item in items]
+        stored = [checkpoint.lookup(key) for key in keys]
+        todo = [i for i, results in enumerate(stored) if results is None]
+        
+        fresh: Dict[str, List[MetricResult]] = {}
+        if todo:
+            fresh = await self._score_items([items[i] for i in todo], batch_idx)
+            checkpoint.record(batch_idx, [keys[i] for i in todo], fresh)
+        
+        position = {i: j for j, i in enumerate(todo)}
+        return {
+            name: [
+                results[name] if results is not None else fresh[name][position[i]]
+                for i, results in enumerate(stored)
+            ]
+            for name in self.evaluator.get_metric_names()
+        }
+    
+    async def _run_metrics(
+        self,
+        predictions: List[Any],
+        ground_truths: List[Any],
+        metric_names: Optional[List[str]] = None,
+        batch_idx: Optional[int] = None
+    ) -> Dict[str, List[MetricResult]]:
+        """Run metrics on a batch, sending pooled metrics to the process pool."""
+        names = metric_names if metric_names is not None else self.evaluator.get_metric_names()
+        if self.process_pool is None:
+            return await self.evaluator.evaluate_batch_async(predictions, ground_truths, metric_names)
+        
+        pooled = self.process_pool.select_metrics(self.evaluator.metrics[name] for name in names)
+        pooled_names = {metric.name for metric in pooled}
+        local_names = [name for name in names if name not in pooled_names]
+        
+        timeouts = [self.evaluator.get_timeout(name) for name in pooled_names]
+        timeout = None if not timeouts or None in timeouts else max(timeouts)
+        
+        async def run_local() -> Dict[str, List[MetricResult]]:
+            if not local_names:
+                return {}
+            return await self.evaluator.evaluate_batch_async(predictions, ground_truths, local_names)
+        
+        async def run_pooled() -> Dict[str, List[MetricResult]]:
+            if not pooled:
+                return {}
+            return await self.process_pool.evaluate_batch_async(
+                pooled, predictions, ground_truths, timeout=timeout, batch_idx=batch_idx
+            )
+        
+        local, remote = await asyncio.gather(run_local(), run_pooled())
+        return {name: local[name] if name in local else remote[name] for name in names}
+    
+    def close(self) -> None:
+        """Shut down the process pool if this evaluator created it."""
+        if self._owns_pool and self.process_pool is not None:
+            self.process_pool.close()
+    
+    async def score_items(
+        self,
+        items: List[DatasetItem],
+        batch_idx: Optional[int] = None
+    ) -> Optional[Dict[str, List[MetricResult]]]:
+        """
+        Score items with every metric as one batch.
+        
+        Scores are reused from the result store when one is configured. As
+        in dataset evaluation, a failing batch is logged rather than raised.
+        
+        Args:
+            items: Items to score
+            batch_idx: Index of the batch, used in logs and trace spans
+        
+        Returns:
+            Per-metric results aligned with items, or None if the batch failed
+        """
+        try:
+            return await self._score_items(items, batch_idx)
+        except Exception as e:
+            logger.error(f"Batch {batch_idx} failed: {str(e)}")
+            return None
+    
+    async def _score_items(
+        self,
+        items: List[DatasetItem],
+        batch_idx: Optional[int] = None
+    ) -> Dict[str, List[MetricResult]]:
+        """Score items with every metric, reusing scores from the result store."""
+        store = self.result_store
+        if store is None:
+            return await self._run_metrics(
+                [item.prediction for item in items],
+                [item.ground_truth for item in items],
+                batch_idx=batch_idx
+            )
+        
+        keys = [item_hash(item.prediction, item.ground_truth, item.context) for item in items]
+        columns: Dict[str, List[Optional[MetricResult]]] = {}
+        # Metrics missing the same items are scored together
+        groups: Dict[Tuple[int, ...], List[str]] = {}
+        for name, metric in self.evaluator.metrics.items():
+            cached = store.lookup(keys, metric, self.model_id)
+            columns[name] = [
+                MetricResult(name=name, value=cached[key], details={"cached": True})
+                if key in cached else None
+                for key in keys
+            ]
+            todo = tuple(i for i, result in enumerate(columns[name]) if result is None)
+            if todo:
+                groups.setdefault(todo, []).append(name)
+        
+        async def score(todo: Tuple[int, ...], names: List[str]) -> None:
+            fresh = await self._run_metrics(
+                [items[i].prediction for i in todo],
+                [items[i].ground_truth for i in todo],
+                metric_names=names,
+                batch_idx=batch_idx
+            )
+            for name, results in fresh.items():
+                for i, result in zip(todo, results):
+                    columns[name][i] = result
+                store.store([keys[i] for i in todo], self.evaluator.metrics[name], results, self.model_id)
+        
+        await asyncio.gather(*(score(todo, names) for todo, names in groups.items()))
+        return columns
+    
+    def _build_item_results(
+        self,
+        batch_idx: int,
+        items: List[DatasetItem],
+        columns: Dict[str, List[MetricResult]]
+    ) -> List[EvaluationResult]:
+        """Build per-item EvaluationResults from per-metric batch results."""
+        item_ids = [item.id for item in items]
+        results = []
+        
+        for i, item in enumerate(items):
+            metrics = {name: column[i] for name, column in columns.items()}
+            valid_scores = [
+                result.value for result in metrics.values()
+                if result.value is not None and result.error is None
+            ]
+            results.append(EvaluationResult(
+                evaluation_id=str(uuid.uuid4()),
+                metrics=metrics,
+                overall_score=sum(valid_scores) / len(valid_scores) if valid_scores else None,
+                item_count=1,
+                metadata={
+                    "batch_idx": batch_idx,
+                    "batch_size": len(items),
+                    "item_ids": item_ids,
+                    "item_idx": i,
+                    "item_id": item.id,
+                    "context": item.context
+                }
+            ))
+        
+        return results
+    
+    def _aggregate_scores(
+        self,
+        metric_names: Iterable[str],
+        score_sums: Dict[str, float],
+        score_counts: Dict[str, int],
+        item_count: int
+    ) -> Dict[str, float]:
+        """Aggregate metrics from running per-metric sums."""
+        if item_count == 0:
+            return {}
+        
+        aggregated = {
+            metric_name: score_sums[metric_name] / score_counts[metric_name]
+            if score_counts.get(metric_name) else 0.0
+            for metric_name in metric_names
+        }
+        
+        # Calculate overall score
+        if aggregated:
+            aggregated["overall_score"] = sum(aggregated.values()) / len(aggregated)
+        else:
+            aggregated["overall_score"] = 0.0
+        
+        return aggregated
+    
     def _aggregate_metrics(self, results: List[EvaluationResult]) -> Dict[str, float]:
         """Aggregate metrics across all results."""
         if not results:
@@ -394,7 +876,8 @@ class BatchEvaluator:
         ground_truths: List[Any],
         contexts: Optional[List[str]] = None,
         dataset_name: str = "batch_evaluation",
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        resume: bool = False
     ) -> BatchResult:
         """
         Evaluate lists of predictions and ground truths.
@@ -405,6 +888,7 @@ class BatchEvaluator:
             contexts: Optional list of contexts
             dataset_name: Name for the temporary dataset
             metadata: Optional metadata
+            resume: Reuse scores from the checkpoint
             
         Returns:
             BatchResult with evaluation results
@@ -418,7 +902,7 @@ class BatchEvaluator:
             description="Temporary dataset for batch evaluation"
         )
         
-        return self.evaluate_dataset(dataset, metadata)
+        return self.evaluate_dataset(dataset, metadata, resume)
     
     async def evaluate_predictions_async(
         self,
@@ -426,7 +910,8 @@ class BatchEvaluator:
         ground_truths: List[Any],
         contexts: Optional[List[str]] = None,
         dataset_name: str = "batch_evaluation",
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        resume: bool = False
     ) -> BatchResult:
         """
         Asynchronously evaluate lists of predictions and ground truths.
@@ -437,6 +922,7 @@ class BatchEvaluator:
             contexts: Optional list of contexts
             dataset_name: Name for the temporary dataset
             metadata: Optional metadata
+            resume: Reuse scores from the checkpoint
             
         Returns:
             BatchResult with evaluation results
@@ -450,4 +936,4 @@ class BatchEvaluator:
             description="Temporary dataset for batch evaluation"
         )
         
-        return await self.evaluate_dataset_async(dataset, metadata)
\ No newline at end of file
+        return await self.evaluate_dataset_async(dataset, metadata, resume)
\ No newline at end of file
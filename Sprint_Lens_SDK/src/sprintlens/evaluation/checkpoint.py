@@ -0,0 +1,427 @@
+"""
+Checkpointing for long-running batch evaluations.
+
+Completed batches, per-item scores and per-metric partial aggregates are
+periodically persisted to a local JSON file or SQLite database, so a run that
+crashes or is preempted can be resumed without re-running (and re-paying
+for) metrics on items that were already scored.
+
+Items are matched on resume by a content hash of their inputs; a checkpoint
+is only reused when the metric configuration fingerprint matches.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union, Iterable
+
+from .metrics import BaseMetric, MetricResult
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+# item hash -> metric name -> [value, error]
+ItemScores = Dict[str, Dict[str, List[Any]]]
+
+
+def _stable_default(obj: Any) -> Any:
+    """JSON fallback that does not leak memory addresses into hashes."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    if isinstance(obj, (bytes, bytearray)):
+        return hashlib.sha256(bytes(obj)).hexdigest()
+    if hasattr(obj, "__dict__") or callable(obj):
+        return f"{type(obj).__module__}.{type(obj).__qualname__}"
+    return str(obj)
+
+
+def _digest(obj: Any) -> str:
+    """SHA-256 of a canonical JSON encoding."""
+    encoded = json.dumps(obj, sort_keys=True, default=_stable_default, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _metric_identity(metric: BaseMetric) -> Dict[str, Any]:
+    """Metric configuration plus the judge identity kept outside of it."""
+    config = metric.get_config()
+    extra = metric.fingerprint_extra()
+    # Plain metrics keep the fingerprints they had before the hook existed
+    return {**config, "fingerprint_extra": extra} if extra else config
+
+
+def metrics_fingerprint(metrics: Iterable[BaseMetric]) -> str:
+    """
+    Fingerprint of a metric configuration.
+
+    Args:
+        metrics: Metrics of the evaluator
+
+    Returns:
+        Hex digest that changes when metrics, their configuration or their
+        judge model change
+    """
+    return _digest(sorted(
+        (_metric_identity(metric) for metric in metrics),
+        key=lambda config: config["name"]
+    ))
+
+
+def item_hash(prediction: Any, ground_truth: Any, context: Any = None) -> str:
+    """
+    Content hash of one evaluation item's inputs.
+
+    Args:
+        prediction: Predicted value
+        ground_truth: Ground truth value
+        context: Optional context
+
+    Returns:
+        Hex digest
+    """
+    return _digest([prediction, ground_truth, context])
+
+
+@dataclass
+class CheckpointState:
+    """Persisted progress of an evaluation run."""
+
+    fingerprint: str
+    completed_batches: List[int] = field(default_factory=list)
+    item_scores: ItemScores = field(default_factory=dict)
+    aggregates: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    updated_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "version": CHECKPOINT_VERSION,
+            "fingerprint": self.fingerprint,
+            "completed_batches": self.completed_batches,
+            "item_scores": self.item_scores,
+            "aggregates": self.aggregates,
+            "updated_at": self.updated_at
+        }
+
+
+class CheckpointStore(ABC):
+    """Storage backend for evaluation checkpoints."""
+
+    @abstractmethod
+    def load(self) -> Optional[CheckpointState]:
+        """Load the stored checkpoint, if any."""
+        pass
+
+    @abstractmethod
+    def save(self, state: CheckpointState, new_items: ItemScores) -> None:
+        """
+        Atomically persist a checkpoint.
+
+        Args:
+            state: Full checkpoint state
+            new_items: Item scores added since the last save
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete the stored checkpoint."""
+        pass
+
+
+class JSONCheckpointStore(CheckpointStore):
+    """
+    Checkpoint stored as a JSON snapshot plus an append-only journal.
+
+    Saves append only the newly scored items to ``<path>.journal``; the
+    snapshot is rewritten (through a temporary file and an atomic rename)
+    once the journal outgrows it, so the total bytes written stay linear
+    in the number of items. A torn final journal line is ignored on load.
+    Prefer SQLiteCheckpointStore for runs with millions of items.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        # None until a snapshot is loaded or written; the first save writes one
+        self._snapshot_items: Optional[int] = None
+        self._journal_items = 0
+        self._journaled_batches = 0
+
+    def load(self) -> Optional[CheckpointState]:
+        if not self.path.exists():
+            return None
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        state = CheckpointState(
+            fingerprint=data["fingerprint"],
+            completed_batches=data.get("completed_batches", []),
+            item_scores=data.get("item_scores", {}),
+            aggregates=data.get("aggregates", {}),
+            updated_at=data.get("updated_at")
+        )
+        self._snapshot_items = len(state.item_scores)
+        self._journal_items = 0
+
+        if self.journal_path.exists():
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        logger.warning("Ignoring incomplete checkpoint journal entry")
+                        break
+                    state.item_scores.update(entry["item_scores"])
+                    state.completed_batches.extend(entry["completed_batches"])
+                    state.aggregates = entry["aggregates"]
+                    state.updated_at = entry["updated_at"]
+                    self._journal_items += len(entry["item_scores"])
+        self._journaled_batches = len(state.completed_batches)
+        return state
+
+    def save(self, state: CheckpointState, new_items: ItemScores) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._snapshot_items is None or self._journal_items + len(new_items) > max(self._snapshot_items, 1000):
+            self._write_snapshot(state)
+            return
+        if not new_items and len(state.completed_batches) == self._journaled_batches:
+            return
+
+        entry = {
+            "item_scores": new_items,
+            "completed_batches": state.completed_batches[self._journaled_batches:],
+            "aggregates": state.aggregates,
+            "updated_at": state.updated_at
+        }
+        try:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            # A partly written entry would hide later ones; snapshot next time
+            self._snapshot_items = None
+            raise
+        self._journal_items += len(new_items)
+        self._journaled_batches = len(state.completed_batches)
+
+    def clear(self) -> None:
+        for path in (self.journal_path, self.path):
+            if path.exists():
+                path.unlink()
+        self._snapshot_items = None
+
+    def _write_snapshot(self, state: CheckpointState) -> None:
+        """Rewrite the full snapshot and start an empty journal."""
+        fd, tmp_path = tempfile.mkstemp(prefix=self.path.name, suffix=".tmp", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state.to_dict(), f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        # The snapshot already holds everything the journal did
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+        self._snapshot_items = len(state.item_scores)
+        self._journal_items = 0
+        self._journaled_batches = len(state.completed_batches)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Checkpoint stored in a SQLite database.
+
+    Saves are incremental (only newly scored items are written) and each
+    save is a single transaction.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS items (item_hash TEXT PRIMARY KEY, scores TEXT)")
+
+    def load(self) -> Optional[CheckpointState]:
+        meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        if "fingerprint" not in meta:
+            return None
+        return CheckpointState(
+            fingerprint=meta["fingerprint"],
+            completed_batches=json.loads(meta.get("completed_batches", "[]")),
+            item_scores={
+                key: json.loads(scores)
+                for key, scores in self._conn.execute("SELECT item_hash, scores FROM items")
+            },
+            aggregates=json.loads(meta.get("aggregates", "{}")),
+            updated_at=meta.get("updated_at")
+        )
+
+    def save(self, state: CheckpointState, new_items: ItemScores) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO items (item_hash, scores) VALUES (?, ?)",
+                [(key, json.dumps(scores)) for key, scores in new_items.items()]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("version", str(CHECKPOINT_VERSION)),
+                    ("fingerprint", state.fingerprint),
+                    ("completed_batches", json.dumps(state.completed_batches)),
+                    ("aggregates", json.dumps(state.aggregates)),
+                    ("updated_at", state.updated_at or ""),
+                ]
+            )
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM items")
+            self._conn.execute("DELETE FROM meta")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+def open_checkpoint_store(path: Union[str, Path, CheckpointStore]) -> CheckpointStore:
+    """
+    Open a checkpoint store, choosing the backend from the file suffix.
+
+    ``.db``, ``.sqlite`` and ``.sqlite3`` files use SQLite; anything else is
+    a JSON file.
+
+    Args:
+        path: Checkpoint path, or an existing store
+
+    Returns:
+        CheckpointStore instance
+    """
+    if isinstance(path, CheckpointStore):
+        return path
+    if Path(path).suffix.lower() in (".db", ".sqlite", ".sqlite3"):
+        return SQLiteCheckpointStore(path)
+    return JSONCheckpointStore(path)
+
+
+class CheckpointSession:
+    """
+    Checkpoint bookkeeping for one evaluation run.
+
+    Used by BatchEvaluator: looks up already scored items and records newly
+    scored batches, saving at most every ``interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore,
+        metrics: Iterable[BaseMetric],
+        resume: bool = False,
+        interval: float = 30.0
+    ):
+        """
+        Initialize the session.
+
+        Args:
+            store: Checkpoint storage backend
+            metrics: Metrics of the evaluator (used for the fingerprint)
+            resume: Reuse scores from a matching existing checkpoint;
+                otherwise any existing checkpoint is discarded
+            interval: Minimum seconds between saves
+        """
+        self.store = store
+        self.interval = interval
+        fingerprint = metrics_fingerprint(metrics)
+
+        state = store.load() if resume else None
+        if state is not None and state.fingerprint != fingerprint:
+            logger.warning("Checkpoint metric configuration differs; starting from scratch")
+            state = None
+        if state is None:
+            store.clear()
+            state = CheckpointState(fingerprint=fingerprint)
+        elif state.item_scores:
+            logger.info(f"Resuming from checkpoint with {len(state.item_scores)} scored items")
+
+        self.state = state
+        self.resumed_items = 0
+        self._completed_batches = set(state.completed_batches)
+        self._pending: ItemScores = {}
+        self._last_save = time.monotonic()
+
+    def lookup(self, key: str) -> Optional[Dict[str, MetricResult]]:
+        """
+        Stored results for an item, if every metric scored it successfully.
+
+        Args:
+            key: Item content hash
+
+        Returns:
+            Mapping of metric name to MetricResult, or None
+        """
+        scores = self.state.item_scores.get(key)
+        if scores is None or any(error is not None for _, error in scores.values()):
+            return None
+        self.resumed_items += 1
+        return {
+            name: MetricResult(name=name, value=value, details={"resumed": True})
+            for name, (value, _) in scores.items()
+        }
+
+    def record(self, batch_idx: int, keys: List[str], columns: Dict[str, List[MetricResult]]) -> None:
+        """
+        Record the results of a completed batch.
+
+        Args:
+            batch_idx: Index of the batch
+            keys: Content hashes of the batch items that were evaluated
+            columns: Per-metric results, aligned with keys
+        """
+        for i, key in enumerate(keys):
+            scores = {name: [column[i].value, column[i].error] for name, column in columns.items()}
+            # A re-scored item (e.g. a retried failure) replaces its old contribution
+            self._add_to_aggregates(self.state.item_scores.get(key, {}), -1)
+            self._add_to_aggregates(scores, 1)
+            self.state.item_scores[key] = scores
+            self._pending[key] = scores
+        if batch_idx not in self._completed_batches:
+            self._completed_batches.add(batch_idx)
+            self.state.completed_batches.append(batch_idx)
+
+        if time.monotonic() - self._last_save >= self.interval:
+            self.save()
+
+    def _add_to_aggregates(self, scores: Dict[str, List[Any]], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) an item's successful scores."""
+        for name, (value, error) in scores.items():
+            aggregate = self.state.aggregates.setdefault(name, {"sum": 0.0, "count": 0})
+            if value is not None and error is None:
+                aggregate["sum"] += sign * value
+                aggregate["count"] += sign
+
+    def save(self) -> None:
+        """Persist the checkpoint now."""
+        self.state.updated_at = datetime.now().isoformat()
+        try:
+            self.store.save(self.state, self._pending)
+            self._pending = {}
+        except Exception as e:
+            # A failed checkpoint must not fail the evaluation itself
+            logger.error(f"Failed to save evaluation checkpoint: {str(e)}")
+        self._last_save = time.monotonic()
@@ -0,0 +1,462 @@
+"""
+Columnar storage of per-item evaluation results.
+
+ColumnarResults keeps one contiguous float64 array per metric (NaN marks a
+missing score) instead of a MetricResult object per item and metric. Errors
+and details are stored sparsely, only for the rows that have them, and row
+ids are an optional column. For 1M items x 8 metrics the scores take 64 MB.
+
+Score arrays are handed to numpy, pyarrow and pandas without copying, and
+aggregates (count, mean, std, min, max, quantiles) run directly on them.
+
+Example:
+    >>> result = batch_evaluator.evaluate_dataset(dataset)
+    >>> result.columns.aggregate("accuracy")
+    >>> result.columns.write_parquet("run.parquet")
+    >>> ColumnarResults.read_parquet("run.parquet").to_pandas()
+"""
+
+import json
+import math
+from array import array
+from typing import List, Dict, Any, Optional, Sequence
+
+from .metrics import MetricResult
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pq = None
+    PYARROW_AVAILABLE = False
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    pd = None
+    PANDAS_AVAILABLE = False
+
+ROW_ID_COLUMN = "row_id"
+ERROR_SUFFIX = "__error"
+DETAILS_SUFFIX = "__details"
+# Key of the Arrow schema metadata describing the layout
+SCHEMA_METADATA_KEY = b"sprintlens.columnar"
+COLUMNAR_VERSION = 1
+
+_NAN = float("nan")
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Arrow/Parquet conversion. Install with: pip install pyarrow")
+
+
+def _validity_bitmap(values: array) -> Optional[bytes]:
+    """Arrow validity bitmap marking non-NaN values, or None if all are valid."""
+    if NUMPY_AVAILABLE:
+        valid = ~np.isnan(np.frombuffer(values, dtype=np.float64))
+        if valid.all():
+            return None
+        return np.packbits(valid, bitorder="little").tobytes()
+
+    if not any(value != value for value in values):
+        return None
+    bitmap = bytearray((len(values) + 7) // 8)
+    for i, value in enumerate(values):
+        if value == value:
+            bitmap[i >> 3] |= 1 << (i & 7)
+    return bytes(bitmap)
+
+
+class ColumnarResults:
+    """
+    Per-item metric scores stored as one float64 array per metric.
+
+    Rows are appended a batch at a time. A metric first seen after some rows
+    were appended is back-filled with missing values.
+    """
+
+    def __init__(self, keep_details: bool = True, row_ids: bool = True):
+        """
+        Initialize an empty container.
+
+        Args:
+            keep_details: Keep non-empty MetricResult details (sparsely)
+            row_ids: Keep a row id column
+        """
+        self.keep_details = keep_details
+        self.row_ids: Optional[List[Optional[str]]] = [] if row_ids else None
+        self.num_rows = 0
+        self._scores: Dict[str, array] = {}
+        self._errors: Dict[str, Dict[int, str]] = {}
+        self._details: Dict[str, Dict[int, Dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @property
+    def metric_names(self) -> List[str]:
+        """Names of the stored metrics."""
+        return list(self._scores)
+
+    def append_batch(
+        self,
+        columns: Dict[str, List[MetricResult]],
+        row_ids: Optional[Sequence[Optional[str]]] = None
+    ) -> None:
+        """
+        Append the per-metric results of a batch.
+
+        Args:
+            columns: Mapping of metric name to per-item results
+            row_ids: Optional ids of the batch items
+        """
+        size = len(next(iter(columns.values()))) if columns else len(row_ids or ())
+        if any(len(column) != size for column in columns.values()):
+            raise ValueError("All metric columns must have the same length")
+        if row_ids is not None and len(row_ids) != size:
+            raise ValueError("Row ids must match the number of results")
+
+        offset = self.num_rows
+        for name in columns:
+            self._column(name)
+        for name, values in self._scores.items():
+            column = columns.get(name)
+            if column is None:
+                self._extend(name, [_NAN] * size)
+                continue
+            # Failed results keep their error but have no score
+            self._extend(name, [
+                _NAN if result.value is None or result.error is not None else float(result.value)
+                for result in column
+            ])
+            for i, result in enumerate(column):
+                if result.error is not None:
+                    self._errors.setdefault(name, {})[offset + i] = result.error
+                if self.keep_details and result.details:
+                    self._details.setdefault(name, {})[offset + i] = result.details
+
+        if self.row_ids is not None:
+            self.row_ids.extend(row_ids if row_ids is not None else [None] * size)
+        self.num_rows += size
+
+    def append_scores(
+        self,
+        scores: Dict[str, Sequence[Optional[float]]],
+        row_ids: Optional[Sequence[Optional[str]]] = None
+    ) -> None:
+        """
+        Append plain scores (None for missing values).
+
+        Args:
+            scores: Mapping of metric name to per-item scores
+            row_ids: Optional ids of the items
+        """
+        self.append_batch(
+            {name: [MetricResult(name=name, value=value) for value in values] for name, values in scores.items()},
+            row_ids
+        )
+
+    def column(self, metric_name: str) -> array:
+        """
+        Raw float64 score array of a metric (NaN for missing scores).
+
+        Args:
+            metric_name: Metric name
+
+        Returns:
+            The stored array itself, not a copy
+        """
+        if metric_name not in self._scores:
+            raise KeyError(f"No scores for metric '{metric_name}'")
+        return self._scores[metric_name]
+
+    def to_numpy(self, metric_name: str) -> Any:
+        """Zero-copy numpy view of a metric's scores."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for array conversion. Install with: pip install numpy")
+        return np.frombuffer(self.column(metric_name), dtype=np.float64)
+
+    def scores(self, metric_name: str) -> List[Optional[float]]:
+        """Scores of a metric as a list, with None for missing scores."""
+        if metric_name not in self._scores:
+            return []
+        return [None if value != value else value for value in self._scores[metric_name]]
+
+    def errors(self, metric_name: str) -> Dict[int, str]:
+        """Errors of a metric by row index."""
+        return dict(self._errors.get(metric_name, {}))
+
+    def details(self, metric_name: str, row: int) -> Dict[str, Any]:
+        """Details of one metric result (empty if none were kept)."""
+        return self._details.get(metric_name, {}).get(row, {})
+
+    def get_result(self, metric_name: str, row: int) -> MetricResult:
+        """Rebuild the MetricResult of one row."""
+        value = self.column(metric_name)[row]
+        return MetricResult(
+            name=metric_name,
+            value=None if value != value else value,
+            error=self._errors.get(metric_name, {}).get(row),
+            details=self.details(metric_name, row)
+        )
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+
+    def count(self, metric_name: str) -> int:
+        """Number of rows with a score."""
+        if NUMPY_AVAILABLE:
+            return int(np.count_nonzero(~np.isnan(self.to_numpy(metric_name))))
+        return sum(1 for value in self.column(metric_name) if value == value)
+
+    def mean(self, metric_name: str) -> Optional[float]:
+        """Mean score, ignoring missing scores (None if there are none)."""
+        return self.aggregate(metric_name)["mean"] if self.count(metric_name) else None
+
+    def quantile(self, metric_name: str, q: float) -> Optional[float]:
+        """
+        Quantile of the scores (linear interpolation).
+
+        Args:
+            metric_name: Metric name
+            q: Quantile in [0, 1]
+
+        Returns:
+            Quantile value, or None if there are no scores
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Quantile must be between 0 and 1")
+        if NUMPY_AVAILABLE:
+            values = self.to_numpy(metric_name)
+            values = values[~np.isnan(values)]
+            return float(np.quantile(values, q)) if values.size else None
+
+        values = sorted(value for value in self.column(metric_name) if value == value)
+        if not values:
+            return None
+        position = q * (len(values) - 1)
+        lower = math.floor(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    def aggregate(self, metric_name: str) -> Dict[str, float]:
+        """
+        Count, mean, min, max and sample standard deviation of a metric.
+
+        Args:
+            metric_name: Metric name
+
+        Returns:
+            Statistics in the format of BatchResult.get_metric_statistics()
+        """
+        if NUMPY_AVAILABLE:
+            values = self.to_numpy(metric_name)
+            values = values[~np.isnan(values)]
+            if not values.size:
+                return {"count": 0, "mean": 0.0, "min": 0.0, "max": 0.0, "std": 0.0}
+            return {
+                "count": int(values.size),
+                "mean": float(values.mean()),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "std": float(values.std(ddof=1)) if values.size > 1 else 0.0
+            }
+
+        values = [value for value in self.column(metric_name) if value == value]
+        if not values:
+            return {"count": 0, "mean": 0.0, "min": 0.0, "max": 0.0, "std": 0.0}
+        mean = math.fsum(values) / len(values)
+        variance = (
+            math.fsum((value - mean) ** 2 for value in values) / (len(values) - 1)
+            if len(values) > 1 else 0.0
+        )
+        return {
+            "count": len(values),
+            "mean": mean,
+            "min": min(values),
+            "max": max(values),
+            "std": math.sqrt(variance)
+        }
+
+    def aggregate_all(self) -> Dict[str, Dict[str, float]]:
+        """aggregate() for every metric."""
+        return {name: self.aggregate(name) for name in self._scores}
+
+    # ------------------------------------------------------------------
+    # Arrow, pandas and Parquet
+    # ------------------------------------------------------------------
+
+    def to_arrow(self) -> Any:
+        """
+        Convert to a pyarrow Table.
+
+        Score columns share memory with this container; later appends copy
+        the affected arrays first, so the table stays valid. Sparse errors
+        and details become nullable ``<metric>__error`` and JSON-encoded
+        ``<metric>__details`` columns when present.
+
+        Returns:
+            pyarrow.Table
+        """
+        _require_pyarrow()
+        arrays: List[Any] = []
+        names: List[str] = []
+
+        if self.row_ids is not None:
+            arrays.append(pa.array(self.row_ids, type=pa.string()))
+            names.append(ROW_ID_COLUMN)
+
+        for name, values in self._scores.items():
+            bitmap = _validity_bitmap(values)
+            arrays.append(pa.Array.from_buffers(
+                pa.float64(),
+                len(values),
+                [pa.py_buffer(bitmap) if bitmap is not None else None, pa.py_buffer(values)]
+            ))
+            names.append(name)
+            if self._errors.get(name):
+                arrays.append(pa.array(self._sparse_column(self._errors[name]), type=pa.string()))
+                names.append(name + ERROR_SUFFIX)
+            if self._details.get(name):
+                encoded = {row: json.dumps(details, default=str) for row, details in self._details[name].items()}
+                arrays.append(pa.array(self._sparse_column(encoded), type=pa.string()))
+                names.append(name + DETAILS_SUFFIX)
+
+        layout = json.dumps({"version": COLUMNAR_VERSION, "metrics": self.metric_names})
+        return pa.Table.from_arrays(arrays, names=names, metadata={SCHEMA_METADATA_KEY: layout})
+
+    @classmethod
+    def from_arrow(cls, table: Any) -> "ColumnarResults":
+        """
+        Build from a pyarrow Table written by to_arrow().
+
+        Tables from elsewhere are accepted too: every floating point column
+        is read as a metric.
+
+        Args:
+            table: pyarrow.Table
+
+        Returns:
+            ColumnarResults instance
+        """
+        _require_pyarrow()
+        layout = (table.schema.metadata or {}).get(SCHEMA_METADATA_KEY)
+        if layout is not None:
+            metric_names = json.loads(layout)["metrics"]
+        else:
+            metric_names = [
+                field.name for field in table.schema if pa.types.is_floating(field.type)
+            ]
+
+        results = cls(row_ids=ROW_ID_COLUMN in table.column_names)
+        results.num_rows = table.num_rows
+        if results.row_ids is not None:
+            results.row_ids = table.column(ROW_ID_COLUMN).to_pylist()
+
+        for name in metric_names:
+            column = table.column(name).cast(pa.float64()).fill_null(_NAN)
+            values = array("d")
+            for chunk in column.chunks:
+                data = memoryview(chunk.buffers()[1])
+                values.frombytes(data[chunk.offset * 8:(chunk.offset + len(chunk)) * 8])
+            results._scores[name] = values
+            if name + ERROR_SUFFIX in table.column_names:
+                results._errors[name] = cls._dense_to_sparse(table.column(name + ERROR_SUFFIX).to_pylist())
+            if name + DETAILS_SUFFIX in table.column_names:
+                results._details[name] = {
+                    row: json.loads(encoded)
+                    for row, encoded in cls._dense_to_sparse(table.column(name + DETAILS_SUFFIX).to_pylist()).items()
+                }
+        return results
+
+    def to_pandas(self) -> Any:
+        """
+        Convert to a pandas DataFrame.
+
+        Score columns are float64 with NaN for missing scores and, without
+        pyarrow, are numpy views of the stored arrays.
+
+        Returns:
+            pandas.DataFrame
+        """
+        if not PANDAS_AVAILABLE:
+            raise ImportError("pandas is required for DataFrame conversion. Install with: pip install pandas")
+        if PYARROW_AVAILABLE:
+            return self.to_arrow().to_pandas()
+
+        data: Dict[str, Any] = {}
+        if self.row_ids is not None:
+            data[ROW_ID_COLUMN] = self.row_ids
+        for name in self._scores:
+            data[name] = self.to_numpy(name)
+            if self._errors.get(name):
+                data[name + ERROR_SUFFIX] = self._sparse_column(self._errors[name])
+        return pd.DataFrame(data, copy=False)
+
+    def write_parquet(self, path: Any, **kwargs) -> None:
+        """
+        Write to a Parquet file.
+
+        Args:
+            path: Destination path
+            **kwargs: Passed to pyarrow.parquet.write_table (compression, ...)
+        """
+        _require_pyarrow()
+        pq.write_table(self.to_arrow(), str(path), **kwargs)
+
+    @classmethod
+    def read_parquet(cls, path: Any) -> "ColumnarResults":
+        """
+        Read a Parquet file written by write_parquet().
+
+        Args:
+            path: Source path
+
+        Returns:
+            ColumnarResults instance
+        """
+        _require_pyarrow()
+        return cls.from_arrow(pq.read_table(str(path)))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _column(self, name: str) -> array:
+        """Get a score array, creating it back-filled with missing values."""
+        if name not in self._scores:
+            self._scores[name] = array("d", [_NAN]) * self.num_rows
+        return self._scores[name]
+
+    def _extend(self, name: str, values: List[float]) -> None:
+        try:
+            self._scores[name].extend(values)
+        except BufferError:
+            # The array is shared with an exported Arrow or numpy buffer
+            self._scores[name] = array("d", self._scores[name])
+            self._scores[name].extend(values)
+
+    def _sparse_column(self, values: Dict[int, Any]) -> List[Any]:
+        column: List[Any] = [None] * self.num_rows
+        for row, value in values.items():
+            column[row] = value
+        return column
+
+    @staticmethod
+    def _dense_to_sparse(values: List[Any]) -> Dict[int, Any]:
+        return {row: value for row, value in enumerate(values) if value is not None}
@@ -418,8 +418,44 @@ class EvaluationDataset:
         file_path = Path(file_path)
         dataset_name = name or file_path.stem
         
-        items = []
+        items = list(cls.iter_csv(
+            file_path, prediction_col, ground_truth_col, context_col, id_col
+        ))
+        
+        dataset = cls(
+            name=dataset_name,
+            items=items,
+            description=f"Dataset loaded from {file_path}",
+            metadata={"source_file": str(file_path)}
+        )
+        
+        logger.info(f"Loaded dataset '{dataset.name}' with {len(items)} items from {file_path}")
+        
+        return dataset
+    
+    @staticmethod
+    def iter_csv(
+        file_path: Union[str, Path],
+        prediction_col: str = 'prediction',
+        ground_truth_col: str = 'ground_truth',
+        context_col: Optional[str] = 'context',
+        id_col: Optional[str] = 'id'
+    ) -> Iterator[DatasetItem]:
+        """
+        Stream dataset items from a CSV file without loading it into memory.
+        
+        Suitable as input to BatchEvaluator.evaluate_stream_async().
         
+        Args:
+            file_path: Path to the CSV file
+            prediction_col: Column name for predictions
+            ground_truth_col: Column name for ground truth
+            context_col: Column name for context (optional)
+            id_col: Column name for item IDs (optional)
+            
+        Yields:
+            DatasetItem for each complete row
+        """
         with open(file_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             
@@ -443,7 +479,7 @@ class EvaluationDataset:
                         if value:  # Only include non-empty values
                             metadata[key] = value
                 
-                item = DatasetItem(
+                yield DatasetItem(
                     id=item_id or str(uuid.uuid4()),
                     prediction=prediction,
                     ground_truth=ground_truth,
@@ -451,19 +487,6 @@ class EvaluationDataset:
                     metadata=metadata,
                     created_at=row.get('created_at', datetime.now().isoformat())
                 )
-                
-                items.append(item)
-        
-        dataset = cls(
-            name=dataset_name,
-            items=items,
-            description=f"Dataset loaded from {file_path}",
-            metadata={"source_file": str(file_path)}
-        )
-        
-        logger.info(f"Loaded dataset '{dataset.name}' with {len(items)} items from {file_path}")
-        
-        return dataset
     
     @classmethod
     def from_lists(
@@ -0,0 +1,1077 @@
+"""
+Distributed batch evaluation through a shared work queue.
+
+An EvaluationCoordinator splits a dataset into batch tasks and writes them to
+a work queue; EvaluationWorkers on any number of processes or machines lease
+tasks, score them and write back per-item results with partial aggregates.
+The coordinator merges aggregates as results arrive and assembles the final
+BatchResult.
+
+- Leases have a visibility timeout, extended by worker heartbeats; a task
+  whose worker dies becomes available again when its lease expires.
+- Failed attempts are retried up to ``max_attempts`` times.
+- Tasks running much longer than the typical task are speculatively handed
+  to a second worker; the first completion wins.
+
+SQLite in WAL mode is the default queue (any process that can open the file
+can be a worker); Redis is supported as an optional backend.
+
+Queues carry pickled items and metrics, so only connect workers to queues
+you trust.
+
+Example:
+    >>> coordinator = EvaluationCoordinator(BatchEvaluator(evaluator), "eval-queue.db")
+    >>> result = coordinator.evaluate_dataset(dataset, local_workers=4)
+
+    # or, on other machines: sprintlens eval-worker sqlite:///shared/eval-queue.db
+"""
+
+import asyncio
+import multiprocessing
+import pickle
+import re
+import socket
+import sqlite3
+import statistics
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+from .batch import BatchEvaluator, BatchProgress, BatchResult
+from .columnar import ColumnarResults
+from .dataset import EvaluationDataset
+from .evaluator import Evaluator
+from .metrics import MetricResult
+from .process_pool import metric_payload, load_metric
+from .streaming import RunningStats
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+
+@dataclass
+class LeasedTask:
+    """A task leased by a worker."""
+    job_id: str
+    task_id: int
+    attempt: int
+    payload: bytes
+    lease_token: str
+    speculative: bool = False
+
+
+@dataclass
+class QueueProgress:
+    """Task counts of a job."""
+    total: int = 0
+    pending: int = 0
+    leased: int = 0
+    done: int = 0
+    failed: int = 0
+
+    @property
+    def finished(self) -> bool:
+        """Whether every task is done or has failed for good."""
+        return self.done + self.failed >= self.total
+
+
+class WorkQueue(ABC):
+    """Shared queue of batch evaluation tasks."""
+
+    url: str
+
+    @abstractmethod
+    def create_job(self, job_id: str, spec: bytes, tasks: List[bytes], max_attempts: int = 3) -> None:
+        """
+        Create a job with its tasks.
+
+        Args:
+            job_id: Job identifier
+            spec: Serialized job specification (metrics, timeouts)
+            tasks: Serialized task payloads; task ids are their indices
+            max_attempts: Attempts per task before it fails for good
+        """
+        pass
+
+    @abstractmethod
+    def get_job_spec(self, job_id: str) -> Optional[bytes]:
+        """Specification of an open job, or None if it is closed or unknown."""
+        pass
+
+    @abstractmethod
+    def open_jobs(self) -> List[str]:
+        """Ids of open jobs, oldest first."""
+        pass
+
+    @abstractmethod
+    def lease(self, worker_id: str, visibility_timeout: float, job_id: Optional[str] = None) -> Optional[LeasedTask]:
+        """
+        Lease the next available task.
+
+        Expired leases are returned to the queue first (or failed when out
+        of attempts).
+
+        Args:
+            worker_id: Identifier of the leasing worker
+            visibility_timeout: Seconds until the lease expires
+            job_id: Only lease tasks of this job
+
+        Returns:
+            LeasedTask, or None if no task is available
+        """
+        pass
+
+    @abstractmethod
+    def heartbeat(self, task: LeasedTask, visibility_timeout: float) -> bool:
+        """Extend a lease; returns False if the lease expired or was taken over by another attempt."""
+        pass
+
+    @abstractmethod
+    def complete(self, task: LeasedTask, result: bytes) -> bool:
+        """Store a task result; returns False if another attempt completed first."""
+        pass
+
+    @abstractmethod
+    def fail(self, task: LeasedTask, error: str) -> None:
+        """Release a failed attempt for retry (or fail the task when out of attempts)."""
+        pass
+
+    @abstractmethod
+    def results_since(self, job_id: str, cursor: int) -> Tuple[List[Tuple[int, bytes]], int]:
+        """
+        Results completed after a cursor.
+
+        Args:
+            job_id: Job identifier
+            cursor: Cursor returned by the previous call (0 initially)
+
+        Returns:
+            List of (task id, result) and the new cursor
+        """
+        pass
+
+    @abstractmethod
+    def failed_tasks(self, job_id: str) -> Dict[int, str]:
+        """Tasks that failed for good, with their last error."""
+        pass
+
+    @abstractmethod
+    def running_tasks(self, job_id: str) -> List[Tuple[int, float, bool]]:
+        """Leased tasks as (task id, leased at, already speculated)."""
+        pass
+
+    @abstractmethod
+    def speculate(self, job_id: str, task_id: int) -> bool:
+        """Make a leased task available to a second worker."""
+        pass
+
+    @abstractmethod
+    def progress(self, job_id: str) -> QueueProgress:
+        """Task counts of a job."""
+        pass
+
+    @abstractmethod
+    def close_job(self, job_id: str) -> None:
+        """Stop handing out tasks of a job."""
+        pass
+
+    @abstractmethod
+    def delete_job(self, job_id: str) -> None:
+        """Remove a job and its tasks."""
+        pass
+
+    @abstractmethod
+    def spec(self) -> Dict[str, Any]:
+        """Everything needed to reopen this queue in another process (see from_spec())."""
+        pass
+
+    @staticmethod
+    def from_spec(spec: Dict[str, Any]) -> "WorkQueue":
+        """
+        Open a queue from the specification returned by spec().
+
+        Args:
+            spec: Queue specification
+
+        Returns:
+            WorkQueue instance
+        """
+        options = dict(spec)
+        kind = options.pop("type")
+        if kind == "sqlite":
+            return SQLiteWorkQueue(**options)
+        if kind == "redis":
+            return RedisWorkQueue(**options)
+        raise ValueError(f"Unknown work queue type: {kind}")
+
+    def close(self) -> None:
+        """Release connections."""
+        pass
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """
+    Work queue in a SQLite database using WAL mode.
+
+    Leases run in ``BEGIN IMMEDIATE`` transactions, so any number of worker
+    processes sharing the file lease each task exactly once. Queues with
+    different table prefixes share a database file without seeing each
+    other's jobs.
+    """
+
+    def __init__(self, path: Union[str, Path], prefix: str = ""):
+        if not re.fullmatch(r"[A-Za-z0-9_]*", prefix):
+            raise ValueError("SQLite work queue prefixes may only contain letters, digits and underscores")
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.url = f"sqlite:///{self.path}"
+        self.prefix = prefix
+        self._jobs = f"{prefix}jobs"
+        self._tasks = f"{prefix}tasks"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._jobs} ("
+            "job_id TEXT PRIMARY KEY, spec BLOB, total INTEGER, status TEXT, created_at REAL)"
+        )
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._tasks} ("
+            "job_id TEXT NOT NULL, task_id INTEGER NOT NULL, payload BLOB, status TEXT NOT NULL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, max_attempts INTEGER NOT NULL, lease_token TEXT, "
+            "leased_by TEXT, leased_at REAL, lease_expires REAL, speculative INTEGER NOT NULL DEFAULT 0, "
+            "error TEXT, result BLOB, completed_seq INTEGER, "
+            "PRIMARY KEY (job_id, task_id))"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {self._tasks}_status ON {self._tasks} (status, job_id)")
+
+    def spec(self) -> Dict[str, Any]:
+        return {"type": "sqlite", "path": str(self.path), "prefix": self.prefix}
+
+    def _transaction(self, body):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = body(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def _query(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def create_job(self, job_id: str, spec: bytes, tasks: List[bytes], max_attempts: int = 3) -> None:
+        def body(conn):
+            conn.execute(
+                f"INSERT INTO {self._jobs} (job_id, spec, total, status, created_at) VALUES (?, ?, ?, 'open', ?)",
+                (job_id, spec, len(tasks), time.time())
+            )
+            conn.executemany(
+                f"INSERT INTO {self._tasks} (job_id, task_id, payload, status, max_attempts) VALUES (?, ?, ?, 'pending', ?)",
+                [(job_id, task_id, payload, max_attempts) for task_id, payload in enumerate(tasks)]
+            )
+        self._transaction(body)
+
+    def get_job_spec(self, job_id: str) -> Optional[bytes]:
+        rows = self._query(f"SELECT spec FROM {self._jobs} WHERE job_id = ? AND status = 'open'", (job_id,))
+        return rows[0][0] if rows else None
+
+    def open_jobs(self) -> List[str]:
+        return [row[0] for row in self._query(f"SELECT job_id FROM {self._jobs} WHERE status = 'open' ORDER BY created_at")]
+
+    def lease(self, worker_id: str, visibility_timeout: float, job_id: Optional[str] = None) -> Optional[LeasedTask]:
+        now = time.time()
+        token = uuid.uuid4().hex
+        job_filter = "AND t.job_id = ?" if job_id is not None else ""
+        job_params: Tuple[Any, ...] = (job_id,) if job_id is not None else ()
+
+        def body(conn):
+            conn.execute(
+                f"UPDATE {self._tasks} SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END, "
+                "error = COALESCE(error, 'lease expired'), speculative = 0 "
+                "WHERE status = 'leased' AND lease_expires < ?",
+                (now,)
+            )
+            row = conn.execute(
+                f"SELECT t.job_id, t.task_id, t.status, t.attempts, t.payload FROM {self._tasks} t "
+                f"JOIN {self._jobs} j ON j.job_id = t.job_id "
+                f"WHERE j.status = 'open' {job_filter} "
+                "AND (t.status = 'pending' OR (t.status = 'leased' AND t.speculative = 1)) "
+                "ORDER BY t.status = 'leased', j.created_at, t.task_id LIMIT 1",
+                job_params
+            ).fetchone()
+            if row is None:
+                return None
+
+            task_job, task_id, status, attempts, payload = row
+            if status == "leased":
+                # Speculative copy: the original lease stays in place
+                conn.execute(
+                    f"UPDATE {self._tasks} SET speculative = 2 WHERE job_id = ? AND task_id = ?",
+                    (task_job, task_id)
+                )
+                return LeasedTask(task_job, task_id, attempts, payload, token, speculative=True)
+
+            conn.execute(
+                f"UPDATE {self._tasks} SET status = 'leased', attempts = attempts + 1, lease_token = ?, leased_by = ?, "
+                "leased_at = ?, lease_expires = ? WHERE job_id = ? AND task_id = ?",
+                (token, worker_id, now, now + visibility_timeout, task_job, task_id)
+            )
+            return LeasedTask(task_job, task_id, attempts + 1, payload, token)
+
+        return self._transaction(body)
+
+    def heartbeat(self, task: LeasedTask, visibility_timeout: float) -> bool:
+        def body(conn):
+            return conn.execute(
+                f"UPDATE {self._tasks} SET lease_expires = ? "
+                "WHERE job_id = ? AND task_id = ? AND status = 'leased' AND lease_token = ?",
+                (time.time() + visibility_timeout, task.job_id, task.task_id, task.lease_token)
+            ).rowcount > 0
+        return self._transaction(body)
+
+    def complete(self, task: LeasedTask, result: bytes) -> bool:
+        def body(conn):
+            return conn.execute(
+                f"UPDATE {self._tasks} SET status = 'done', result = ?, payload = NULL, error = NULL, "
+                f"completed_seq = (SELECT COALESCE(MAX(completed_seq), 0) + 1 FROM {self._tasks} WHERE job_id = ?) "
+                "WHERE job_id = ? AND task_id = ? AND status IN ('pending', 'leased')",
+                (result, task.job_id, task.job_id, task.task_id)
+            ).rowcount > 0
+        return self._transaction(body)
+
+    def fail(self, task: LeasedTask, error: str) -> None:
+        def body(conn):
+            conn.execute(
+                f"UPDATE {self._tasks} SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END, "
+                "error = ?, speculative = 0 "
+                "WHERE job_id = ? AND task_id = ? AND status = 'leased' AND lease_token = ?",
+                (error, task.job_id, task.task_id, task.lease_token)
+            )
+        self._transaction(body)
+
+    def results_since(self, job_id: str, cursor: int) -> Tuple[List[Tuple[int, bytes]], int]:
+        rows = self._query(
+            f"SELECT task_id, result, completed_seq FROM {self._tasks} "
+            "WHERE job_id = ? AND status = 'done' AND completed_seq > ? ORDER BY completed_seq",
+            (job_id, cursor)
+        )
+        return [(task_id, result) for task_id, result, _ in rows], (rows[-1][2] if rows else cursor)
+
+    def failed_tasks(self, job_id: str) -> Dict[int, str]:
+        return dict(self._query(f"SELECT task_id, error FROM {self._tasks} WHERE job_id = ? AND status = 'failed'", (job_id,)))
+
+    def running_tasks(self, job_id: str) -> List[Tuple[int, float, bool]]:
+        return [
+            (task_id, leased_at, bool(speculative))
+            for task_id, leased_at, speculative in self._query(
+                f"SELECT task_id, leased_at, speculative FROM {self._tasks} WHERE job_id = ? AND status = 'leased'",
+                (job_id,)
+            )
+        ]
+
+    def speculate(self, job_id: str, task_id: int) -> bool:
+        def body(conn):
+            return conn.execute(
+                f"UPDATE {self._tasks} SET speculative = 1 "
+                "WHERE job_id = ? AND task_id = ? AND status = 'leased' AND speculative = 0",
+                (job_id, task_id)
+            ).rowcount > 0
+        return self._transaction(body)
+
+    def progress(self, job_id: str) -> QueueProgress:
+        counts = dict(self._query(f"SELECT status, COUNT(*) FROM {self._tasks} WHERE job_id = ? GROUP BY status", (job_id,)))
+        return QueueProgress(
+            total=sum(counts.values()),
+            pending=counts.get("pending", 0),
+            leased=counts.get("leased", 0),
+            done=counts.get("done", 0),
+            failed=counts.get("failed", 0)
+        )
+
+    def close_job(self, job_id: str) -> None:
+        self._transaction(lambda conn: conn.execute(f"UPDATE {self._jobs} SET status = 'closed' WHERE job_id = ?", (job_id,)))
+
+    def delete_job(self, job_id: str) -> None:
+        def body(conn):
+            conn.execute(f"DELETE FROM {self._tasks} WHERE job_id = ?", (job_id,))
+            conn.execute(f"DELETE FROM {self._jobs} WHERE job_id = ?", (job_id,))
+        self._transaction(body)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Atomically requeue expired leases, then pop the next pending or speculative task
+_REDIS_LEASE = """
+local prefix = KEYS[1]
+local now = tonumber(ARGV[1])
+local expired = redis.call('ZRANGEBYSCORE', prefix .. ':leases', '-inf', now)
+for _, id in ipairs(expired) do
+  redis.call('ZREM', prefix .. ':leases', id)
+  local key = prefix .. ':task:' .. id
+  if redis.call('HGET', key, 'status') == 'leased' then
+    redis.call('HSET', key, 'speculative', 0)
+    if tonumber(redis.call('HGET', key, 'attempts')) >= tonumber(redis.call('HGET', key, 'max_attempts')) then
+      redis.call('HSET', key, 'status', 'failed', 'error', 'lease expired')
+      redis.call('RPUSH', prefix .. ':failed', id)
+    else
+      redis.call('HSET', key, 'status', 'pending')
+      redis.call('RPUSH', prefix .. ':pending', id)
+    end
+  end
+end
+while true do
+  local id = redis.call('LPOP', prefix .. ':pending')
+  if not id then return nil end
+  local key = prefix .. ':task:' .. id
+  local status = redis.call('HGET', key, 'status')
+  if status == 'pending' then
+    local attempts = redis.call('HINCRBY', key, 'attempts', 1)
+    redis.call('HSET', key, 'status', 'leased', 'lease_token', ARGV[3], 'leased_by', ARGV[4], 'leased_at', ARGV[1])
+    redis.call('ZADD', prefix .. ':leases', ARGV[2], id)
+    return {id, attempts, redis.call('HGET', key, 'payload'), 0}
+  elseif status == 'leased' and redis.call('HGET', key, 'speculative') == '1' then
+    redis.call('HSET', key, 'speculative', 2)
+    return {id, redis.call('HGET', key, 'attempts'), redis.call('HGET', key, 'payload'), 1}
+  end
+end
+"""
+
+_REDIS_HEARTBEAT = """
+local prefix = KEYS[1]
+local key = prefix .. ':task:' .. ARGV[1]
+if redis.call('HGET', key, 'status') ~= 'leased' or redis.call('HGET', key, 'lease_token') ~= ARGV[2] then
+  return 0
+end
+redis.call('ZADD', prefix .. ':leases', 'XX', ARGV[3], ARGV[1])
+return 1
+"""
+
+_REDIS_COMPLETE = """
+local prefix = KEYS[1]
+local key = prefix .. ':task:' .. ARGV[1]
+local status = redis.call('HGET', key, 'status')
+if status ~= 'pending' and status ~= 'leased' then return 0 end
+redis.call('HSET', key, 'status', 'done', 'result', ARGV[2])
+redis.call('HDEL', key, 'payload', 'error')
+redis.call('ZREM', prefix .. ':leases', ARGV[1])
+redis.call('RPUSH', prefix .. ':done', ARGV[1])
+return 1
+"""
+
+_REDIS_FAIL = """
+local prefix = KEYS[1]
+local key = prefix .. ':task:' .. ARGV[1]
+if redis.call('HGET', key, 'status') ~= 'leased' or redis.call('HGET', key, 'lease_token') ~= ARGV[2] then
+  return 0
+end
+redis.call('ZREM', prefix .. ':leases', ARGV[1])
+redis.call('HSET', key, 'error', ARGV[3], 'speculative', 0)
+if tonumber(redis.call('HGET', key, 'attempts')) >= tonumber(redis.call('HGET', key, 'max_attempts')) then
+  redis.call('HSET', key, 'status', 'failed')
+  redis.call('RPUSH', prefix .. ':failed', ARGV[1])
+else
+  redis.call('HSET', key, 'status', 'pending')
+  redis.call('RPUSH', prefix .. ':pending', ARGV[1])
+end
+return 1
+"""
+
+
+class RedisWorkQueue(WorkQueue):
+    """
+    Work queue in Redis.
+
+    Leasing, completion and failure are Lua scripts, so they are atomic
+    across any number of workers.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "sprintlens:evalqueue"):
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis is required for the Redis work queue. Install with: pip install redis")
+        self.url = url
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url)
+        self._lease = self._redis.register_script(_REDIS_LEASE)
+        self._heartbeat = self._redis.register_script(_REDIS_HEARTBEAT)
+        self._complete = self._redis.register_script(_REDIS_COMPLETE)
+        self._fail = self._redis.register_script(_REDIS_FAIL)
+
+    def spec(self) -> Dict[str, Any]:
+        return {"type": "redis", "url": self.url, "prefix": self.prefix}
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+    def create_job(self, job_id: str, spec: bytes, tasks: List[bytes], max_attempts: int = 3) -> None:
+        key = self._job_key(job_id)
+        pipe = self._redis.pipeline()
+        for task_id, payload in enumerate(tasks):
+            pipe.hset(f"{key}:task:{task_id}", mapping={
+                "payload": payload, "status": "pending", "attempts": 0,
+                "max_attempts": max_attempts, "speculative": 0
+            })
+        if tasks:
+            pipe.rpush(f"{key}:pending", *range(len(tasks)))
+        pipe.hset(key, mapping={"spec": spec, "total": len(tasks), "status": "open"})
+        pipe.zadd(f"{self.prefix}:jobs", {job_id: time.time()})
+        pipe.execute()
+
+    def get_job_spec(self, job_id: str) -> Optional[bytes]:
+        spec, status = self._redis.hmget(self._job_key(job_id), "spec", "status")
+        return spec if status == b"open" else None
+
+    def open_jobs(self) -> List[str]:
+        return [job_id.decode() for job_id in self._redis.zrange(f"{self.prefix}:jobs", 0, -1)]
+
+    def lease(self, worker_id: str, visibility_timeout: float, job_id: Optional[str] = None) -> Optional[LeasedTask]:
+        now = time.time()
+        for candidate in [job_id] if job_id is not None else self.open_jobs():
+            if self._redis.hget(self._job_key(candidate), "status") != b"open":
+                continue
+            token = uuid.uuid4().hex
+            leased = self._lease(
+                keys=[self._job_key(candidate)],
+                args=[now, now + visibility_timeout, token, worker_id]
+            )
+            if leased:
+                task_id, attempts, payload, speculative = leased
+                return LeasedTask(candidate, int(task_id), int(attempts), payload, token, bool(int(speculative)))
+        return None
+
+    def heartbeat(self, task: LeasedTask, visibility_timeout: float) -> bool:
+        return bool(self._heartbeat(
+            keys=[self._job_key(task.job_id)],
+            args=[task.task_id, task.lease_token, time.time() + visibility_timeout]
+        ))
+
+    def complete(self, task: LeasedTask, result: bytes) -> bool:
+        return bool(self._complete(keys=[self._job_key(task.job_id)], args=[task.task_id, result]))
+
+    def fail(self, task: LeasedTask, error: str) -> None:
+        self._fail(keys=[self._job_key(task.job_id)], args=[task.task_id, task.lease_token, error])
+
+    def results_since(self, job_id: str, cursor: int) -> Tuple[List[Tuple[int, bytes]], int]:
+        key = self._job_key(job_id)
+        task_ids = [int(task_id) for task_id in self._redis.lrange(f"{key}:done", cursor, -1)]
+        pipe = self._redis.pipeline()
+        for task_id in task_ids:
+            pipe.hget(f"{key}:task:{task_id}", "result")
+        return list(zip(task_ids, pipe.execute())), cursor + len(task_ids)
+
+    def failed_tasks(self, job_id: str) -> Dict[int, str]:
+        key = self._job_key(job_id)
+        failed = {}
+        for task_id in self._redis.lrange(f"{key}:failed", 0, -1):
+            error = self._redis.hget(f"{key}:task:{int(task_id)}", "error")
+            failed[int(task_id)] = error.decode() if error else ""
+        return failed
+
+    def running_tasks(self, job_id: str) -> List[Tuple[int, float, bool]]:
+        key = self._job_key(job_id)
+        running = []
+        for task_id in self._redis.zrange(f"{key}:leases", 0, -1):
+            leased_at, speculative = self._redis.hmget(f"{key}:task:{int(task_id)}", "leased_at", "speculative")
+            running.append((int(task_id), float(leased_at or 0.0), speculative not in (None, b"0")))
+        return running
+
+    def speculate(self, job_id: str, task_id: int) -> bool:
+        key = self._job_key(job_id)
+        task_key = f"{key}:task:{task_id}"
+        status, speculative = self._redis.hmget(task_key, "status", "speculative")
+        if status != b"leased" or speculative != b"0":
+            return False
+        pipe = self._redis.pipeline()
+        pipe.hset(task_key, "speculative", 1)
+        pipe.rpush(f"{key}:pending", task_id)
+        pipe.execute()
+        return True
+
+    def progress(self, job_id: str) -> QueueProgress:
+        key = self._job_key(job_id)
+        total = int(self._redis.hget(key, "total") or 0)
+        done = self._redis.llen(f"{key}:done")
+        failed = self._redis.llen(f"{key}:failed")
+        leased = self._redis.zcard(f"{key}:leases")
+        return QueueProgress(
+            total=total, pending=max(0, total - done - failed - leased),
+            leased=leased, done=done, failed=failed
+        )
+
+    def close_job(self, job_id: str) -> None:
+        self._redis.hset(self._job_key(job_id), "status", "closed")
+        self._redis.zrem(f"{self.prefix}:jobs", job_id)
+
+    def delete_job(self, job_id: str) -> None:
+        key = self._job_key(job_id)
+        keys = [key, f"{key}:pending", f"{key}:leases", f"{key}:done", f"{key}:failed"]
+        keys.extend(self._redis.scan_iter(f"{key}:task:*"))
+        self._redis.delete(*keys)
+        self._redis.zrem(f"{self.prefix}:jobs", job_id)
+
+    def close(self) -> None:
+        self._redis.close()
+
+
+def open_work_queue(
+    queue: Union[str, Path, Dict[str, Any], WorkQueue],
+    prefix: Optional[str] = None
+) -> WorkQueue:
+    """
+    Open a work queue.
+
+    Args:
+        queue: ``redis://`` or ``rediss://`` URL, ``sqlite:///path`` URL or
+            plain path of a SQLite database, a specification from
+            WorkQueue.spec(), or an existing queue
+        prefix: Key prefix (Redis) or table prefix (SQLite) when opening
+            from a location; defaults to the queue's own default
+
+    Returns:
+        WorkQueue instance
+    """
+    if isinstance(queue, WorkQueue):
+        return queue
+    if isinstance(queue, dict):
+        return WorkQueue.from_spec(queue)
+    options = {"prefix": prefix} if prefix is not None else {}
+    location = str(queue)
+    if location.startswith(("redis://", "rediss://", "unix://")):
+        return RedisWorkQueue(location, **options)
+    if location.startswith("sqlite:///"):
+        location = location[len("sqlite:///"):]
+    return SQLiteWorkQueue(location, **options)
+
+
+class EvaluationWorker:
+    """
+    Leases batch tasks from a work queue and scores them.
+
+    Metrics and evaluator settings come from the job specification written
+    by the coordinator, so a worker needs nothing but the queue location
+    (and the metric classes importable).
+    """
+
+    def __init__(
+        self,
+        queue: Union[str, Path, Dict[str, Any], WorkQueue],
+        worker_id: Optional[str] = None,
+        poll_interval: float = 0.5
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            queue: Work queue or its location (see open_work_queue())
+            worker_id: Identifier recorded with leases (defaults to host:pid:random)
+            poll_interval: Seconds to wait when no task is available
+        """
+        self.queue = open_work_queue(queue)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{multiprocessing.current_process().pid}:{uuid.uuid4().hex[:6]}"
+        self.poll_interval = poll_interval
+        self.completed_tasks = 0
+        self._jobs: Dict[str, Tuple[Evaluator, Dict[str, Any]]] = {}
+
+    def run(
+        self,
+        job_id: Optional[str] = None,
+        max_tasks: Optional[int] = None,
+        idle_timeout: Optional[float] = None
+    ) -> int:
+        """
+        Process tasks until stopped.
+
+        Args:
+            job_id: Only work on this job, and stop once it is closed
+            max_tasks: Stop after this many tasks
+            idle_timeout: Stop after this many seconds without a task
+
+        Returns:
+            Number of tasks processed
+        """
+        processed = 0
+        idle_since = time.monotonic()
+        try:
+            while max_tasks is None or processed < max_tasks:
+                if self.run_once(job_id):
+                    processed += 1
+                    idle_since = time.monotonic()
+                    continue
+                if job_id is not None and self.queue.get_job_spec(job_id) is None:
+                    break
+                if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                    break
+                time.sleep(self.poll_interval)
+        finally:
+            for evaluator, _ in self._jobs.values():
+                evaluator.close()
+        return processed
+
+    def run_once(self, job_id: Optional[str] = None) -> bool:
+        """
+        Lease and process a single task.
+
+        Args:
+            job_id: Only lease tasks of this job
+
+        Returns:
+            True if a task was processed
+        """
+        # Before a job's spec is known, lease with the default coordinator timeout
+        known = self._load_job(job_id) if job_id is not None else None
+        task = self.queue.lease(self.worker_id, known[1]["visibility_timeout"] if known else 300.0, job_id)
+        if task is None:
+            return False
+
+        job = self._load_job(task.job_id)
+        if job is None:
+            self.queue.fail(task, "job is closed")
+            return True
+        evaluator, spec = job
+        visibility_timeout = spec["visibility_timeout"]
+        self.queue.heartbeat(task, visibility_timeout)
+
+        stop = threading.Event()
+
+        def keep_alive() -> None:
+            while not stop.wait(visibility_timeout / 3):
+                if not self.queue.heartbeat(task, visibility_timeout):
+                    return
+
+        heartbeat = threading.Thread(target=keep_alive, name="sprintlens-lease-heartbeat", daemon=True)
+        heartbeat.start()
+        start_time = time.perf_counter()
+        try:
+            items = pickle.loads(task.payload)
+            columns = asyncio.run(evaluator.evaluate_batch_async(items["predictions"], items["ground_truths"]))
+            result = _encode_result(columns, (time.perf_counter() - start_time) * 1000, self.worker_id)
+        except Exception as e:
+            logger.error(f"Task {task.task_id} of job {task.job_id} failed: {str(e)}")
+            stop.set()
+            self.queue.fail(task, str(e) or type(e).__name__)
+            return True
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        if self.queue.complete(task, result):
+            self.completed_tasks += 1
+        return True
+
+    def _load_job(self, job_id: str) -> Optional[Tuple[Evaluator, Dict[str, Any]]]:
+        if job_id not in self._jobs:
+            encoded = self.queue.get_job_spec(job_id)
+            if encoded is None:
+                return None
+            spec = pickle.loads(encoded)
+            metrics = [load_metric(spec["metrics"][name]) for name in spec["metric_names"]]
+            self._jobs[job_id] = (
+                Evaluator(
+                    metrics,
+                    max_concurrency=spec["max_concurrency"],
+                    metric_timeout=spec["metric_timeout"],
+                    max_workers=spec["max_workers"]
+                ),
+                spec
+            )
+        return self._jobs[job_id]
+
+
+def _encode_result(columns: Dict[str, List[MetricResult]], duration_ms: float, worker_id: str) -> bytes:
+    """Serialize per-item results of a task together with partial aggregates."""
+    partials = {}
+    for name, column in columns.items():
+        stats = RunningStats()
+        for result in column:
+            if result.value is not None and result.error is None:
+                stats.add(result.value)
+        partials[name] = stats
+    return pickle.dumps({
+        "columns": {
+            name: [(result.value, result.error, result.details, result.duration_ms) for result in column]
+            for name, column in columns.items()
+        },
+        "partials": partials,
+        "duration_ms": duration_ms,
+        "worker_id": worker_id
+    })
+
+
+def run_worker(
+    queue: Union[str, Path, Dict[str, Any], WorkQueue],
+    job_id: Optional[str] = None,
+    max_tasks: Optional[int] = None,
+    idle_timeout: Optional[float] = None
+) -> int:
+    """
+    Run an evaluation worker (entry point for worker processes).
+
+    Args:
+        queue: Work queue, its location or its specification
+        job_id: Only work on this job
+        max_tasks: Stop after this many tasks
+        idle_timeout: Stop after this many idle seconds
+
+    Returns:
+        Number of tasks processed
+    """
+    worker = EvaluationWorker(queue)
+    try:
+        return worker.run(job_id=job_id, max_tasks=max_tasks, idle_timeout=idle_timeout)
+    finally:
+        worker.queue.close()
+
+
+class EvaluationCoordinator:
+    """
+    Splits a dataset into batch tasks on a work queue and merges the results.
+
+    Uses the evaluator, batch size, progress callback and result options of
+    the given BatchEvaluator.
+    """
+
+    def __init__(
+        self,
+        batch_evaluator: BatchEvaluator,
+        queue: Union[str, Path, WorkQueue],
+        visibility_timeout: float = 300.0,
+        max_attempts: int = 3,
+        speculative_factor: Optional[float] = 3.0,
+        min_speculative_seconds: float = 5.0,
+        poll_interval: float = 0.2
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            batch_evaluator: Batch evaluator whose settings are used
+            queue: Work queue or its location (see open_work_queue())
+            visibility_timeout: Seconds a lease survives without a heartbeat
+            max_attempts: Attempts per task before its items count as failed
+            speculative_factor: Hand a task to a second worker once it has run
+                this many times longer than the median task (None disables)
+            min_speculative_seconds: Never speculate on tasks running for
+                less than this
+            poll_interval: Seconds between polls for results
+        """
+        if not batch_evaluator.evaluator.metrics:
+            raise ValueError("The evaluator has no metrics")
+        self.batch_evaluator = batch_evaluator
+        self.queue = open_work_queue(queue)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.speculative_factor = speculative_factor
+        self.min_speculative_seconds = min_speculative_seconds
+        self.poll_interval = poll_interval
+
+    def evaluate_dataset(
+        self,
+        dataset: EvaluationDataset,
+        metadata: Optional[Dict[str, Any]] = None,
+        local_workers: int = 0,
+        timeout: Optional[float] = None,
+        keep_job: bool = False
+    ) -> BatchResult:
+        """
+        Evaluate a dataset on the workers attached to the queue.
+
+        Args:
+            dataset: Dataset to evaluate
+            metadata: Optional metadata for the batch
+            local_workers: Worker processes to start on this machine
+            timeout: Give up after this many seconds (TimeoutError)
+            keep_job: Keep the job's tasks and results in the queue
+
+        Returns:
+            BatchResult with aggregated results
+        """
+        evaluator = self.batch_evaluator.evaluator
+        batch_size = self.batch_evaluator.batch_size
+        job_id = str(uuid.uuid4())
+        start_time = datetime.now()
+
+        batches = [dataset.items[i:i + batch_size] for i in range(0, len(dataset), batch_size)]
+        spec = self._job_spec(evaluator)
+        tasks = [
+            pickle.dumps({
+                "predictions": [item.prediction for item in items],
+                "ground_truths": [item.ground_truth for item in items]
+            })
+            for items in batches
+        ]
+        self.queue.create_job(job_id, spec, tasks, max_attempts=self.max_attempts)
+        logger.info(f"Created distributed evaluation job {job_id} with {len(tasks)} tasks")
+
+        workers = [
+            multiprocessing.get_context("spawn").Process(
+                target=run_worker, args=(self.queue.spec(), job_id), name=f"sprintlens-eval-worker-{i}", daemon=True
+            )
+            for i in range(local_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        progress = BatchProgress(batch_id=job_id, total_items=len(dataset))
+        task_results: Dict[int, Dict[str, Any]] = {}
+        metric_stats = {name: RunningStats() for name in evaluator.get_metric_names()}
+        durations: List[float] = []
+        speculated = 0
+        cursor = 0
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        try:
+            while True:
+                # Read results after the state so the last ones are not missed
+                state = self.queue.progress(job_id)
+                results, cursor = self.queue.results_since(job_id, cursor)
+                for task_id, encoded in results:
+                    if task_id in task_results:
+                        continue
+                    result = pickle.loads(encoded)
+                    task_results[task_id] = result
+                    durations.append(result["duration_ms"] / 1000)
+                    for name, partial in result["partials"].items():
+                        metric_stats.setdefault(name, RunningStats()).merge(partial)
+                    progress.update(completed=len(batches[task_id]))
+                    if self.batch_evaluator.progress_callback:
+                        self.batch_evaluator.progress_callback(progress)
+
+                if state.finished:
+                    break
+                if deadline is not None and time.monotonic() > deadline:
+                    raise TimeoutError(f"Distributed evaluation {job_id} did not finish within {timeout}s")
+                speculated += self._speculate(job_id, durations)
+                time.sleep(self.poll_interval)
+
+            failed = self.queue.failed_tasks(job_id)
+        finally:
+            self.queue.close_job(job_id)
+            for worker in workers:
+                worker.join(timeout=30)
+                if worker.is_alive():
+                    worker.terminate()
+            if not keep_job:
+                self.queue.delete_job(job_id)
+
+        return self._build_result(
+            job_id, dataset, batches, task_results, failed, metric_stats,
+            start_time, metadata, speculated
+        )
+
+    def _job_spec(self, evaluator: Evaluator) -> bytes:
+        payloads = {}
+        for metric in evaluator.metrics.values():
+            payload = metric_payload(metric)
+            if payload is None:
+                raise ValueError(f"Metric {metric.name} can neither be pickled nor rebuilt from its import path")
+            payloads[metric.name] = payload
+        return pickle.dumps({
+            "metrics": payloads,
+            "metric_names": evaluator.get_metric_names(),
+            "max_concurrency": evaluator.max_concurrency,
+            "metric_timeout": evaluator.metric_timeout,
+            "max_workers": evaluator.max_workers,
+            "visibility_timeout": self.visibility_timeout
+        })
+
+    def _speculate(self, job_id: str, durations: List[float]) -> int:
+        """Hand stragglers to a second worker; returns the number speculated."""
+        if self.speculative_factor is None or not durations:
+            return 0
+        state = self.queue.progress(job_id)
+        if state.pending:
+            # Idle workers are still busy with fresh tasks
+            return 0
+        threshold = max(self.min_speculative_seconds, self.speculative_factor * statistics.median(durations))
+        now = time.time()
+        count = 0
+        for task_id, leased_at, speculated in self.queue.running_tasks(job_id):
+            if not speculated and now - leased_at > threshold and self.queue.speculate(job_id, task_id):
+                logger.info(f"Speculatively re-executing straggling task {task_id} of job {job_id}")
+                count += 1
+        return count
+
+    def _build_result(
+        self,
+        job_id: str,
+        dataset: EvaluationDataset,
+        batches: List[List[Any]],
+        task_results: Dict[int, Dict[str, Any]],
+        failed: Dict[int, str],
+        metric_stats: Dict[str, RunningStats],
+        start_time: datetime,
+        metadata: Optional[Dict[str, Any]],
+        speculated: int
+    ) -> BatchResult:
+        keep_item_results = self.batch_evaluator.keep_item_results
+        columns = ColumnarResults(keep_details=self.batch_evaluator.keep_details)
+        item_results = []
+        successful_items = 0
+        failed_items = 0
+
+        for task_id, items in enumerate(batches):
+            if task_id not in task_results:
+                logger.error(f"Batch failed: {failed.get(task_id, 'no result')}")
+                failed_items += len(items)
+                continue
+            batch_columns = {
+                name: [
+                    MetricResult(name=name, value=value, error=error, details=details, duration_ms=duration_ms)
+                    for value, error, details, duration_ms in column
+                ]
+                for name, column in task_results[task_id]["columns"].items()
+            }
+            columns.append_batch(batch_columns, [item.id for item in items])
+            if keep_item_results:
+                item_results.extend(self.batch_evaluator._build_item_results(task_id, items, batch_columns))
+            successful_items += len(items)
+
+        aggregated_metrics = self.batch_evaluator._aggregate_scores(
+            metric_stats,
+            {name: stats.mean * stats.count for name, stats in metric_stats.items()},
+            {name: stats.count for name, stats in metric_stats.items()},
+            successful_items
+        )
+        end_time = datetime.now()
+        result = BatchResult(
+            batch_id=job_id,
+            dataset_name=dataset.name,
+            total_items=len(dataset),
+            successful_items=successful_items,
+            failed_items=failed_items,
+            results=item_results,
+            aggregated_metrics=aggregated_metrics,
+            duration_ms=(end_time - start_time).total_seconds() * 1000,
+            start_time=start_time.isoformat(),
+            end_time=end_time.isoformat(),
+            metadata={
+                **(metadata or {}),
+                "distributed": {
+                    "tasks": len(batches),
+                    "failed_tasks": len(failed),
+                    "speculative_tasks": speculated,
+                    "workers": len({result["worker_id"] for result in task_results.values()})
+                }
+            },
+            columns=columns
+        )
+        logger.info(f"Distributed evaluation completed: {job_id}, success_rate: {result.success_rate:.1f}%")
+        return result
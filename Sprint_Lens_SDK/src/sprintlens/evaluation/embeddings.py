@@ -0,0 +1,519 @@
+"""
+Local text embeddings for semantic similarity metrics.
+
+Encoders turn texts (or their tokens) into L2-normalized vectors on CPU:
+
+- SentenceTransformerEncoder: a small sentence-embedding model, used when
+  ``sentence-transformers`` is installed
+- HashingEncoder: signed feature hashing of words and character n-grams with
+  optional IDF weights; needs no downloads and is always available
+
+Embeddings are cached under a content hash of (encoder, text) in an
+in-memory LRU tier and an optional SQLite tier, so repeated evaluations over
+the same references never re-encode them. Similarity is computed as one
+matrix product per batch when numpy is available.
+
+Example:
+    >>> configure_embedding_cache("~/.cache/sprintlens/embeddings.db")
+    >>> vectors = embed_texts(["a cat", "a dog"], get_default_encoder())
+"""
+
+import hashlib
+import math
+import re
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+
+from .tiered_cache import CacheStats, TieredCache
+from ..utils.logging import get_logger
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+DEFAULT_SENTENCE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# A vector is a 1-D numpy array (or list of floats); a matrix is a 2-D
+# numpy array (or list of vectors), one row per token
+Vector = Any
+Matrix = Any
+
+
+def _normalize(values: List[float]) -> Vector:
+    norm = math.sqrt(sum(v * v for v in values))
+    if norm > 0:
+        values = [v / norm for v in values]
+    return np.asarray(values, dtype=np.float32) if NUMPY_AVAILABLE else values
+
+
+def _as_matrix(rows: List[Vector], dimension: int) -> Matrix:
+    if NUMPY_AVAILABLE:
+        return np.asarray(rows, dtype=np.float32).reshape(len(rows), dimension)
+    return [list(row) for row in rows]
+
+
+class TextEncoder(ABC):
+    """Turns texts into L2-normalized vectors."""
+
+    #: Identifies the encoder and its settings in cache keys
+    name: str = "encoder"
+    dimension: int = 0
+
+    @abstractmethod
+    def encode(self, texts: List[str]) -> List[Vector]:
+        """Encode a batch of texts, one vector per text."""
+        pass
+
+    @abstractmethod
+    def encode_tokens(self, texts: List[str]) -> List[Matrix]:
+        """Encode a batch of texts, one vector per token of each text."""
+        pass
+
+
+class HashingEncoder(TextEncoder):
+    """
+    Feature-hashing encoder over words and character n-grams.
+
+    Character n-grams of each word give related word forms ("evaluate",
+    "evaluation") overlapping vectors. Hashes are stable across processes
+    (CRC32), and a second hash bit picks the sign to offset collisions.
+    """
+
+    def __init__(
+        self,
+        dimension: int = 1024,
+        ngram_range: Tuple[int, int] = (3, 5),
+        lowercase: bool = True
+    ):
+        """
+        Initialize the encoder.
+
+        Args:
+            dimension: Number of hash buckets
+            ngram_range: Smallest and largest character n-gram size
+            lowercase: Lowercase texts before hashing
+        """
+        self.dimension = dimension
+        self.ngram_range = ngram_range
+        self.lowercase = lowercase
+        self.idf: Optional[Dict[int, float]] = None
+        self._idf_version = ""
+
+    @property
+    def name(self) -> str:
+        low, high = self.ngram_range
+        return f"hashing:{self.dimension}:{low}-{high}:{int(self.lowercase)}{self._idf_version}"
+
+    def _features(self, word: str) -> List[str]:
+        low, high = self.ngram_range
+        padded = f"<{word}>"
+        features = [word]
+        for n in range(low, high + 1):
+            features.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+        return features
+
+    def _accumulate(self, words: Sequence[str], values: List[float]) -> None:
+        for word in words:
+            for feature in self._features(word):
+                hashed = zlib.crc32(feature.encode("utf-8"))
+                bucket = hashed % self.dimension
+                weight = self.idf.get(bucket, 1.0) if self.idf else 1.0
+                values[bucket] += weight if hashed & 0x80000000 else -weight
+
+    def _words(self, text: str) -> List[str]:
+        return _WORD_PATTERN.findall(text.lower() if self.lowercase else text)
+
+    def fit_idf(self, texts: Sequence[str]) -> 'HashingEncoder':
+        """
+        Weight buckets by inverse document frequency over a corpus.
+
+        Args:
+            texts: Representative documents (e.g. the references)
+
+        Returns:
+            self
+        """
+        document_frequency: Dict[int, int] = {}
+        for text in texts:
+            buckets = {
+                zlib.crc32(feature.encode("utf-8")) % self.dimension
+                for word in self._words(text) for feature in self._features(word)
+            }
+            for bucket in buckets:
+                document_frequency[bucket] = document_frequency.get(bucket, 0) + 1
+        total = len(texts)
+        self.idf = {bucket: math.log((1 + total) / (1 + df)) + 1.0 for bucket, df in document_frequency.items()}
+        digest = hashlib.sha256(repr(sorted(self.idf.items())).encode("utf-8")).hexdigest()[:12]
+        self._idf_version = f":idf-{digest}"
+        return self
+
+    def encode(self, texts: List[str]) -> List[Vector]:
+        vectors = []
+        for text in texts:
+            values = [0.0] * self.dimension
+            self._accumulate(self._words(text), values)
+            vectors.append(_normalize(values))
+        return vectors
+
+    def encode_tokens(self, texts: List[str]) -> List[Matrix]:
+        matrices = []
+        for text in texts:
+            rows = []
+            for word in self._words(text):
+                values = [0.0] * self.dimension
+                self._accumulate((word,), values)
+                rows.append(_normalize(values))
+            matrices.append(_as_matrix(rows, self.dimension))
+        return matrices
+
+
+class SentenceTransformerEncoder(TextEncoder):
+    """Local sentence-transformers model run on CPU."""
+
+    def __init__(self, model_name: str = DEFAULT_SENTENCE_MODEL, batch_size: int = 32, device: str = "cpu"):
+        """
+        Initialize the encoder.
+
+        Args:
+            model_name: sentence-transformers model name or path
+            batch_size: Texts encoded per forward pass
+            device: Torch device
+        """
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError(
+                "sentence-transformers is required for SentenceTransformerEncoder. "
+                "Install with: pip install sentence-transformers"
+            )
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model = SentenceTransformer(model_name, device=device)
+        self.dimension = self._model.get_sentence_embedding_dimension()
+
+    @property
+    def name(self) -> str:
+        return f"st:{self.model_name}"
+
+    def encode(self, texts: List[str]) -> List[Vector]:
+        embeddings = self._model.encode(
+            texts, batch_size=self.batch_size, normalize_embeddings=True, convert_to_numpy=True
+        )
+        return list(embeddings.astype(np.float32))
+
+    def encode_tokens(self, texts: List[str]) -> List[Matrix]:
+        outputs = self._model.encode(texts, batch_size=self.batch_size, output_value="token_embeddings")
+        matrices = []
+        for tokens in outputs:
+            matrix = tokens.cpu().numpy().astype(np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrices.append(matrix / np.where(norms > 0, norms, 1.0))
+        return matrices
+
+
+def get_default_encoder(model_name: Optional[str] = None) -> TextEncoder:
+    """
+    Best available local encoder.
+
+    Args:
+        model_name: sentence-transformers model to load when installed
+
+    Returns:
+        SentenceTransformerEncoder, or HashingEncoder when it is not installed
+    """
+    if SENTENCE_TRANSFORMERS_AVAILABLE:
+        try:
+            return SentenceTransformerEncoder(model_name or DEFAULT_SENTENCE_MODEL)
+        except Exception as e:
+            logger.warning(f"Could not load sentence-transformers model, using hashing encoder: {e}")
+    return HashingEncoder()
+
+
+def _to_blob(matrix: Matrix) -> Tuple[bytes, int]:
+    if NUMPY_AVAILABLE:
+        matrix = np.asarray(matrix, dtype=np.float32)
+        rows = 1 if matrix.ndim == 1 else matrix.shape[0]
+        return matrix.tobytes(), rows
+    if not matrix:
+        # Texts without tokens have empty token matrices
+        return b"", 0
+    if isinstance(matrix[0], (list, tuple, array)):
+        flat = array("f")
+        for row in matrix:
+            flat.extend(row)
+        return flat.tobytes(), len(matrix)
+    return array("f", matrix).tobytes(), 1
+
+
+def _from_blob(blob: bytes, rows: int, dimension: int, token_level: bool) -> Any:
+    if NUMPY_AVAILABLE:
+        values = np.frombuffer(blob, dtype=np.float32)
+        return values.reshape(rows, dimension) if token_level else values
+    values = array("f")
+    values.frombytes(blob)
+    values = values.tolist()
+    if not token_level:
+        return values
+    return [values[i * dimension:(i + 1) * dimension] for i in range(rows)]
+
+
+@dataclass
+class EmbeddingCacheStats(CacheStats):
+    """Cache hit/miss counters."""
+
+
+class EmbeddingCache(TieredCache):
+    """Content-hash keyed embedding cache with memory and SQLite tiers."""
+
+    table = "embeddings"
+    columns = "key TEXT PRIMARY KEY, rows INTEGER NOT NULL, dimension INTEGER NOT NULL, data BLOB NOT NULL"
+
+    def __init__(self, path: Union[str, Path, None] = None, max_memory_entries: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (None for a memory-only cache)
+            max_memory_entries: Size of the in-memory LRU tier
+        """
+        super().__init__(path, max_memory_entries)
+        self.stats = EmbeddingCacheStats()
+
+    @staticmethod
+    def key(encoder: TextEncoder, text: str, token_level: bool = False) -> str:
+        """Content hash of an encoder, granularity and text."""
+        kind = "tokens" if token_level else "text"
+        return hashlib.sha256(f"{encoder.name}\0{kind}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Sequence[str], token_level: bool = False) -> Dict[str, Any]:
+        """
+        Look up several embeddings.
+
+        Args:
+            keys: Cache keys (see EmbeddingCache.key)
+            token_level: Whether the entries are token matrices
+
+        Returns:
+            Mapping of the keys found to their embeddings
+        """
+        found: Dict[str, Any] = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                value = self._recall(key)
+                if value is not None:
+                    found[key] = value
+                    self.stats.memory_hits += 1
+                else:
+                    missing.append(key)
+
+            if self._conn is not None and missing:
+                # Stay under SQLite's bound-parameter limit
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start:start + 500]
+                    rows = self._conn.execute(
+                        f"SELECT key, rows, dimension, data FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                    for key, count, dimension, blob in rows:
+                        value = _from_blob(blob, count, dimension, token_level)
+                        self._remember(key, value)
+                        found[key] = value
+                        self.stats.disk_hits += 1
+
+            self.stats.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, entries: Dict[str, Any], dimension: int) -> None:
+        """
+        Store several embeddings.
+
+        Args:
+            entries: Mapping of cache key to vector or token matrix
+            dimension: Embedding dimension
+        """
+        with self._lock:
+            for key, value in entries.items():
+                self._remember(key, value)
+            self.stats.writes += len(entries)
+            if self._conn is None:
+                return
+            rows = []
+            for key, value in entries.items():
+                blob, count = _to_blob(value)
+                rows.append((key, count, dimension, blob))
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, rows, dimension, data) VALUES (?, ?, ?, ?)", rows
+                )
+
+
+def _embed(
+    texts: Sequence[str],
+    encoder: TextEncoder,
+    cache: Optional[EmbeddingCache],
+    batch_size: int,
+    token_level: bool
+) -> List[Any]:
+    """Embed unique texts once, serving what it can from the cache."""
+    cache = cache if cache is not None else get_embedding_cache()
+    unique = list(dict.fromkeys(texts))
+    embedded: Dict[str, Any] = {}
+
+    if cache is not None:
+        keys = {text: EmbeddingCache.key(encoder, text, token_level) for text in unique}
+        found = cache.get_many(list(keys.values()), token_level)
+        embedded = {text: found[key] for text, key in keys.items() if key in found}
+
+    pending = [text for text in unique if text not in embedded]
+    encode = encoder.encode_tokens if token_level else encoder.encode
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        vectors = encode(batch)
+        fresh = dict(zip(batch, vectors))
+        embedded.update(fresh)
+        if cache is not None:
+            cache.set_many(
+                {EmbeddingCache.key(encoder, text, token_level): vector for text, vector in fresh.items()},
+                encoder.dimension
+            )
+    return [embedded[text] for text in texts]
+
+
+def embed_texts(
+    texts: Sequence[str],
+    encoder: TextEncoder,
+    cache: Optional[EmbeddingCache] = None,
+    batch_size: int = 64
+) -> List[Vector]:
+    """
+    One normalized vector per text.
+
+    Args:
+        texts: Texts to embed (duplicates are encoded once)
+        encoder: Encoder to use
+        cache: Embedding cache (defaults to the global cache, if configured)
+        batch_size: Texts per encoder call
+
+    Returns:
+        Vectors in input order
+    """
+    return _embed(texts, encoder, cache, batch_size, token_level=False)
+
+
+def embed_tokens(
+    texts: Sequence[str],
+    encoder: TextEncoder,
+    cache: Optional[EmbeddingCache] = None,
+    batch_size: int = 64
+) -> List[Matrix]:
+    """
+    One normalized token matrix per text.
+
+    Args:
+        texts: Texts to embed (duplicates are encoded once)
+        encoder: Encoder to use
+        cache: Embedding cache (defaults to the global cache, if configured)
+        batch_size: Texts per encoder call
+
+    Returns:
+        Token matrices in input order
+    """
+    return _embed(texts, encoder, cache, batch_size, token_level=True)
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+def paired_cosine_similarity(left: Sequence[Vector], right: Sequence[Vector]) -> List[float]:
+    """
+    Cosine similarity of aligned pairs of normalized vectors.
+
+    Args:
+        left: Vectors
+        right: Vectors, aligned with ``left``
+
+    Returns:
+        One similarity per pair
+    """
+    if not left:
+        return []
+    if NUMPY_AVAILABLE:
+        return np.einsum("ij,ij->i", np.asarray(left), np.asarray(right)).astype(float).tolist()
+    return [_dot(a, b) for a, b in zip(left, right)]
+
+
+def greedy_match(candidate: Matrix, reference: Matrix) -> Tuple[float, float, float]:
+    """
+    BERTScore-style greedy matching of token embeddings.
+
+    Every candidate token is matched to its most similar reference token
+    (precision) and vice versa (recall).
+
+    Args:
+        candidate: Normalized candidate token matrix
+        reference: Normalized reference token matrix
+
+    Returns:
+        (precision, recall, f1)
+    """
+    if len(candidate) == 0 or len(reference) == 0:
+        return 0.0, 0.0, 0.0
+    if NUMPY_AVAILABLE:
+        similarity = np.asarray(candidate) @ np.asarray(reference).T
+        precision = float(similarity.max(axis=1).mean())
+        recall = float(similarity.max(axis=0).mean())
+    else:
+        similarity = [[_dot(c, r) for r in reference] for c in candidate]
+        precision = sum(max(row) for row in similarity) / len(candidate)
+        recall = sum(max(column) for column in zip(*similarity)) / len(reference)
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall > 0 else 0.0
+    return precision, recall, f1
+
+
+# Global embedding cache (disabled unless configured)
+_global_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def configure_embedding_cache(
+    path: Union[str, Path, None] = None,
+    enabled: bool = True,
+    **kwargs
+) -> Optional[EmbeddingCache]:
+    """
+    Enable the global embedding cache used by metrics without their own cache.
+
+    Args:
+        path: SQLite database file (None for a memory-only cache)
+        enabled: Pass False to disable the global cache
+        **kwargs: Additional EmbeddingCache parameters
+
+    Returns:
+        The active cache, or None when disabled
+    """
+    global _global_embedding_cache
+    if _global_embedding_cache is not None:
+        _global_embedding_cache.close()
+    _global_embedding_cache = EmbeddingCache(path, **kwargs) if enabled else None
+    return _global_embedding_cache
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Get the global embedding cache, if configured."""
+    return _global_embedding_cache
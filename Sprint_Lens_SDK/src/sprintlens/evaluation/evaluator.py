@@ -3,12 +3,18 @@ Core evaluator class for Sprint Lens evaluation framework.
 """
 
 import asyncio
+import contextvars
+import functools
+import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union, Callable, Awaitable
+from typing import List, Dict, Any, Optional, Union, Callable, Awaitable, Iterable
 from dataclasses import dataclass, field
 
 from .metrics import BaseMetric, MetricResult
+from .metrics.confusion import shared_confusion_matrices
 from ..tracing.trace import Trace
 from ..tracing.types import SpanType
 from ..utils.logging import get_logger
@@ -71,7 +77,11 @@ class Evaluator:
         self, 
         metrics: List[BaseMetric],
         trace: Optional[Trace] = None,
-        evaluation_name: Optional[str] = None
+        evaluation_name: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        metric_timeout: Union[float, Dict[str, float], None] = None,
+        max_workers: Optional[int] = None,
+        fuse_judges: bool = False
     ):
         """
         Initialize evaluator with metrics.
@@ -80,13 +90,56 @@ class Evaluator:
             metrics: List of metric instances to evaluate
             trace: Optional trace to capture evaluation steps
             evaluation_name: Human-readable name for this evaluation
+            max_concurrency: Maximum metrics evaluated at once (None for all)
+            metric_timeout: Timeout in seconds for every metric, or a mapping
+                of metric name to timeout
+            max_workers: Size of the thread pool used for synchronous metrics
+            fuse_judges: Score compatible LLM judge metrics sharing a custom
+                model with one fused prompt per item (see judge_fusion)
         """
         self.metrics = {metric.name: metric for metric in metrics}
         self.trace = trace
         self.evaluation_name = evaluation_name or "evaluation"
+        self.max_concurrency = max_concurrency
+        self.metric_timeout = metric_timeout
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 2)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        if fuse_judges:
+            from .judge_fusion import fuse_judge_metrics
+            fuse_judge_metrics(self.metrics.values())
         
         logger.debug(f"Initialized evaluator with {len(self.metrics)} metrics")
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Dedicated thread pool for synchronous metrics (created lazily)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="sprintlens-metric"
+            )
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the metric thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def get_timeout(self, metric_name: str) -> Optional[float]:
+        """
+        Timeout for a metric, if any.
+
+        Args:
+            metric_name: Name of the metric
+
+        Returns:
+            Seconds allowed per metric call, or None for no limit
+        """
+        if isinstance(self.metric_timeout, dict):
+            return self.metric_timeout.get(metric_name)
+        return self.metric_timeout
+    
     def add_metric(self, metric: BaseMetric) -> None:
         """Add a metric to the evaluator."""
         self.metrics[metric.name] = metric
@@ -163,34 +216,21 @@ class Evaluator:
             })
         
         try:
-            # Run all metrics
-            metric_results = {}
+            # Run all metrics concurrently; failures and timeouts are isolated per metric
+            semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
             
-            # Execute metrics in parallel for better performance
-            tasks = []
-            for metric_name, metric in self.metrics.items():
-                task = self._evaluate_metric_async(
-                    metric, predictions, ground_truth, eval_trace
-                )
-                tasks.append((metric_name, task))
+            async def run_metric(metric: BaseMetric) -> MetricResult:
+                if semaphore is None:
+                    return await self._run_isolated(metric, predictions, ground_truth, eval_trace)
+                async with semaphore:
+                    return await self._run_isolated(metric, predictions, ground_truth, eval_trace)
             
-            # Wait for all metrics to complete
-            for metric_name, task in tasks:
-                try:
-                    result = await task
-                    metric_results[metric_name] = result
-                    
-                    logger.debug(f"Metric {metric_name} completed: {result.value}")
-                    
-                except Exception as e:
-                    logger.error(f"Metric {metric_name} failed: {str(e)}")
-                    # Create error result
-                    metric_results[metric_name] = MetricResult(
-                        name=metric_name,
-                        value=0.0,
-                        error=str(e),
-                        details={"error": True, "exception": str(e)}
-                    )
+            # Classification metrics over the same inputs share one confusion matrix
+            with shared_confusion_matrices():
+                results = await asyncio.gather(*(
+                    run_metric(metric) for metric in self.metrics.values()
+                ))
+            metric_results = dict(zip(self.metrics.keys(), results))
             
             # Calculate overall score (average of all metrics)
             valid_scores = [
@@ -238,6 +278,44 @@ class Evaluator:
             if eval_trace:
                 eval_trace.__exit__(None, None, None)
     
+    async def _run_isolated(
+        self,
+        metric: BaseMetric,
+        predictions: List[Any],
+        ground_truth: List[Any],
+        parent_span=None
+    ) -> MetricResult:
+        """Evaluate one metric, turning timeouts and exceptions into error results."""
+        timeout = self.get_timeout(metric.name)
+        start_time = time.time()
+        try:
+            result = await asyncio.wait_for(
+                self._evaluate_metric_async(metric, predictions, ground_truth, parent_span),
+                timeout=timeout
+            )
+            logger.debug(f"Metric {metric.name} completed: {result.value}")
+            return result
+            
+        except asyncio.TimeoutError:
+            logger.error(f"Metric {metric.name} timed out after {timeout}s")
+            return MetricResult(
+                name=metric.name,
+                value=None,
+                error=f"Metric timed out after {timeout}s",
+                details={"error": True, "timeout": timeout},
+                duration_ms=(time.time() - start_time) * 1000
+            )
+            
+        except Exception as e:
+            logger.error(f"Metric {metric.name} failed: {str(e)}")
+            return MetricResult(
+                name=metric.name,
+                value=None,
+                error=str(e),
+                details={"error": True, "exception": str(e)},
+                duration_ms=(time.time() - start_time) * 1000
+            )
+    
     async def _evaluate_metric_async(
         self, 
         metric: BaseMetric, 
@@ -262,13 +340,15 @@ class Evaluator:
             })
         
         try:
-            # Check if metric supports async evaluation
-            if hasattr(metric, 'evaluate_async') and callable(getattr(metric, 'evaluate_async')):
+            # Metrics that only implement evaluate() would block the event loop
+            # through BaseMetric.evaluate_async, so run them on the metric pool
+            if type(metric).evaluate_async is not BaseMetric.evaluate_async:
                 result = await metric.evaluate_async(predictions, ground_truth)
             else:
-                # Run synchronous metric in thread pool
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, metric.evaluate, predictions, ground_truth
+                # Copy the context so the metric sees scoped state (shared matrices, priority)
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(),
+                    functools.partial(contextvars.copy_context().run, metric.evaluate, predictions, ground_truth)
                 )
             
             if metric_span:
@@ -327,6 +407,98 @@ class Evaluator:
         """
         return await self.evaluate_async([prediction], [ground_truth], metadata=metadata)
     
+    async def evaluate_batch_async(
+        self,
+        predictions: List[Any],
+        ground_truth: List[Any],
+        metric_names: Optional[Iterable[str]] = None
+    ) -> Dict[str, List[MetricResult]]:
+        """
+        Evaluate a batch of items, scoring every item separately.
+        
+        Each metric receives the whole batch through its batch interface.
+        Metrics run concurrently with the same concurrency limit, timeouts and
+        failure isolation as evaluate_async(); a metric that fails or times
+        out yields an error result for every item.
+        
+        Args:
+            predictions: List of predicted values
+            ground_truth: List of ground truth values
+            metric_names: Only run these metrics (default: all)
+            
+        Returns:
+            Mapping of metric name to per-item results, aligned with the inputs
+        """
+        if len(predictions) != len(ground_truth):
+            raise ValueError("Predictions and ground truth must have same length")
+        
+        metrics = self.metrics if metric_names is None else {
+            name: self.metrics[name] for name in metric_names
+        }
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        
+        async def run_metric(metric: BaseMetric) -> List[MetricResult]:
+            if semaphore is None:
+                return await self._run_batch_isolated(metric, predictions, ground_truth)
+            async with semaphore:
+                return await self._run_batch_isolated(metric, predictions, ground_truth)
+        
+        results = await asyncio.gather(*(
+            run_metric(metric) for metric in metrics.values()
+        ))
+        return dict(zip(metrics.keys(), results))
+    
+    async def _run_batch_isolated(
+        self,
+        metric: BaseMetric,
+        predictions: List[Any],
+        ground_truth: List[Any]
+    ) -> List[MetricResult]:
+        """Evaluate one metric over a batch, isolating timeouts and exceptions."""
+        timeout = self.get_timeout(metric.name)
+        start_time = time.time()
+        try:
+            # Metrics without async support would block the event loop, so run
+            # their batch evaluation on the metric pool
+            if (type(metric).evaluate_batch_async is not BaseMetric.evaluate_batch_async
+                    or type(metric).evaluate_async is not BaseMetric.evaluate_async):
+                batch = metric.evaluate_batch_async(predictions, ground_truth)
+            else:
+                batch = asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(),
+                    functools.partial(contextvars.copy_context().run, metric.evaluate_batch, predictions, ground_truth)
+                )
+            results = await asyncio.wait_for(batch, timeout=timeout)
+            
+            if len(results) != len(predictions):
+                raise ValueError(
+                    f"Metric returned {len(results)} results for {len(predictions)} items"
+                )
+            return list(results)
+            
+        except asyncio.TimeoutError:
+            logger.error(f"Metric {metric.name} timed out after {timeout}s")
+            error = f"Metric timed out after {timeout}s"
+            details: Dict[str, Any] = {"error": True, "timeout": timeout}
+            
+        except Exception as e:
+            logger.error(f"Metric {metric.name} failed: {str(e)}")
+            error = str(e)
+            details = {"error": True, "exception": str(e)}
+        
+        duration_ms = (time.time() - start_time) * 1000
+        return [
+            MetricResult(
+                name=metric.name,
+                value=None,
+                error=error,
+                details=dict(details),
+                duration_ms=duration_ms
+            )
+            for _ in predictions
+        ]
+    
     def get_metric_names(self) -> List[str]:
         """Get list of metric names in this evaluator."""
         return list(self.metrics.keys())
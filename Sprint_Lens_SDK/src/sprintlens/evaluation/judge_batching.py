@@ -0,0 +1,329 @@
+"""
+Micro-batching of LLM judge items.
+
+Short judge requests (a QA pair, a one-line summary) are dominated by
+per-request overhead and queueing. A JudgeMicroBatcher collects concurrent
+item prompts for a few milliseconds and packs up to ``max_items`` of them,
+bounded by a prompt token budget, into a single judge call with indexed
+items. The response is validated against the expected item ids; only the
+items that are missing or malformed are asked again, and anything still
+missing after that is judged on its own.
+
+Example:
+    >>> batcher = enable_micro_batching([RelevanceMetric(llm_provider=p), FluencyMetric(llm_provider=p)])
+    >>> await BatchEvaluator(Evaluator(metrics)).evaluate_dataset_async(dataset)
+    >>> batcher.stats.items_per_call
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Callable, Awaitable, Hashable, Iterable, Tuple
+
+from .rate_limiter import estimate_tokens
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# send(prompt, max_tokens) -> str, or a response object with .content (and optionally .cost/.latency)
+JudgeSend = Callable[[str, Optional[int]], Awaitable[Any]]
+
+
+class JudgeBatchError(Exception):
+    """Raised for an item the judge did not answer."""
+    pass
+
+
+@dataclass
+class JudgeItemResponse:
+    """Judge answer for one item of a micro-batch."""
+    content: str
+    cost: float = 0.0
+    latency: float = 0.0
+    batch_size: int = 1
+
+
+@dataclass
+class MicroBatchStats:
+    """Counters for micro-batched judge calls."""
+    calls: int = 0
+    packed_calls: int = 0
+    items: int = 0
+    reasked_items: int = 0
+    single_fallbacks: int = 0
+
+    @property
+    def items_per_call(self) -> float:
+        """Average number of items answered per judge call."""
+        return self.items / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {**asdict(self), "items_per_call": self.items_per_call}
+
+
+def build_batch_prompt(prompts: List[str], ids: List[int]) -> str:
+    """
+    Pack item prompts into one indexed prompt.
+
+    Args:
+        prompts: Self-contained evaluation prompt of every item
+        ids: Item ids to use in the prompt and expect in the response
+
+    Returns:
+        Prompt asking for a JSON array with one entry per item
+    """
+    sections = "\n\n".join(f"### Item {item_id}\n{prompt.strip()}" for item_id, prompt in zip(ids, prompts))
+    return f"""Evaluate each of the following {len(prompts)} items independently. Every item has its own instructions.
+
+{sections}
+
+Respond with a JSON array containing exactly {len(prompts)} objects, one per item, in the form
+{{"id": <item id>, "response": "<your complete answer to that item, in the format it asks for>"}}.
+"""
+
+
+def parse_batch_response(content: str, ids: Iterable[int]) -> Dict[int, str]:
+    """
+    Parse a packed judge response.
+
+    Accepts a JSON array of {"id", "response"} objects, optionally wrapped in
+    an object under "results" or "items". Entries with unknown or repeated
+    ids are ignored.
+
+    Args:
+        content: Raw model response
+        ids: Item ids that were asked for
+
+    Returns:
+        Mapping of item id to that item's answer
+    """
+    expected = set(ids)
+    start = min((i for i in (content.find("["), content.find("{")) if i != -1), default=-1)
+    end = max(content.rfind("]"), content.rfind("}"))
+    if start == -1 or end <= start:
+        return {}
+    try:
+        parsed = json.loads(content[start:end + 1])
+    except (json.JSONDecodeError, ValueError):
+        return {}
+    if isinstance(parsed, dict):
+        parsed = parsed.get("results", parsed.get("items"))
+    if not isinstance(parsed, list):
+        return {}
+
+    answers: Dict[int, str] = {}
+    seen = set()
+    for entry in parsed:
+        if not isinstance(entry, dict) or "response" not in entry:
+            continue
+        try:
+            item_id = int(entry.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if item_id not in expected or item_id in seen:
+            answers.pop(item_id, None)
+            seen.add(item_id)
+            continue
+        seen.add(item_id)
+        response = entry["response"]
+        answers[item_id] = response if isinstance(response, str) else json.dumps(response)
+
+    if len(parsed) != len(expected):
+        logger.debug(f"Judge returned {len(parsed)} entries for {len(expected)} items")
+    return answers
+
+
+class _PendingBatch:
+    """Item prompts waiting to be packed into one judge call."""
+
+    def __init__(self, send: JudgeSend, max_tokens: Optional[int]):
+        self.send = send
+        self.max_tokens = max_tokens
+        self.items: List[Tuple[str, asyncio.Future]] = []
+        self.tokens = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.closed = False
+
+
+class JudgeMicroBatcher:
+    """
+    Packs concurrent judge items into fewer, larger requests.
+
+    Items are grouped by a caller-provided key (items with different
+    system prompts, models or parameters must not share a call). A group
+    is sent when it reaches ``max_items`` or ``max_prompt_tokens``, or
+    ``window`` seconds after its first item arrived.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 8,
+        max_prompt_tokens: int = 4000,
+        window: float = 0.01,
+        max_reasks: int = 1
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_items: Maximum items packed into one judge call
+            max_prompt_tokens: Estimated prompt token budget per call
+            window: Seconds to wait for more items after the first one
+            max_reasks: Packed re-asks for items missing from a response
+                before they are judged one by one
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self.max_items = max_items
+        self.max_prompt_tokens = max_prompt_tokens
+        self.window = window
+        self.max_reasks = max_reasks
+        self.stats = MicroBatchStats()
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self._tasks = set()
+
+    async def submit(
+        self,
+        prompt: str,
+        send: JudgeSend,
+        key: Hashable = None,
+        max_tokens: Optional[int] = None
+    ) -> JudgeItemResponse:
+        """
+        Judge one item, possibly packed with other items of the same key.
+
+        Args:
+            prompt: Self-contained evaluation prompt of the item
+            send: Coroutine function sending a prompt to the judge
+            key: Items are only packed with items of an equal key
+            max_tokens: Completion token limit for a single item
+
+        Returns:
+            The judge's answer for this item
+        """
+        tokens = estimate_tokens([{"content": prompt}])
+        batch = self._pending.get(key)
+        if batch is not None and (
+            len(batch.items) >= self.max_items
+            or (batch.items and batch.tokens + tokens > self.max_prompt_tokens)
+        ):
+            self._flush(key, batch)
+            batch = None
+        if batch is None:
+            batch = _PendingBatch(send, max_tokens)
+            batch.timer = asyncio.get_running_loop().call_later(self.window, self._flush, key, batch)
+            self._pending[key] = batch
+
+        future = asyncio.get_running_loop().create_future()
+        batch.items.append((prompt, future))
+        batch.tokens += tokens
+        if len(batch.items) >= self.max_items:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: Hashable, batch: _PendingBatch) -> None:
+        """Close a batch and send it in the background."""
+        if batch.closed:
+            return
+        batch.closed = True
+        batch.timer.cancel()
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _call(self, batch: _PendingBatch, prompt: str, items: int) -> Tuple[str, float, float]:
+        """Send one prompt; returns content, cost and latency."""
+        max_tokens = batch.max_tokens * items if batch.max_tokens else batch.max_tokens
+        start = time.perf_counter()
+        response = await batch.send(prompt, max_tokens)
+        elapsed = time.perf_counter() - start
+        self.stats.calls += 1
+        content = getattr(response, "content", response)
+        cost = getattr(response, "cost", None) or 0.0
+        latency = getattr(response, "latency", None) or elapsed
+        return content if isinstance(content, str) else str(content), cost, latency
+
+    async def _run(self, batch: _PendingBatch) -> None:
+        """Judge a closed batch and resolve the waiting items."""
+        prompts = [prompt for prompt, _ in batch.items]
+        futures = [future for _, future in batch.items]
+        missing = list(range(len(prompts)))
+
+        try:
+            attempt = 0
+            while len(missing) > 1 and attempt <= self.max_reasks:
+                if attempt:
+                    self.stats.reasked_items += len(missing)
+                ids = [i + 1 for i in missing]
+                content, cost, latency = await self._call(batch, build_batch_prompt([prompts[i] for i in missing], ids), len(missing))
+                self.stats.packed_calls += 1
+                answers = parse_batch_response(content, ids)
+                for i in missing:
+                    if i + 1 in answers:
+                        self._resolve(futures[i], JudgeItemResponse(
+                            content=answers[i + 1],
+                            cost=cost / len(answers),
+                            latency=latency,
+                            batch_size=len(missing)
+                        ))
+                missing = [i for i in missing if i + 1 not in answers]
+                attempt += 1
+
+            if missing:
+                if len(prompts) > 1:
+                    self.stats.single_fallbacks += len(missing)
+                results = await asyncio.gather(
+                    *(self._call(batch, prompts[i], 1) for i in missing), return_exceptions=True
+                )
+                for i, result in zip(missing, results):
+                    if isinstance(result, BaseException):
+                        self._reject(futures[i], result)
+                    else:
+                        content, cost, latency = result
+                        self._resolve(futures[i], JudgeItemResponse(content, cost, latency, 1))
+        except Exception as e:
+            for future in futures:
+                self._reject(future, e)
+
+    def _resolve(self, future: asyncio.Future, response: JudgeItemResponse) -> None:
+        if not future.done():
+            self.stats.items += 1
+            future.set_result(response)
+
+    def _reject(self, future: asyncio.Future, error: BaseException) -> None:
+        if not future.done():
+            future.set_exception(error)
+
+
+def enable_micro_batching(
+    metrics: Iterable[Any],
+    batcher: Optional[JudgeMicroBatcher] = None,
+    **kwargs
+) -> JudgeMicroBatcher:
+    """
+    Attach a shared micro-batcher to LLM judge metrics.
+
+    Applies to LLMBasedMetric subclasses and to advanced metrics judged by
+    a custom model. Items are only packed when they are evaluated
+    concurrently, e.g. per item through BatchEvaluator.
+
+    Args:
+        metrics: Metrics to batch
+        batcher: Batcher to share (created from kwargs if omitted)
+        **kwargs: JudgeMicroBatcher parameters
+
+    Returns:
+        The shared batcher
+    """
+    batcher = batcher or JudgeMicroBatcher(**kwargs)
+    for metric in metrics:
+        client = getattr(metric, "metrics_client", None)
+        if client is not None and hasattr(client, "batcher"):
+            client.batcher = batcher
+        elif hasattr(metric, "batcher"):
+            metric.batcher = batcher
+    return batcher
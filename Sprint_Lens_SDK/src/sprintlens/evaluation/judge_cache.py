@@ -0,0 +1,315 @@
+"""
+Persistent response cache for LLM-as-judge metrics.
+
+Judge responses are cached under a stable hash of everything that affects
+them: model, provider parameters, rendered prompt and metric version. An
+in-memory LRU tier sits in front of an optional SQLite tier with TTL and
+size limits, so re-running a regression suite only pays for the items that
+actually changed.
+
+Example:
+    >>> configure_judge_cache("~/.cache/sprintlens/judge.db", ttl=7 * 86400)
+    >>> # LLM-based and advanced metrics now reuse identical judge calls
+    >>> get_judge_cache().stats.hit_rate
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, Any, Union, Callable, Awaitable
+
+from .tiered_cache import CacheStats, TieredCache
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def judge_cache_key(
+    model: Optional[str],
+    provider: Optional[str],
+    prompt: Any,
+    metric: str,
+    metric_version: str = "1",
+    params: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Stable cache key for a judge request.
+
+    Args:
+        model: Judge model name
+        provider: Provider name or class
+        prompt: Rendered prompt (string, message list or request payload)
+        metric: Metric name
+        metric_version: Version of the metric's prompt and parsing
+        params: Provider parameters affecting the response (temperature, ...)
+
+    Returns:
+        Hex digest
+    """
+    encoded = json.dumps(
+        {
+            "model": model,
+            "provider": provider,
+            "params": params or {},
+            "prompt": prompt,
+            "metric": metric,
+            "metric_version": metric_version,
+        },
+        sort_keys=True,
+        default=str,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def judge_provider_id(provider: Any) -> str:
+    """
+    Identify a judge provider for cache keys.
+
+    Two instances of the same provider class can talk to different servers
+    or default models, so the endpoint and default model are part of the
+    identity, not just the class name.
+
+    Args:
+        provider: LLM provider or custom judge model
+
+    Returns:
+        Provider identity string
+    """
+    config = getattr(provider, "config", None)
+    config = config if isinstance(config, dict) else {}
+    base_url = getattr(provider, "base_url", None) or config.get("base_url")
+    model = getattr(provider, "model", None) or getattr(provider, "model_name", None)
+    return json.dumps(
+        [type(provider).__name__, base_url, model if isinstance(model, str) else None],
+        separators=(",", ":")
+    )
+
+
+@dataclass
+class JudgeCacheStats(CacheStats):
+    """Cache hit/miss counters, plus evictions and expiries."""
+    evictions: int = 0
+    expired: int = 0
+
+
+class JudgeCache(TieredCache):
+    """
+    Two-tier cache for judge responses.
+
+    Values must be JSON-serializable. Only successful responses should be
+    stored; callers skip caching on errors.
+    """
+
+    table = "judge_cache"
+    columns = (
+        "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+        "created_at REAL NOT NULL, accessed_at REAL NOT NULL"
+    )
+    indexes = ("CREATE INDEX IF NOT EXISTS judge_cache_accessed ON judge_cache (accessed_at)",)
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        ttl: Optional[float] = None,
+        max_memory_entries: int = 1024,
+        max_disk_entries: Optional[int] = None,
+        max_disk_bytes: Optional[int] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (None for a memory-only cache)
+            ttl: Seconds an entry stays valid (None for no expiry)
+            max_memory_entries: Size of the in-memory LRU tier
+            max_disk_entries: Maximum entries kept on disk
+            max_disk_bytes: Maximum total size of cached values on disk
+        """
+        super().__init__(path, max_memory_entries)
+        self.ttl = ttl
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = JudgeCacheStats()
+        # Shared by every thread and event loop using the cache
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and now - created_at > self.ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key (see judge_cache_key)
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._recall(key)
+            if entry is not None:
+                if not self._is_expired(entry[1], now):
+                    self.stats.memory_hits += 1
+                    return entry[0]
+                del self._memory[key]
+                self.stats.expired += 1
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM judge_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    if not self._is_expired(row[1], now):
+                        with self._conn:
+                            self._conn.execute(
+                                "UPDATE judge_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                            )
+                        value = json.loads(row[0])
+                        self._remember(key, (value, row[1]))
+                        self.stats.disk_hits += 1
+                        return value
+                    with self._conn:
+                        self._conn.execute("DELETE FROM judge_cache WHERE key = ?", (key,))
+                    self.stats.expired += 1
+
+            self.stats.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key (see judge_cache_key)
+            value: JSON-serializable value
+        """
+        now = time.time()
+        with self._lock:
+            self._remember(key, (value, now))
+            self.stats.writes += 1
+            if self._conn is None:
+                return
+            encoded = json.dumps(value, default=str)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO judge_cache (key, value, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, encoded, len(encoded), now, now)
+                )
+                self._enforce_limits(now)
+
+    def _enforce_limits(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the limits."""
+        conn = self._conn
+        if self.ttl is not None:
+            cursor = conn.execute("DELETE FROM judge_cache WHERE created_at < ?", (now - self.ttl,))
+            self.stats.expired += cursor.rowcount
+
+        if self.max_disk_entries is not None:
+            count = conn.execute("SELECT COUNT(*) FROM judge_cache").fetchone()[0]
+            excess = count - self.max_disk_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM judge_cache WHERE key IN ("
+                    "SELECT key FROM judge_cache ORDER BY accessed_at LIMIT ?)", (excess,)
+                )
+                self.stats.evictions += excess
+
+        if self.max_disk_bytes is not None:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM judge_cache").fetchone()[0]
+            if total > self.max_disk_bytes:
+                rows = conn.execute("SELECT key, size FROM judge_cache ORDER BY accessed_at").fetchall()
+                evict = []
+                for key, size in rows:
+                    if total <= self.max_disk_bytes:
+                        break
+                    evict.append((key,))
+                    total -= size
+                conn.executemany("DELETE FROM judge_cache WHERE key = ?", evict)
+                self.stats.evictions += len(evict)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        should_cache: Callable[[Any], bool] = lambda value: True
+    ) -> Any:
+        """
+        Return a cached value or compute and store it.
+
+        Concurrent calls for the same key share a single computation, so
+        duplicate items in one batch cost one judge call. This also holds
+        across threads running their own event loops.
+
+        Args:
+            key: Cache key (see judge_cache_key)
+            compute: Coroutine function producing the value
+            should_cache: Whether a computed value may be stored
+
+        Returns:
+            Cached or computed value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future: concurrent.futures.Future = concurrent.futures.Future()
+                self._inflight[key] = future
+        if inflight is not None:
+            # Shielded so a cancelled waiter does not cancel the shared computation
+            return await asyncio.shield(asyncio.wrap_future(inflight))
+
+        try:
+            value = await compute()
+            if should_cache(value):
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+# Global judge cache (disabled unless configured)
+_global_judge_cache: Optional[JudgeCache] = None
+
+
+def configure_judge_cache(
+    path: Union[str, Path, None] = None,
+    enabled: bool = True,
+    **kwargs
+) -> Optional[JudgeCache]:
+    """
+    Enable the global judge cache used by metrics without their own cache.
+
+    Args:
+        path: SQLite database file (None for a memory-only cache)
+        enabled: Pass False to disable the global cache
+        **kwargs: Additional JudgeCache parameters
+
+    Returns:
+        The active cache, or None when disabled
+    """
+    global _global_judge_cache
+    if _global_judge_cache is not None:
+        _global_judge_cache.close()
+    _global_judge_cache = JudgeCache(path, **kwargs) if enabled else None
+    return _global_judge_cache
+
+
+def get_judge_cache() -> Optional[JudgeCache]:
+    """Get the global judge cache, if enabled."""
+    return _global_judge_cache
@@ -0,0 +1,425 @@
+"""
+Multi-metric prompt fusion for LLM-as-judge metrics.
+
+When several judge metrics score the same output with the same custom
+model, each item normally costs one judge call per metric, re-sending the
+same output and context every time. A JudgeFusionClient shared by those
+metrics coalesces their concurrent requests for an item into a single
+structured prompt, asks for one score and reason per metric in a JSON
+object, and hands every metric its usual per-call response. Metrics missing
+from the judge's answer (or an unparseable answer) fall back to separate
+calls.
+
+Example:
+    >>> judge = EvaluationModel(name="gpt-4o", custom_model=my_model)
+    >>> metrics = [UsefulnessMetric(model=judge), ModerationMetric(model=judge)]
+    >>> fuse_judge_metrics(metrics)
+    >>> result = await Evaluator(metrics).evaluate_async(predictions, ground_truth)
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+
+from .advanced_metrics import (
+    AdvancedMetricsClient, MetricType, EvaluationModel, JUDGE_PROMPT_VERSION
+)
+from .judge_cache import JudgeCache, judge_cache_key, judge_provider_id, get_judge_cache
+from .metrics.base import BaseMetric
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Scoring instructions per criterion, matching how each metric reads the score
+FUSION_CRITERIA: Dict[MetricType, str] = {
+    MetricType.HALLUCINATION: "1.0 if every claim in the output is supported by the context, 0.0 if it is entirely hallucinated",
+    MetricType.RELEVANCE: "relevance of the output to the input, 0.0 (irrelevant) to 1.0 (fully relevant)",
+    MetricType.ANSWER_RELEVANCE: "how directly the output answers the input question, 0.0 to 1.0",
+    MetricType.CONTEXT_PRECISION: "accuracy of the output with respect to the context, 0.0 (inaccurate) to 1.0 (perfectly aligned)",
+    MetricType.CONTEXT_RECALL: "how much of the relevant context the output uses, 0.0 (none) to 1.0 (all)",
+    MetricType.MODERATION: "how unsafe or harmful the output is, 0.0 (safe) to 1.0 (clearly unsafe)",
+    MetricType.USEFULNESS: "usefulness of the output, 0.0 (useless) to 1.0 (very useful)",
+    MetricType.COHERENCE: "logical coherence of the output, 0.0 to 1.0",
+    MetricType.G_EVAL: "quality of the output against the given criteria, 0.0 to 1.0",
+    MetricType.CONVERSATIONAL_COHERENCE: "coherence and logical flow of the conversation, 0.0 to 1.0",
+    MetricType.SESSION_COMPLETENESS_QUALITY: "how thoroughly the user's intentions were addressed, 0.0 to 1.0",
+    MetricType.USER_FRUSTRATION: "user frustration in the conversation, 0.0 (none) to 1.0 (high)",
+}
+
+
+@dataclass
+class JudgeFusionStats:
+    """Counters for fused judge calls."""
+    fused_calls: int = 0
+    fused_requests: int = 0
+    single_calls: int = 0
+    fallbacks: int = 0
+
+    @property
+    def calls_saved(self) -> int:
+        """Judge calls avoided by fusion."""
+        return self.fused_requests - self.fused_calls - self.fallbacks
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {**asdict(self), "calls_saved": self.calls_saved}
+
+
+class _FusionGroup:
+    """Pending requests for one output, waiting to be judged together."""
+
+    def __init__(self):
+        self.requests: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self.metric_types = set()
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.closed = False
+
+
+def _format_context(context: Optional[List[Any]]) -> str:
+    if not context:
+        return "No context provided"
+    return "\n".join(
+        "\n".join(str(c) for c in ctx) if isinstance(ctx, list) else str(ctx)
+        for ctx in context
+    )
+
+
+def build_fused_prompt(output_text: str, context: Optional[List[Any]], requests: List[Dict[str, Any]]) -> str:
+    """
+    Build one judge prompt covering several metrics.
+
+    Args:
+        output_text: Output being judged
+        context: Context shared by all requests
+        requests: evaluate_single() arguments of the fused metrics
+
+    Returns:
+        Prompt asking for a JSON object keyed by metric type
+    """
+    criteria = []
+    for request in requests:
+        metric_type = request["metric_type"]
+        lines = [f'- "{metric_type.value}": {FUSION_CRITERIA.get(metric_type, "quality of the output, 0.0 to 1.0")}']
+        if request.get("input_text"):
+            lines.append(f"  Input: {request['input_text']}")
+        if request.get("reference"):
+            lines.append(f"  Reference: {request['reference']}")
+        if request.get("task_introduction"):
+            lines.append(f"  Task: {request['task_introduction']}")
+        if request.get("evaluation_criteria"):
+            lines.append(f"  Criteria: {request['evaluation_criteria']}")
+        if request.get("evaluation_steps"):
+            lines.append(f"  Steps: {'; '.join(request['evaluation_steps'])}")
+        criteria.append("\n".join(lines))
+
+    example = ", ".join(
+        f'"{request["metric_type"].value}": {{"score": 0.0-1.0, "reasoning": "explanation", "confidence": 0.0-1.0}}'
+        for request in requests
+    )
+    criteria_text = "\n".join(criteria)
+    return f"""
+Evaluate the output below against each of the following criteria independently.
+
+Output: {output_text}
+Context: {_format_context(context)}
+
+Criteria:
+{criteria_text}
+
+Respond with a single JSON object containing one entry per criterion:
+{{{example}}}
+"""
+
+
+def parse_fused_response(content: str, names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse a fused judge response.
+
+    Args:
+        content: Raw model response
+        names: Expected criterion names
+
+    Returns:
+        Mapping of criterion name to {"score", "reasoning", "confidence"}
+        for every criterion with a valid numeric score; empty if the
+        response is not a JSON object
+    """
+    start, end = content.find("{"), content.rfind("}")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        parsed = json.loads(content[start:end + 1])
+    except (json.JSONDecodeError, ValueError):
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+
+    results = {}
+    for name in names:
+        entry = parsed.get(name)
+        if not isinstance(entry, dict):
+            continue
+        score = entry.get("score")
+        if isinstance(score, bool) or not isinstance(score, (int, float)):
+            continue
+        confidence = entry.get("confidence", 1.0)
+        results[name] = {
+            "score": float(score),
+            "reasoning": str(entry.get("reasoning", "No reasoning provided")),
+            "confidence": float(confidence) if isinstance(confidence, (int, float)) else 1.0
+        }
+    return results
+
+
+class JudgeFusionClient(AdvancedMetricsClient):
+    """
+    Metrics client that fuses concurrent judge requests for the same output.
+
+    Share one instance between metrics (see fuse_judge_metrics) and run
+    them concurrently, e.g. through Evaluator. Requests for the same
+    output, context and custom model are collected until every sharing
+    metric has asked or ``window`` seconds have passed, then judged in one
+    call. Backend (non custom-model) requests and custom prompts are
+    passed through unchanged, since the backend endpoint scores a single
+    metric per call.
+    """
+
+    def __init__(
+        self,
+        expected_metrics: int = 0,
+        window: float = 0.05,
+        base_url: Optional[str] = None,
+        cache: Optional[JudgeCache] = None
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            expected_metrics: Number of metrics sharing this client; a group
+                is judged as soon as this many requests have arrived
+            window: Maximum seconds to wait for the other metrics' requests
+            base_url: Backend URL (defaults to the global client's URL)
+            cache: Judge response cache (defaults to the global judge cache)
+        """
+        super().__init__(base_url=base_url, cache=cache)
+        self.expected_metrics = expected_metrics
+        self.window = window
+        self.stats = JudgeFusionStats()
+        self._groups: Dict[Any, _FusionGroup] = {}
+        self._tasks = set()
+
+    async def evaluate_single(
+        self,
+        input_text: str,
+        output_text: str,
+        metric_type: MetricType,
+        context: Optional[List[str]] = None,
+        reference: Optional[str] = None,
+        model: Optional[EvaluationModel] = None,
+        custom_prompt: Optional[str] = None,
+        trace_id: Optional[str] = None,
+        experiment_id: Optional[str] = None,
+        task_introduction: Optional[str] = None,
+        evaluation_criteria: Optional[str] = None,
+        evaluation_steps: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Evaluate a single response, fusing it with concurrent requests where possible."""
+        request = {
+            "input_text": input_text,
+            "output_text": output_text,
+            "metric_type": metric_type,
+            "context": context,
+            "reference": reference,
+            "model": model,
+            "custom_prompt": custom_prompt,
+            "trace_id": trace_id,
+            "experiment_id": experiment_id,
+            "task_introduction": task_introduction,
+            "evaluation_criteria": evaluation_criteria,
+            "evaluation_steps": evaluation_steps
+        }
+        if custom_prompt or model is None or model.custom_model is None or self.expected_metrics < 2:
+            return await super().evaluate_single(**request)
+
+        key = (
+            id(model.custom_model), model.name, model.temperature,
+            output_text, json.dumps(context, default=str)
+        )
+        group = self._groups.get(key)
+        if group is not None and metric_type in group.metric_types:
+            # Same metric type twice (e.g. the next item of a faster metric)
+            self._flush(key, group)
+            group = None
+        if group is None:
+            group = _FusionGroup()
+            group.timer = asyncio.get_running_loop().call_later(self.window, self._flush, key, group)
+            self._groups[key] = group
+
+        future = asyncio.get_running_loop().create_future()
+        group.requests.append((request, future))
+        group.metric_types.add(metric_type)
+        if len(group.requests) >= self.expected_metrics:
+            self._flush(key, group)
+        return await future
+
+    def _flush(self, key: Any, group: _FusionGroup) -> None:
+        """Close a group and judge its requests in the background."""
+        if group.closed:
+            return
+        group.closed = True
+        group.timer.cancel()
+        if self._groups.get(key) is group:
+            del self._groups[key]
+        task = asyncio.ensure_future(self._run_group(group.requests))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_group(self, pending: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Judge a closed group and resolve the waiting requests."""
+        try:
+            if len(pending) == 1:
+                self.stats.single_calls += 1
+                responses = {0: await super().evaluate_single(**pending[0][0])}
+            else:
+                responses = await self._evaluate_fused([request for request, _ in pending])
+                missing = [i for i in range(len(pending)) if i not in responses]
+                if missing:
+                    self.stats.fallbacks += len(missing)
+                    fallback = await asyncio.gather(
+                        *(super(JudgeFusionClient, self).evaluate_single(**pending[i][0]) for i in missing),
+                        return_exceptions=True
+                    )
+                    responses.update(zip(missing, fallback))
+        except Exception as e:
+            responses = {i: e for i in range(len(pending))}
+
+        for i, (_, future) in enumerate(pending):
+            if future.done():
+                continue
+            response = responses[i]
+            if isinstance(response, BaseException):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+
+    async def _evaluate_fused(self, requests: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """
+        Judge several metrics with one custom model call.
+
+        Returns:
+            Responses keyed by request index; requests the judge did not
+            score are left out for the caller to retry separately
+        """
+        model = requests[0]["model"]
+        custom_model = model.custom_model
+        names = [request["metric_type"].value for request in requests]
+        prompt = build_fused_prompt(requests[0]["output_text"], requests[0]["context"], requests)
+        messages = [{"role": "user", "content": prompt}]
+        max_tokens = model.max_tokens * len(requests) if model.max_tokens else model.max_tokens
+        called = []
+
+        async def generate() -> Dict[str, Any]:
+            called.append(True)
+            response = await custom_model.generate_provider_response(
+                messages=messages,
+                temperature=model.temperature,
+                max_tokens=max_tokens
+            )
+            return {
+                "content": response.content,
+                "cost": response.cost or 0.0,
+                "latency": response.latency or 0.0
+            }
+
+        try:
+            cache = self.cache or get_judge_cache()
+            if cache is None:
+                generated = await generate()
+            else:
+                key = judge_cache_key(
+                    model=model.name,
+                    provider="custom:" + judge_provider_id(custom_model),
+                    prompt=messages,
+                    metric="fused:" + "+".join(names),
+                    metric_version=JUDGE_PROMPT_VERSION,
+                    params={"temperature": model.temperature, "max_tokens": max_tokens}
+                )
+                generated = await cache.get_or_compute(
+                    key, generate,
+                    should_cache=lambda value: len(parse_fused_response(value.get("content") or "", names)) == len(names)
+                )
+        except Exception as e:
+            logger.warning(f"Fused judge call failed, evaluating metrics separately: {e}")
+            return {}
+
+        cached = not called
+        self.stats.fused_calls += 1
+        self.stats.fused_requests += len(requests)
+        parsed = parse_fused_response(generated["content"] or "", names)
+        if len(parsed) < len(names):
+            logger.warning(
+                f"Fused judge response missing {len(names) - len(parsed)} of {len(names)} metrics; "
+                "evaluating them separately"
+            )
+
+        share = len(parsed) or 1
+        responses = {}
+        for i, name in enumerate(names):
+            if name not in parsed:
+                continue
+            responses[i] = {
+                "data": {
+                    **parsed[name],
+                    # The call's cost is split between the metrics it scored
+                    "cost": 0.0 if cached else generated["cost"] / share,
+                    "latency": 0 if cached else int(generated["latency"] * 1000),
+                    "model": model.name,
+                    "provider": "custom",
+                    "cached": cached,
+                    "fused": True
+                }
+            }
+        return responses
+
+
+def fuse_judge_metrics(
+    metrics: Iterable[BaseMetric],
+    window: float = 0.05,
+    cache: Optional[JudgeCache] = None
+) -> List[JudgeFusionClient]:
+    """
+    Share fusing clients between compatible judge metrics.
+
+    Metrics using an AdvancedMetricsClient with a custom judge model are
+    grouped by that model; every group of two or more gets one
+    JudgeFusionClient. Other metrics are left untouched.
+
+    Args:
+        metrics: Metrics that will be evaluated together
+        window: Maximum seconds to wait for the other metrics' requests
+        cache: Judge response cache (defaults to the global judge cache)
+
+    Returns:
+        The fusing clients created (one per judge model)
+    """
+    groups: Dict[int, List[BaseMetric]] = {}
+    for metric in metrics:
+        model = getattr(metric, "model", None)
+        if not isinstance(getattr(metric, "metrics_client", None), AdvancedMetricsClient):
+            continue
+        if not isinstance(model, EvaluationModel) or model.custom_model is None:
+            continue
+        if getattr(metric, "custom_prompt", None):
+            continue
+        groups.setdefault(id(model.custom_model), []).append(metric)
+
+    clients = []
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        client = JudgeFusionClient(expected_metrics=len(group), window=window, cache=cache)
+        for metric in group:
+            metric.metrics_client = client
+        clients.append(client)
+    return clients
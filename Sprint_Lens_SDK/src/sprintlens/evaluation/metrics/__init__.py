@@ -6,8 +6,8 @@ Includes built-in metrics, LLM-based metrics, and custom metric capabilities.
 
 from .base import BaseMetric, MetricResult, ScoreResult
 from .builtin import (
-    AccuracyMetric, PrecisionMetric, RecallMetric, F1Metric,
-    BleuMetric, RougeMetric, BertScoreMetric,
+    AccuracyMetric, PrecisionMetric, RecallMetric, F1Metric, ClassificationReportMetric,
+    BleuMetric, RougeMetric, BertScoreMetric, SemanticSimilarityMetric,
     ExactMatchMetric, LevenshteinDistanceMetric,
     SimilarityMetric, ContainmentMetric
 )
@@ -16,6 +16,14 @@ from .llm_based import (
     HallucinationMetric, ToxicityMetric, BiasMetric,
     GroundednessMetric, FluencyMetric, ConcisenessMetric
 )
+from .confusion import ConfusionMatrix, get_confusion_matrix, shared_confusion_matrices
+from .ngram import BleuStats, RougeStats, sentence_bleu, corpus_bleu, rouge_scores
+from .string_kernels import (
+    levenshtein_distance, normalized_levenshtein_similarity, indel_similarity,
+    jaro_winkler_similarity, token_set_ratio,
+    levenshtein_distance_batch, normalized_levenshtein_similarity_batch, indel_similarity_batch,
+    jaro_winkler_similarity_batch, token_set_ratio_batch
+)
 from .custom import CustomMetric, LLMAsJudgeMetric, CometStyleCustomMetric, CometLLMJudgeMetric
 
 __all__ = [
@@ -23,11 +31,23 @@ __all__ = [
     "BaseMetric", "MetricResult", "ScoreResult",
     
     # Built-in metrics  
-    "AccuracyMetric", "PrecisionMetric", "RecallMetric", "F1Metric",
-    "BleuMetric", "RougeMetric", "BertScoreMetric",
+    "AccuracyMetric", "PrecisionMetric", "RecallMetric", "F1Metric", "ClassificationReportMetric",
+    "BleuMetric", "RougeMetric", "BertScoreMetric", "SemanticSimilarityMetric",
     "ExactMatchMetric", "LevenshteinDistanceMetric",
     "SimilarityMetric", "ContainmentMetric",
     
+    # Confusion-matrix engine
+    "ConfusionMatrix", "get_confusion_matrix", "shared_confusion_matrices",
+    
+    # N-gram overlap scoring
+    "BleuStats", "RougeStats", "sentence_bleu", "corpus_bleu", "rouge_scores",
+    
+    # String similarity kernels
+    "levenshtein_distance", "normalized_levenshtein_similarity", "indel_similarity",
+    "jaro_winkler_similarity", "token_set_ratio",
+    "levenshtein_distance_batch", "normalized_levenshtein_similarity_batch", "indel_similarity_batch",
+    "jaro_winkler_similarity_batch", "token_set_ratio_batch",
+    
     # LLM-based metrics
     "RelevanceMetric", "FactualConsistencyMetric", "CoherenceMetric", 
     "HallucinationMetric", "ToxicityMetric", "BiasMetric",
@@ -4,6 +4,7 @@ Base classes for Sprint Lens evaluation metrics.
 This module provides the foundation for all metrics in the evaluation framework.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Any, Dict, Optional, Union
 from dataclasses import dataclass, field
@@ -67,6 +68,9 @@ class BaseMetric(ABC):
     Metrics can be synchronous or asynchronous, built-in or custom.
     """
     
+    # Bump when scoring logic changes, to invalidate stored results
+    metric_version = "1"
+    
     def __init__(
         self, 
         name: Optional[str] = None,
@@ -124,6 +128,76 @@ class BaseMetric(ABC):
         """
         return self.evaluate(predictions, ground_truth, **kwargs)
     
+    def evaluate_batch(
+        self, 
+        predictions: List[Any], 
+        ground_truth: List[Any],
+        **kwargs
+    ) -> List[MetricResult]:
+        """
+        Evaluate each item of a batch, returning one result per item.
+        
+        The default implementation calls evaluate() once per item. Metrics
+        that can score many items in one pass should override this.
+        
+        Args:
+            predictions: List of predicted values
+            ground_truth: List of ground truth values
+            **kwargs: Additional evaluation parameters
+            
+        Returns:
+            List of MetricResult, aligned with the inputs
+        """
+        return [
+            self._evaluate_item(pred, gt, **kwargs)
+            for pred, gt in zip(predictions, ground_truth)
+        ]
+    
+    async def evaluate_batch_async(
+        self, 
+        predictions: List[Any], 
+        ground_truth: List[Any],
+        **kwargs
+    ) -> List[MetricResult]:
+        """
+        Asynchronous batch evaluation.
+        
+        Metrics with their own evaluate_async() (e.g. LLM-based metrics) have
+        all items of the batch evaluated concurrently; otherwise this calls
+        evaluate_batch().
+        
+        Args:
+            predictions: List of predicted values
+            ground_truth: List of ground truth values
+            **kwargs: Additional evaluation parameters
+            
+        Returns:
+            List of MetricResult, aligned with the inputs
+        """
+        if type(self).evaluate_async is BaseMetric.evaluate_async:
+            return self.evaluate_batch(predictions, ground_truth, **kwargs)
+        
+        return list(await asyncio.gather(*(
+            self._evaluate_item_async(pred, gt, **kwargs)
+            for pred, gt in zip(predictions, ground_truth)
+        )))
+    
+    def _evaluate_item(self, prediction: Any, ground_truth: Any, **kwargs) -> MetricResult:
+        """Evaluate a single item, turning exceptions into an error result."""
+        start_time = time.time()
+        try:
+            return self.evaluate([prediction], [ground_truth], **kwargs)
+        except Exception as e:
+            return self._create_result(error=str(e), start_time=start_time)
+    
+    async def _evaluate_item_async(self, prediction: Any, ground_truth: Any, **kwargs) -> MetricResult:
+        """Asynchronously evaluate a single item, turning exceptions into an error result."""
+        start_time = time.time()
+        try:
+            return await self.evaluate_async([prediction], [ground_truth], **kwargs)
+        except Exception as e:
+            return self._create_result(error=str(e), start_time=start_time)
+    
     def _validate_inputs(
         self, 
         predictions: List[Any], 
@@ -207,6 +281,19 @@ class BaseMetric(ABC):
             **self.config
         }
     
+    def fingerprint_extra(self) -> Dict[str, Any]:
+        """
+        Identity kept outside get_config() that still changes the scores.
+        
+        Metrics judged by an LLM override this with the judge provider and
+        model so that switching judges invalidates checkpoints and stored
+        results.
+        
+        Returns:
+            JSON-serializable identity (empty by default)
+        """
+        return {}
+    
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}')"
     
@@ -6,11 +6,17 @@ This module contains standard machine learning and NLP evaluation metrics.
 
 import time
 import re
+from abc import abstractmethod
 from typing import List, Any, Dict, Optional, Set, Union
-from collections import Counter
 import difflib
 
 from .base import BaseMetric, MetricResult, NumericMetric, TextMetric, ClassificationMetric
+from .confusion import ConfusionMatrix, get_confusion_matrix
+from . import ngram, string_kernels
+from ..embeddings import (
+    DEFAULT_SENTENCE_MODEL, EmbeddingCache, TextEncoder, embed_texts, embed_tokens, get_default_encoder,
+    greedy_match, paired_cosine_similarity
+)
 
 
 class AccuracyMetric(ClassificationMetric):
@@ -47,34 +53,57 @@ class AccuracyMetric(ClassificationMetric):
             
         except Exception as e:
             return self._create_result(error=str(e), start_time=start_time)
+    
+    def evaluate_batch(
+        self, 
+        predictions: List[Any], 
+        ground_truth: List[Any],
+        **kwargs
+    ) -> List[MetricResult]:
+        """Score each item as correct (1.0) or incorrect (0.0) in one pass."""
+        start_time = time.time()
+        
+        try:
+            self._validate_inputs(predictions, ground_truth)
+        except Exception as e:
+            return [self._create_result(error=str(e), start_time=start_time) for _ in predictions]
+        
+        return [
+            self._create_result(
+                value=1.0 if p == gt else 0.0,
+                details={"correct": int(p == gt), "total": 1},
+                start_time=start_time
+            )
+            for p, gt in zip(predictions, ground_truth)
+        ]
 
 
-class PrecisionMetric(ClassificationMetric):
-    """Precision metric for classification tasks."""
+class _ConfusionMatrixMetric(ClassificationMetric):
+    """Classification metric derived from a (shared) confusion matrix."""
     
     def __init__(self, average: str = "weighted", **kwargs):
-        super().__init__(
-            name="precision", 
-            description="Classification precision", 
-            average=average,
-            **kwargs
-        )
+        super().__init__(average=average, **kwargs)
         self.average = average
     
+    @abstractmethod
+    def _compute(self, matrix: ConfusionMatrix) -> tuple:
+        """Return (value, details) for the matrix."""
+        pass
+    
     def evaluate(
         self, 
         predictions: List[Any], 
         ground_truth: List[Any],
         **kwargs
     ) -> MetricResult:
-        """Calculate precision score."""
+        """Calculate the score from the confusion matrix."""
         start_time = time.time()
         
         try:
             self._validate_inputs(predictions, ground_truth)
             
-            # Get unique classes
-            classes = sorted(set(ground_truth + predictions))
+            matrix = get_confusion_matrix(predictions, ground_truth)
+            classes = matrix.labels
             
             if len(classes) <= 1:
                 return self._create_result(
@@ -83,53 +112,34 @@ class PrecisionMetric(ClassificationMetric):
                     start_time=start_time
                 )
             
-            # Calculate precision for each class
-            class_precisions = {}
-            class_counts = Counter(predictions)
-            
-            for cls in classes:
-                tp = sum(1 for p, gt in zip(predictions, ground_truth) if p == cls and gt == cls)
-                predicted_positive = class_counts.get(cls, 0)
-                
-                if predicted_positive == 0:
-                    class_precisions[cls] = 0.0
-                else:
-                    class_precisions[cls] = tp / predicted_positive
-            
-            # Calculate average precision
-            if self.average == "macro":
-                precision = sum(class_precisions.values()) / len(class_precisions)
-            elif self.average == "weighted":
-                gt_counts = Counter(ground_truth)
-                total = sum(gt_counts.values())
-                precision = sum(
-                    class_precisions[cls] * gt_counts.get(cls, 0) / total 
-                    for cls in classes
-                )
-            else:  # micro
-                tp_total = sum(
-                    sum(1 for p, gt in zip(predictions, ground_truth) if p == cls and gt == cls)
-                    for cls in classes
-                )
-                predicted_total = len(predictions)
-                precision = tp_total / predicted_total if predicted_total > 0 else 0.0
-            
-            return self._create_result(
-                value=precision,
-                details={
-                    "precision": precision,
-                    "class_precisions": class_precisions,
-                    "average": self.average,
-                    "classes": classes
-                },
-                start_time=start_time
-            )
+            value, details = self._compute(matrix)
+            details.update({"average": self.average, "classes": classes})
+            return self._create_result(value=value, details=details, start_time=start_time)
             
         except Exception as e:
             return self._create_result(error=str(e), start_time=start_time)
 
 
-class RecallMetric(ClassificationMetric):
+class PrecisionMetric(_ConfusionMatrixMetric):
+    """Precision metric for classification tasks."""
+    
+    def __init__(self, average: str = "weighted", **kwargs):
+        super().__init__(
+            name="precision", 
+            description="Classification precision", 
+            average=average,
+            **kwargs
+        )
+    
+    def _compute(self, matrix: ConfusionMatrix) -> tuple:
+        precision = matrix.precision(self.average)
+        return precision, {
+            "precision": precision,
+            "class_precisions": matrix.per_class_precision()
+        }
+
+
+class RecallMetric(_ConfusionMatrixMetric):
     """Recall metric for classification tasks."""
     
     def __init__(self, average: str = "weighted", **kwargs):
@@ -139,77 +149,22 @@ class RecallMetric(ClassificationMetric):
             average=average,
             **kwargs
         )
-        self.average = average
     
-    def evaluate(
-        self, 
-        predictions: List[Any], 
-        ground_truth: List[Any],
-        **kwargs
-    ) -> MetricResult:
-        """Calculate recall score."""
-        start_time = time.time()
-        
-        try:
-            self._validate_inputs(predictions, ground_truth)
-            
-            # Get unique classes
-            classes = sorted(set(ground_truth + predictions))
-            
-            if len(classes) <= 1:
-                return self._create_result(
-                    value=1.0 if len(classes) == 1 else 0.0,
-                    details={"classes": classes, "average": self.average},
-                    start_time=start_time
-                )
-            
-            # Calculate recall for each class
-            class_recalls = {}
-            gt_counts = Counter(ground_truth)
-            
-            for cls in classes:
-                tp = sum(1 for p, gt in zip(predictions, ground_truth) if p == cls and gt == cls)
-                actual_positive = gt_counts.get(cls, 0)
-                
-                if actual_positive == 0:
-                    class_recalls[cls] = 0.0
-                else:
-                    class_recalls[cls] = tp / actual_positive
-            
-            # Calculate average recall
-            if self.average == "macro":
-                recall = sum(class_recalls.values()) / len(class_recalls)
-            elif self.average == "weighted":
-                total = sum(gt_counts.values())
-                recall = sum(
-                    class_recalls[cls] * gt_counts.get(cls, 0) / total 
-                    for cls in classes
-                )
-            else:  # micro
-                tp_total = sum(
-                    sum(1 for p, gt in zip(predictions, ground_truth) if p == cls and gt == cls)
-                    for cls in classes
-                )
-                actual_total = len(ground_truth)
-                recall = tp_total / actual_total if actual_total > 0 else 0.0
-            
-            return self._create_result(
-                value=recall,
-                details={
-                    "recall": recall,
-                    "class_recalls": class_recalls,
-                    "average": self.average,
-                    "classes": classes
-                },
-                start_time=start_time
-            )
-            
-        except Exception as e:
-            return self._create_result(error=str(e), start_time=start_time)
+    def _compute(self, matrix: ConfusionMatrix) -> tuple:
+        recall = matrix.recall(self.average)
+        return recall, {
+            "recall": recall,
+            "class_recalls": matrix.per_class_recall()
+        }
 
 
-class F1Metric(ClassificationMetric):
-    """F1 score metric for classification tasks."""
+class F1Metric(_ConfusionMatrixMetric):
+    """
+    F1 score metric for classification tasks.
+    
+    Macro and weighted averages average the per-class F1 scores; micro F1
+    equals accuracy for single-label classification.
+    """
     
     def __init__(self, average: str = "weighted", **kwargs):
         super().__init__(
@@ -218,53 +173,41 @@ class F1Metric(ClassificationMetric):
             average=average,
             **kwargs
         )
-        self.average = average
     
-    def evaluate(
-        self, 
-        predictions: List[Any], 
-        ground_truth: List[Any],
-        **kwargs
-    ) -> MetricResult:
-        """Calculate F1 score."""
-        start_time = time.time()
-        
-        try:
-            # Calculate precision and recall first
-            precision_metric = PrecisionMetric(average=self.average)
-            recall_metric = RecallMetric(average=self.average)
-            
-            precision_result = precision_metric.evaluate(predictions, ground_truth)
-            recall_result = recall_metric.evaluate(predictions, ground_truth)
-            
-            if precision_result.error or recall_result.error:
-                error_msg = precision_result.error or recall_result.error
-                return self._create_result(error=error_msg, start_time=start_time)
-            
-            precision = precision_result.value
-            recall = recall_result.value
-            
-            # Calculate F1 score
-            if precision + recall == 0:
-                f1 = 0.0
-            else:
-                f1 = 2 * (precision * recall) / (precision + recall)
-            
-            return self._create_result(
-                value=f1,
-                details={
-                    "f1": f1,
-                    "precision": precision,
-                    "recall": recall,
-                    "average": self.average,
-                    "precision_details": precision_result.details,
-                    "recall_details": recall_result.details
-                },
-                start_time=start_time
-            )
-            
-        except Exception as e:
-            return self._create_result(error=str(e), start_time=start_time)
+    def _compute(self, matrix: ConfusionMatrix) -> tuple:
+        f1 = matrix.f1(self.average)
+        precision = matrix.precision(self.average)
+        recall = matrix.recall(self.average)
+        return f1, {
+            "f1": f1,
+            "precision": precision,
+            "recall": recall,
+            "class_f1": matrix.per_class_f1(),
+            "precision_details": {"precision": precision, "class_precisions": matrix.per_class_precision()},
+            "recall_details": {"recall": recall, "class_recalls": matrix.per_class_recall()}
+        }
+
+
+class ClassificationReportMetric(_ConfusionMatrixMetric):
+    """
+    Accuracy, precision, recall and F1 under every averaging scheme at once.
+    
+    The value is the F1 score for the configured average; the full report
+    and the confusion matrix are in the details.
+    """
+    
+    def __init__(self, average: str = "weighted", **kwargs):
+        super().__init__(
+            name="classification_report",
+            description="Classification report from one confusion matrix",
+            average=average,
+            **kwargs
+        )
+    
+    def _compute(self, matrix: ConfusionMatrix) -> tuple:
+        report = matrix.report()
+        report["confusion_matrix"] = matrix.to_list()
+        return report[f"f1_{self.average}"], report
 
 
 class ExactMatchMetric(TextMetric):
@@ -315,6 +258,33 @@ class ExactMatchMetric(TextMetric):
             
         except Exception as e:
             return self._create_result(error=str(e), start_time=start_time)
+    
+    def evaluate_batch(
+        self, 
+        predictions: List[Any], 
+        ground_truth: List[Any],
+        **kwargs
+    ) -> List[MetricResult]:
+        """Score each item as an exact match (1.0) or not (0.0) in one pass."""
+        start_time = time.time()
+        
+        try:
+            self._validate_inputs(predictions, ground_truth)
+        except Exception as e:
+            return [self._create_result(error=str(e), start_time=start_time) for _ in predictions]
+        
+        if not self.case_sensitive:
+            predictions = [p.lower() for p in predictions]
+            ground_truth = [gt.lower() for gt in ground_truth]
+        
+        return [
+            self._create_result(
+                value=1.0 if p == gt else 0.0,
+                details={"matches": int(p == gt), "total": 1, "case_sensitive": self.case_sensitive},
+                start_time=start_time
+            )
+            for p, gt in zip(predictions, ground_truth)
+        ]
 
 
 class LevenshteinDistanceMetric(TextMetric):
@@ -331,23 +301,7 @@ class LevenshteinDistanceMetric(TextMetric):
     
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
         """Calculate Levenshtein distance between two strings."""
-        if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
-        
-        if len(s2) == 0:
-            return len(s1)
-        
-        previous_row = list(range(len(s2) + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        
-        return previous_row[-1]
+        return string_kernels.levenshtein_distance(s1, s2)
     
     def evaluate(
         self, 
@@ -361,13 +315,10 @@ class LevenshteinDistanceMetric(TextMetric):
         try:
             self._validate_inputs(predictions, ground_truth)
             
-            distances = []
+            distances = string_kernels.levenshtein_distance_batch(predictions, ground_truth)
             similarities = []
             
-            for pred, gt in zip(predictions, ground_truth):
-                distance = self._levenshtein_distance(pred, gt)
-                distances.append(distance)
-                
+            for pred, gt, distance in zip(predictions, ground_truth, distances):
                 if self.normalize:
                     max_len = max(len(pred), len(gt))
                     similarity = 1.0 - (distance / max_len) if max_len > 0 else 1.0
@@ -397,14 +348,35 @@ class LevenshteinDistanceMetric(TextMetric):
 
 
 class SimilarityMetric(TextMetric):
-    """Text similarity using difflib SequenceMatcher."""
+    """
+    Text similarity ratio.
+
+    Methods:
+        indel: 2 * LCS / total length (difflib's ratio formula, computed exactly)
+        jaro_winkler: Jaro-Winkler similarity
+        token_set: word-order-insensitive token-set ratio
+        sequence_matcher: difflib.SequenceMatcher ratio (quadratic on long texts)
+    """
     
-    def __init__(self, **kwargs):
+    METHODS = {
+        "indel": string_kernels.indel_similarity_batch,
+        "jaro_winkler": string_kernels.jaro_winkler_similarity_batch,
+        "token_set": string_kernels.token_set_ratio_batch,
+        "sequence_matcher": lambda predictions, ground_truth: [
+            difflib.SequenceMatcher(None, pred, gt).ratio() for pred, gt in zip(predictions, ground_truth)
+        ]
+    }
+    
+    def __init__(self, method: str = "indel", **kwargs):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown similarity method '{method}', expected one of {list(self.METHODS)}")
         super().__init__(
             name="similarity", 
             description="Text similarity using sequence matching",
+            method=method,
             **kwargs
         )
+        self.method = method
     
     def evaluate(
         self, 
@@ -418,11 +390,7 @@ class SimilarityMetric(TextMetric):
         try:
             self._validate_inputs(predictions, ground_truth)
             
-            similarities = []
-            
-            for pred, gt in zip(predictions, ground_truth):
-                similarity = difflib.SequenceMatcher(None, pred, gt).ratio()
-                similarities.append(similarity)
+            similarities = self.METHODS[self.method](predictions, ground_truth)
             
             avg_similarity = sum(similarities) / len(similarities) if similarities else 0.0
             
@@ -432,7 +400,8 @@ class SimilarityMetric(TextMetric):
                     "average_similarity": avg_similarity,
                     "similarities": similarities,
                     "min_similarity": min(similarities) if similarities else 0.0,
-                    "max_similarity": max(similarities) if similarities else 0.0
+                    "max_similarity": max(similarities) if similarities else 0.0,
+                    "method": self.method
                 },
                 start_time=start_time
             )
@@ -502,16 +471,49 @@ class ContainmentMetric(TextMetric):
             return self._create_result(error=str(e), start_time=start_time)
 
 
-# Placeholder metrics for advanced NLP metrics (would require additional dependencies)
-class BleuMetric(TextMetric):
-    """BLEU score metric for machine translation evaluation."""
+class _ReferenceTextMetric(TextMetric):
+    """Text metric whose ground truth items may be a list of references."""
     
-    def __init__(self, **kwargs):
+    def _validate_inputs(
+        self, 
+        predictions: List[Any], 
+        ground_truth: List[Any]
+    ) -> None:
+        """Validate string predictions and string (or list of string) references."""
+        BaseMetric._validate_inputs(self, predictions, ground_truth)
+        
+        for i, pred in enumerate(predictions):
+            if not isinstance(pred, str):
+                raise ValueError(f"Prediction at index {i} is not a string: {type(pred)}")
+        
+        for i, gt in enumerate(ground_truth):
+            if isinstance(gt, str):
+                continue
+            if not isinstance(gt, (list, tuple)) or not gt or not all(isinstance(ref, str) for ref in gt):
+                raise ValueError(f"Ground truth at index {i} is not a string or list of strings: {type(gt)}")
+
+
+class BleuMetric(_ReferenceTextMetric):
+    """
+    Corpus-level BLEU for machine translation evaluation.
+
+    The metric value is corpus BLEU over all items (n-gram statistics are
+    pooled before the geometric mean); per-item smoothed sentence BLEU
+    scores are reported in the details.
+    """
+    
+    def __init__(self, smooth_method: str = "exp", max_order: int = ngram.BLEU_MAX_ORDER, **kwargs):
+        if smooth_method not in ngram.SMOOTH_METHODS:
+            raise ValueError(f"Unknown smoothing '{smooth_method}', expected one of {ngram.SMOOTH_METHODS}")
         super().__init__(
             name="bleu", 
             description="BLEU score for translation quality",
+            smooth_method=smooth_method,
+            max_order=max_order,
             **kwargs
         )
+        self.smooth_method = smooth_method
+        self.max_order = max_order
     
     def evaluate(
         self, 
@@ -519,32 +521,55 @@ class BleuMetric(TextMetric):
         ground_truth: List[Any],
         **kwargs
     ) -> MetricResult:
-        """Calculate BLEU score."""
+        """Calculate corpus and sentence BLEU scores."""
         start_time = time.time()
         
         try:
             self._validate_inputs(predictions, ground_truth)
             
-            # Simplified BLEU implementation (would need nltk or similar for full implementation)
-            # For now, return similarity-based approximation
-            similarity_metric = SimilarityMetric()
-            result = similarity_metric.evaluate(predictions, ground_truth)
+            corpus = ngram.BleuStats(self.max_order)
+            sentence_scores = []
+            for pred, refs in zip(predictions, ground_truth):
+                segment = corpus.add(pred, refs)
+                sentence_scores.append(segment.score(self.smooth_method, effective_order=True))
             
-            # Modify result for BLEU
-            if result.value is not None:
-                result.name = self.name
-                result.details.update({"bleu_approximation": True})
+            bleu = corpus.score(self.smooth_method)
             
-            return result
+            return self._create_result(
+                value=bleu,
+                details={
+                    "corpus_bleu": bleu,
+                    "sentence_scores": sentence_scores,
+                    "precisions": corpus.precisions(self.smooth_method),
+                    "brevity_penalty": corpus.brevity_penalty,
+                    "length_ratio": corpus.hyp_len / corpus.ref_len if corpus.ref_len else 0.0,
+                    "corpus_stats": corpus.to_dict(),
+                    "smooth_method": self.smooth_method
+                },
+                start_time=start_time
+            )
             
         except Exception as e:
             return self._create_result(error=str(e), start_time=start_time)
 
 
-class RougeMetric(TextMetric):
-    """ROUGE score metric for summarization evaluation."""
+class RougeMetric(_ReferenceTextMetric):
+    """
+    ROUGE score metric for summarization evaluation.
+
+    The metric value is the mean F-measure of ``rouge_type`` (rouge-1,
+    rouge-2, rouge-l or rouge-lsum); its mean precision and recall are
+    reported in the details. Only the selected type is computed.
+    """
+    
+    ROUGE_TYPE_ALIASES = {
+        "rouge-1": "rouge1", "rouge-2": "rouge2", "rouge-l": "rougeL", "rouge-lsum": "rougeLsum"
+    }
     
     def __init__(self, rouge_type: str = "rouge-1", **kwargs):
+        scorer_type = self.ROUGE_TYPE_ALIASES.get(rouge_type.lower(), rouge_type)
+        if scorer_type not in ngram.ROUGE_TYPES:
+            raise ValueError(f"Unknown ROUGE type '{rouge_type}', expected one of {list(self.ROUGE_TYPE_ALIASES)}")
         super().__init__(
             name="rouge", 
             description="ROUGE score for summarization quality",
@@ -552,6 +577,7 @@ class RougeMetric(TextMetric):
             **kwargs
         )
         self.rouge_type = rouge_type
+        self._scorer_type = scorer_type
     
     def evaluate(
         self, 
@@ -559,35 +585,48 @@ class RougeMetric(TextMetric):
         ground_truth: List[Any],
         **kwargs
     ) -> MetricResult:
-        """Calculate ROUGE score."""
+        """Calculate ROUGE scores."""
         start_time = time.time()
         
         try:
             self._validate_inputs(predictions, ground_truth)
             
-            # Simplified ROUGE implementation (would need rouge-score library for full implementation)
-            # For now, return similarity-based approximation
-            similarity_metric = SimilarityMetric()
-            result = similarity_metric.evaluate(predictions, ground_truth)
+            stats = ngram.RougeStats((self._scorer_type,))
+            scores = [stats.add(pred, refs)[self._scorer_type]["fmeasure"] for pred, refs in zip(predictions, ground_truth)]
+            means = stats.mean()
             
-            # Modify result for ROUGE
-            if result.value is not None:
-                result.name = self.name
-                result.details.update({
+            return self._create_result(
+                value=means[self._scorer_type]["fmeasure"],
+                details={
                     "rouge_type": self.rouge_type,
-                    "rouge_approximation": True
-                })
-            
-            return result
+                    "precision": means[self._scorer_type]["precision"],
+                    "recall": means[self._scorer_type]["recall"],
+                    "fmeasure": means[self._scorer_type]["fmeasure"],
+                    "scores": scores
+                },
+                start_time=start_time
+            )
             
         except Exception as e:
             return self._create_result(error=str(e), start_time=start_time)
 
 
 class BertScoreMetric(TextMetric):
-    """BERTScore metric for semantic similarity evaluation."""
+    """
+    BERTScore-style semantic similarity on local CPU embeddings.
+
+    Token embeddings of each prediction and reference are greedily matched
+    by cosine similarity; the metric value is the mean F1. Uses
+    sentence-transformers when installed and the hashing encoder otherwise.
+    """
     
-    def __init__(self, model: str = "bert-base-uncased", **kwargs):
+    def __init__(
+        self,
+        model: str = DEFAULT_SENTENCE_MODEL,
+        encoder: Optional[TextEncoder] = None,
+        cache: Optional[EmbeddingCache] = None,
+        **kwargs
+    ):
         super().__init__(
             name="bertscore", 
             description="BERTScore for semantic similarity",
@@ -595,6 +634,15 @@ class BertScoreMetric(TextMetric):
             **kwargs
         )
         self.model = model
+        self._encoder = encoder
+        self.cache = cache
+    
+    @property
+    def encoder(self) -> TextEncoder:
+        """Encoder, loaded on first use."""
+        if self._encoder is None:
+            self._encoder = get_default_encoder(self.model)
+        return self._encoder
     
     def evaluate(
         self, 
@@ -602,26 +650,93 @@ class BertScoreMetric(TextMetric):
         ground_truth: List[Any],
         **kwargs
     ) -> MetricResult:
-        """Calculate BERTScore."""
+        """Calculate BERTScore precision, recall and F1."""
         start_time = time.time()
         
         try:
             self._validate_inputs(predictions, ground_truth)
             
-            # Simplified BERTScore implementation (would need bert-score library for full implementation)
-            # For now, return similarity-based approximation
-            similarity_metric = SimilarityMetric()
-            result = similarity_metric.evaluate(predictions, ground_truth)
+            candidates = embed_tokens(predictions, self.encoder, self.cache)
+            references = embed_tokens(ground_truth, self.encoder, self.cache)
+            scores = [greedy_match(c, r) for c, r in zip(candidates, references)]
+            precisions = [score[0] for score in scores]
+            recalls = [score[1] for score in scores]
+            f1_scores = [score[2] for score in scores]
+            avg_f1 = sum(f1_scores) / len(f1_scores)
             
-            # Modify result for BERTScore
-            if result.value is not None:
-                result.name = self.name
-                result.details.update({
+            return self._create_result(
+                value=avg_f1,
+                details={
+                    "precision": sum(precisions) / len(precisions),
+                    "recall": sum(recalls) / len(recalls),
+                    "f1": avg_f1,
+                    "f1_scores": f1_scores,
                     "model": self.model,
-                    "bertscore_approximation": True
-                })
+                    "encoder": self.encoder.name
+                },
+                start_time=start_time
+            )
+            
+        except Exception as e:
+            return self._create_result(error=str(e), start_time=start_time)
+
+
+class SemanticSimilarityMetric(TextMetric):
+    """Cosine similarity of local sentence embeddings."""
+    
+    def __init__(
+        self,
+        encoder: Optional[TextEncoder] = None,
+        cache: Optional[EmbeddingCache] = None,
+        model: Optional[str] = None,
+        **kwargs
+    ):
+        super().__init__(
+            name="semantic_similarity", 
+            description="Embedding cosine similarity",
+            model=model,
+            **kwargs
+        )
+        self.model = model
+        self._encoder = encoder
+        self.cache = cache
+    
+    @property
+    def encoder(self) -> TextEncoder:
+        """Encoder, loaded on first use."""
+        if self._encoder is None:
+            self._encoder = get_default_encoder(self.model)
+        return self._encoder
+    
+    def evaluate(
+        self, 
+        predictions: List[Any], 
+        ground_truth: List[Any],
+        **kwargs
+    ) -> MetricResult:
+        """Calculate embedding cosine similarities."""
+        start_time = time.time()
+        
+        try:
+            self._validate_inputs(predictions, ground_truth)
+            
+            similarities = paired_cosine_similarity(
+                embed_texts(predictions, self.encoder, self.cache),
+                embed_texts(ground_truth, self.encoder, self.cache)
+            )
+            avg_similarity = sum(similarities) / len(similarities)
             
-            return result
+            return self._create_result(
+                value=avg_similarity,
+                details={
+                    "average_similarity": avg_similarity,
+                    "similarities": similarities,
+                    "min_similarity": min(similarities),
+                    "max_similarity": max(similarities),
+                    "encoder": self.encoder.name
+                },
+                start_time=start_time
+            )
             
         except Exception as e:
-            return self._create_result(error=str(e), start_time=start_time)
\ No newline at end of file
+            return self._create_result(error=str(e), start_time=start_time)
@@ -0,0 +1,265 @@
+"""
+Confusion-matrix engine for classification metrics.
+
+The matrix is built in a single pass over the (ground truth, prediction)
+pairs; precision, recall, F1 (micro, macro, weighted) and accuracy are then
+derived from it in O(k^2) for k classes instead of rescanning the data per
+class. numpy is used when available, with a pure-Python fallback.
+
+Metrics evaluated together by an Evaluator share one matrix per input pair
+through shared_confusion_matrices().
+"""
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Any, Dict, Optional, Sequence, Iterator
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+AVERAGES = ("micro", "macro", "weighted")
+
+
+def _sorted_labels(labels: Any) -> List[Any]:
+    """Sort labels, falling back to their repr for mixed types."""
+    labels = set(labels)
+    try:
+        return sorted(labels)
+    except TypeError:
+        return sorted(labels, key=repr)
+
+
+def _safe_divide(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator else 0.0
+
+
+class ConfusionMatrix:
+    """
+    Single-label confusion matrix.
+
+    Rows are ground truth labels, columns are predicted labels, both in
+    ``labels`` order.
+    """
+
+    def __init__(self, labels: List[Any], counts: Any):
+        """
+        Initialize from precomputed counts.
+
+        Args:
+            labels: Class labels in matrix order
+            counts: k x k matrix of counts (numpy array or nested lists)
+        """
+        self.labels = labels
+        self.counts = counts
+        if NUMPY_AVAILABLE and isinstance(counts, np.ndarray):
+            self.true_positives = np.diag(counts).astype(float)
+            self.support = counts.sum(axis=1).astype(float)
+            self.predicted = counts.sum(axis=0).astype(float)
+            self.total = int(counts.sum())
+        else:
+            k = len(labels)
+            self.true_positives = [float(counts[i][i]) for i in range(k)]
+            self.support = [float(sum(row)) for row in counts]
+            self.predicted = [float(sum(counts[i][j] for i in range(k))) for j in range(k)]
+            self.total = int(sum(self.support))
+
+    @classmethod
+    def from_labels(
+        cls,
+        predictions: Sequence[Any],
+        ground_truth: Sequence[Any],
+        labels: Optional[List[Any]] = None
+    ) -> 'ConfusionMatrix':
+        """
+        Build the matrix in one pass.
+
+        Args:
+            predictions: Predicted labels
+            ground_truth: True labels
+            labels: Class labels (defaults to every label seen, sorted)
+
+        Returns:
+            ConfusionMatrix
+
+        Raises:
+            ValueError: If the inputs differ in length or contain a label
+                missing from ``labels``
+        """
+        if len(predictions) != len(ground_truth):
+            raise ValueError("Predictions and ground truth must have the same length")
+
+        if NUMPY_AVAILABLE and isinstance(predictions, np.ndarray) and isinstance(ground_truth, np.ndarray):
+            if labels is None:
+                labels = _sorted_labels(np.unique(np.concatenate([ground_truth, predictions])).tolist())
+            k = len(labels)
+            index = np.asarray(labels)
+            unknown = np.setdiff1d(np.concatenate([ground_truth, predictions]), index)
+            if unknown.size:
+                raise ValueError(f"Labels missing from the label list: {unknown.tolist()}")
+            order = np.argsort(index)
+            true_idx = order[np.searchsorted(index, ground_truth, sorter=order)]
+            pred_idx = order[np.searchsorted(index, predictions, sorter=order)]
+            counts = np.bincount(true_idx * k + pred_idx, minlength=k * k).reshape(k, k)
+            return cls(labels, counts)
+
+        # Counting pairs runs in C; everything after is per distinct pair
+        pairs = Counter(zip(ground_truth, predictions))
+        if labels is None:
+            seen = set()
+            for truth, prediction in pairs:
+                seen.add(truth)
+                seen.add(prediction)
+            labels = _sorted_labels(seen)
+        position = {label: i for i, label in enumerate(labels)}
+        unknown = {label for pair in pairs for label in pair if label not in position}
+        if unknown:
+            raise ValueError(f"Labels missing from the label list: {_sorted_labels(unknown)}")
+        k = len(labels)
+
+        if NUMPY_AVAILABLE:
+            counts = np.zeros((k, k), dtype=np.int64)
+        else:
+            counts = [[0] * k for _ in range(k)]
+        for (truth, prediction), count in pairs.items():
+            i, j = position[truth], position[prediction]
+            if NUMPY_AVAILABLE:
+                counts[i, j] += count
+            else:
+                counts[i][j] += count
+        return cls(labels, counts)
+
+    @property
+    def accuracy(self) -> float:
+        """Fraction of correct predictions."""
+        return _safe_divide(float(sum(self.true_positives)), self.total)
+
+    def per_class_precision(self) -> Dict[Any, float]:
+        """Precision of every class (0.0 for classes never predicted)."""
+        return {
+            label: _safe_divide(tp, predicted)
+            for label, tp, predicted in zip(self.labels, self.true_positives, self.predicted)
+        }
+
+    def per_class_recall(self) -> Dict[Any, float]:
+        """Recall of every class (0.0 for classes absent from the ground truth)."""
+        return {
+            label: _safe_divide(tp, support)
+            for label, tp, support in zip(self.labels, self.true_positives, self.support)
+        }
+
+    def per_class_f1(self) -> Dict[Any, float]:
+        """F1 score of every class."""
+        precision, recall = self.per_class_precision(), self.per_class_recall()
+        return {
+            label: _safe_divide(2 * precision[label] * recall[label], precision[label] + recall[label])
+            for label in self.labels
+        }
+
+    def _average(self, per_class: Dict[Any, float], average: str) -> float:
+        if average == "micro":
+            # Single-label: micro precision, recall and F1 all equal accuracy
+            return self.accuracy
+        values = [per_class[label] for label in self.labels]
+        if average == "macro":
+            return _safe_divide(sum(values), len(values))
+        if average == "weighted":
+            return _safe_divide(sum(v * s for v, s in zip(values, self.support)), self.total)
+        raise ValueError(f"Unknown average '{average}', expected one of {AVERAGES}")
+
+    def precision(self, average: str = "weighted") -> float:
+        """Averaged precision."""
+        return self._average(self.per_class_precision(), average)
+
+    def recall(self, average: str = "weighted") -> float:
+        """Averaged recall."""
+        return self._average(self.per_class_recall(), average)
+
+    def f1(self, average: str = "weighted") -> float:
+        """Averaged F1 score."""
+        return self._average(self.per_class_f1(), average)
+
+    def to_list(self) -> List[List[int]]:
+        """Counts as nested lists."""
+        if NUMPY_AVAILABLE and isinstance(self.counts, np.ndarray):
+            return self.counts.tolist()
+        return [list(row) for row in self.counts]
+
+    def report(self) -> Dict[str, Any]:
+        """Accuracy plus precision, recall and F1 under every averaging scheme."""
+        precision, recall, f1 = self.per_class_precision(), self.per_class_recall(), self.per_class_f1()
+        return {
+            "accuracy": self.accuracy,
+            **{
+                f"{name}_{average}": self._average(per_class, average)
+                for name, per_class in (("precision", precision), ("recall", recall), ("f1", f1))
+                for average in AVERAGES
+            },
+            "per_class": {
+                label: {"precision": precision[label], "recall": recall[label], "f1": f1[label]}
+                for label in self.labels
+            }
+        }
+
+
+class _MatrixCache:
+    """Matrices built during one scope, keyed by the identity of the inputs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Any, tuple] = {}
+
+    def get(self, predictions: Sequence[Any], ground_truth: Sequence[Any], labels: Optional[List[Any]]) -> ConfusionMatrix:
+        key = (id(predictions), id(ground_truth), tuple(labels) if labels else None)
+        with self._lock:
+            entry = self._entries.get(key)
+            # The entry keeps the inputs alive, so their ids cannot be reused
+            if entry is not None and entry[0] is predictions and entry[1] is ground_truth:
+                return entry[2]
+            matrix = ConfusionMatrix.from_labels(predictions, ground_truth, labels)
+            self._entries[key] = (predictions, ground_truth, matrix)
+            return matrix
+
+
+_matrix_cache: ContextVar[Optional[_MatrixCache]] = ContextVar("sprintlens_confusion_matrices", default=None)
+
+
+@contextmanager
+def shared_confusion_matrices() -> Iterator[None]:
+    """
+    Share confusion matrices between metrics evaluated in this scope.
+
+    Inputs must not be modified while the scope is active.
+    """
+    token = _matrix_cache.set(_MatrixCache())
+    try:
+        yield
+    finally:
+        _matrix_cache.reset(token)
+
+
+def get_confusion_matrix(
+    predictions: Sequence[Any],
+    ground_truth: Sequence[Any],
+    labels: Optional[List[Any]] = None
+) -> ConfusionMatrix:
+    """
+    Confusion matrix for the inputs, reused within a shared scope.
+
+    Args:
+        predictions: Predicted labels
+        ground_truth: True labels
+        labels: Class labels (defaults to every label seen, sorted)
+
+    Returns:
+        ConfusionMatrix
+    """
+    cache = _matrix_cache.get()
+    if cache is None:
+        return ConfusionMatrix.from_labels(predictions, ground_truth, labels)
+    return cache.get(predictions, ground_truth, labels)
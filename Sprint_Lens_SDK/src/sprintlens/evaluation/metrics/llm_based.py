@@ -10,6 +10,9 @@ from typing import List, Any, Dict, Optional, Union
 from dataclasses import dataclass
 
 from .base import BaseMetric, MetricResult, TextMetric
+from ..judge_batching import JudgeMicroBatcher
+from ..judge_cache import JudgeCache, judge_cache_key, judge_provider_id, get_judge_cache
+from ..rate_limiter import JudgeRateLimiter, estimate_tokens, get_rate_limiter
 from ...llm.providers import LLMProvider
 from ...utils.logging import get_logger
 
@@ -30,16 +33,34 @@ class LLMJudgeConfig:
 class LLMBasedMetric(BaseMetric):
     """Base class for LLM-based evaluation metrics."""
     
+    # Bump when prompts or response parsing change, to invalidate cached judgements
+    metric_version = "1"
+    
     def __init__(
         self,
         llm_provider: Optional[LLMProvider] = None,
         config: Optional[LLMJudgeConfig] = None,
+        cache: Optional[JudgeCache] = None,
+        rate_limiter: Optional[JudgeRateLimiter] = None,
+        batcher: Optional[JudgeMicroBatcher] = None,
         **kwargs
     ):
         super().__init__(**kwargs)
         self.llm_provider = llm_provider
         self.llm_config = config or LLMJudgeConfig()
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.batcher = batcher
         
+    def fingerprint_extra(self) -> Dict[str, Any]:
+        """Identify the judge provider and model behind this metric."""
+        return {
+            "judge": judge_provider_id(self.llm_provider) if self.llm_provider else None,
+            "model": self.llm_config.model,
+            "temperature": self.llm_config.temperature,
+            "version": self.metric_version
+        }
+    
     def _get_system_prompt(self) -> str:
         """Get the system prompt for this metric."""
         return "You are an expert evaluator. Provide objective, unbiased assessments."
@@ -115,19 +136,73 @@ class LLMBasedMetric(BaseMetric):
             prediction, ground_truth, context, **kwargs
         )
         
-        try:
-            response = await self.llm_provider.generate_async(
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": eval_prompt}
-                ],
-                model=self.llm_config.model,
-                temperature=self.llm_config.temperature,
-                max_tokens=self.llm_config.max_tokens,
-                timeout=self.llm_config.timeout
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": eval_prompt}
+        ]
+        
+        async def call_provider(prompt: str, max_tokens: Optional[int]) -> str:
+            call_messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ]
+            
+            async def call() -> str:
+                return await self.llm_provider.generate_async(
+                    messages=call_messages,
+                    model=self.llm_config.model,
+                    temperature=self.llm_config.temperature,
+                    max_tokens=max_tokens,
+                    timeout=self.llm_config.timeout
+                )
+            
+            # The shared limiter bounds calls in flight unless limiting was disabled
+            limiter = self.rate_limiter or get_rate_limiter(self.llm_config.model)
+            if limiter is None:
+                return await call()
+            return await limiter.run(call, estimated_tokens=estimate_tokens(call_messages, max_tokens))
+        
+        async def generate() -> str:
+            if self.batcher is None:
+                return await call_provider(eval_prompt, self.llm_config.max_tokens)
+            # Items sharing system prompt, provider and settings can share one judge call
+            response = await self.batcher.submit(
+                eval_prompt,
+                call_provider,
+                key=(system_prompt, id(self.llm_provider), self.llm_config.model, self.llm_config.temperature),
+                max_tokens=self.llm_config.max_tokens
             )
+            return response.content
+        
+        # Responses parsed while deciding whether to cache them
+        parsed: Dict[str, Dict[str, Any]] = {}
+        
+        def should_cache(value: Any) -> bool:
+            if not isinstance(value, str) or not value:
+                return False
+            parsed[value] = self._parse_llm_response(value)
+            # A reply without a usable score is not worth replaying
+            return not parsed[value].get("parse_error")
+        
+        try:
+            cache = self.cache or get_judge_cache()
+            if cache is None:
+                response = await generate()
+            else:
+                key = judge_cache_key(
+                    model=self.llm_config.model,
+                    provider=judge_provider_id(self.llm_provider),
+                    prompt=messages,
+                    metric=self.name,
+                    metric_version=self.metric_version,
+                    params={
+                        "temperature": self.llm_config.temperature,
+                        "max_tokens": self.llm_config.max_tokens
+                    }
+                )
+                response = await cache.get_or_compute(key, generate, should_cache=should_cache)
             
-            return self._parse_llm_response(response)
+            return parsed.get(response) or self._parse_llm_response(response)
             
         except Exception as e:
             logger.error(f"LLM evaluation failed: {str(e)}")
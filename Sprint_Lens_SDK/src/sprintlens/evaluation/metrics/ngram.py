@@ -0,0 +1,362 @@
+"""
+N-gram overlap scoring: BLEU and ROUGE.
+
+BLEU follows sacreBLEU (the default ``13a`` tokenizer, clipped n-gram
+precisions up to order 4, brevity
+penalty against the closest reference length, ``exp``/``floor``/``add-k``
+smoothing, effective order for sentence scores). ROUGE-1/2/L/Lsum follow
+Google's rouge-score package (lowercased alphanumeric tokens, max F-measure
+over references, union-LCS for Lsum) without stemming.
+
+Tokenization and n-gram counting are memoized, so a reference shared by
+many items (or scored by several metrics) is processed once. Corpus-level
+scores are built from sufficient statistics (BleuStats, RougeStats) that
+can be accumulated item by item and merged across batches.
+"""
+
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Optional, Sequence, Tuple, Union
+
+BLEU_MAX_ORDER = 4
+ROUGE_TYPES = ("rouge1", "rouge2", "rougeL", "rougeLsum")
+SMOOTH_METHODS = ("none", "floor", "add-k", "exp")
+
+# sacreBLEU's 13a tokenizer (mteval-v13a.pl), applied in order
+_BLEU_13A_RULES = (
+    # Symbols and most punctuation
+    (re.compile(r"([\{-\~\[-\` -\&\(-\+\:-\@\/])"), r" \1 "),
+    # Period and comma unless preceded by a digit
+    (re.compile(r"([^0-9])([\.,])"), r"\1 \2 "),
+    # Period and comma unless followed by a digit
+    (re.compile(r"([\.,])([^0-9])"), r" \1 \2"),
+    # Dash when preceded by a digit
+    (re.compile(r"([0-9])(-)"), r"\1 \2 "),
+)
+_ROUGE_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+References = Union[str, Sequence[str]]
+
+
+def _as_references(references: References) -> List[str]:
+    return [references] if isinstance(references, str) else list(references)
+
+
+@lru_cache(maxsize=65536)
+def bleu_tokenize(text: str) -> Tuple[str, ...]:
+    """Tokenize like sacreBLEU's default ``13a`` tokenizer (case preserved)."""
+    line = text.replace("<skipped>", "").replace("-\n", "").replace("\n", " ")
+    if "&" in line:
+        line = line.replace("&quot;", '"').replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
+    line = f" {line} "
+    for pattern, replacement in _BLEU_13A_RULES:
+        line = pattern.sub(replacement, line)
+    return tuple(line.split())
+
+
+@lru_cache(maxsize=65536)
+def rouge_tokenize(text: str) -> Tuple[str, ...]:
+    """Lowercase and keep alphanumeric runs, as rouge-score does."""
+    return tuple(token for token in _ROUGE_NON_ALNUM.split(text.lower()) if token)
+
+
+@lru_cache(maxsize=65536)
+def ngram_counts(tokens: Tuple[str, ...], n: int) -> Counter:
+    """
+    Count the n-grams of a token sequence.
+
+    The returned Counter is shared through the cache and must not be mutated.
+    """
+    return Counter(zip(*(tokens[i:] for i in range(n))))
+
+
+def lcs_table_length(a: Sequence[str], b: Sequence[str]) -> int:
+    """Longest common subsequence length with a single reused DP row."""
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return 0
+    row = [0] * (len(b) + 1)
+    for x in a:
+        diagonal = 0
+        for j, y in enumerate(b, 1):
+            above = row[j]
+            row[j] = diagonal + 1 if x == y else (above if above > row[j - 1] else row[j - 1])
+            diagonal = above
+    return row[-1]
+
+
+def _lcs_indices(reference: Sequence[str], candidate: Sequence[str]) -> List[int]:
+    """Reference positions of one longest common subsequence."""
+    rows, cols = len(reference), len(candidate)
+    table = [[0] * (cols + 1) for _ in range(rows + 1)]
+    for i in range(1, rows + 1):
+        current, previous, token = table[i], table[i - 1], reference[i - 1]
+        for j in range(1, cols + 1):
+            if token == candidate[j - 1]:
+                current[j] = previous[j - 1] + 1
+            else:
+                current[j] = max(previous[j], current[j - 1])
+    indices = []
+    i, j = rows, cols
+    while i > 0 and j > 0:
+        if reference[i - 1] == candidate[j - 1]:
+            indices.append(i - 1)
+            i -= 1
+            j -= 1
+        elif table[i][j - 1] > table[i - 1][j]:
+            j -= 1
+        else:
+            i -= 1
+    return indices[::-1]
+
+
+def _f_measure(precision: float, recall: float) -> float:
+    return 2 * precision * recall / (precision + recall) if precision + recall > 0 else 0.0
+
+
+class BleuStats:
+    """
+    Sufficient statistics for corpus BLEU.
+
+    Matches and totals per n-gram order plus hypothesis and reference
+    lengths; add() items as they arrive and merge() partial statistics.
+    """
+
+    def __init__(self, max_order: int = BLEU_MAX_ORDER):
+        self.max_order = max_order
+        self.matches = [0] * max_order
+        self.totals = [0] * max_order
+        self.hyp_len = 0
+        self.ref_len = 0
+
+    def add(self, hypothesis: str, references: References) -> 'BleuStats':
+        """Add one segment; returns the segment's own statistics."""
+        segment = self.segment(hypothesis, references, self.max_order)
+        self.merge(segment)
+        return segment
+
+    @classmethod
+    def segment(cls, hypothesis: str, references: References, max_order: int = BLEU_MAX_ORDER) -> 'BleuStats':
+        """Statistics for a single segment."""
+        stats = cls(max_order)
+        hyp_tokens = bleu_tokenize(hypothesis)
+        ref_tokens = [bleu_tokenize(ref) for ref in _as_references(references)]
+        stats.hyp_len = len(hyp_tokens)
+        # Closest reference length, preferring the shorter one on ties
+        stats.ref_len = min((abs(len(ref) - stats.hyp_len), len(ref)) for ref in ref_tokens)[1] if ref_tokens else 0
+
+        for n in range(1, max_order + 1):
+            hyp_ngrams = ngram_counts(hyp_tokens, n)
+            if len(ref_tokens) == 1:
+                max_ref = ngram_counts(ref_tokens[0], n)
+            else:
+                max_ref = Counter()
+                for ref in ref_tokens:
+                    max_ref |= ngram_counts(ref, n)
+            stats.matches[n - 1] = sum(min(count, max_ref[ngram]) for ngram, count in hyp_ngrams.items())
+            stats.totals[n - 1] = max(0, stats.hyp_len - n + 1)
+        return stats
+
+    def merge(self, other: 'BleuStats') -> None:
+        """Combine with statistics collected elsewhere."""
+        for i in range(self.max_order):
+            self.matches[i] += other.matches[i]
+            self.totals[i] += other.totals[i]
+        self.hyp_len += other.hyp_len
+        self.ref_len += other.ref_len
+
+    @property
+    def brevity_penalty(self) -> float:
+        if self.hyp_len == 0:
+            return 0.0
+        if self.hyp_len >= self.ref_len:
+            return 1.0
+        return math.exp(1 - self.ref_len / self.hyp_len)
+
+    def precisions(self, smooth_method: str = "exp", smooth_value: Optional[float] = None) -> List[float]:
+        """Smoothed n-gram precisions in [0, 1]."""
+        if smooth_method not in SMOOTH_METHODS:
+            raise ValueError(f"Unknown smoothing '{smooth_method}', expected one of {SMOOTH_METHODS}")
+        precisions = []
+        exp_factor = 1.0
+        for n, (matches, total) in enumerate(zip(self.matches, self.totals), 1):
+            if smooth_method == "add-k" and n > 1:
+                k = 1.0 if smooth_value is None else smooth_value
+                precisions.append((matches + k) / (total + k))
+            elif total == 0:
+                precisions.append(0.0)
+            elif matches == 0 and smooth_method == "exp":
+                exp_factor *= 2
+                precisions.append(1.0 / (exp_factor * total))
+            elif matches == 0 and smooth_method == "floor":
+                precisions.append((0.1 if smooth_value is None else smooth_value) / total)
+            else:
+                precisions.append(matches / total)
+        return precisions
+
+    def score(
+        self,
+        smooth_method: str = "exp",
+        smooth_value: Optional[float] = None,
+        effective_order: bool = False
+    ) -> float:
+        """
+        BLEU in [0, 1].
+
+        Args:
+            smooth_method: One of none, floor, add-k, exp
+            smooth_value: Floor value (default 0.1) or k (default 1)
+            effective_order: Only use orders that have n-grams (for short segments)
+
+        Returns:
+            BLEU score
+        """
+        if not any(self.matches):
+            return 0.0
+        precisions = self.precisions(smooth_method, smooth_value)
+        order = self.max_order
+        if effective_order:
+            order = sum(1 for total in self.totals if total > 0)
+            precisions = precisions[:order]
+        if order == 0 or any(p <= 0 for p in precisions):
+            return 0.0
+        return self.brevity_penalty * math.exp(sum(math.log(p) for p in precisions) / order)
+
+    def to_dict(self) -> Dict[str, Union[int, List[int]]]:
+        return {"matches": list(self.matches), "totals": list(self.totals), "hyp_len": self.hyp_len, "ref_len": self.ref_len}
+
+
+def sentence_bleu(hypothesis: str, references: References, smooth_method: str = "exp") -> float:
+    """Sentence BLEU with smoothing and effective order."""
+    return BleuStats.segment(hypothesis, references).score(smooth_method, effective_order=True)
+
+
+def corpus_bleu(
+    hypotheses: Sequence[str],
+    references: Sequence[References],
+    smooth_method: str = "exp"
+) -> float:
+    """Corpus BLEU from statistics pooled over all segments."""
+    if len(hypotheses) != len(references):
+        raise ValueError("Hypotheses and references must have the same length")
+    stats = BleuStats()
+    for hypothesis, refs in zip(hypotheses, references):
+        stats.add(hypothesis, refs)
+    return stats.score(smooth_method)
+
+
+def _rouge_n(hyp_tokens: Tuple[str, ...], ref_tokens: Tuple[str, ...], n: int) -> Tuple[float, float, float]:
+    hyp_ngrams, ref_ngrams = ngram_counts(hyp_tokens, n), ngram_counts(ref_tokens, n)
+    hyp_total, ref_total = max(0, len(hyp_tokens) - n + 1), max(0, len(ref_tokens) - n + 1)
+    if len(hyp_ngrams) > len(ref_ngrams):
+        hyp_ngrams, ref_ngrams = ref_ngrams, hyp_ngrams
+    overlap = sum(min(count, ref_ngrams[ngram]) for ngram, count in hyp_ngrams.items())
+    precision = overlap / hyp_total if hyp_total else 0.0
+    recall = overlap / ref_total if ref_total else 0.0
+    return precision, recall, _f_measure(precision, recall)
+
+
+def _rouge_l(hyp_tokens: Tuple[str, ...], ref_tokens: Tuple[str, ...]) -> Tuple[float, float, float]:
+    if not hyp_tokens or not ref_tokens:
+        return 0.0, 0.0, 0.0
+    lcs = lcs_table_length(hyp_tokens, ref_tokens)
+    precision, recall = lcs / len(hyp_tokens), lcs / len(ref_tokens)
+    return precision, recall, _f_measure(precision, recall)
+
+
+def _rouge_lsum(hypothesis: str, reference: str) -> Tuple[float, float, float]:
+    """Summary-level ROUGE-L over newline-separated sentences."""
+    hyp_sents = [tokens for tokens in (rouge_tokenize(s) for s in hypothesis.split("\n")) if tokens]
+    ref_sents = [tokens for tokens in (rouge_tokenize(s) for s in reference.split("\n")) if tokens]
+    hyp_len, ref_len = sum(map(len, hyp_sents)), sum(map(len, ref_sents))
+    if not hyp_len or not ref_len:
+        return 0.0, 0.0, 0.0
+
+    hyp_counts, ref_counts = Counter(), Counter()
+    for sentence in hyp_sents:
+        hyp_counts.update(sentence)
+    for sentence in ref_sents:
+        ref_counts.update(sentence)
+
+    hits = 0
+    for ref in ref_sents:
+        union = sorted(set().union(*(_lcs_indices(ref, hyp) for hyp in hyp_sents)))
+        for token in (ref[i] for i in union):
+            if hyp_counts[token] > 0 and ref_counts[token] > 0:
+                hits += 1
+                hyp_counts[token] -= 1
+                ref_counts[token] -= 1
+    precision, recall = hits / hyp_len, hits / ref_len
+    return precision, recall, _f_measure(precision, recall)
+
+
+def rouge_scores(
+    hypothesis: str,
+    references: References,
+    rouge_types: Sequence[str] = ROUGE_TYPES
+) -> Dict[str, Dict[str, float]]:
+    """
+    ROUGE precision, recall and F-measure for one item.
+
+    Args:
+        hypothesis: Generated text
+        references: Reference text or texts (the best F-measure is kept)
+        rouge_types: Any of rouge1, rouge2, rougeL, rougeLsum
+
+    Returns:
+        Mapping of ROUGE type to {"precision", "recall", "fmeasure"}
+    """
+    for rouge_type in rouge_types:
+        if rouge_type not in ROUGE_TYPES:
+            raise ValueError(f"Unknown ROUGE type '{rouge_type}', expected one of {ROUGE_TYPES}")
+    hyp_tokens = rouge_tokenize(hypothesis)
+    scores = {}
+    for rouge_type in rouge_types:
+        best = None
+        for reference in _as_references(references):
+            if rouge_type == "rougeLsum":
+                score = _rouge_lsum(hypothesis, reference)
+            elif rouge_type == "rougeL":
+                score = _rouge_l(hyp_tokens, rouge_tokenize(reference))
+            else:
+                score = _rouge_n(hyp_tokens, rouge_tokenize(reference), int(rouge_type[-1]))
+            if best is None or score[2] > best[2]:
+                best = score
+        best = best or (0.0, 0.0, 0.0)
+        scores[rouge_type] = {"precision": best[0], "recall": best[1], "fmeasure": best[2]}
+    return scores
+
+
+class RougeStats:
+    """Running means of ROUGE precision, recall and F-measure per type."""
+
+    def __init__(self, rouge_types: Sequence[str] = ROUGE_TYPES):
+        self.rouge_types = tuple(rouge_types)
+        self.count = 0
+        self.sums = {t: {"precision": 0.0, "recall": 0.0, "fmeasure": 0.0} for t in self.rouge_types}
+
+    def add(self, hypothesis: str, references: References) -> Dict[str, Dict[str, float]]:
+        """Score one item and fold it in; returns the item's scores."""
+        scores = rouge_scores(hypothesis, references, self.rouge_types)
+        self.count += 1
+        for rouge_type, values in scores.items():
+            for key, value in values.items():
+                self.sums[rouge_type][key] += value
+        return scores
+
+    def merge(self, other: 'RougeStats') -> None:
+        """Combine with statistics collected elsewhere."""
+        self.count += other.count
+        for rouge_type in self.rouge_types:
+            for key, value in other.sums[rouge_type].items():
+                self.sums[rouge_type][key] += value
+
+    def mean(self) -> Dict[str, Dict[str, float]]:
+        """Mean scores per ROUGE type."""
+        return {
+            rouge_type: {key: value / self.count if self.count else 0.0 for key, value in sums.items()}
+            for rouge_type, sums in self.sums.items()
+        }
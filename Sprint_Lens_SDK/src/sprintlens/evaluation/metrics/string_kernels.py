@@ -0,0 +1,303 @@
+"""
+String similarity kernels for text metrics.
+
+Edit distances and similarity ratios used by LevenshteinDistanceMetric and
+SimilarityMetric, with batch APIs for aligned prediction/reference lists.
+When ``rapidfuzz`` is installed its native implementations are used;
+otherwise pure-Python fallbacks do the work:
+
+- Levenshtein: bit-parallel Myers/Hyyrö algorithm over Python integers
+  (one word-parallel step per character, any string length), or a banded
+  dynamic program with early exit when a small ``max_distance`` is given
+- Indel (LCS) similarity: bit-parallel LCS, the linear-time replacement for
+  difflib.SequenceMatcher.ratio()
+- Jaro-Winkler and token-set ratio, with rapidfuzz's conventions (no case
+  folding, prefix boost only above a Jaro score of 0.7)
+
+Common prefixes and suffixes are stripped before any computation, which
+makes near-identical long outputs cheap.
+"""
+
+from typing import List, Dict, Optional, Sequence, Tuple
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein, Indel as _rf_indel, JaroWinkler as _rf_jaro_winkler
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Use the banded DP instead of the bit-parallel kernel below this band width
+_MAX_BAND_WIDTH = 16
+
+
+def _strip_affixes(a: str, b: str) -> Tuple[str, str]:
+    """Remove the common prefix and suffix, which never affect the distance."""
+    if a == b:
+        return "", ""
+    limit = min(len(a), len(b))
+    start = 0
+    while start < limit and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < limit - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    return a[start:len(a) - end], b[start:len(b) - end]
+
+
+def _pattern_masks(pattern: str, masks: Dict[str, int]) -> Dict[str, int]:
+    """Fill ``masks`` with the bit positions of every character of the pattern."""
+    masks.clear()
+    bit = 1
+    for char in pattern:
+        masks[char] = masks.get(char, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def _myers_distance(pattern: str, text: str, masks: Dict[str, int], max_distance: Optional[int]) -> int:
+    """Bit-parallel Levenshtein distance (Hyyrö's formulation of Myers' algorithm)."""
+    m = len(pattern)
+    _pattern_masks(pattern, masks)
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    remaining = len(text)
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & full) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & full
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv
+        remaining -= 1
+        # The score can drop by at most one per remaining character
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+    return score
+
+
+def _banded_distance(a: str, b: str, max_distance: int) -> int:
+    """Levenshtein distance restricted to a diagonal band, exiting once it exceeds the threshold."""
+    n, m = len(a), len(b)
+    k = max_distance
+    big = k + 1
+    previous = [j if j <= k else big for j in range(m + 1)]
+    current = [big] * (m + 1)
+    for i in range(1, n + 1):
+        low, high = max(1, i - k), min(m, i + k)
+        current[low - 1] = i if low == 1 and i <= k else big
+        char = a[i - 1]
+        row_min = current[low - 1]
+        for j in range(low, high + 1):
+            cost = previous[j - 1] + (char != b[j - 1])
+            insert = current[j - 1] + 1
+            delete = previous[j] + 1
+            value = min(cost, insert, delete)
+            current[j] = value if value < big else big
+            if current[j] < row_min:
+                row_min = current[j]
+        if high < m:
+            current[high + 1] = big
+        if row_min > k:
+            return big
+        previous, current = current, previous
+    return min(previous[m], big)
+
+
+def levenshtein_distance(
+    a: str,
+    b: str,
+    max_distance: Optional[int] = None,
+    _masks: Optional[Dict[str, int]] = None
+) -> int:
+    """
+    Levenshtein (edit) distance.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Stop once the distance is known to exceed this value;
+            ``max_distance + 1`` is returned in that case
+
+    Returns:
+        Number of single-character insertions, deletions and substitutions
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return _rf_levenshtein.distance(a, b, score_cutoff=max_distance)
+
+    a, b = _strip_affixes(a, b)
+    if len(a) > len(b):
+        a, b = b, a
+    if max_distance is not None and len(b) - len(a) > max_distance:
+        return max_distance + 1
+    if not a:
+        return len(b)
+    if max_distance is not None and 2 * max_distance + 1 <= _MAX_BAND_WIDTH < len(a):
+        return _banded_distance(a, b, max_distance)
+    return _myers_distance(a, b, _masks if _masks is not None else {}, max_distance)
+
+
+def normalized_levenshtein_similarity(a: str, b: str, _masks: Optional[Dict[str, int]] = None) -> float:
+    """
+    Levenshtein similarity in [0, 1]: 1 - distance / max(len(a), len(b)).
+
+    Two empty strings are identical (1.0).
+    """
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    return 1.0 - levenshtein_distance(a, b, _masks=_masks) / longest
+
+
+def lcs_length(a: str, b: str, _masks: Optional[Dict[str, int]] = None) -> int:
+    """Length of the longest common subsequence (bit-parallel)."""
+    prefix = 0
+    limit = min(len(a), len(b))
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    a, b = a[prefix:], b[prefix:]
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return prefix
+    masks = _pattern_masks(a, _masks if _masks is not None else {})
+    full = (1 << len(a)) - 1
+    s = full
+    for char in b:
+        matches = s & masks.get(char, 0)
+        s = ((s + matches) | (s - matches)) & full
+    return prefix + len(a) - bin(s).count("1")
+
+
+def indel_similarity(a: str, b: str, _masks: Optional[Dict[str, int]] = None) -> float:
+    """
+    Normalized Indel similarity, 2 * LCS / (len(a) + len(b)).
+
+    The same formula as difflib.SequenceMatcher.ratio(), computed from the
+    optimal common subsequence in linear passes.
+    """
+    total = len(a) + len(b)
+    if total == 0:
+        return 1.0
+    if RAPIDFUZZ_AVAILABLE:
+        return _rf_indel.normalized_similarity(a, b)
+    return 2.0 * lcs_length(a, b, _masks) / total
+
+
+def jaro_winkler_similarity(a: str, b: str, prefix_weight: float = 0.1) -> float:
+    """
+    Jaro-Winkler similarity in [0, 1].
+
+    Args:
+        a: First string
+        b: Second string
+        prefix_weight: Boost per matching leading character (up to four),
+            applied only when the Jaro similarity exceeds 0.7
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return _rf_jaro_winkler.similarity(a, b, prefix_weight=prefix_weight)
+    if a == b:
+        return 1.0
+    len_a, len_b = len(a), len(b)
+    if not len_a or not len_b:
+        return 0.0
+
+    window = max(max(len_a, len_b) // 2 - 1, 0)
+    matched_b = [False] * len_b
+    matches_a = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(len_b, i + window + 1)):
+            if not matched_b[j] and b[j] == char:
+                matched_b[j] = True
+                matches_a.append(char)
+                break
+    matches = len(matches_a)
+    if matches == 0:
+        return 0.0
+
+    matches_b = [b[j] for j in range(len_b) if matched_b[j]]
+    transpositions = sum(x != y for x, y in zip(matches_a, matches_b)) // 2
+    jaro = (matches / len_a + matches / len_b + (matches - transpositions) / matches) / 3
+    if jaro <= 0.7:
+        return jaro
+
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_weight * (1.0 - jaro)
+
+
+def token_set_ratio(a: str, b: str) -> float:
+    """
+    Token-set similarity in [0, 1], insensitive to word order and repetition.
+
+    Compares the shared tokens with each side's full token set and returns
+    the best Indel similarity (1.0 when one token set contains the other).
+    Case-sensitive, and 0.0 when either text has no tokens, as in rapidfuzz.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return _rf_fuzz.token_set_ratio(a, b) / 100.0
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    if not tokens_a or not tokens_b:
+        return 0.0
+    common = " ".join(sorted(tokens_a & tokens_b))
+    only_a = " ".join(sorted(tokens_a - tokens_b))
+    only_b = " ".join(sorted(tokens_b - tokens_a))
+    if common and (not only_a or not only_b):
+        return 1.0
+    combined_a = f"{common} {only_a}".strip()
+    combined_b = f"{common} {only_b}".strip()
+    masks: Dict[str, int] = {}
+    return max(
+        indel_similarity(combined_a, combined_b, masks),
+        indel_similarity(common, combined_a, masks) if common else 0.0,
+        indel_similarity(common, combined_b, masks) if common else 0.0
+    )
+
+
+def _pairs(predictions: Sequence[str], references: Sequence[str]):
+    if len(predictions) != len(references):
+        raise ValueError("Predictions and references must have the same length")
+    return zip(predictions, references)
+
+
+def levenshtein_distance_batch(
+    predictions: Sequence[str],
+    references: Sequence[str],
+    max_distance: Optional[int] = None
+) -> List[int]:
+    """Levenshtein distance of every aligned pair, reusing one bitmask table."""
+    masks: Dict[str, int] = {}
+    return [levenshtein_distance(p, r, max_distance, masks) for p, r in _pairs(predictions, references)]
+
+
+def normalized_levenshtein_similarity_batch(predictions: Sequence[str], references: Sequence[str]) -> List[float]:
+    """Normalized Levenshtein similarity of every aligned pair."""
+    masks: Dict[str, int] = {}
+    return [normalized_levenshtein_similarity(p, r, masks) for p, r in _pairs(predictions, references)]
+
+
+def indel_similarity_batch(predictions: Sequence[str], references: Sequence[str]) -> List[float]:
+    """Indel similarity of every aligned pair."""
+    masks: Dict[str, int] = {}
+    return [indel_similarity(p, r, masks) for p, r in _pairs(predictions, references)]
+
+
+def jaro_winkler_similarity_batch(predictions: Sequence[str], references: Sequence[str]) -> List[float]:
+    """Jaro-Winkler similarity of every aligned pair."""
+    return [jaro_winkler_similarity(p, r) for p, r in _pairs(predictions, references)]
+
+
+def token_set_ratio_batch(predictions: Sequence[str], references: Sequence[str]) -> List[float]:
+    """Token-set ratio of every aligned pair."""
+    return [token_set_ratio(p, r) for p, r in _pairs(predictions, references)]
@@ -11,9 +11,10 @@ import json
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Callable, Awaitable
 import httpx
 
+from .rate_limiter import JudgeRateLimiter, Priority, estimate_tokens, get_rate_limiter
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -36,17 +37,23 @@ class AgentLensBaseModel(ABC):
     
     All custom models must inherit from this class and implement the required methods.
     This provides a consistent interface for model integration across different providers.
+    
+    Implementations should route provider calls through ``_run_limited`` so
+    they respect the model's rate limits and adaptive concurrency.
     """
     
-    def __init__(self, model_name: str, **kwargs):
+    def __init__(self, model_name: str, rate_limiter: Optional[JudgeRateLimiter] = None, **kwargs):
         """
         Initialize the custom model.
         
         Args:
             model_name: Name/identifier of the model
+            rate_limiter: Limiter for this model's calls (defaults to the
+                shared limiter from configure_rate_limits)
             **kwargs: Additional model-specific configuration
         """
         self.model_name = model_name
+        self.rate_limiter = rate_limiter
         self.config = kwargs
         self._session = None
     
@@ -78,6 +85,38 @@ class AgentLensBaseModel(ABC):
         """
         pass
     
+    async def _run_limited(
+        self,
+        call: Callable[..., Awaitable[ModelResponse]],
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int],
+        **kwargs
+    ) -> ModelResponse:
+        """
+        Make a provider call within the model's rate limits.
+        
+        Args:
+            call: Coroutine function called as ``call(messages, **kwargs)``
+            messages: Chat messages
+            max_tokens: Completion token limit, for the token estimate
+            **kwargs: Generation parameters; ``priority`` overrides the
+                admission priority
+            
+        Returns:
+            ModelResponse from the call
+        """
+        priority: Optional[Priority] = kwargs.pop("priority", None)
+        limiter = self.rate_limiter or get_rate_limiter(self.model_name)
+        if limiter is None:
+            return await call(messages, **kwargs)
+        
+        return await limiter.run(
+            lambda: call(messages, **kwargs),
+            priority=priority,
+            estimated_tokens=estimate_tokens(messages, max_tokens),
+            usage=lambda response: (response.usage or {}).get("total_tokens")
+        )
+    
     async def close(self):
         """Close any open connections or cleanup resources."""
         if self._session:
@@ -142,6 +181,12 @@ class LiteLLMChatModel(AgentLensBaseModel):
     
     async def generate_provider_response(self, messages: List[Dict[str, str]], **kwargs) -> ModelResponse:
         """Generate response using LiteLLM with full metadata."""
+        return await self._run_limited(
+            self._complete, messages, kwargs.get("max_tokens", self.max_tokens), **kwargs
+        )
+    
+    async def _complete(self, messages: List[Dict[str, str]], **kwargs) -> ModelResponse:
+        """Make one LiteLLM completion call."""
         start_time = time.time()
         
         try:
@@ -258,6 +303,12 @@ class CustomOpenAICompatibleModel(AgentLensBaseModel):
     
     async def generate_provider_response(self, messages: List[Dict[str, str]], **kwargs) -> ModelResponse:
         """Generate response using OpenAI-compatible API."""
+        return await self._run_limited(
+            self._complete, messages, kwargs.get("max_tokens", self.max_tokens), **kwargs
+        )
+    
+    async def _complete(self, messages: List[Dict[str, str]], **kwargs) -> ModelResponse:
+        """Make one chat completions request."""
         start_time = time.time()
         
         try:
@@ -362,6 +413,12 @@ class HuggingFaceModel(AgentLensBaseModel):
     
     async def generate_provider_response(self, messages: List[Dict[str, str]], **kwargs) -> ModelResponse:
         """Generate response using Hugging Face API."""
+        return await self._run_limited(
+            self._complete, messages, kwargs.get("max_new_tokens", self.max_new_tokens), **kwargs
+        )
+    
+    async def _complete(self, messages: List[Dict[str, str]], **kwargs) -> ModelResponse:
+        """Make one inference request."""
         start_time = time.time()
         
         try:
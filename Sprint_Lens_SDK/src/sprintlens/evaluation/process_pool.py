@@ -0,0 +1,434 @@
+"""
+Process-pool execution backend for CPU-bound metrics.
+
+Synchronous metrics normally run on the evaluator's thread pool, where
+pure-Python scorers (edit distance, BLEU/ROUGE, custom functions) are
+serialized by the GIL. With a ProcessPoolBackend, BatchEvaluator ships every
+batch of items to a pool of worker processes instead:
+
+- Metrics are sent to each worker once, when it starts, by pickling or, for
+  metrics that cannot be pickled, by import path and configuration. Workers
+  stay warm across batches and runs.
+- Each batch is one task scoring all pooled metrics; results are returned as
+  soon as the batch completes, together with per-metric partial aggregates
+  that are merged in the parent.
+- The current trace and span ids are passed along with each task (see
+  get_shard_trace_context()), and each task is recorded as a child span of
+  the current span.
+
+Metrics with their own async implementation (LLM judges and other I/O-bound
+metrics) keep running in the parent's event loop.
+
+Example:
+    >>> batch = BatchEvaluator(evaluator, batch_size=500, process_pool=32)
+    >>> result = batch.evaluate_dataset(dataset)
+    >>> batch.close()
+"""
+
+import asyncio
+import importlib
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Callable, Optional, Tuple, Iterable, Set
+
+from .checkpoint import _digest
+from .metrics import BaseMetric, MetricResult
+from .streaming import RunningStats
+from ..tracing.context import get_current_span, get_trace_id
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# (kind, data): ("pickle", bytes) or ("import", ("module:qualname", kwargs))
+MetricPayload = Tuple[str, Any]
+# Per-item result as shipped back from a worker: (value, error, details, duration_ms)
+EncodedResult = Tuple[Optional[float], Optional[str], Dict[str, Any], Optional[float]]
+
+# Metrics of the current worker process, loaded once by _init_worker()
+_worker_metrics: Dict[str, BaseMetric] = {}
+
+_shard_trace_context: ContextVar[Optional[Dict[str, Optional[str]]]] = ContextVar(
+    "shard_trace_context", default=None
+)
+
+
+def get_shard_trace_context() -> Optional[Dict[str, Optional[str]]]:
+    """
+    Trace context of the batch being scored in this worker process.
+
+    Returns:
+        Dict with ``trace_id`` and ``span_id`` of the parent process's
+        span for the batch, or None outside a pooled metric
+    """
+    return _shard_trace_context.get()
+
+
+def is_sync_metric(metric: BaseMetric) -> bool:
+    """Whether a metric only has a synchronous implementation."""
+    return (type(metric).evaluate_batch_async is BaseMetric.evaluate_batch_async
+            and type(metric).evaluate_async is BaseMetric.evaluate_async)
+
+
+def metric_payload(metric: BaseMetric) -> Optional[MetricPayload]:
+    """
+    Serialize a metric for shipping to worker processes.
+
+    Pickling is tried first. Otherwise the metric is rebuilt in the worker
+    from its class import path and configuration, which requires a
+    module-level class accepting ``name`` and its config as keyword
+    arguments.
+
+    Args:
+        metric: Metric instance
+
+    Returns:
+        Payload, or None if the metric cannot be shipped
+    """
+    try:
+        return ("pickle", pickle.dumps(metric))
+    except Exception as e:
+        logger.debug(f"Metric {metric.name} is not picklable ({e}); trying import path")
+
+    cls = type(metric)
+    payload: MetricPayload = (
+        "import",
+        (f"{cls.__module__}:{cls.__qualname__}", {"name": metric.name, **metric.config})
+    )
+    try:
+        load_metric(payload)
+    except Exception as e:
+        logger.debug(f"Metric {metric.name} cannot be rebuilt from its import path: {e}")
+        return None
+    return payload
+
+
+def load_metric(payload: MetricPayload) -> BaseMetric:
+    """
+    Rebuild a metric from metric_payload().
+
+    Args:
+        payload: Serialized metric
+
+    Returns:
+        Metric instance
+    """
+    kind, data = payload
+    if kind == "pickle":
+        return pickle.loads(data)
+    if kind == "import":
+        path, kwargs = data
+        module_name, _, qualname = path.partition(":")
+        target: Any = importlib.import_module(module_name)
+        for attribute in qualname.split("."):
+            target = getattr(target, attribute)
+        return target(**kwargs)
+    raise ValueError(f"Unknown metric payload kind: {kind}")
+
+
+def _init_worker(payloads: Dict[str, MetricPayload]) -> None:
+    """Worker initializer: load the pooled metrics once per process."""
+    global _worker_metrics
+    _worker_metrics = {name: load_metric(payload) for name, payload in payloads.items()}
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+def _score_shard(
+    metric_names: List[str],
+    predictions: List[Any],
+    ground_truth: List[Any],
+    trace_context: Optional[Dict[str, Optional[str]]]
+) -> Tuple[Dict[str, List[EncodedResult]], Dict[str, RunningStats], Dict[str, Any]]:
+    """Score one batch with the given metrics inside a worker process."""
+    token = _shard_trace_context.set(trace_context)
+    start_time = time.perf_counter()
+    try:
+        columns: Dict[str, List[EncodedResult]] = {}
+        partials: Dict[str, RunningStats] = {}
+        for name in metric_names:
+            metric = _worker_metrics[name]
+            metric_start = time.time()
+            try:
+                results = metric.evaluate_batch(predictions, ground_truth)
+                if len(results) != len(predictions):
+                    raise ValueError(
+                        f"Metric returned {len(results)} results for {len(predictions)} items"
+                    )
+                encoded = [
+                    (result.value, result.error, result.details, result.duration_ms)
+                    for result in results
+                ]
+            except Exception as e:
+                duration_ms = (time.time() - metric_start) * 1000
+                encoded = [
+                    (None, str(e), {"error": True, "exception": str(e)}, duration_ms)
+                    for _ in predictions
+                ]
+
+            stats = RunningStats()
+            for value, error, _, _ in encoded:
+                if value is not None and error is None:
+                    stats.add(value)
+            columns[name] = encoded
+            partials[name] = stats
+
+        return columns, partials, {
+            "pid": os.getpid(),
+            "duration_ms": (time.perf_counter() - start_time) * 1000
+        }
+    finally:
+        _shard_trace_context.reset(token)
+
+
+@dataclass
+class ProcessPoolStats:
+    """Work done by a process pool backend, with merged partial aggregates."""
+    shards: int = 0
+    items: int = 0
+    failed_shards: int = 0
+    worker_time_ms: float = 0.0
+    worker_pids: Set[int] = field(default_factory=set)
+    metric_stats: Dict[str, RunningStats] = field(default_factory=dict)
+
+    def merge(self, partials: Dict[str, RunningStats]) -> None:
+        """Merge per-metric partial aggregates from one shard."""
+        for name, partial in partials.items():
+            self.metric_stats.setdefault(name, RunningStats()).merge(partial)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "shards": self.shards,
+            "items": self.items,
+            "failed_shards": self.failed_shards,
+            "worker_time_ms": self.worker_time_ms,
+            "workers": len(self.worker_pids),
+            "metrics": {
+                name: {"count": stats.count, "mean": stats.mean, "std": stats.std}
+                for name, stats in self.metric_stats.items()
+            }
+        }
+
+
+class ProcessPoolBackend:
+    """
+    Scores synchronous metrics on a pool of warm worker processes.
+
+    The pool is started lazily and restarted only when the set of pooled
+    metrics changes, a worker dies, or a batch times out while a worker is
+    still scoring it.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        metrics: Optional[Iterable[str]] = None,
+        mp_context: Optional[str] = "spawn"
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count)
+            metrics: Names of the metrics to run in the pool; by default
+                every synchronous metric that can be shipped
+            mp_context: Multiprocessing start method; "spawn" keeps workers
+                independent of the parent's threads and event loop
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.metric_filter = set(metrics) if metrics is not None else None
+        self.mp_context = mp_context
+        self.stats = ProcessPoolStats()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_key: Optional[str] = None
+        self._payloads: Dict[BaseMetric, Optional[MetricPayload]] = {}
+        # Workers started by the current pool: the executor starts one per
+        # submitted task until max_workers are running
+        self._workers = 0
+        # Unfinished tasks of the current pool, cancelled on close()
+        self._pending: Set[Future] = set()
+
+    def select_metrics(self, metrics: Iterable[BaseMetric]) -> List[BaseMetric]:
+        """
+        Metrics that will run in the pool.
+
+        Args:
+            metrics: Candidate metrics
+
+        Returns:
+            Synchronous, shippable metrics (restricted to the configured names)
+        """
+        selected = []
+        for metric in metrics:
+            if self.metric_filter is not None and metric.name not in self.metric_filter:
+                continue
+            if not is_sync_metric(metric):
+                continue
+            if metric not in self._payloads:
+                self._payloads[metric] = metric_payload(metric)
+                if self._payloads[metric] is None:
+                    logger.warning(f"Metric {metric.name} cannot be sent to worker processes; running it in-process")
+            if self._payloads[metric] is not None:
+                selected.append(metric)
+        return selected
+
+    def warm_up(self, metrics: Iterable[BaseMetric]) -> int:
+        """
+        Start all workers and load the metrics in them.
+
+        Args:
+            metrics: Metrics that will be pooled
+
+        Returns:
+            Number of worker processes started
+        """
+        pool = self._get_pool(self.select_metrics(metrics))
+        futures = [self._submit(pool, _warm_up) for _ in range(self.max_workers)]
+        self.stats.worker_pids.update(future.result() for future in futures)
+        return self._workers
+
+    async def evaluate_batch_async(
+        self,
+        metrics: List[BaseMetric],
+        predictions: List[Any],
+        ground_truth: List[Any],
+        timeout: Optional[float] = None,
+        batch_idx: Optional[int] = None
+    ) -> Dict[str, List[MetricResult]]:
+        """
+        Score one batch with pooled metrics in a worker process.
+
+        Args:
+            metrics: Metrics returned by select_metrics()
+            predictions: Predicted values
+            ground_truth: Ground truth values
+            timeout: Seconds to wait for the worker
+            batch_idx: Batch index, used to name the trace span
+
+        Returns:
+            Mapping of metric name to per-item results, aligned with the inputs
+        """
+        pool = self._get_pool(metrics)
+        names = [metric.name for metric in metrics]
+        parent_span = get_current_span()
+        span = None
+        if parent_span is not None:
+            span = parent_span.create_child_span(
+                f"process_shard_{batch_idx}" if batch_idx is not None else "process_shard"
+            ).__enter__()
+            span.set_input({"metrics": names, "items": len(predictions)})
+        trace_context = {
+            "trace_id": parent_span.trace_id if parent_span is not None else get_trace_id(),
+            "span_id": span.id if span is not None else None
+        }
+        start_time = time.time()
+        future = None
+
+        try:
+            future = self._submit(pool, _score_shard, names, predictions, ground_truth, trace_context)
+            columns, partials, info = await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # A worker died; start a fresh pool for the next batch
+                self.close()
+            elif isinstance(e, asyncio.TimeoutError) and future is not None and not future.cancel():
+                # A worker is still scoring the batch; later batches get a fresh
+                # pool, and the busy worker exits once it finishes
+                self._retire_pool()
+            if isinstance(e, asyncio.TimeoutError):
+                error = f"Metric timed out after {timeout}s"
+                details: Dict[str, Any] = {"error": True, "timeout": timeout}
+            else:
+                error = str(e) or type(e).__name__
+                details = {"error": True, "exception": error}
+            logger.error(f"Process pool batch failed: {error}")
+            self.stats.failed_shards += 1
+            if span is not None:
+                span.set_error(e)
+                span.__exit__(None, None, None)
+            duration_ms = (time.time() - start_time) * 1000
+            return {
+                name: [
+                    MetricResult(name=name, value=None, error=error, details=dict(details), duration_ms=duration_ms)
+                    for _ in predictions
+                ]
+                for name in names
+            }
+
+        self.stats.shards += 1
+        self.stats.items += len(predictions)
+        self.stats.worker_time_ms += info["duration_ms"]
+        self.stats.worker_pids.add(info["pid"])
+        self.stats.merge(partials)
+        if span is not None:
+            span.set_metadata("worker_pid", info["pid"])
+            span.add_metric("worker_duration_ms", info["duration_ms"], unit="ms")
+            span.__exit__(None, None, None)
+
+        return {
+            name: [
+                MetricResult(name=name, value=value, error=error, details=details, duration_ms=duration_ms)
+                for value, error, details, duration_ms in column
+            ]
+            for name, column in columns.items()
+        }
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._pool is not None:
+            # shutdown(cancel_futures=True) needs Python 3.9
+            for future in list(self._pending):
+                future.cancel()
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self._pool_key = None
+            self._workers = 0
+            self._pending = set()
+
+    def _retire_pool(self) -> None:
+        """Stop using the current pool, letting its queued batches finish."""
+        if self._pool is not None:
+            logger.warning("Replacing process pool after a timed-out batch")
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self._pool_key = None
+            self._workers = 0
+            self._pending = set()
+
+    def _submit(self, pool: ProcessPoolExecutor, fn: Callable[..., Any], *args: Any) -> Future:
+        """Submit a task, counting the worker it starts."""
+        future = pool.submit(fn, *args)
+        self._workers = min(self.max_workers, self._workers + 1)
+        pending = self._pending
+        pending.add(future)
+        future.add_done_callback(pending.discard)
+        return future
+
+    def __enter__(self) -> "ProcessPoolBackend":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _get_pool(self, metrics: List[BaseMetric]) -> ProcessPoolExecutor:
+        payloads = {metric.name: self._payloads[metric] for metric in metrics}
+        key = _digest(sorted((name, repr(payload)) for name, payload in payloads.items()))
+        if self._pool is None or key != self._pool_key:
+            self.close()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.mp_context) if self.mp_context else None,
+                initializer=_init_worker,
+                initargs=(payloads,)
+            )
+            self._pool_key = key
+            logger.debug(f"Started process pool with {self.max_workers} workers for {sorted(payloads)}")
+        return self._pool
@@ -0,0 +1,455 @@
+"""
+Adaptive rate limiting for LLM judge calls.
+
+A JudgeRateLimiter combines three mechanisms per model:
+
+- token buckets for requests per minute and tokens per minute
+- AIMD concurrency control: the number of calls in flight grows slowly
+  while calls succeed and is cut multiplicatively on 429s and timeouts
+- priority ordering, so interactive evaluations are admitted before batch
+  backfills waiting on the same model
+
+Limiters are shared per model through configure_rate_limits() and picked
+up by the evaluation model classes and LLM-based metrics. Until limits are
+configured every model gets a limiter with AIMD concurrency control only,
+so judge fan-out is bounded by default.
+
+Example:
+    >>> configure_rate_limits(requests_per_minute=500, tokens_per_minute=150_000)
+    >>> with priority_scope(Priority.INTERACTIVE):
+    ...     result = await evaluator.evaluate_async(predictions, ground_truth)
+"""
+
+import asyncio
+import contextvars
+import heapq
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from enum import IntEnum
+from typing import Optional, Dict, Any, List, Callable, Awaitable, Iterator, TypeVar
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses that mean "slow down"
+OVERLOAD_STATUS_CODES = (429, 503)
+
+
+class Priority(IntEnum):
+    """Admission priority; lower values are admitted first."""
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
+
+
+_current_priority: contextvars.ContextVar[Optional[Priority]] = contextvars.ContextVar(
+    "sprintlens_judge_priority", default=None
+)
+
+
+def current_priority() -> Priority:
+    """Priority of judge calls made in the current context."""
+    return _current_priority.get() or Priority.NORMAL
+
+
+@contextmanager
+def priority_scope(priority: Priority, replace: bool = True) -> Iterator[None]:
+    """
+    Set the priority of judge calls made within the block.
+
+    Args:
+        priority: Priority to use
+        replace: Whether to override a priority set by an enclosing scope
+    """
+    if not replace and _current_priority.get() is not None:
+        yield
+        return
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an error signals rate limiting or overload (429, 503, timeouts)."""
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    try:
+        import httpx
+        if isinstance(error, httpx.TimeoutException):
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in OVERLOAD_STATUS_CODES
+    except ImportError:
+        pass
+    if getattr(error, "status_code", None) in OVERLOAD_STATUS_CODES:
+        return True
+    # e.g. litellm.RateLimitError, openai.RateLimitError
+    return "RateLimit" in type(error).__name__
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Retry-After delay carried by an error, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], max_tokens: Optional[int] = None) -> int:
+    """
+    Rough token estimate for a chat request (about four characters per token).
+
+    Args:
+        messages: Chat messages
+        max_tokens: Completion token limit
+
+    Returns:
+        Estimated prompt plus completion tokens
+    """
+    characters = sum(len(str(message.get("content", ""))) for message in messages)
+    return characters // 4 + len(messages) * 4 + (max_tokens or 0)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            per_minute: Refill rate per minute
+            burst: Bucket capacity (defaults to one minute's worth)
+        """
+        if per_minute <= 0:
+            raise ValueError("per_minute must be positive")
+        self.rate = per_minute / 60.0
+        self.capacity = burst or per_minute
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until ``amount`` tokens are available and take them."""
+        # Requests larger than the bucket wait for a full bucket instead of forever
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def adjust(self, amount: float) -> None:
+        """Take (or return, if negative) tokens after the fact, e.g. to reconcile estimates."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class AIMDController:
+    """Additive-increase/multiplicative-decrease concurrency limit."""
+
+    def __init__(
+        self,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            initial: Starting concurrency limit
+            minimum: Lowest limit
+            maximum: Highest limit
+            increase: Limit increase per limit's worth of successful calls
+            decrease: Factor applied to the limit on overload
+            cooldown: Seconds after a decrease during which further
+                overload signals (from the same burst) are ignored
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self._last_decrease = float("-inf")
+
+    @property
+    def concurrency(self) -> int:
+        """Current whole-number concurrency limit."""
+        return max(self.minimum, int(self.limit))
+
+    def on_success(self) -> None:
+        """Grow the limit by about ``increase`` per round of calls."""
+        self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+
+    def on_overload(self) -> bool:
+        """
+        Cut the limit after a 429 or timeout.
+
+        Returns:
+            True if the limit was decreased
+        """
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return False
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit * self.decrease)
+        logger.debug(f"Judge concurrency reduced to {self.concurrency}")
+        return True
+
+
+class _PriorityGate:
+    """Concurrency gate admitting waiters in priority order."""
+
+    def __init__(self, controller: AIMDController):
+        self._controller = controller
+        self._waiters: List[tuple] = []
+        self._sequence = 0
+        self.active = 0
+
+    async def acquire(self, priority: Priority) -> None:
+        if self.active < self._controller.concurrency and not self._waiters:
+            self.active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._sequence += 1
+        heapq.heappush(self._waiters, (int(priority), self._sequence, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just before being cancelled: hand the slot on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.active -= 1
+        self.wake()
+
+    def wake(self) -> None:
+        while self._waiters and self.active < self._controller.concurrency:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.cancelled():
+                continue
+            self.active += 1
+            future.set_result(None)
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters for one limiter."""
+    requests: int = 0
+    throttled: int = 0
+    retries: int = 0
+    failures: int = 0
+    peak_in_flight: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return asdict(self)
+
+
+class JudgeRateLimiter:
+    """
+    Rate limiter and adaptive concurrency controller for one judge model.
+
+    Example:
+        >>> limiter = JudgeRateLimiter(requests_per_minute=60, tokens_per_minute=90_000)
+        >>> response = await limiter.run(lambda: model.generate_provider_response(messages))
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 64,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        max_backoff: float = 30.0
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request rate limit (None for unlimited)
+            tokens_per_minute: Token rate limit (None for unlimited)
+            initial_concurrency: Starting number of calls in flight
+            min_concurrency: Lowest concurrency AIMD may back off to
+            max_concurrency: Highest concurrency AIMD may grow to
+            max_retries: Retries of a call that was throttled or timed out
+            backoff_base: First retry delay in seconds (doubled per retry)
+            max_backoff: Longest retry delay in seconds
+        """
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.controller = AIMDController(
+            initial=initial_concurrency, minimum=min_concurrency, maximum=max_concurrency
+        )
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.stats = RateLimiterStats()
+        self._gate = _PriorityGate(self.controller)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently admitted."""
+        return self._gate.active
+
+    @property
+    def waiting(self) -> int:
+        """Calls waiting for admission."""
+        return self._gate.waiting
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        priority: Optional[Priority] = None,
+        estimated_tokens: int = 0,
+        usage: Optional[Callable[[T], Optional[int]]] = None
+    ) -> T:
+        """
+        Run a judge call within the limits, retrying when throttled.
+
+        Args:
+            call: Coroutine function making one provider call
+            priority: Admission priority (defaults to the current scope)
+            estimated_tokens: Tokens to reserve from the tokens-per-minute budget
+            usage: Extracts actual token usage from the result, used to
+                reconcile the estimate
+
+        Returns:
+            Result of the call
+
+        Raises:
+            Exception: The call's error, once retries are exhausted or for
+                errors that are not rate limiting
+        """
+        priority = current_priority() if priority is None else priority
+
+        for attempt in range(self.max_retries + 1):
+            await self._gate.acquire(priority)
+            delay = None
+            try:
+                self.stats.peak_in_flight = max(self.stats.peak_in_flight, self._gate.active)
+                if self.request_bucket is not None:
+                    await self.request_bucket.acquire(1)
+                if self.token_bucket is not None and estimated_tokens:
+                    await self.token_bucket.acquire(estimated_tokens)
+
+                self.stats.requests += 1
+                try:
+                    result = await call()
+                except Exception as e:
+                    if not is_overload_error(e):
+                        self.stats.failures += 1
+                        raise
+                    self.stats.throttled += 1
+                    self.controller.on_overload()
+                    if attempt >= self.max_retries:
+                        self.stats.failures += 1
+                        raise
+                    delay = _retry_after(e)
+                    if delay is None:
+                        delay = min(self.max_backoff, self.backoff_base * (2 ** attempt))
+                        delay *= random.uniform(0.5, 1.0)
+                else:
+                    self.controller.on_success()
+                    if usage is not None and self.token_bucket is not None:
+                        actual = usage(result)
+                        if actual:
+                            self.token_bucket.adjust(actual - estimated_tokens)
+                    return result
+            finally:
+                self._gate.release()
+
+            self.stats.retries += 1
+            await asyncio.sleep(delay)
+
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+
+# Shared limiters, one per model; unconfigured models only get AIMD concurrency control
+_limit_defaults: Optional[Dict[str, Any]] = {}
+_model_limits: Dict[str, Dict[str, Any]] = {}
+_limiters: Dict[str, JudgeRateLimiter] = {}
+
+
+def configure_rate_limits(
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    per_model: Optional[Dict[str, Dict[str, Any]]] = None,
+    enabled: bool = True,
+    **kwargs
+) -> None:
+    """
+    Configure the shared per-model judge limiters.
+
+    Args:
+        requests_per_minute: Default request limit per model
+        tokens_per_minute: Default token limit per model
+        per_model: Overrides by model name, as JudgeRateLimiter parameters
+        enabled: Pass False to disable shared limiting, leaving judge calls
+            unbounded
+        **kwargs: Additional default JudgeRateLimiter parameters
+    """
+    global _limit_defaults, _model_limits
+    _limiters.clear()
+    if not enabled:
+        _limit_defaults = None
+        _model_limits = {}
+        return
+    _limit_defaults = {
+        "requests_per_minute": requests_per_minute,
+        "tokens_per_minute": tokens_per_minute,
+        **kwargs
+    }
+    _model_limits = dict(per_model or {})
+
+
+def get_rate_limiter(model: Optional[str]) -> Optional[JudgeRateLimiter]:
+    """
+    Shared limiter for a model.
+
+    Args:
+        model: Model name
+
+    Returns:
+        JudgeRateLimiter for the model, or None if shared limiting was
+        disabled with configure_rate_limits(enabled=False)
+    """
+    if _limit_defaults is None:
+        return None
+    key = model or "default"
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = JudgeRateLimiter(**{**_limit_defaults, **_model_limits.get(key, {})})
+        _limiters[key] = limiter
+    return limiter
@@ -0,0 +1,355 @@
+"""
+Persistent store of per-item metric scores for incremental re-evaluation.
+
+Scores are keyed by (item content hash, metric name, metric config hash,
+model id). A BatchEvaluator configured with a result store looks every item
+up first and only scores items that are new, whose inputs changed, or whose
+metric configuration or ``metric_version`` changed; cached scores are merged
+into the aggregates as if they had just been computed.
+
+Example:
+    >>> store = ResultStore("~/.cache/sprintlens/results.db")
+    >>> batch = BatchEvaluator(evaluator, result_store=store, model_id="gpt-4o-mini")
+    >>> batch.evaluate_dataset(dataset)   # nightly run only scores new rows
+    >>> store.apply_version_diff(manager.generate_diff(old_id, new_id))
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union, Iterable, Sequence
+
+from .checkpoint import _digest, _metric_identity, item_hash
+from .metrics import BaseMetric, MetricResult
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# SQLite's default limit on bound parameters is 999
+_CHUNK_SIZE = 500
+
+
+def metric_config_hash(metric: BaseMetric) -> str:
+    """
+    Hash of a metric's configuration, judge model and version.
+
+    Args:
+        metric: Metric instance
+
+    Returns:
+        Hex digest that changes when the configuration, judge model or
+        ``metric_version`` of the metric changes
+    """
+    return _digest({
+        "config": _metric_identity(metric),
+        "version": getattr(metric, "metric_version", "1")
+    })
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    """
+    Content hash of a dataset record (as stored by DatasetVersionManager).
+
+    Args:
+        record: Dict with prediction, ground_truth and optional context
+
+    Returns:
+        Hex digest matching item_hash() of the equivalent DatasetItem
+    """
+    return item_hash(record.get("prediction"), record.get("ground_truth"), record.get("context"))
+
+
+@dataclass
+class ResultStoreStats:
+    """Result store hit/miss counters."""
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    invalidated: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of item/metric lookups served from the store."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class ResultStoreDiff:
+    """What an evaluation of a set of items would have to score."""
+    total_items: int
+    cached: Dict[str, int] = field(default_factory=dict)
+    missing: Dict[str, List[int]] = field(default_factory=dict)
+
+    @property
+    def items_to_score(self) -> List[int]:
+        """Indices of items missing a score for at least one metric."""
+        return sorted(set().union(*self.missing.values())) if self.missing else []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "total_items": self.total_items,
+            "cached": self.cached,
+            "missing": {name: len(indices) for name, indices in self.missing.items()},
+            "items_to_score": len(self.items_to_score)
+        }
+
+
+class ResultStore:
+    """
+    SQLite-backed store of per-item metric scores.
+
+    Only successful scores are stored, so failed items are retried on the
+    next run. Safe to share between threads.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        """
+        Initialize the store.
+
+        Args:
+            path: Database file; None keeps results in memory for the
+                lifetime of the store
+        """
+        self.path = Path(path).expanduser() if path is not None else None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.stats = ResultStoreStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path) if self.path is not None else ":memory:",
+            check_same_thread=False
+        )
+        with self._conn:
+            if self.path is not None:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "item_hash TEXT NOT NULL, metric TEXT NOT NULL, config_hash TEXT NOT NULL, "
+                "model_id TEXT NOT NULL, value REAL NOT NULL, created_at REAL NOT NULL, "
+                "PRIMARY KEY (metric, config_hash, model_id, item_hash)) WITHOUT ROWID"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS results_item ON results (item_hash)")
+
+    def lookup(
+        self,
+        item_hashes: Sequence[str],
+        metric: BaseMetric,
+        model_id: str = ""
+    ) -> Dict[str, float]:
+        """
+        Stored scores of a metric for the given items.
+
+        Args:
+            item_hashes: Item content hashes (see item_hash())
+            metric: Metric whose current configuration must match
+            model_id: Model the scores were produced for
+
+        Returns:
+            Mapping of item hash to score for the items found
+        """
+        config_hash = metric_config_hash(metric)
+        unique = list(dict.fromkeys(item_hashes))
+        found: Dict[str, float] = {}
+        with self._lock:
+            for start in range(0, len(unique), _CHUNK_SIZE):
+                chunk = unique[start:start + _CHUNK_SIZE]
+                found.update(self._conn.execute(
+                    "SELECT item_hash, value FROM results "
+                    "WHERE metric = ? AND config_hash = ? AND model_id = ? "
+                    f"AND item_hash IN ({','.join('?' * len(chunk))})",
+                    (metric.name, config_hash, model_id, *chunk)
+                ))
+            hits = sum(1 for key in item_hashes if key in found)
+            self.stats.hits += hits
+            self.stats.misses += len(item_hashes) - hits
+        return found
+
+    def store(
+        self,
+        item_hashes: Sequence[str],
+        metric: BaseMetric,
+        results: Sequence[MetricResult],
+        model_id: str = ""
+    ) -> int:
+        """
+        Store the successful scores of a metric.
+
+        Args:
+            item_hashes: Item content hashes, aligned with results
+            metric: Metric that produced the results
+            results: Per-item results
+            model_id: Model the scores were produced for
+
+        Returns:
+            Number of scores written
+        """
+        if len(item_hashes) != len(results):
+            raise ValueError("Item hashes and results must have same length")
+
+        config_hash = metric_config_hash(metric)
+        now = time.time()
+        rows = [
+            (key, metric.name, config_hash, model_id, float(result.value), now)
+            for key, result in zip(item_hashes, results)
+            if result.is_successful()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results "
+                "(item_hash, metric, config_hash, model_id, value, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self.stats.writes += len(rows)
+        return len(rows)
+
+    def diff(
+        self,
+        items: Iterable[Any],
+        metrics: Iterable[BaseMetric],
+        model_id: str = ""
+    ) -> ResultStoreDiff:
+        """
+        Work out which items an evaluation would have to score.
+
+        Args:
+            items: DatasetItems or dataset records
+            metrics: Metrics of the evaluator
+            model_id: Model the scores are produced for
+
+        Returns:
+            ResultStoreDiff with cached counts and missing item indices per metric
+        """
+        keys = [
+            record_hash(item) if isinstance(item, dict)
+            else item_hash(item.prediction, item.ground_truth, item.context)
+            for item in items
+        ]
+        result = ResultStoreDiff(total_items=len(keys))
+        for metric in metrics:
+            found = self.lookup(keys, metric, model_id)
+            missing = [i for i, key in enumerate(keys) if key not in found]
+            result.cached[metric.name] = len(keys) - len(missing)
+            if missing:
+                result.missing[metric.name] = missing
+        return result
+
+    def invalidate(self, metric_name: str, model_id: Optional[str] = None) -> int:
+        """
+        Drop all stored scores of a metric.
+
+        Args:
+            metric_name: Metric name
+            model_id: Only drop scores for this model
+
+        Returns:
+            Number of scores removed
+        """
+        query, params = "DELETE FROM results WHERE metric = ?", [metric_name]
+        if model_id is not None:
+            query += " AND model_id = ?"
+            params.append(model_id)
+        return self._delete(query, params)
+
+    def prune(self, metrics: Iterable[BaseMetric]) -> int:
+        """
+        Drop scores stored under outdated configurations of the given metrics.
+
+        Scores from an older configuration or ``metric_version`` are never
+        returned, so this only reclaims space.
+
+        Args:
+            metrics: Metrics in their current configuration
+
+        Returns:
+            Number of scores removed
+        """
+        removed = 0
+        for metric in metrics:
+            removed += self._delete(
+                "DELETE FROM results WHERE metric = ? AND config_hash != ?",
+                [metric.name, metric_config_hash(metric)]
+            )
+        return removed
+
+    def forget_items(self, item_hashes: Iterable[str]) -> int:
+        """
+        Drop all scores of the given items.
+
+        Args:
+            item_hashes: Item content hashes
+
+        Returns:
+            Number of scores removed
+        """
+        keys = list(dict.fromkeys(item_hashes))
+        removed = 0
+        for start in range(0, len(keys), _CHUNK_SIZE):
+            chunk = keys[start:start + _CHUNK_SIZE]
+            removed += self._delete(
+                f"DELETE FROM results WHERE item_hash IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+        return removed
+
+    def apply_version_diff(self, diff: Any) -> int:
+        """
+        Drop scores of records a dataset version removed or replaced.
+
+        Unchanged and added records need no bookkeeping: the former are
+        found by content hash and the latter are scored on the next run.
+
+        Args:
+            diff: VersionDiff from DatasetVersionManager.generate_diff()
+
+        Returns:
+            Number of scores removed
+        """
+        stale = [record_hash(record) for record in diff.removed_records]
+        stale.extend(record_hash(change["old"]) for change in diff.modified_records)
+        # Content that is still present under another record stays valid
+        current = {record_hash(record) for record in diff.added_records}
+        current.update(record_hash(change["new"]) for change in diff.modified_records)
+        return self.forget_items(key for key in stale if key not in current)
+
+    def count(self, metric_name: Optional[str] = None) -> int:
+        """Number of stored scores, optionally for a single metric."""
+        with self._lock:
+            if metric_name is None:
+                return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM results WHERE metric = ?", (metric_name,)
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all stored scores."""
+        self._delete("DELETE FROM results", [])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _delete(self, query: str, params: List[Any]) -> int:
+        with self._lock, self._conn:
+            removed = self._conn.execute(query, params).rowcount
+            self.stats.invalidated += removed
+        return removed
+
+
+def open_result_store(path: Union[str, Path, ResultStore]) -> ResultStore:
+    """
+    Open a result store.
+
+    Args:
+        path: Database path, or an existing store
+
+    Returns:
+        ResultStore instance
+    """
+    if isinstance(path, ResultStore):
+        return path
+    return ResultStore(path)
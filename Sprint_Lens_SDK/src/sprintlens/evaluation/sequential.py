@@ -0,0 +1,490 @@
+"""
+Sequential A/B evaluation with early stopping.
+
+SequentialABEvaluator scores two variants (models, prompts) on the same
+items in a random, optionally stratified order, and after every batch
+updates an always-valid test on the paired score differences of a decision
+metric. Evaluation stops as soon as the difference is significant, the
+variants are shown equivalent, or the confidence interval is narrow
+enough, so decisive comparisons only pay for a fraction of the dataset.
+
+The test is the normal-mixture mSPRT (Robbins; Johari et al., "Always Valid
+Inference"): its p-values and confidence sequences hold at every look, so
+checking after each batch does not inflate the error rate the way repeated
+t-tests would. The variance is estimated from the data (asymptotically
+valid), so a minimum number of items is scored before the first look.
+
+Example:
+    >>> sequential = SequentialABEvaluator(BatchEvaluator(Evaluator([judge])), metric="judge")
+    >>> result = sequential.compare(dataset_a, dataset_b, stratify_by="category")
+    >>> result.decision, result.effective_sample_size
+"""
+
+import asyncio
+import math
+import random
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Callable, Tuple, Union
+
+from .batch import BatchEvaluator, BatchProgress
+from .dataset import EvaluationDataset, DatasetItem
+from .rate_limiter import Priority, priority_scope
+from .streaming import RunningStats
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SequentialTest:
+    """
+    Always-valid test of the mean of a stream of paired differences.
+
+    The mixing distribution is tuned so the confidence sequence is tightest
+    after ``tuning_samples`` observations; it stays valid at every other
+    sample size.
+    """
+
+    def __init__(self, confidence_level: float = 0.95, tuning_samples: int = 100, null_value: float = 0.0):
+        """
+        Initialize the test.
+
+        Args:
+            confidence_level: Confidence level of the sequence (1 - alpha)
+            tuning_samples: Sample size at which the interval is tightest
+            null_value: Mean difference under the null hypothesis
+        """
+        if not 0.0 < confidence_level < 1.0:
+            raise ValueError("confidence_level must be between 0 and 1")
+        self.confidence_level = confidence_level
+        self.alpha = 1.0 - confidence_level
+        self.null_value = null_value
+        log_alpha = -2.0 * math.log(self.alpha)
+        # Robbins' normal mixture, optimal boundary width at tuning_samples
+        self.rho2 = (log_alpha + math.log(log_alpha + 1.0)) / max(1, tuning_samples)
+        self.stats = RunningStats()
+        self._min_p_value = 1.0
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return self.stats.count
+
+    @property
+    def mean(self) -> float:
+        """Mean difference."""
+        return self.stats.mean
+
+    def add(self, value: float) -> None:
+        """Add an observation (does not update the p-value; see look())."""
+        self.stats.add(value)
+
+    def look(self) -> Tuple[Tuple[float, float], float]:
+        """
+        Analyze the observations so far.
+
+        Returns:
+            Confidence interval of the mean and always-valid p-value, which
+            never increases between looks
+        """
+        interval = self.interval()
+        n, variance = self.stats.count, self.stats.variance
+        if n > 1:
+            if variance > 0:
+                scaled = 1.0 + n * self.rho2
+                log_lr = (
+                    n * n * self.rho2 * (self.mean - self.null_value) ** 2 / (2.0 * variance * scaled)
+                    - 0.5 * math.log(scaled)
+                )
+                p_value = math.exp(-log_lr) if log_lr > 0 else 1.0
+            else:
+                p_value = 0.0 if self.mean != self.null_value else 1.0
+            self._min_p_value = min(self._min_p_value, p_value)
+        return interval, self._min_p_value
+
+    def interval(self) -> Tuple[float, float]:
+        """Confidence sequence for the mean at the current sample size."""
+        n = self.stats.count
+        if n < 2:
+            return (-math.inf, math.inf)
+        scaled = 1.0 + n * self.rho2
+        radius = math.sqrt(
+            self.stats.variance * 2.0 * scaled / (n * n * self.rho2) * math.log(math.sqrt(scaled) / self.alpha)
+        )
+        return (self.mean - radius, self.mean + radius)
+
+
+@dataclass
+class SequentialLook:
+    """State of the test after one batch."""
+    items: int
+    difference: float
+    confidence_interval: Tuple[float, float]
+    p_value: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "items": self.items,
+            "difference": self.difference,
+            "confidence_interval": self.confidence_interval,
+            "p_value": self.p_value
+        }
+
+
+@dataclass
+class SequentialResult:
+    """Outcome of a sequential A/B evaluation."""
+    metric: str
+    name_a: str
+    name_b: str
+    decision: str  # "a_better", "b_better", "equivalent" or "inconclusive"
+    stop_reason: str  # "significant", "equivalent", "precision", "max_items" or "exhausted"
+    mean_a: float
+    mean_b: float
+    difference: float  # mean_b - mean_a
+    confidence_interval: Tuple[float, float]
+    p_value: float
+    confidence_level: float
+    effective_sample_size: int
+    items_evaluated: int
+    total_items: int
+    failed_items: int = 0  # Items of batches that failed for either variant
+    item_ids: List[str] = field(default_factory=list)
+    scores_a: Dict[str, List[Optional[float]]] = field(default_factory=dict)
+    scores_b: Dict[str, List[Optional[float]]] = field(default_factory=dict)
+    looks: List[SequentialLook] = field(default_factory=list)
+
+    @property
+    def fraction_evaluated(self) -> float:
+        """Share of the dataset that was scored."""
+        return self.items_evaluated / self.total_items if self.total_items else 0.0
+
+    @property
+    def items_saved(self) -> int:
+        """Items per variant that did not need scoring."""
+        return self.total_items - self.items_evaluated
+
+    @property
+    def winner(self) -> Optional[str]:
+        """Name of the better variant, if the difference is significant."""
+        return {"a_better": self.name_a, "b_better": self.name_b}.get(self.decision)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "metric": self.metric,
+            "name_a": self.name_a,
+            "name_b": self.name_b,
+            "decision": self.decision,
+            "stop_reason": self.stop_reason,
+            "mean_a": self.mean_a,
+            "mean_b": self.mean_b,
+            "difference": self.difference,
+            "confidence_interval": self.confidence_interval,
+            "p_value": self.p_value,
+            "confidence_level": self.confidence_level,
+            "effective_sample_size": self.effective_sample_size,
+            "items_evaluated": self.items_evaluated,
+            "total_items": self.total_items,
+            "failed_items": self.failed_items,
+            "fraction_evaluated": self.fraction_evaluated,
+            "looks": [look.to_dict() for look in self.looks]
+        }
+
+
+def stratified_order(
+    items: List[DatasetItem],
+    stratify_by: Union[str, Callable[[DatasetItem], Any], None] = None,
+    seed: Optional[int] = None
+) -> List[int]:
+    """
+    Random evaluation order whose every prefix is balanced across strata.
+
+    Items are shuffled within their stratum and then interleaved in
+    proportion to stratum sizes, so after k items each stratum holds about
+    its share of k.
+
+    Args:
+        items: Items to order
+        stratify_by: Metadata key or function giving an item's stratum
+            (None for a plain shuffle)
+        seed: Random seed for a reproducible order
+
+    Returns:
+        Item indices in evaluation order
+    """
+    rng = random.Random(seed)
+    if stratify_by is None:
+        order = list(range(len(items)))
+        rng.shuffle(order)
+        return order
+
+    key = stratify_by if callable(stratify_by) else (lambda item: item.metadata.get(stratify_by))
+    strata: Dict[Any, List[int]] = defaultdict(list)
+    for index, item in enumerate(items):
+        strata[key(item)].append(index)
+
+    positions = []
+    for members in strata.values():
+        rng.shuffle(members)
+        size = len(members)
+        positions.extend(((rank + rng.random()) / size, index) for rank, index in enumerate(members))
+    positions.sort()
+    return [index for _, index in positions]
+
+
+class SequentialABEvaluator:
+    """
+    Compares two variants on the same items and stops as soon as the
+    comparison of a decision metric is conclusive.
+
+    Scoring goes through the given BatchEvaluator, so its result store,
+    process pool, batch size and progress callback all apply. Every batch is
+    one look of the sequential test.
+    """
+
+    def __init__(
+        self,
+        batch_evaluator: BatchEvaluator,
+        metric: str,
+        confidence_level: float = 0.95,
+        precision: Optional[float] = None,
+        equivalence_margin: Optional[float] = None,
+        stop_on_significance: bool = True,
+        min_items: int = 30,
+        max_items: Optional[int] = None,
+        tuning_samples: Optional[int] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the sequential evaluator.
+
+        Args:
+            batch_evaluator: Batch evaluator used to score both variants
+            metric: Metric the stopping decision is based on
+            confidence_level: Confidence level of the always-valid interval
+            precision: Stop once the interval half-width is at most this
+            equivalence_margin: Stop once the interval lies within
+                (-margin, margin)
+            stop_on_significance: Stop once the interval excludes zero
+            min_items: Items scored before the first look
+            max_items: Stop after this many items per variant
+            tuning_samples: Sample size at which the interval is tightest
+                (defaults to 10% of the dataset, at least min_items)
+            seed: Random seed for the evaluation order
+        """
+        if metric not in batch_evaluator.evaluator.metrics:
+            raise ValueError(f"Metric {metric} is not configured on the evaluator")
+        self.batch_evaluator = batch_evaluator
+        self.metric = metric
+        self.confidence_level = confidence_level
+        self.precision = precision
+        self.equivalence_margin = equivalence_margin
+        self.stop_on_significance = stop_on_significance
+        self.min_items = min_items
+        self.max_items = max_items
+        self.tuning_samples = tuning_samples
+        self.seed = seed
+
+    def compare(
+        self,
+        dataset_a: EvaluationDataset,
+        dataset_b: EvaluationDataset,
+        stratify_by: Union[str, Callable[[DatasetItem], Any], None] = None,
+        name_a: str = "A",
+        name_b: str = "B"
+    ) -> SequentialResult:
+        """
+        Synchronously compare two item-aligned datasets.
+
+        Args:
+            dataset_a: Predictions of variant A
+            dataset_b: Predictions of variant B for the same items, in order
+            stratify_by: Metadata key or function of a dataset_a item giving
+                its stratum
+            name_a: Name of variant A
+            name_b: Name of variant B
+
+        Returns:
+            SequentialResult
+        """
+        return asyncio.run(self.compare_async(dataset_a, dataset_b, stratify_by, name_a, name_b))
+
+    def compare_predictions(
+        self,
+        predictions_a: List[Any],
+        predictions_b: List[Any],
+        ground_truths: List[Any],
+        contexts: Optional[List[str]] = None,
+        strata: Optional[List[Any]] = None,
+        name_a: str = "A",
+        name_b: str = "B"
+    ) -> SequentialResult:
+        """
+        Compare two lists of predictions for the same ground truths.
+
+        Args:
+            predictions_a: Predictions of variant A
+            predictions_b: Predictions of variant B
+            ground_truths: Shared ground truths
+            contexts: Optional shared contexts
+            strata: Optional stratum of every item
+            name_a: Name of variant A
+            name_b: Name of variant B
+
+        Returns:
+            SequentialResult
+        """
+        def build(predictions: List[Any]) -> EvaluationDataset:
+            dataset = EvaluationDataset.from_lists(f"sequential_{name_a}_{name_b}", predictions, ground_truths, contexts)
+            if strata is not None:
+                for item, stratum in zip(dataset.items, strata):
+                    item.metadata["stratum"] = stratum
+            return dataset
+
+        return self.compare(
+            build(predictions_a), build(predictions_b),
+            stratify_by="stratum" if strata is not None else None, name_a=name_a, name_b=name_b
+        )
+
+    async def compare_async(
+        self,
+        dataset_a: EvaluationDataset,
+        dataset_b: EvaluationDataset,
+        stratify_by: Union[str, Callable[[DatasetItem], Any], None] = None,
+        name_a: str = "A",
+        name_b: str = "B"
+    ) -> SequentialResult:
+        """
+        Asynchronously compare two item-aligned datasets.
+
+        See compare() for the arguments.
+        """
+        if len(dataset_a) != len(dataset_b):
+            raise ValueError("Sequential comparison needs the same items for both variants")
+
+        total = len(dataset_a)
+        limit = min(total, self.max_items) if self.max_items is not None else total
+        order = stratified_order(dataset_a.items, stratify_by, self.seed)[:limit]
+        test = SequentialTest(
+            self.confidence_level,
+            tuning_samples=self.tuning_samples or max(self.min_items, total // 10)
+        )
+        batch_size = self.batch_evaluator.batch_size
+        progress = BatchProgress(batch_id=str(uuid.uuid4()), total_items=limit)
+
+        stats_a, stats_b = RunningStats(), RunningStats()
+        item_ids: List[str] = []
+        scores_a: Dict[str, List[Optional[float]]] = defaultdict(list)
+        scores_b: Dict[str, List[Optional[float]]] = defaultdict(list)
+        looks: List[SequentialLook] = []
+        failed_items = 0
+        interval, p_value = (-math.inf, math.inf), 1.0
+        stop_reason = "max_items" if limit < total else "exhausted"
+
+        for batch_idx, start in enumerate(range(0, limit, batch_size)):
+            indices = order[start:start + batch_size]
+            items_a = [dataset_a.items[i] for i in indices]
+            items_b = [dataset_b.items[i] for i in indices]
+            with priority_scope(Priority.BATCH, replace=False):
+                columns_a, columns_b = await asyncio.gather(
+                    self.batch_evaluator.score_items(items_a, batch_idx),
+                    self.batch_evaluator.score_items(items_b, batch_idx)
+                )
+
+            item_ids.extend(item.id for item in items_a)
+            if columns_a is None or columns_b is None:
+                # A failed batch leaves its items unscored and unpaired
+                for name in self.batch_evaluator.evaluator.metrics:
+                    scores_a[name].extend([None] * len(indices))
+                    scores_b[name].extend([None] * len(indices))
+                failed_items += len(indices)
+                progress.update(failed=len(indices))
+                if self.batch_evaluator.progress_callback:
+                    self.batch_evaluator.progress_callback(progress)
+                continue
+
+            for name, column in columns_a.items():
+                scores_a[name].extend(_score(result) for result in column)
+            for name, column in columns_b.items():
+                scores_b[name].extend(_score(result) for result in column)
+            # Only items scored successfully under both variants are paired
+            for result_a, result_b in zip(columns_a[self.metric], columns_b[self.metric]):
+                value_a, value_b = _score(result_a), _score(result_b)
+                if value_a is not None and value_b is not None:
+                    stats_a.add(value_a)
+                    stats_b.add(value_b)
+                    test.add(value_b - value_a)
+
+            progress.update(completed=len(indices))
+            if self.batch_evaluator.progress_callback:
+                self.batch_evaluator.progress_callback(progress)
+
+            if test.count < max(2, self.min_items):
+                continue
+            interval, p_value = test.look()
+            looks.append(SequentialLook(len(item_ids), test.mean, interval, p_value))
+            reason = self._stop_reason(test, interval, p_value)
+            if reason is not None:
+                stop_reason = reason
+                break
+
+        if not looks and test.count >= 2:
+            interval, p_value = test.look()
+
+        result = SequentialResult(
+            metric=self.metric,
+            name_a=name_a,
+            name_b=name_b,
+            decision=self._decision(test.mean, interval, p_value),
+            stop_reason=stop_reason,
+            mean_a=stats_a.mean,
+            mean_b=stats_b.mean,
+            difference=test.mean,
+            confidence_interval=interval,
+            p_value=p_value,
+            confidence_level=self.confidence_level,
+            effective_sample_size=test.count,
+            items_evaluated=len(item_ids),
+            total_items=total,
+            failed_items=failed_items,
+            item_ids=item_ids,
+            scores_a=dict(scores_a),
+            scores_b=dict(scores_b),
+            looks=looks
+        )
+        logger.info(
+            f"Sequential comparison stopped ({stop_reason}) after {result.items_evaluated}/{total} items: "
+            f"{result.decision}, difference {result.difference:.4f}"
+        )
+        return result
+
+    def _stop_reason(self, test: SequentialTest, interval: Tuple[float, float], p_value: float) -> Optional[str]:
+        if test.stats.variance == 0 and test.mean == 0:
+            # Identical scores so far say nothing about the spread yet
+            return None
+        if self.stop_on_significance and p_value <= test.alpha:
+            return "significant"
+        margin = self.equivalence_margin
+        if margin is not None and -margin < interval[0] and interval[1] < margin:
+            return "equivalent"
+        if self.precision is not None and (interval[1] - interval[0]) / 2 <= self.precision:
+            return "precision"
+        return None
+
+    def _decision(self, difference: float, interval: Tuple[float, float], p_value: float) -> str:
+        if p_value <= 1.0 - self.confidence_level and difference != 0:
+            return "b_better" if difference > 0 else "a_better"
+        margin = self.equivalence_margin
+        if margin is not None and -margin < interval[0] and interval[1] < margin:
+            return "equivalent"
+        return "inconclusive"
+
+
+def _score(result: Any) -> Optional[float]:
+    """Usable score of a metric result, or None."""
+    if result is None or result.error is not None or result.value is None:
+        return None
+    return result.value
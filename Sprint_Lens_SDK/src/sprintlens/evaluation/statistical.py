@@ -3,20 +3,386 @@ Statistical analysis utilities for Sprint Lens evaluation results.
 
 This module provides tools for analyzing evaluation results, computing
 statistical significance, and generating insights from evaluation data.
+
+Scores are converted once to a numpy array when numpy is available (plain
+lists otherwise) and moments are computed in a single pass. p-values use
+exact Student t and chi-square distributions (scipy when installed, a
+regularized incomplete beta/gamma implementation otherwise). Bootstrap and
+permutation tests are vectorized in bounded-memory blocks; when scores take
+few distinct values (binary or rating-scale metrics) resamples are drawn as
+multinomial/binomial counts over the distinct values, which is exact and
+independent of the number of items.
 """
 
 import math
-from typing import List, Dict, Any, Optional, Tuple, Union
+import os
+import random
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Union, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-import statistics
 
 from .evaluator import EvaluationResult
 from .batch import BatchResult
 from ..utils.logging import get_logger
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from scipy import stats as scipy_stats
+    SCIPY_AVAILABLE = True
+except ImportError:
+    scipy_stats = None
+    SCIPY_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Upper bound on resampled elements materialized at once
+_RESAMPLE_BLOCK = 1 << 22
+
+# Use count-based resampling when items outnumber distinct values this much
+_COMPRESSION_RATIO = 8
+
+# Above this many resampled elements, continuous scores are resampled as
+# equal-count quantile bins represented by their means
+_EXACT_RESAMPLE_BUDGET = 1 << 28
+_APPROXIMATION_BINS = 4096
+
+_EPS = 1e-15
+_FPMIN = 1e-300
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    """Continued fraction for the incomplete beta function (modified Lentz)."""
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c = 1.0
+    d = 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > _FPMIN else _FPMIN)
+    h = d
+    for m in range(1, 10000 + int(10 * math.sqrt(max(a, b)))):
+        m2 = 2 * m
+        for aa in (
+            m * (b - m) * x / ((qam + m2) * (a + m2)),
+            -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        ):
+            d = 1.0 + aa * d
+            d = 1.0 / (d if abs(d) > _FPMIN else _FPMIN)
+            c = 1.0 + aa / c
+            c = c if abs(c) > _FPMIN else _FPMIN
+            delta = d * c
+            h *= delta
+        if abs(delta - 1.0) < _EPS:
+            break
+    return h
+
+
+def _regularized_beta(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    )
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _beta_continued_fraction(a, b, x) / a
+    return 1.0 - front * _beta_continued_fraction(b, a, 1.0 - x) / b
+
+
+def _regularized_gamma_upper(a: float, x: float) -> float:
+    """Regularized upper incomplete gamma function Q(a, x)."""
+    if x <= 0.0:
+        return 1.0
+    log_front = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1.0:
+        # Series for the lower function
+        term = total = 1.0 / a
+        ap = a
+        for _ in range(100000):
+            ap += 1.0
+            term *= x / ap
+            total += term
+            if abs(term) < abs(total) * _EPS:
+                break
+        return 1.0 - total * math.exp(log_front)
+    # Continued fraction for the upper function
+    b = x + 1.0 - a
+    c = 1.0 / _FPMIN
+    d = 1.0 / b
+    h = d
+    for i in range(1, 100000):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = 1.0 / (d if abs(d) > _FPMIN else _FPMIN)
+        c = b + an / c
+        c = c if abs(c) > _FPMIN else _FPMIN
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < _EPS:
+            break
+    return math.exp(log_front) * h
+
+
+def t_two_sided_p_value(t_stat: float, df: float) -> float:
+    """
+    Two-sided p-value of a Student t statistic.
+
+    Args:
+        t_stat: Test statistic
+        df: Degrees of freedom
+
+    Returns:
+        P(|T| >= |t_stat|)
+    """
+    if math.isinf(t_stat):
+        return 0.0
+    if math.isnan(t_stat) or df <= 0:
+        return 1.0
+    if SCIPY_AVAILABLE:
+        return float(2 * scipy_stats.t.sf(abs(t_stat), df))
+    return min(1.0, _regularized_beta(df / 2.0, 0.5, df / (df + t_stat * t_stat)))
+
+
+def t_critical_value(confidence_level: float, df: float) -> float:
+    """
+    Two-sided critical value of the Student t distribution.
+
+    Args:
+        confidence_level: Confidence level, e.g. 0.95
+        df: Degrees of freedom
+
+    Returns:
+        t such that P(|T| <= t) = confidence_level
+    """
+    alpha = 1.0 - confidence_level
+    if SCIPY_AVAILABLE:
+        return float(scipy_stats.t.ppf(1.0 - alpha / 2.0, df))
+    low, high = 0.0, 1.0
+    while t_two_sided_p_value(high, df) > alpha:
+        low, high = high, high * 2.0
+    for _ in range(200):
+        mid = (low + high) / 2.0
+        if t_two_sided_p_value(mid, df) > alpha:
+            low = mid
+        else:
+            high = mid
+        if high - low < 1e-12 * high:
+            break
+    return (low + high) / 2.0
+
+
+def chi2_sf(statistic: float, df: float) -> float:
+    """
+    Survival function of the chi-square distribution.
+
+    Args:
+        statistic: Chi-square statistic
+        df: Degrees of freedom
+
+    Returns:
+        P(X >= statistic)
+    """
+    if SCIPY_AVAILABLE:
+        return float(scipy_stats.chi2.sf(statistic, df))
+    return _regularized_gamma_upper(df / 2.0, statistic / 2.0)
+
+
+def _clean(values: Sequence[Optional[float]]) -> Any:
+    """Drop None values; returns a float array (or list without numpy)."""
+    if NUMPY_AVAILABLE:
+        if isinstance(values, np.ndarray) and values.dtype.kind == "f":
+            return values[~np.isnan(values)]
+        return np.asarray([v for v in values if v is not None], dtype=float)
+    return [float(v) for v in values if v is not None]
+
+
+def _moments(values: Any) -> Tuple[int, float, float, float, float]:
+    """Count, mean and central sums of squares, cubes and fourth powers."""
+    n = len(values)
+    if n == 0:
+        return 0, 0.0, 0.0, 0.0, 0.0
+    if NUMPY_AVAILABLE:
+        mean = math.fsum(values.tolist()) / n
+        deviations = values - mean
+        squares = deviations * deviations
+        return n, mean, float(squares.sum()), float((squares * deviations).sum()), float((squares * squares).sum())
+
+    # Single pass (Terriberry's extension of Welford's algorithm)
+    mean = m2 = m3 = m4 = 0.0
+    for count, x in enumerate(values, 1):
+        delta = x - mean
+        delta_n = delta / count
+        delta_n2 = delta_n * delta_n
+        term = delta * delta_n * (count - 1)
+        mean += delta_n
+        m4 += term * delta_n2 * (count * count - 3 * count + 3) + 6 * delta_n2 * m2 - 4 * delta_n * m3
+        m3 += term * delta_n * (count - 2) - 3 * delta_n * m2
+        m2 += term
+    return n, math.fsum(values) / n, m2, m3, m4
+
+
+def _mean_and_std(values: Any) -> Tuple[int, float, float]:
+    n, mean, m2, _, _ = _moments(values)
+    return n, mean, math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+
+
+def _is_binary(values: Any) -> bool:
+    if NUMPY_AVAILABLE:
+        return bool(np.isin(values, (0.0, 1.0)).all())
+    return all(v in (0.0, 1.0) for v in values)
+
+
+def _resampling_support(values: Any, n_resamples: int) -> Optional[Tuple[Any, Any]]:
+    """
+    Values and counts to resample as category counts, or None to resample items.
+
+    Distinct values are used when they are few (exact). Otherwise, when
+    per-item resampling would exceed the budget, sorted values are grouped
+    into equal-count bins represented by their means: the resampled means
+    stay unbiased and only the within-bin variance (negligible at thousands
+    of bins) is lost.
+    """
+    n = len(values)
+    uniques, counts = np.unique(values, return_counts=True)
+    if len(uniques) * _COMPRESSION_RATIO <= n:
+        return uniques.astype(float), counts
+    if n * n_resamples <= _EXACT_RESAMPLE_BUDGET:
+        return None
+    starts = np.linspace(0, n, _APPROXIMATION_BINS + 1).astype(np.int64)
+    starts = np.unique(starts[:-1])
+    counts = np.diff(np.append(starts, n))
+    return np.add.reduceat(np.sort(values), starts) / counts, counts
+
+
+def _blocks(total: int, width: int) -> Sequence[Tuple[int, int]]:
+    """Split ``total`` resamples into blocks of at most _RESAMPLE_BLOCK elements."""
+    size = max(1, _RESAMPLE_BLOCK // max(1, width))
+    return [(start, min(size, total - start)) for start in range(0, total, size)]
+
+
+def _bootstrap_distribution(values: Any, statistic: str, n_resamples: int, seed: Optional[int]) -> Any:
+    """Statistic of ``n_resamples`` bootstrap resamples."""
+    n = len(values)
+    if not NUMPY_AVAILABLE:
+        rng = random.Random(seed)
+        compute = statistics.median if statistic == "median" else (lambda sample: math.fsum(sample) / n)
+        return [compute(rng.choices(values, k=n)) for _ in range(n_resamples)]
+
+    rng = np.random.default_rng(seed)
+    support = _resampling_support(values, n_resamples) if statistic == "mean" else None
+    if support is not None:
+        uniques, counts = support
+        probabilities = counts / n
+        out = np.empty(n_resamples)
+        for start, size in _blocks(n_resamples, len(uniques)):
+            out[start:start + size] = rng.multinomial(n, probabilities, size=size) @ uniques / n
+        return out
+
+    out = np.empty(n_resamples)
+    for start, size in _blocks(n_resamples, n):
+        sample = values[rng.integers(0, n, size=(size, n))]
+        out[start:start + size] = np.median(sample, axis=1) if statistic == "median" else sample.mean(axis=1)
+    return out
+
+
+def _sign_flip_means(differences: Any, n_resamples: int, seed: Optional[int]) -> Any:
+    """Mean difference under random sign flips (paired permutation null)."""
+    n = len(differences)
+    if not NUMPY_AVAILABLE:
+        rng = random.Random(seed)
+        return [
+            math.fsum(d if flip else -d for d, flip in zip(differences, rng.choices((True, False), k=n))) / n
+            for _ in range(n_resamples)
+        ]
+
+    rng = np.random.default_rng(seed)
+    uniques, counts = np.unique(differences, return_counts=True)
+    out = np.empty(n_resamples)
+    if len(uniques) * _COMPRESSION_RATIO <= n:
+        uniques = uniques.astype(float)
+        for start, size in _blocks(n_resamples, len(uniques)):
+            positive = rng.binomial(counts, 0.5, size=(size, len(uniques)))
+            out[start:start + size] = (2 * positive - counts) @ uniques / n
+        return out
+    # Random bits unpacked to 0/1 rows: sum of kept values via matrix-vector product
+    total = differences.sum()
+    for start, size in _blocks(n_resamples, n):
+        random_bytes = rng.integers(0, 256, size=(size, (n + 7) // 8), dtype=np.uint8)
+        kept = np.unpackbits(random_bytes, axis=1, count=n).astype(np.float64) @ differences
+        out[start:start + size] = (2 * kept - total) / n
+    return out
+
+
+def _label_shuffle_differences(values1: Any, values2: Any, n_resamples: int, seed: Optional[int]) -> Any:
+    """Difference of means under random relabelling (two-sample permutation null)."""
+    n1, n2 = len(values1), len(values2)
+    if not NUMPY_AVAILABLE:
+        rng = random.Random(seed)
+        pooled = list(values1) + list(values2)
+        total = math.fsum(pooled)
+        out = []
+        for _ in range(n_resamples):
+            sum1 = math.fsum(rng.sample(pooled, n1))
+            out.append(sum1 / n1 - (total - sum1) / n2)
+        return out
+
+    rng = np.random.default_rng(seed)
+    pooled = np.concatenate([values1, values2])
+    total = pooled.sum()
+    support = _resampling_support(pooled, n_resamples)
+    out = np.empty(n_resamples)
+    if support is not None:
+        uniques, counts = support
+        for start, size in _blocks(n_resamples, len(uniques)):
+            sum1 = rng.multivariate_hypergeometric(counts, n1, size=size) @ uniques
+            out[start:start + size] = sum1 / n1 - (total - sum1) / n2
+        return out
+    for start, size in _blocks(n_resamples, len(pooled)):
+        keys = rng.random((size, len(pooled)))
+        chosen = np.argpartition(keys, n1 - 1, axis=1)[:, :n1]
+        sum1 = pooled[chosen].sum(axis=1)
+        out[start:start + size] = sum1 / n1 - (total - sum1) / n2
+    return out
+
+
+def _two_sided_resampling_p(null_distribution: Any, observed: float) -> float:
+    """Permutation p-value with the +1 correction."""
+    threshold = abs(observed) - 1e-12 * max(1.0, abs(observed))
+    if NUMPY_AVAILABLE:
+        extreme = int(np.count_nonzero(np.abs(null_distribution) >= threshold))
+    else:
+        extreme = sum(1 for value in null_distribution if abs(value) >= threshold)
+    return (extreme + 1) / (len(null_distribution) + 1)
+
+
+def _percentile_interval(distribution: Any, confidence_level: float) -> Tuple[float, float]:
+    alpha = 1.0 - confidence_level
+    if NUMPY_AVAILABLE:
+        low, high = np.quantile(distribution, [alpha / 2, 1 - alpha / 2])
+        return float(low), float(high)
+    ordered = sorted(distribution)
+    return _interpolated_percentile(ordered, alpha / 2), _interpolated_percentile(ordered, 1 - alpha / 2)
+
+
+def _interpolated_percentile(sorted_values: Sequence[float], percentile: float) -> float:
+    """Linear-interpolation percentile of sorted values."""
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * percentile
+    f = math.floor(k)
+    c = math.ceil(k)
+    if f == c:
+        return sorted_values[int(k)]
+    return sorted_values[int(f)] * (c - k) + sorted_values[int(c)] * (k - f)
+
 
 @dataclass
 class StatisticalTest:
@@ -108,132 +474,118 @@ class ComparisonAnalysis:
 class StatisticalAnalyzer:
     """
     Statistical analyzer for evaluation results.
-    
+
     Provides comprehensive statistical analysis capabilities including:
     - Descriptive statistics
-    - Statistical significance testing
+    - Statistical significance testing (t-tests, permutation tests, McNemar)
     - Effect size calculation
-    - Confidence intervals
-    - Comparative analysis
+    - Confidence intervals (t-based and bootstrap)
+    - Comparative analysis, including paired comparison of whole runs
     """
-    
-    def __init__(self, confidence_level: float = 0.95):
+
+    def __init__(
+        self,
+        confidence_level: float = 0.95,
+        n_resamples: int = 10000,
+        seed: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ):
         """
         Initialize statistical analyzer.
-        
+
         Args:
             confidence_level: Confidence level for statistical tests and intervals
+            n_resamples: Default number of bootstrap and permutation resamples
+            seed: Random seed for reproducible resampling
+            max_workers: Threads used to analyze metrics in parallel (defaults
+                to the CPU count when numpy is available, else 1)
         """
         self.confidence_level = confidence_level
         self.alpha = 1.0 - confidence_level
-        
+        self.n_resamples = n_resamples
+        self.seed = seed
+        self.max_workers = max_workers
+
         logger.debug(f"Initialized statistical analyzer with confidence level {confidence_level}")
-    
+
     def compute_descriptive_stats(self, values: List[float]) -> DescriptiveStats:
         """
         Compute descriptive statistics for a list of values.
-        
+
         Args:
             values: List of numeric values
-            
+
         Returns:
             DescriptiveStats object with computed statistics
         """
-        if not values:
+        if values is None or len(values) == 0:
             raise ValueError("Cannot compute statistics for empty list")
-        
-        # Remove None values
-        clean_values = [v for v in values if v is not None]
-        
-        if not clean_values:
+
+        clean_values = _clean(values)
+
+        if len(clean_values) == 0:
             raise ValueError("No valid values found after removing None values")
-        
-        # Sort for percentile calculations
-        sorted_values = sorted(clean_values)
-        n = len(clean_values)
-        
-        # Basic statistics
-        mean_val = statistics.mean(clean_values)
-        median_val = statistics.median(clean_values)
-        std_dev = statistics.stdev(clean_values) if n > 1 else 0.0
-        variance = statistics.variance(clean_values) if n > 1 else 0.0
-        
+
+        n, mean_val, m2, m3, m4 = _moments(clean_values)
+        variance = m2 / (n - 1) if n > 1 else 0.0
+        std_dev = math.sqrt(variance)
+
         # Percentiles
-        q1 = self._percentile(sorted_values, 0.25)
-        q3 = self._percentile(sorted_values, 0.75)
-        iqr = q3 - q1
-        
-        # Higher-order moments (optional, simplified implementation)
-        skewness = self._compute_skewness(clean_values, mean_val, std_dev) if n > 2 else None
-        kurtosis = self._compute_kurtosis(clean_values, mean_val, std_dev) if n > 3 else None
-        
+        if NUMPY_AVAILABLE:
+            q1, median_val, q3 = (float(q) for q in np.percentile(clean_values, [25, 50, 75]))
+            min_val, max_val = float(clean_values.min()), float(clean_values.max())
+        else:
+            sorted_values = sorted(clean_values)
+            q1 = self._percentile(sorted_values, 0.25)
+            median_val = self._percentile(sorted_values, 0.5)
+            q3 = self._percentile(sorted_values, 0.75)
+            min_val, max_val = sorted_values[0], sorted_values[-1]
+
+        # Standardized moments, scaled by the sample standard deviation
+        skewness = None
+        kurtosis = None
+        if n > 2:
+            skewness = (m3 / n) / std_dev ** 3 if std_dev > 0 else 0.0
+        if n > 3:
+            kurtosis = (m4 / n) / std_dev ** 4 - 3.0 if std_dev > 0 else 0.0
+
         return DescriptiveStats(
             count=n,
             mean=mean_val,
             median=median_val,
             std_dev=std_dev,
             variance=variance,
-            min_value=min(clean_values),
-            max_value=max(clean_values),
+            min_value=min_val,
+            max_value=max_val,
             q1=q1,
             q3=q3,
-            iqr=iqr,
+            iqr=q3 - q1,
             skewness=skewness,
             kurtosis=kurtosis
         )
-    
+
     def _percentile(self, sorted_values: List[float], percentile: float) -> float:
         """Compute percentile for sorted values."""
-        if not sorted_values:
-            return 0.0
-        
-        k = (len(sorted_values) - 1) * percentile
-        f = math.floor(k)
-        c = math.ceil(k)
-        
-        if f == c:
-            return sorted_values[int(k)]
-        
-        d0 = sorted_values[int(f)] * (c - k)
-        d1 = sorted_values[int(c)] * (k - f)
-        return d0 + d1
-    
-    def _compute_skewness(self, values: List[float], mean_val: float, std_dev: float) -> float:
-        """Compute skewness (third moment)."""
-        if std_dev == 0:
-            return 0.0
-        
-        n = len(values)
-        skewness = sum(((x - mean_val) / std_dev) ** 3 for x in values) / n
-        return skewness
-    
-    def _compute_kurtosis(self, values: List[float], mean_val: float, std_dev: float) -> float:
-        """Compute kurtosis (fourth moment)."""
-        if std_dev == 0:
-            return 0.0
-        
-        n = len(values)
-        kurtosis = sum(((x - mean_val) / std_dev) ** 4 for x in values) / n
-        return kurtosis - 3.0  # Excess kurtosis (subtract 3 for normal distribution)
-    
+        return _interpolated_percentile(sorted_values, percentile)
+
     def t_test_one_sample(
-        self, 
-        values: List[float], 
+        self,
+        values: List[float],
         null_hypothesis_mean: float = 0.0
     ) -> StatisticalTest:
         """
         Perform one-sample t-test.
-        
+
         Args:
             values: Sample values
             null_hypothesis_mean: Mean value to test against
-            
+
         Returns:
             StatisticalTest result
         """
-        clean_values = [v for v in values if v is not None]
-        
-        if len(clean_values) < 2:
+        n, mean_val, std_dev = _mean_and_std(_clean(values))
+
+        if n < 2:
             return StatisticalTest(
                 test_name="One-sample t-test",
                 test_statistic=0.0,
@@ -242,30 +594,19 @@ class StatisticalAnalyzer:
                 confidence_level=self.confidence_level,
                 description="Insufficient data for t-test"
             )
-        
-        mean_val = statistics.mean(clean_values)
-        std_dev = statistics.stdev(clean_values)
-        n = len(clean_values)
-        
+
         # Calculate t-statistic
         if std_dev == 0:
             t_stat = float('inf') if mean_val != null_hypothesis_mean else 0.0
         else:
             t_stat = (mean_val - null_hypothesis_mean) / (std_dev / math.sqrt(n))
-        
-        # Approximate p-value using normal distribution (for large n)
-        # For small n, this is less accurate but still provides guidance
-        if abs(t_stat) == float('inf'):
-            p_value = 0.0
-        else:
-            # Two-tailed test
-            p_value = 2 * (1 - self._normal_cdf(abs(t_stat)))
-        
+
+        p_value = t_two_sided_p_value(t_stat, n - 1)
         significant = p_value < self.alpha
-        
+
         # Effect size (Cohen's d)
         effect_size = abs(t_stat) / math.sqrt(n) if n > 0 else 0.0
-        
+
         return StatisticalTest(
             test_name="One-sample t-test",
             test_statistic=t_stat,
@@ -275,28 +616,28 @@ class StatisticalAnalyzer:
             effect_size=effect_size,
             description=f"Testing if mean differs from {null_hypothesis_mean}"
         )
-    
+
     def t_test_two_sample(
-        self, 
-        values1: List[float], 
+        self,
+        values1: List[float],
         values2: List[float],
         equal_variance: bool = False
     ) -> StatisticalTest:
         """
         Perform two-sample t-test.
-        
+
         Args:
             values1: First sample
             values2: Second sample
             equal_variance: Whether to assume equal variance
-            
+
         Returns:
             StatisticalTest result
         """
-        clean_values1 = [v for v in values1 if v is not None]
-        clean_values2 = [v for v in values2 if v is not None]
-        
-        if len(clean_values1) < 2 or len(clean_values2) < 2:
+        n1, mean1, std1 = _mean_and_std(_clean(values1))
+        n2, mean2, std2 = _mean_and_std(_clean(values2))
+
+        if n1 < 2 or n2 < 2:
             return StatisticalTest(
                 test_name="Two-sample t-test",
                 test_statistic=0.0,
@@ -305,48 +646,34 @@ class StatisticalAnalyzer:
                 confidence_level=self.confidence_level,
                 description="Insufficient data for two-sample t-test"
             )
-        
-        mean1 = statistics.mean(clean_values1)
-        mean2 = statistics.mean(clean_values2)
-        std1 = statistics.stdev(clean_values1)
-        std2 = statistics.stdev(clean_values2)
-        n1 = len(clean_values1)
-        n2 = len(clean_values2)
-        
-        # Calculate t-statistic and degrees of freedom
+
+        # Calculate standard error and degrees of freedom
         if equal_variance:
-            # Pooled standard error
             pooled_std = math.sqrt(((n1 - 1) * std1**2 + (n2 - 1) * std2**2) / (n1 + n2 - 2))
             std_error = pooled_std * math.sqrt(1/n1 + 1/n2)
             df = n1 + n2 - 2
         else:
-            # Welch's t-test
+            # Welch's t-test with the Welch-Satterthwaite degrees of freedom
             std_error = math.sqrt(std1**2/n1 + std2**2/n2)
-            if std_error == 0:
-                t_stat = 0.0 if mean1 == mean2 else float('inf')
-                p_value = 1.0 if mean1 == mean2 else 0.0
-            else:
-                # Welch-Satterthwaite equation for degrees of freedom
-                df = (std1**2/n1 + std2**2/n2)**2 / (
-                    (std1**2/n1)**2/(n1-1) + (std2**2/n2)**2/(n2-1)
-                )
-        
+            df = (std1**2/n1 + std2**2/n2)**2 / (
+                (std1**2/n1)**2/(n1-1) + (std2**2/n2)**2/(n2-1)
+            ) if std_error > 0 else n1 + n2 - 2
+
         if std_error > 0:
             t_stat = (mean1 - mean2) / std_error
-            # Approximate p-value
-            p_value = 2 * (1 - self._normal_cdf(abs(t_stat)))
+            p_value = t_two_sided_p_value(t_stat, df)
         else:
             t_stat = 0.0 if mean1 == mean2 else float('inf')
             p_value = 1.0 if mean1 == mean2 else 0.0
-        
+
         significant = p_value < self.alpha
-        
+
         # Effect size (Cohen's d)
         pooled_std_for_effect = math.sqrt((std1**2 + std2**2) / 2)
         effect_size = abs(mean1 - mean2) / pooled_std_for_effect if pooled_std_for_effect > 0 else 0.0
-        
+
         test_type = "Welch's t-test" if not equal_variance else "Student's t-test"
-        
+
         return StatisticalTest(
             test_name=test_type,
             test_statistic=t_stat,
@@ -356,69 +683,215 @@ class StatisticalAnalyzer:
             effect_size=effect_size,
             description=f"Comparing means of two independent samples"
         )
-    
+
+    def t_test_paired(self, values1: List[float], values2: List[float]) -> StatisticalTest:
+        """
+        Perform a paired t-test on item-aligned scores.
+
+        Args:
+            values1: Scores of the first run
+            values2: Scores of the second run, aligned with values1
+
+        Returns:
+            StatisticalTest result (effect size is Cohen's d_z)
+        """
+        differences = self._paired_differences(values1, values2)
+        n, mean_diff, std_diff = _mean_and_std(differences)
+
+        if n < 2:
+            return StatisticalTest(
+                test_name="Paired t-test",
+                test_statistic=0.0,
+                p_value=1.0,
+                significant=False,
+                confidence_level=self.confidence_level,
+                description="Insufficient data for paired t-test"
+            )
+
+        if std_diff == 0:
+            t_stat = 0.0 if mean_diff == 0 else float('inf')
+        else:
+            t_stat = mean_diff / (std_diff / math.sqrt(n))
+        p_value = t_two_sided_p_value(t_stat, n - 1) if t_stat != 0.0 else 1.0
+
+        return StatisticalTest(
+            test_name="Paired t-test",
+            test_statistic=t_stat,
+            p_value=p_value,
+            significant=p_value < self.alpha,
+            confidence_level=self.confidence_level,
+            effect_size=abs(mean_diff) / std_diff if std_diff > 0 else 0.0,
+            description="Comparing item-aligned scores of two runs"
+        )
+
+    def permutation_test(
+        self,
+        values1: List[float],
+        values2: List[float],
+        paired: bool = False,
+        n_resamples: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> StatisticalTest:
+        """
+        Permutation test for a difference in means.
+
+        Paired samples use random sign flips of the per-item differences;
+        independent samples use random relabelling of the pooled scores.
+
+        Args:
+            values1: First sample
+            values2: Second sample (item-aligned with values1 when paired)
+            paired: Whether the samples are paired
+            n_resamples: Number of permutations (defaults to the analyzer's)
+            seed: Random seed (defaults to the analyzer's)
+
+        Returns:
+            StatisticalTest result
+        """
+        n_resamples = n_resamples or self.n_resamples
+        seed = self.seed if seed is None else seed
+        test_name = "Paired permutation test" if paired else "Permutation test"
+
+        if paired:
+            differences = self._paired_differences(values1, values2)
+            n, observed, _ = _mean_and_std(differences)
+            enough = n >= 2
+        else:
+            clean1, clean2 = _clean(values1), _clean(values2)
+            enough = len(clean1) >= 2 and len(clean2) >= 2
+            observed = _mean_and_std(clean1)[1] - _mean_and_std(clean2)[1] if enough else 0.0
+
+        if not enough:
+            return StatisticalTest(
+                test_name=test_name,
+                test_statistic=0.0,
+                p_value=1.0,
+                significant=False,
+                confidence_level=self.confidence_level,
+                description="Insufficient data for permutation test"
+            )
+
+        if paired:
+            null_distribution = _sign_flip_means(differences, n_resamples, seed)
+        else:
+            null_distribution = _label_shuffle_differences(clean1, clean2, n_resamples, seed)
+        p_value = _two_sided_resampling_p(null_distribution, observed)
+
+        return StatisticalTest(
+            test_name=test_name,
+            test_statistic=observed,
+            p_value=p_value,
+            significant=p_value < self.alpha,
+            confidence_level=self.confidence_level,
+            description=f"Difference in means against {n_resamples} permutations"
+        )
+
+    def mcnemar_test(self, values1: List[float], values2: List[float]) -> StatisticalTest:
+        """
+        McNemar's test for paired binary (0/1) scores.
+
+        Args:
+            values1: Binary scores of the first run
+            values2: Binary scores of the second run, aligned with values1
+
+        Returns:
+            StatisticalTest result (continuity-corrected chi-square, 1 df)
+        """
+        differences = self._paired_differences(values1, values2)
+        if NUMPY_AVAILABLE:
+            only_first = int(np.count_nonzero(differences > 0))
+            only_second = int(np.count_nonzero(differences < 0))
+        else:
+            only_first = sum(1 for d in differences if d > 0)
+            only_second = sum(1 for d in differences if d < 0)
+
+        discordant = only_first + only_second
+        statistic = (abs(only_first - only_second) - 1) ** 2 / discordant if discordant else 0.0
+        p_value = chi2_sf(statistic, 1) if discordant else 1.0
+
+        return StatisticalTest(
+            test_name="McNemar's test",
+            test_statistic=statistic,
+            p_value=p_value,
+            significant=p_value < self.alpha,
+            confidence_level=self.confidence_level,
+            description=f"{only_first} items only correct in the first run, {only_second} only in the second"
+        )
+
+    def _paired_differences(self, values1: Sequence[Optional[float]], values2: Sequence[Optional[float]]) -> Any:
+        """Per-item differences, skipping items missing a score in either run."""
+        if len(values1) != len(values2):
+            raise ValueError("Paired samples must have the same length")
+        if NUMPY_AVAILABLE:
+            first = np.asarray([np.nan if v is None else v for v in values1], dtype=float)
+            second = np.asarray([np.nan if v is None else v for v in values2], dtype=float)
+            differences = first - second
+            return differences[~np.isnan(differences)]
+        return [a - b for a, b in zip(values1, values2) if a is not None and b is not None]
+
     def _normal_cdf(self, x: float) -> float:
-        """Approximate cumulative distribution function for standard normal."""
-        # Using approximation for standard normal CDF
-        if x < -8:
-            return 0.0
-        if x > 8:
-            return 1.0
-        
-        # Abramowitz and Stegun approximation
-        a1 = 0.254829592
-        a2 = -0.284496736
-        a3 = 1.421413741
-        a4 = -1.453152027
-        a5 = 1.061405429
-        p = 0.3275911
-        
-        sign = 1 if x >= 0 else -1
-        x = abs(x)
-        
-        t = 1.0 / (1.0 + p * x)
-        y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * math.exp(-x * x)
-        
-        return 0.5 * (1.0 + sign * y)
-    
+        """Cumulative distribution function of the standard normal."""
+        return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
     def confidence_interval_mean(
-        self, 
+        self,
         values: List[float],
         confidence_level: Optional[float] = None
     ) -> Tuple[float, float]:
         """
-        Compute confidence interval for the mean.
-        
+        Compute a t-distribution confidence interval for the mean.
+
         Args:
             values: Sample values
             confidence_level: Confidence level (uses instance default if None)
-            
+
         Returns:
             Tuple of (lower_bound, upper_bound)
         """
-        clean_values = [v for v in values if v is not None]
-        
-        if len(clean_values) < 2:
-            mean_val = clean_values[0] if clean_values else 0.0
+        n, mean_val, std_dev = _mean_and_std(_clean(values))
+
+        if n < 2:
             return (mean_val, mean_val)
-        
+
         conf_level = confidence_level or self.confidence_level
-        alpha = 1.0 - conf_level
-        
-        mean_val = statistics.mean(clean_values)
-        std_dev = statistics.stdev(clean_values)
-        n = len(clean_values)
-        
-        # Use t-distribution critical value (approximated as z for large n)
-        # For n > 30, t-distribution is approximately normal
-        z_score = 1.96 if conf_level == 0.95 else 2.576  # 95% or 99% confidence
-        
-        margin_error = z_score * (std_dev / math.sqrt(n))
-        
+        margin_error = t_critical_value(conf_level, n - 1) * (std_dev / math.sqrt(n))
+
         return (mean_val - margin_error, mean_val + margin_error)
-    
+
+    def bootstrap_confidence_interval(
+        self,
+        values: List[float],
+        statistic: str = "mean",
+        n_resamples: Optional[int] = None,
+        confidence_level: Optional[float] = None,
+        seed: Optional[int] = None
+    ) -> Tuple[float, float]:
+        """
+        Percentile bootstrap confidence interval.
+
+        Args:
+            values: Sample values
+            statistic: "mean" or "median"
+            n_resamples: Number of resamples (defaults to the analyzer's)
+            confidence_level: Confidence level (uses instance default if None)
+            seed: Random seed (defaults to the analyzer's)
+
+        Returns:
+            Tuple of (lower_bound, upper_bound)
+        """
+        if statistic not in ("mean", "median"):
+            raise ValueError(f"Unsupported bootstrap statistic '{statistic}', expected 'mean' or 'median'")
+        clean_values = _clean(values)
+        if len(clean_values) == 0:
+            raise ValueError("Cannot bootstrap an empty sample")
+
+        distribution = _bootstrap_distribution(
+            clean_values, statistic, n_resamples or self.n_resamples, self.seed if seed is None else seed
+        )
+        return _percentile_interval(distribution, confidence_level or self.confidence_level)
+
     def compare_evaluation_results(
-        self, 
+        self,
         results1: List[EvaluationResult],
         results2: List[EvaluationResult],
         metric_name: str,
@@ -427,55 +900,47 @@ class StatisticalAnalyzer:
     ) -> ComparisonAnalysis:
         """
         Compare evaluation results between two models/systems.
-        
+
         Args:
             results1: First set of evaluation results
             results2: Second set of evaluation results
             metric_name: Name of metric to compare
             name1: Name for first model/system
             name2: Name for second model/system
-            
+
         Returns:
             ComparisonAnalysis with detailed comparison
         """
         # Extract metric scores
-        scores1 = [r.get_metric_score(metric_name) for r in results1]
-        scores2 = [r.get_metric_score(metric_name) for r in results2]
-        
-        # Clean scores
-        clean_scores1 = [s for s in scores1 if s is not None]
-        clean_scores2 = [s for s in scores2 if s is not None]
-        
-        if not clean_scores1 or not clean_scores2:
+        clean_scores1 = _clean([r.get_metric_score(metric_name) for r in results1])
+        clean_scores2 = _clean([r.get_metric_score(metric_name) for r in results2])
+
+        if len(clean_scores1) == 0 or len(clean_scores2) == 0:
             raise ValueError("No valid scores found for comparison")
-        
+
         # Compute descriptive statistics
         stats1 = self.compute_descriptive_stats(clean_scores1)
         stats2 = self.compute_descriptive_stats(clean_scores2)
-        
+
         # Perform statistical tests
-        statistical_tests = []
-        
-        # Two-sample t-test
-        t_test = self.t_test_two_sample(clean_scores1, clean_scores2)
-        statistical_tests.append(t_test)
-        
+        statistical_tests = [self.t_test_two_sample(clean_scores1, clean_scores2)]
+
         # Confidence interval for difference of means
-        diff_scores = [s1 - s2 for s1, s2 in zip(clean_scores1[:min(len(clean_scores1), len(clean_scores2))], 
-                                                   clean_scores2[:min(len(clean_scores1), len(clean_scores2))])]
-        
+        common = min(len(clean_scores1), len(clean_scores2))
+        diff_scores = [s1 - s2 for s1, s2 in zip(clean_scores1[:common], clean_scores2[:common])]
+
         if len(diff_scores) > 1:
             ci_diff = self.confidence_interval_mean(diff_scores)
         else:
             ci_diff = None
-        
+
         # Effect size (Cohen's d)
         pooled_std = math.sqrt((stats1.variance + stats2.variance) / 2)
         effect_size = abs(stats1.mean - stats2.mean) / pooled_std if pooled_std > 0 else 0.0
-        
+
         # Generate interpretation
         interpretation = self._interpret_comparison(stats1, stats2, statistical_tests, effect_size)
-        
+
         return ComparisonAnalysis(
             name1=name1,
             name2=name2,
@@ -486,7 +951,114 @@ class StatisticalAnalyzer:
             effect_size=effect_size,
             interpretation=interpretation
         )
-    
+
+    def compare_runs(
+        self,
+        run1: Union[BatchResult, Dict[str, Sequence[Optional[float]]]],
+        run2: Union[BatchResult, Dict[str, Sequence[Optional[float]]]],
+        metrics: Optional[List[str]] = None,
+        paired: bool = True,
+        name1: str = "Run 1",
+        name2: str = "Run 2"
+    ) -> Dict[str, ComparisonAnalysis]:
+        """
+        Compare two evaluation runs metric by metric.
+
+        Each metric gets a t-test (paired or Welch), a permutation test,
+        McNemar's test for paired binary scores, and a bootstrap confidence
+        interval for the difference in means. Metrics are analyzed in
+        parallel threads; numpy releases the GIL in the resampling kernels.
+
+        Args:
+            run1: BatchResult or mapping of metric name to per-item scores
+            run2: Same for the second run (item-aligned when paired)
+            metrics: Metrics to compare (defaults to those present in both runs)
+            paired: Whether items are aligned across runs
+            name1: Name for the first run
+            name2: Name for the second run
+
+        Returns:
+            Mapping of metric name to ComparisonAnalysis
+        """
+        scores1, scores2 = self._run_scores(run1), self._run_scores(run2)
+        if metrics is None:
+            metrics = [name for name in scores1 if name in scores2 and name != "overall_score"]
+
+        if self.max_workers is not None:
+            workers = self.max_workers
+        else:
+            workers = min(len(metrics), os.cpu_count() or 1) if NUMPY_AVAILABLE else 1
+
+        def analyze(index_and_name: Tuple[int, str]) -> ComparisonAnalysis:
+            index, name = index_and_name
+            seed = None if self.seed is None else self.seed + index
+            return self._compare_metric(scores1[name], scores2[name], paired, name1, name2, seed)
+
+        if workers > 1 and len(metrics) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                analyses = list(executor.map(analyze, enumerate(metrics)))
+        else:
+            analyses = [analyze(item) for item in enumerate(metrics)]
+        return dict(zip(metrics, analyses))
+
+    def _run_scores(self, run: Union[BatchResult, Dict[str, Sequence[Optional[float]]]]) -> Dict[str, Sequence[Optional[float]]]:
+        if isinstance(run, BatchResult):
+            return {name: run.get_metric_scores(name) for name in run.aggregated_metrics}
+        return run
+
+    def _compare_metric(
+        self,
+        values1: Sequence[Optional[float]],
+        values2: Sequence[Optional[float]],
+        paired: bool,
+        name1: str,
+        name2: str,
+        seed: Optional[int]
+    ) -> ComparisonAnalysis:
+        """Full comparison of one metric between two runs."""
+        if paired:
+            if len(values1) != len(values2):
+                raise ValueError("Paired runs must score the same items")
+            keep = [a is not None and b is not None for a, b in zip(values1, values2)]
+            values1 = [v for v, k in zip(values1, keep) if k]
+            values2 = [v for v, k in zip(values2, keep) if k]
+        clean1, clean2 = _clean(values1), _clean(values2)
+        if len(clean1) == 0 or len(clean2) == 0:
+            raise ValueError("No valid scores found for comparison")
+
+        stats1 = self.compute_descriptive_stats(clean1)
+        stats2 = self.compute_descriptive_stats(clean2)
+
+        if paired:
+            t_test = self.t_test_paired(clean1, clean2)
+            tests = [t_test, self.permutation_test(clean1, clean2, paired=True, seed=seed)]
+            if _is_binary(clean1) and _is_binary(clean2):
+                tests.append(self.mcnemar_test(clean1, clean2))
+            ci_diff = self.bootstrap_confidence_interval(self._paired_differences(clean1, clean2), seed=seed)
+            effect_size = t_test.effect_size
+        else:
+            tests = [self.t_test_two_sample(clean1, clean2), self.permutation_test(clean1, clean2, seed=seed)]
+            dist1 = _bootstrap_distribution(clean1, "mean", self.n_resamples, seed)
+            dist2 = _bootstrap_distribution(clean2, "mean", self.n_resamples, None if seed is None else seed + 1)
+            if NUMPY_AVAILABLE:
+                differences = dist1 - dist2
+            else:
+                differences = [a - b for a, b in zip(dist1, dist2)]
+            ci_diff = _percentile_interval(differences, self.confidence_level)
+            pooled_std = math.sqrt((stats1.variance + stats2.variance) / 2)
+            effect_size = abs(stats1.mean - stats2.mean) / pooled_std if pooled_std > 0 else 0.0
+
+        return ComparisonAnalysis(
+            name1=name1,
+            name2=name2,
+            stats1=stats1,
+            stats2=stats2,
+            statistical_tests=tests,
+            confidence_interval_diff=ci_diff,
+            effect_size=effect_size,
+            interpretation=self._interpret_comparison(stats1, stats2, tests, effect_size)
+        )
+
     def _interpret_comparison(
         self, 
         stats1: DescriptiveStats, 
@@ -0,0 +1,273 @@
+"""
+Constant-memory statistics for streaming evaluation.
+
+Online aggregates used by BatchEvaluator.evaluate_stream_async() so that
+memory stays flat regardless of dataset size:
+
+- RunningStats: count, mean, variance (Welford), min and max
+- P2Quantile: single quantile estimate using the P-square algorithm
+- Reservoir: fixed-size uniform sample of items (Algorithm R)
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Sequence
+
+
+class RunningStats:
+    """Count, mean, variance, min and max in O(1) memory (Welford's algorithm)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: 'RunningStats') -> None:
+        """Combine with statistics collected elsewhere (Chan et al.)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate in O(1) memory.
+
+    Implements the P-square algorithm (Jain & Chlamtac, 1985), which tracks
+    five markers whose heights are adjusted with piecewise-parabolic
+    interpolation. Exact for the first five observations.
+    """
+
+    def __init__(self, quantile: float):
+        """
+        Initialize the estimator.
+
+        Args:
+            quantile: Quantile to estimate, between 0 and 1
+        """
+        if not 0.0 <= quantile <= 1.0:
+            raise ValueError("quantile must be between 0 and 1")
+        p = quantile
+        self.quantile = quantile
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        q = self._heights
+        if self.count <= 5:
+            q.append(value)
+            q.sort()
+            return
+
+        n = self._positions
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the middle markers towards their desired positions
+        for i in (1, 2, 3):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = height
+                n[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        """Piecewise-parabolic prediction of a marker height."""
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current estimate (None before any observation)."""
+        if self.count == 0:
+            return None
+        if self.count > 5:
+            return self._heights[2]
+        # Exact, linearly interpolated quantile of the few values seen so far
+        q = self._heights
+        rank = self.quantile * (len(q) - 1)
+        lower = int(math.floor(rank))
+        upper = min(lower + 1, len(q) - 1)
+        return q[lower] + (q[upper] - q[lower]) * (rank - lower)
+
+
+class Reservoir:
+    """Uniform fixed-size sample of a stream (Algorithm R)."""
+
+    def __init__(self, size: int, seed: Optional[int] = None):
+        """
+        Initialize the reservoir.
+
+        Args:
+            size: Maximum number of samples kept
+            seed: Random seed for reproducible sampling
+        """
+        self.size = max(0, size)
+        self.seen = 0
+        self.samples: List[Any] = []
+        self._random = random.Random(seed)
+
+    def add(self, item: Any) -> None:
+        """Offer one item to the reservoir."""
+        self.seen += 1
+        if len(self.samples) < self.size:
+            self.samples.append(item)
+        elif self.size:
+            slot = self._random.randrange(self.seen)
+            if slot < self.size:
+                self.samples[slot] = item
+
+
+class MetricStreamStats:
+    """Online aggregates for one metric."""
+
+    def __init__(self, name: str, quantiles: Sequence[float] = (0.5, 0.9, 0.99)):
+        """
+        Initialize aggregates.
+
+        Args:
+            name: Metric name
+            quantiles: Quantiles to estimate
+        """
+        self.name = name
+        self.stats = RunningStats()
+        self.quantiles = {q: P2Quantile(q) for q in quantiles}
+        self.errors = 0
+        self.missing = 0
+
+    def add(self, value: Optional[float], error: Optional[str] = None) -> None:
+        """Add one item score."""
+        if error is not None:
+            self.errors += 1
+        # A failed result's value (often 0.0) is not a score
+        if value is None or error is not None:
+            self.missing += 1
+            return
+        self.stats.add(value)
+        for estimator in self.quantiles.values():
+            estimator.add(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary statistics, in the shape of BatchResult.get_metric_statistics()."""
+        stats = self.stats
+        return {
+            "count": stats.count,
+            "mean": stats.mean,
+            "min": stats.min if stats.min is not None else 0.0,
+            "max": stats.max if stats.max is not None else 0.0,
+            "std": stats.std,
+            "quantiles": {f"p{q * 100:g}": est.value for q, est in self.quantiles.items()},
+            "errors": self.errors,
+            "missing": self.missing
+        }
+
+
+@dataclass
+class StreamingBatchResult:
+    """Result of a streaming evaluation: aggregates plus a bounded item sample."""
+
+    batch_id: str
+    dataset_name: str
+    total_items: int
+    successful_items: int
+    failed_items: int
+    metric_stats: Dict[str, MetricStreamStats]
+    samples: List[Dict[str, Any]]
+    aggregated_metrics: Dict[str, float]
+    duration_ms: float
+    start_time: str
+    end_time: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def success_rate(self) -> float:
+        """Get success rate as percentage."""
+        if self.total_items == 0:
+            return 100.0
+        return (self.successful_items / self.total_items) * 100.0
+
+    def get_metric_statistics(self, metric_name: str) -> Dict[str, Any]:
+        """Get statistics for a specific metric."""
+        if metric_name not in self.metric_stats:
+            return {"count": 0, "mean": 0.0, "min": 0.0, "max": 0.0, "std": 0.0}
+        return self.metric_stats[metric_name].to_dict()
+
+    def get_metric_scores(self, metric_name: str) -> List[Optional[float]]:
+        """Get the sampled scores for a specific metric (not every item)."""
+        return [sample["scores"].get(metric_name) for sample in self.samples]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "batch_id": self.batch_id,
+            "dataset_name": self.dataset_name,
+            "total_items": self.total_items,
+            "successful_items": self.successful_items,
+            "failed_items": self.failed_items,
+            "success_rate": self.success_rate,
+            "aggregated_metrics": self.aggregated_metrics,
+            "metric_statistics": {
+                name: stats.to_dict() for name, stats in self.metric_stats.items()
+            },
+            "duration_ms": self.duration_ms,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "metadata": self.metadata,
+            "samples": self.samples
+        }
@@ -0,0 +1,104 @@
+"""
+Memory and SQLite tiers shared by the SDK's persistent caches.
+
+JudgeCache and EmbeddingCache both keep an in-memory LRU tier in front of
+an optional SQLite table. TieredCache owns the connection, the LRU tier and
+the lock guarding them; subclasses define the table and how values are
+encoded on disk.
+"""
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, Dict, Any, Sequence, Union
+
+
+@dataclass
+class CacheStats:
+    """Cache hit/miss counters."""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Hits in either tier."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {**asdict(self), "hits": self.hits, "hit_rate": self.hit_rate}
+
+
+class TieredCache:
+    """
+    Base for caches with an in-memory LRU tier and an optional SQLite tier.
+
+    Subclasses set ``table`` and ``columns`` (plus optional ``indexes``) and
+    hold ``self._lock`` whenever they touch either tier.
+    """
+
+    table: str = ""
+    columns: str = ""
+    indexes: Sequence[str] = ()
+
+    def __init__(self, path: Union[str, Path, None], max_memory_entries: int):
+        """
+        Initialize the tiers.
+
+        Args:
+            path: SQLite database file (None for a memory-only cache)
+            max_memory_entries: Size of the in-memory LRU tier
+        """
+        self.path = Path(path).expanduser() if path is not None else None
+        self.max_memory_entries = max_memory_entries
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            with self._conn:
+                self._conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({self.columns})")
+                for index in self.indexes:
+                    self._conn.execute(index)
+
+    def _remember(self, key: str, entry: Any) -> None:
+        """Put an entry in the memory tier. Caller holds the lock."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _recall(self, key: str) -> Optional[Any]:
+        """Look up and refresh an entry of the memory tier. Caller holds the lock."""
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(f"DELETE FROM {self.table}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -2,6 +2,14 @@
 LLM provider integrations for Sprint Lens SDK.
 """
 
-from .providers import LLMProvider, OpenAIProvider, AzureOpenAIProvider
+from .providers import (
+    LLMProvider, LLMResponse, LLMProviderError,
+    OpenAICompatibleProvider, OpenAIProvider, AzureOpenAIProvider,
+    get_shared_http_client, close_shared_http_client
+)
 
-__all__ = ["LLMProvider", "OpenAIProvider", "AzureOpenAIProvider"]
\ No newline at end of file
+__all__ = [
+    "LLMProvider", "LLMResponse", "LLMProviderError",
+    "OpenAICompatibleProvider", "OpenAIProvider", "AzureOpenAIProvider",
+    "get_shared_http_client", "close_shared_http_client"
+]
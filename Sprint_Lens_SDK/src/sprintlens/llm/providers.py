@@ -1,15 +1,70 @@
 """
 LLM provider implementations for Sprint Lens SDK.
+
+OpenAIProvider and AzureOpenAIProvider talk to any OpenAI-compatible
+``/chat/completions`` endpoint over a pooled httpx client shared by all
+providers on the same event loop. Requests are retried with exponential
+backoff and jitter on timeouts, connection errors and 408/5xx responses
+(honouring Retry-After), and token usage is accounted per provider.
+Throttling (429/503) is left to the judge rate limiter, which backs off
+and cuts concurrency for every caller of the model, unless the provider
+is created with ``retry_throttled=True``.
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union
 import asyncio
+import json
+import os
+import random
+import time
+import weakref
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, AsyncIterator
+
+import httpx
+
+from ..core.exceptions import SprintLensIntegrationError
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 500, 502, 504}
+# Retried by JudgeRateLimiter; retrying them here too multiplies attempts
+THROTTLE_STATUS_CODES = {429, 503}
+
+
+class LLMProviderError(SprintLensIntegrationError):
+    """Raised when an LLM provider request fails."""
+
+    def __init__(
+        self,
+        message: str = "LLM provider request failed",
+        status_code: Optional[int] = None,
+        response: Optional[httpx.Response] = None,
+        **kwargs
+    ):
+        super().__init__(message, **kwargs)
+        if status_code:
+            self.details["status_code"] = status_code
+        # Read by the judge rate limiter to detect 429/503 and Retry-After
+        self.status_code = status_code
+        self.response = response
+
+
+@dataclass
+class LLMResponse:
+    """Parsed chat completion."""
+    content: str
+    model: Optional[str] = None
+    usage: Dict[str, int] = field(default_factory=dict)
+    finish_reason: Optional[str] = None
+    latency: Optional[float] = None
+    raw: Optional[Dict[str, Any]] = None
 
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
-    
+
     @abstractmethod
     async def generate_async(
         self,
@@ -21,7 +76,31 @@ class LLMProvider(ABC):
     ) -> str:
         """Generate response asynchronously."""
         pass
-    
+
+    async def complete_async(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """Generate a response with usage and metadata."""
+        start = time.perf_counter()
+        content = await self.generate_async(messages, model, temperature, max_tokens, **kwargs)
+        return LLMResponse(content=content, model=model, latency=time.perf_counter() - start)
+
+    async def stream_async(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream response text chunks (the whole response at once by default)."""
+        yield await self.generate_async(messages, model, temperature, max_tokens, **kwargs)
+
     def generate(
         self,
         messages: List[Dict[str, str]],
@@ -34,13 +113,233 @@ class LLMProvider(ABC):
         return asyncio.run(self.generate_async(messages, model, temperature, max_tokens, **kwargs))
 
 
-class OpenAIProvider(LLMProvider):
-    """OpenAI LLM provider."""
-    
-    def __init__(self, api_key: str, **kwargs):
+# One pooled client per event loop, shared by every provider on that loop
+_shared_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Pooled HTTP client for LLM providers on the running event loop.
+
+    Returns:
+        httpx.AsyncClient reused by all providers without their own transport
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(60.0, connect=10.0)
+        )
+        _shared_http_clients[loop] = client
+    return client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared provider client of the running event loop."""
+    client = _shared_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """
+    Provider for OpenAI-compatible chat completion APIs.
+
+    Works with OpenAI, Azure OpenAI (see AzureOpenAIProvider), vLLM,
+    Ollama, LiteLLM proxies or a local stub server.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://api.openai.com/v1",
+        model: str = "gpt-4o-mini",
+        timeout: float = 60.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        max_backoff: float = 20.0,
+        headers: Optional[Dict[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        stream_usage: bool = True,
+        retry_throttled: bool = False
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            api_key: API key sent as a bearer token
+            base_url: API base URL (the part before /chat/completions)
+            model: Default model
+            timeout: Default request timeout in seconds
+            max_retries: Retries after the first attempt
+            backoff_base: First retry delay in seconds (doubled per retry)
+            max_backoff: Maximum retry delay in seconds
+            headers: Extra request headers
+            transport: Custom httpx transport; the provider then uses its
+                own client instead of the shared pool
+            stream_usage: Ask for token usage in streamed responses
+            retry_throttled: Also retry 429/503 responses; only useful when
+                the provider is called without a judge rate limiter
+        """
         self.api_key = api_key
-        self.config = kwargs
-    
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.headers = headers or {}
+        self.stream_usage = stream_usage
+        self.retry_throttled = retry_throttled
+        self.usage: Dict[str, int] = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        self.request_count = 0
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Client for the running loop: own one with a custom transport, else the shared pool."""
+        if self._transport is None:
+            return get_shared_http_client()
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(transport=self._transport)
+            self._client_loop = loop
+        return self._client
+
+    def _request_url(self, model: str) -> str:
+        return f"{self.base_url}/chat/completions"
+
+    def _request_headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": "application/json", **self.headers}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def _build_payload(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        stream: bool,
+        **kwargs
+    ) -> Dict[str, Any]:
+        payload = {"model": model, "messages": messages, "temperature": temperature, **kwargs}
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+        if stream:
+            payload["stream"] = True
+            if self.stream_usage:
+                payload["stream_options"] = {"include_usage": True}
+        return payload
+
+    def _backoff(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """Retry delay: Retry-After when given, else exponential with full jitter."""
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        delay = min(self.max_backoff, self.backoff_base * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+
+    def _record_usage(self, usage: Optional[Dict[str, Any]]) -> Dict[str, int]:
+        usage = {key: int(value) for key, value in (usage or {}).items() if isinstance(value, (int, float))}
+        for key in self.usage:
+            self.usage[key] += usage.get(key, 0)
+        return usage
+
+    async def _send(self, payload: Dict[str, Any], model: str, timeout: Optional[float], stream: bool) -> httpx.Response:
+        """Send a request, retrying transient failures. Streamed responses are returned unread."""
+        client = self._get_http_client()
+        request_timeout = httpx.Timeout(timeout or self.timeout, connect=min(10.0, timeout or self.timeout))
+        retryable = RETRYABLE_STATUS_CODES | THROTTLE_STATUS_CODES if self.retry_throttled else RETRYABLE_STATUS_CODES
+        attempt = 0
+        while True:
+            error: Optional[BaseException] = None
+            try:
+                request = client.build_request(
+                    "POST", self._request_url(model),
+                    json=payload, headers=self._request_headers(), timeout=request_timeout
+                )
+                response = await client.send(request, stream=stream)
+                if response.status_code < 400:
+                    self.request_count += 1
+                    return response
+                if stream:
+                    await response.aread()
+                error = LLMProviderError(
+                    f"LLM request failed with status {response.status_code}: {response.text[:200]}",
+                    status_code=response.status_code,
+                    response=response,
+                    integration=type(self).__name__
+                )
+                if response.status_code not in retryable:
+                    raise error
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                error = e
+
+            if attempt >= self.max_retries:
+                if isinstance(error, LLMProviderError):
+                    raise error
+                raise LLMProviderError(
+                    f"LLM request failed: {error}", integration=type(self).__name__, cause=error
+                ) from error
+            delay = self._backoff(attempt, error)
+            attempt += 1
+            logger.debug(f"Retrying LLM request in {delay:.2f}s (attempt {attempt}): {error}")
+            await asyncio.sleep(delay)
+
+    async def complete_async(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Create a chat completion.
+
+        Args:
+            messages: Chat messages
+            model: Model name (defaults to the provider's model)
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+            timeout: Request timeout in seconds
+            **kwargs: Additional request parameters (top_p, stop, ...)
+
+        Returns:
+            Parsed response with token usage
+        """
+        model = model or self.model
+        payload = self._build_payload(messages, model, temperature, max_tokens, stream=False, **kwargs)
+        start = time.perf_counter()
+        response = await self._send(payload, model, timeout, stream=False)
+        try:
+            data = response.json()
+            choice = data["choices"][0]
+            content = choice.get("message", {}).get("content") or ""
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise LLMProviderError(
+                f"Unexpected LLM response: {response.text[:200]}", integration=type(self).__name__, cause=e
+            )
+        return LLMResponse(
+            content=content,
+            model=data.get("model", model),
+            usage=self._record_usage(data.get("usage")),
+            finish_reason=choice.get("finish_reason"),
+            latency=time.perf_counter() - start,
+            raw=data
+        )
+
     async def generate_async(
         self,
         messages: List[Dict[str, str]],
@@ -49,13 +348,78 @@ class OpenAIProvider(LLMProvider):
         max_tokens: Optional[int] = None,
         **kwargs
     ) -> str:
-        # Placeholder implementation - would integrate with OpenAI API
-        return "Mock OpenAI response"
+        """Generate response asynchronously."""
+        response = await self.complete_async(messages, model, temperature, max_tokens, **kwargs)
+        return response.content
+
+    async def stream_async(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion as text chunks (server-sent events).
+
+        Only establishing the stream is retried; usage reported in the
+        final chunk is added to the provider's totals.
+        """
+        model = model or self.model
+        payload = self._build_payload(messages, model, temperature, max_tokens, stream=True, **kwargs)
+        response = await self._send(payload, model, timeout, stream=True)
+        try:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data)
+                except ValueError:
+                    continue
+                if chunk.get("usage"):
+                    self._record_usage(chunk["usage"])
+                for choice in chunk.get("choices") or []:
+                    text = (choice.get("delta") or {}).get("content")
+                    if text:
+                        yield text
+        finally:
+            await response.aclose()
+
+    async def close(self) -> None:
+        """Close the provider's own client (the shared pool stays open)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class OpenAIProvider(OpenAICompatibleProvider):
+    """OpenAI LLM provider."""
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, **kwargs):
+        """
+        Initialize the provider.
+
+        Args:
+            api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            base_url: API base URL (defaults to OPENAI_BASE_URL or api.openai.com)
+            **kwargs: OpenAICompatibleProvider parameters
+        """
+        super().__init__(
+            api_key=api_key or os.getenv("OPENAI_API_KEY"),
+            base_url=base_url or os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+            **kwargs
+        )
+        self.config = kwargs
+
 
+class AzureOpenAIProvider(OpenAICompatibleProvider):
+    """Azure OpenAI LLM provider; the model name is the deployment name."""
 
-class AzureOpenAIProvider(LLMProvider):
-    """Azure OpenAI LLM provider."""
-    
     def __init__(
         self,
         api_key: str,
@@ -63,18 +427,26 @@ class AzureOpenAIProvider(LLMProvider):
         api_version: str = "2024-02-15-preview",
         **kwargs
     ):
-        self.api_key = api_key
+        """
+        Initialize the provider.
+
+        Args:
+            api_key: Azure OpenAI key (sent as the api-key header)
+            endpoint: Resource endpoint, e.g. https://<resource>.openai.azure.com
+            api_version: REST API version
+            **kwargs: OpenAICompatibleProvider parameters
+        """
+        kwargs.setdefault("stream_usage", False)
+        super().__init__(api_key=api_key, base_url=endpoint, **kwargs)
         self.endpoint = endpoint
         self.api_version = api_version
         self.config = kwargs
-    
-    async def generate_async(
-        self,
-        messages: List[Dict[str, str]],
-        model: Optional[str] = None,
-        temperature: float = 0.7,
-        max_tokens: Optional[int] = None,
-        **kwargs
-    ) -> str:
-        # Placeholder implementation - would integrate with Azure OpenAI API
-        return "Mock Azure OpenAI response"
\ No newline at end of file
+
+    def _request_url(self, model: str) -> str:
+        return f"{self.base_url}/openai/deployments/{model}/chat/completions?api-version={self.api_version}"
+
+    def _request_headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": "application/json", **self.headers}
+        if self.api_key:
+            headers["api-key"] = self.api_key
+        return headers
@@ -13,6 +13,7 @@ import httpx
 from ..core.config import SprintLensConfig
 from ..core.auth import AuthManager
 from ..core.exceptions import SprintLensConnectionError, SprintLensAuthError
+from ..utils.codecs import Codec, get_codec, MSGPACK_CONTENT_TYPE
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -69,7 +70,8 @@ class HTTPClient:
         json: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        codec: Optional[Codec] = None
     ) -> Dict[str, Any]:
         """
         Make authenticated HTTP request.
@@ -81,6 +83,7 @@ class HTTPClient:
             params: Query parameters
             headers: Additional headers
             timeout: Request timeout
+            codec: Codec used to encode the payload (httpx JSON encoding if None)
             
         Returns:
             Response JSON data
@@ -105,11 +108,18 @@ class HTTPClient:
         if headers:
             request_headers.update(headers)
         
+        # Encode the body ourselves when a codec is given
+        content: Optional[bytes] = None
+        if codec is not None and json is not None:
+            content = codec.encode(json)
+            json = None
+            request_headers["Content-Type"] = codec.content_type
+        
         try:
             logger.debug("Making HTTP request", extra={
                 "method": method,
                 "url": url,
-                "has_json": json is not None,
+                "has_json": json is not None or content is not None,
                 "has_params": params is not None
             })
             
@@ -117,6 +127,7 @@ class HTTPClient:
                 method=method,
                 url=url,
                 json=json,
+                content=content,
                 params=params,
                 headers=request_headers,
                 timeout=timeout or self._config.timeout
@@ -134,6 +145,7 @@ class HTTPClient:
                         method=method,
                         url=url,
                         json=json,
+                        content=content,
                         params=params,
                         headers=request_headers,
                         timeout=timeout or self._config.timeout
@@ -147,11 +159,14 @@ class HTTPClient:
                 if response.status_code == 401:
                     raise SprintLensAuthError(error_msg)
                 else:
-                    raise SprintLensConnectionError(error_msg)
+                    raise SprintLensConnectionError(error_msg, status_code=response.status_code)
             
             # Parse response
-            if response.headers.get('content-type', '').startswith('application/json'):
+            response_type = response.headers.get('content-type', '')
+            if response_type.startswith('application/json'):
                 return response.json()
+            elif response_type.startswith(MSGPACK_CONTENT_TYPE):
+                return get_codec("msgpack").decode(response.content)
             else:
                 return {"data": response.text, "status_code": response.status_code}
                 
@@ -180,10 +195,11 @@ class HTTPClient:
         json: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        codec: Optional[Codec] = None
     ) -> Dict[str, Any]:
         """Make POST request."""
-        return await self._make_request("POST", endpoint, json=json, params=params, headers=headers, timeout=timeout)
+        return await self._make_request("POST", endpoint, json=json, params=params, headers=headers, timeout=timeout, codec=codec)
 
     async def put(
         self,
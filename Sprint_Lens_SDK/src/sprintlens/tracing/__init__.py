@@ -17,6 +17,23 @@ from .context import (
     TraceContext
 )
 from .decorator import track
+from .profiling import ProfilingConfig
+from .analysis import (
+    analyze_trace,
+    top_slowest_operations,
+    folded_stacks,
+    TraceAnalysis,
+    SpanTiming,
+    OperationStats
+)
+from .exporters import FileTraceExporter, read_exported_traces
+from .replay import TraceReplayer, ReplayStats
+from .governor import (
+    OverheadGovernor,
+    DetailLevel,
+    configure_governor,
+    get_governor
+)
 from .types import (
     TraceData,
     SpanData,
@@ -42,6 +59,29 @@ __all__ = [
     # Decorator
     "track",
     
+    # Profiling
+    "ProfilingConfig",
+    
+    # Analysis
+    "analyze_trace",
+    "top_slowest_operations",
+    "folded_stacks",
+    "TraceAnalysis",
+    "SpanTiming",
+    "OperationStats",
+    
+    # Export and replay
+    "FileTraceExporter",
+    "read_exported_traces",
+    "TraceReplayer",
+    "ReplayStats",
+    
+    # Overhead governor
+    "OverheadGovernor",
+    "DetailLevel",
+    "configure_governor",
+    "get_governor",
+    
     # Types
     "TraceData",
     "SpanData",
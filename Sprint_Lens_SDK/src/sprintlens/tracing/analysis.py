@@ -0,0 +1,389 @@
+"""
+Local performance analysis for finished traces.
+
+Turns a trace's span tree into a latency report: self time versus child
+time per span, the critical path through parallel children, the trace's
+parallelism factor, the slowest operations across many traces and
+flame-graph compatible folded stacks.
+
+Works on Trace objects held in memory, on the dictionaries produced by
+``Trace.to_dict()`` and on payload records read back from the file exporter.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterable, Tuple, Union, TYPE_CHECKING
+
+from ..utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from .trace import Trace
+
+logger = get_logger(__name__)
+
+TraceLike = Union['Trace', Dict[str, Any]]
+
+# Tolerance when comparing span boundaries, in milliseconds
+_EPSILON_MS = 1e-6
+
+
+@dataclass
+class SpanTiming:
+    """Timing breakdown for a single span, relative to trace start."""
+    span_id: str
+    name: str
+    span_type: str
+    parent_id: Optional[str]
+    start_ms: float
+    end_ms: float
+    duration_ms: float
+    self_time_ms: float = 0.0
+    child_time_ms: float = 0.0
+    depth: int = 0
+    children: List[str] = field(default_factory=list)
+    on_critical_path: bool = False
+
+
+@dataclass
+class TraceAnalysis:
+    """Performance report for one trace."""
+    trace_id: str
+    trace_name: str
+    wall_time_ms: float
+    spans: Dict[str, SpanTiming]
+    roots: List[str]
+    critical_path: List[str]
+    parallelism_factor: float
+
+    @property
+    def total_self_time_ms(self) -> float:
+        """Sum of self time across all spans."""
+        return sum(span.self_time_ms for span in self.spans.values())
+
+    def critical_path_spans(self) -> List[SpanTiming]:
+        """Spans on the critical path, in execution order."""
+        return [self.spans[span_id] for span_id in self.critical_path]
+
+    def slowest_spans(self, n: int = 10, by: str = "self_time_ms") -> List[SpanTiming]:
+        """
+        Get the slowest spans of this trace.
+
+        Args:
+            n: Number of spans to return
+            by: SpanTiming attribute to rank by
+
+        Returns:
+            Spans sorted by the attribute, descending
+        """
+        return sorted(self.spans.values(), key=lambda s: getattr(s, by), reverse=True)[:n]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a dictionary."""
+        return {
+            "trace_id": self.trace_id,
+            "trace_name": self.trace_name,
+            "wall_time_ms": self.wall_time_ms,
+            "total_self_time_ms": self.total_self_time_ms,
+            "parallelism_factor": self.parallelism_factor,
+            "critical_path": self.critical_path,
+            "roots": self.roots,
+            "spans": {span_id: asdict(span) for span_id, span in self.spans.items()},
+        }
+
+
+@dataclass
+class OperationStats:
+    """Latency statistics for one operation (span name) across traces."""
+    name: str
+    span_type: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    p95_ms: float
+    critical_path_count: int = 0
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """Parse a datetime or ISO 8601 string."""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _trace_to_dict(trace: TraceLike) -> Dict[str, Any]:
+    """Get the dictionary form of a trace, accepting exported payloads too."""
+    if not isinstance(trace, dict):
+        return trace.to_dict()
+    if "operationName" in trace and "name" not in trace:
+        # Backend ingestion payload as written by the file exporter
+        return {
+            "id": trace.get("id", ""),
+            "name": trace.get("operationName"),
+            "start_time": trace.get("startTime"),
+            "end_time": trace.get("endTime"),
+            "spans": trace.get("spans", []),
+        }
+    return trace
+
+
+def _union_length(intervals: List[Tuple[float, float]]) -> float:
+    """Total length covered by a set of possibly overlapping intervals."""
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+def _build_timings(trace_dict: Dict[str, Any]) -> Tuple[Dict[str, SpanTiming], float]:
+    """Build span timings relative to the earliest timestamp in the trace."""
+    raw = []
+    for span in trace_dict.get("spans") or []:
+        start = _to_datetime(span.get("start_time"))
+        if start is None:
+            continue
+        end = _to_datetime(span.get("end_time"))
+        raw.append((span, start, end))
+
+    origin = _to_datetime(trace_dict.get("start_time"))
+    if raw:
+        earliest = min(start for _, start, _ in raw)
+        origin = earliest if origin is None else min(origin, earliest)
+
+    timings: Dict[str, SpanTiming] = {}
+    for span, start, end in raw:
+        start_ms = (start - origin).total_seconds() * 1000
+        if end is not None:
+            end_ms = (end - origin).total_seconds() * 1000
+        else:
+            # Unfinished span: fall back to the recorded duration, if any
+            end_ms = start_ms + (span.get("duration_ms") or 0.0)
+        end_ms = max(end_ms, start_ms)
+        timings[span["id"]] = SpanTiming(
+            span_id=span["id"],
+            name=span.get("name", ""),
+            span_type=str(span.get("span_type") or "custom"),
+            parent_id=span.get("parent_id"),
+            start_ms=start_ms,
+            end_ms=end_ms,
+            duration_ms=end_ms - start_ms,
+        )
+
+    wall_time_ms = 0.0
+    if timings:
+        wall_time_ms = max(t.end_ms for t in timings.values()) - min(t.start_ms for t in timings.values())
+    trace_duration = trace_dict.get("duration_ms")
+    if trace_duration:
+        wall_time_ms = max(wall_time_ms, trace_duration)
+
+    return timings, wall_time_ms
+
+
+def _critical_path(span_id: str, timings: Dict[str, SpanTiming]) -> List[str]:
+    """
+    Critical path below a span.
+
+    Walks backwards from the span's end, each time following the child that
+    finished last before the cursor, then moving the cursor to that child's
+    start. Children overlapping a chosen child are off the critical path.
+    """
+    span = timings[span_id]
+    children = sorted(
+        (timings[c] for c in span.children),
+        key=lambda c: c.end_ms,
+        reverse=True,
+    )
+
+    segments: List[List[str]] = []
+    cursor = span.end_ms
+    for child in children:
+        if child.end_ms <= cursor + _EPSILON_MS:
+            segments.append(_critical_path(child.span_id, timings))
+            cursor = child.start_ms
+
+    path = [span_id]
+    for segment in reversed(segments):
+        path.extend(segment)
+    return path
+
+
+def analyze_trace(trace: TraceLike) -> TraceAnalysis:
+    """
+    Analyze a trace's span tree.
+
+    Args:
+        trace: Trace object, ``Trace.to_dict()`` output or exported payload
+
+    Returns:
+        TraceAnalysis with self/child time, critical path and parallelism
+    """
+    trace_dict = _trace_to_dict(trace)
+    timings, wall_time_ms = _build_timings(trace_dict)
+
+    roots: List[str] = []
+    for timing in timings.values():
+        if timing.parent_id in timings and timing.parent_id != timing.span_id:
+            timings[timing.parent_id].children.append(timing.span_id)
+        else:
+            # Spans whose parent is missing are treated as roots
+            roots.append(timing.span_id)
+
+    # Depth-first pass for depth and self/child time
+    stack = [(root, 0) for root in roots]
+    visited = set()
+    while stack:
+        span_id, depth = stack.pop()
+        if span_id in visited:
+            continue
+        visited.add(span_id)
+        timing = timings[span_id]
+        timing.depth = depth
+        clipped = [
+            (max(child.start_ms, timing.start_ms), min(child.end_ms, timing.end_ms))
+            for child in (timings[c] for c in timing.children)
+            if child.end_ms > timing.start_ms and child.start_ms < timing.end_ms
+        ]
+        timing.child_time_ms = _union_length(clipped)
+        timing.self_time_ms = max(0.0, timing.duration_ms - timing.child_time_ms)
+        stack.extend((child_id, depth + 1) for child_id in timing.children)
+
+    # Critical path through the roots, treating the trace as a virtual parent
+    critical_path: List[str] = []
+    cursor = float("inf")
+    segments: List[List[str]] = []
+    for root in sorted((timings[r] for r in roots), key=lambda r: r.end_ms, reverse=True):
+        if root.end_ms <= cursor + _EPSILON_MS:
+            segments.append(_critical_path(root.span_id, timings))
+            cursor = root.start_ms
+    for segment in reversed(segments):
+        critical_path.extend(segment)
+    for span_id in critical_path:
+        timings[span_id].on_critical_path = True
+
+    total_self = sum(t.self_time_ms for t in timings.values())
+    parallelism_factor = total_self / wall_time_ms if wall_time_ms > 0 else 0.0
+
+    return TraceAnalysis(
+        trace_id=trace_dict.get("id", ""),
+        trace_name=trace_dict.get("name", ""),
+        wall_time_ms=wall_time_ms,
+        spans=timings,
+        roots=sorted(roots, key=lambda r: timings[r].start_ms),
+        critical_path=critical_path,
+        parallelism_factor=parallelism_factor,
+    )
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    """Linear-interpolated percentile of pre-sorted values."""
+    if not sorted_values:
+        return 0.0
+    index = (len(sorted_values) - 1) * percentile / 100
+    lower = int(index)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = index - lower
+    return sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction
+
+
+def top_slowest_operations(
+    traces: Iterable[TraceLike],
+    n: int = 10,
+    by: str = "total_ms",
+    metric: str = "self_time_ms"
+) -> List[OperationStats]:
+    """
+    Rank operations by latency across a batch of traces.
+
+    Spans are grouped by name and type, so repeated calls to the same tool
+    or LLM are aggregated.
+
+    Args:
+        traces: Trace objects, trace dictionaries or TraceAnalysis reports
+        n: Number of operations to return
+        by: OperationStats field to rank by (total_ms, mean_ms, max_ms, p95_ms)
+        metric: SpanTiming field to aggregate (self_time_ms or duration_ms)
+
+    Returns:
+        Slowest operations, descending
+    """
+    samples: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+    critical_counts: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    for trace in traces:
+        analysis = trace if isinstance(trace, TraceAnalysis) else analyze_trace(trace)
+        for timing in analysis.spans.values():
+            key = (timing.name, timing.span_type)
+            samples[key].append(getattr(timing, metric))
+            if timing.on_critical_path:
+                critical_counts[key] += 1
+
+    stats = []
+    for (name, span_type), values in samples.items():
+        values.sort()
+        total = sum(values)
+        stats.append(OperationStats(
+            name=name,
+            span_type=span_type,
+            count=len(values),
+            total_ms=total,
+            mean_ms=total / len(values),
+            max_ms=values[-1],
+            p95_ms=_percentile(values, 95),
+            critical_path_count=critical_counts[(name, span_type)],
+        ))
+
+    stats.sort(key=lambda s: getattr(s, by), reverse=True)
+    return stats[:n]
+
+
+def folded_stacks(
+    traces: Iterable[TraceLike],
+    include_trace_name: bool = True,
+    scale: float = 1000.0
+) -> List[str]:
+    """
+    Produce folded stacks for flame graph tools.
+
+    Each line is ``frame;frame;frame value`` where the value is the span's
+    self time, which is the format consumed by flamegraph.pl and speedscope.
+
+    Args:
+        traces: Trace objects, trace dictionaries or TraceAnalysis reports
+        include_trace_name: Prefix each stack with the trace name
+        scale: Multiplier applied to milliseconds (default yields microseconds)
+
+    Returns:
+        Folded stack lines, identical stacks merged
+    """
+    weights: Dict[str, int] = defaultdict(int)
+
+    for trace in traces:
+        analysis = trace if isinstance(trace, TraceAnalysis) else analyze_trace(trace)
+        spans = analysis.spans
+        for timing in spans.values():
+            frames = []
+            current: Optional[SpanTiming] = timing
+            seen = set()
+            while current is not None and current.span_id not in seen:
+                seen.add(current.span_id)
+                frames.append(current.name.replace(";", ":").replace(" ", "_"))
+                current = spans.get(current.parent_id) if current.parent_id else None
+            if include_trace_name and analysis.trace_name:
+                frames.append(analysis.trace_name.replace(";", ":").replace(" ", "_"))
+            value = int(round(timing.self_time_ms * scale))
+            if value > 0:
+                weights[";".join(reversed(frames))] += value
+
+    return [f"{stack} {value}" for stack, value in sorted(weights.items())]
@@ -8,10 +8,13 @@ for function calls, capturing inputs, outputs, and execution metrics.
 import asyncio
 import functools
 import inspect
+import time
 from typing import Optional, Dict, Any, Callable, Union, TYPE_CHECKING
 
 from .types import SpanType
+from .profiling import ProfilingConfig
 from .context import get_current_trace, get_current_span
+from .governor import get_governor, record_overhead
 from ..utils.logging import get_logger
 from ..utils.validation import validate_span_name, sanitize_tags
 from ..utils.serialization import serialize_safely
@@ -50,6 +53,7 @@ class TrackDecorator:
         metadata: Optional[Dict[str, Any]] = None,
         project_name: Optional[str] = None,
         auto_flush: bool = False,
+        profile: Union[bool, ProfilingConfig] = False,
         **span_kwargs
     ):
         """
@@ -65,6 +69,7 @@ class TrackDecorator:
             metadata: Metadata to add to the span
             project_name: Project name for trace (overrides client default)
             auto_flush: Whether to automatically flush trace after function
+            profile: Capture CPU, allocation and await/run time for the span
             **span_kwargs: Additional span parameters
             
         Returns:
@@ -124,6 +129,7 @@ class TrackDecorator:
                     project_name=project_name,
                     auto_flush=auto_flush,
                     is_async=False,
+                    profile=profile,
                     **span_kwargs
                 )
             
@@ -144,6 +150,7 @@ class TrackDecorator:
                     project_name=project_name,
                     auto_flush=auto_flush,
                     is_async=True,
+                    profile=profile,
                     **span_kwargs
                 )
             
@@ -173,6 +180,18 @@ class TrackDecorator:
         **span_kwargs
     ):
         """Execute function with span tracking."""
+        # Reduce capture detail when the SDK is over its overhead budget
+        governor = get_governor()
+        if governor is not None:
+            setup_started = time.perf_counter()
+            level = governor.level
+            if not governor.allows_nested_spans(level) and get_current_span() is not None:
+                governor.note_dropped_span(get_current_trace())
+                record_overhead(setup_started)
+                return func(*args, **kwargs)
+            capture_input = capture_input and governor.allows_input_capture(level)
+            capture_output = capture_output and governor.allows_output_capture(level)
+        
         # Get or create trace
         trace = get_current_trace()
         created_trace = False
@@ -205,6 +224,10 @@ class TrackDecorator:
             **span_kwargs
         )
         
+        if governor is not None:
+            governor.annotate_trace(trace, level)
+            record_overhead(setup_started)
+        
         # Execute function with span
         if is_async:
             return self._execute_async(
@@ -235,22 +258,26 @@ class TrackDecorator:
             try:
                 # Capture input
                 if capture_input:
+                    capture_started = time.perf_counter()
                     input_data = self._capture_function_input(func, args, kwargs)
                     span.set_input(input_data)
                     # For auto-created traces, also set input at trace level
                     if created_trace:
                         trace.set_input(input_data)
+                    record_overhead(capture_started)
                 
                 # Execute function
                 result = func(*args, **kwargs)
                 
                 # Capture output
                 if capture_output:
+                    capture_started = time.perf_counter()
                     output_data = serialize_safely(result)
                     span.set_output(output_data)
                     # For auto-created traces, also set output at trace level
                     if created_trace:
                         trace.set_output(output_data)
+                    record_overhead(capture_started)
                 
                 return result
                 
@@ -322,22 +349,29 @@ class TrackDecorator:
             try:
                 # Capture input
                 if capture_input:
+                    capture_started = time.perf_counter()
                     input_data = self._capture_function_input(func, args, kwargs)
                     span.set_input(input_data)
                     # For auto-created traces, also set input at trace level
                     if created_trace:
                         trace.set_input(input_data)
+                    record_overhead(capture_started)
                 
-                # Execute function
-                result = await func(*args, **kwargs)
+                # Execute function (step-timed when profiling is enabled)
+                coro = func(*args, **kwargs)
+                if span.profiler:
+                    coro = span.profiler.instrument(coro)
+                result = await coro
                 
                 # Capture output
                 if capture_output:
+                    capture_started = time.perf_counter()
                     output_data = serialize_safely(result)
                     span.set_output(output_data)
                     # For auto-created traces, also set output at trace level
                     if created_trace:
                         trace.set_output(output_data)
+                    record_overhead(capture_started)
                 
                 return result
                 
@@ -433,6 +467,7 @@ def track(
     metadata: Optional[Dict[str, Any]] = None,
     project_name: Optional[str] = None,
     auto_flush: bool = False,
+    profile: Union[bool, ProfilingConfig] = False,
     **span_kwargs
 ):
     """
@@ -456,6 +491,7 @@ def track(
         metadata: Metadata to add to the span
         project_name: Project name for trace
         auto_flush: Whether to automatically flush trace
+        profile: Capture CPU, allocation and await/run time for the span
         **span_kwargs: Additional span parameters
         
     Returns:
@@ -492,6 +528,7 @@ def track(
             metadata=metadata,
             project_name=project_name,
             auto_flush=auto_flush,
+            profile=profile,
             **span_kwargs
         )(func)
     
@@ -0,0 +1,337 @@
+"""
+Local file exporter for Sprint Lens traces.
+
+Writes trace payloads to rotating, optionally gzip-compressed NDJSON or
+msgpack files instead of sending them over HTTP. The records are the exact
+payloads the client would post to the backend, so exported files can later
+be bulk-ingested with the replay tool (``sprintlens replay``).
+
+Files are written under a ``.part`` suffix and renamed once rotated or
+closed, so readers only ever see complete files. Batches are written by a
+single writer thread, in the order they were taken from the buffer.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator, Iterable, Union, IO
+
+from ..core.exceptions import SprintLensError
+from ..utils.codecs import get_codec, MSGPACK_AVAILABLE
+from ..utils.logging import get_logger
+from .governor import record_overhead
+
+if MSGPACK_AVAILABLE:
+    import msgpack
+
+logger = get_logger(__name__)
+
+EXPORT_FORMATS = ("ndjson", "msgpack")
+_PART_SUFFIX = ".part"
+
+
+def _file_extension(export_format: str, compress: bool) -> str:
+    """File extension for an export format."""
+    extension = ".ndjson" if export_format == "ndjson" else ".msgpack"
+    return extension + (".gz" if compress else "")
+
+
+class FileTraceExporter:
+    """
+    Exporter writing batched traces to rotating local files.
+
+    Example:
+        >>> exporter = FileTraceExporter("./traces", max_file_bytes=64 * 1024 * 1024)
+        >>> client = SprintLensClient(url=..., api_key=..., exporter=exporter)
+        >>> # traces are now written to ./traces/*.ndjson.gz
+        >>> exporter.close()
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        export_format: str = "ndjson",
+        compress: bool = True,
+        batch_size: int = 100,
+        max_file_bytes: int = 64 * 1024 * 1024,
+        max_file_records: Optional[int] = None,
+        file_prefix: str = "traces"
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            directory: Directory to write export files into
+            export_format: "ndjson" or "msgpack"
+            compress: Gzip-compress files
+            batch_size: Number of traces buffered in memory before writing
+            max_file_bytes: Rotate after this many uncompressed bytes
+            max_file_records: Rotate after this many records (optional)
+            file_prefix: Prefix for generated file names
+
+        Raises:
+            SprintLensError: If the format is unknown
+            ImportError: If msgpack is requested but not installed
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise SprintLensError(
+                f"Unsupported export format: {export_format}",
+                details={"supported": list(EXPORT_FORMATS)}
+            )
+
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.export_format = export_format
+        self.compress = compress
+        self.batch_size = max(1, batch_size)
+        self.max_file_bytes = max_file_bytes
+        self.max_file_records = max_file_records
+        self.file_prefix = file_prefix
+        self._codec = get_codec("msgpack" if export_format == "msgpack" else "json")
+        self._separator = b"" if export_format == "msgpack" else b"\n"
+
+        self._lock = threading.Lock()
+        self._buffer: List[bytes] = []
+        self._file: Optional[IO[bytes]] = None
+        self._file_path: Optional[Path] = None
+        self._file_bytes = 0
+        self._file_records = 0
+        self._sequence = 0
+        # One writer keeps batches in order; threads only start on first use
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sprintlens-export")
+        self._closing = False
+        self._closed = False
+
+        # Statistics
+        self.traces_exported = 0
+        self.files_written: List[Path] = []
+
+    def _encode(self, payload: Dict[str, Any]) -> bytes:
+        """Encode one payload as a record."""
+        started = time.perf_counter()
+        record = self._codec.encode(payload) + self._separator
+        record_overhead(started)
+        return record
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        """
+        Buffer a trace payload for export.
+
+        Args:
+            payload: Backend ingestion payload for one trace
+        """
+        future = self._buffer_record(self._encode(payload))
+        if future is not None:
+            future.result()
+
+    async def export_async(self, payload: Dict[str, Any]) -> None:
+        """
+        Async variant of export.
+
+        Encoding and buffering happen inline; only batch writes, which touch
+        the disk, are moved off the event loop.
+        """
+        future = self._buffer_record(self._encode(payload))
+        if future is not None:
+            await asyncio.wrap_future(future)
+
+    def export_trace(self, trace: Any, default_project_name: Optional[str] = None) -> None:
+        """
+        Export a Trace object or trace dictionary.
+
+        Args:
+            trace: Trace object or ``Trace.to_dict()`` output
+            default_project_name: Project used when the trace has none
+        """
+        from ..core.client import build_trace_payload
+
+        trace_data = trace if isinstance(trace, dict) else trace.to_dict()
+        self.export(build_trace_payload(trace_data, default_project_name))
+
+    def flush(self) -> None:
+        """Write buffered traces and flush the current file."""
+        with self._lock:
+            if self._closing:
+                return
+            batch, self._buffer = self._buffer, []
+            future = self._writer.submit(self._write_records_locked, batch, flush=True)
+        future.result()
+
+    def close(self) -> None:
+        """Flush remaining traces, wait for pending writes and finalize the current file."""
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            batch, self._buffer = self._buffer, []
+            if batch:
+                self._writer.submit(self._write_records_locked, batch)
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            self._finalize_file()
+            self._closed = True
+
+        logger.info("Trace exporter closed", extra={
+            "directory": str(self.directory),
+            "traces_exported": self.traces_exported,
+            "files_written": len(self.files_written)
+        })
+
+    def _buffer_record(self, record: bytes) -> Optional[Future]:
+        """Buffer a record; returns the write of a full batch, if one was started."""
+        with self._lock:
+            if self._closing:
+                raise SprintLensError("Exporter is closed")
+            self._buffer.append(record)
+            if len(self._buffer) < self.batch_size:
+                return None
+            batch, self._buffer = self._buffer, []
+            # Submitting under the lock keeps batches in buffer order
+            return self._writer.submit(self._write_records_locked, batch)
+
+    def _write_records_locked(self, records: List[bytes], flush: bool = False) -> None:
+        """Write records on the writer thread."""
+        with self._lock:
+            if self._closed:
+                raise SprintLensError("Exporter is closed")
+            self._write_records(records)
+            if flush and self._file is not None:
+                self._file.flush()
+
+    def _write_records(self, records: List[bytes]) -> None:
+        """Append records to the current file, rotating as needed. Caller holds the lock."""
+        for record in records:
+            if self._file is None:
+                self._open_file()
+            self._file.write(record)
+            self._file_bytes += len(record)
+            self._file_records += 1
+            self.traces_exported += 1
+
+            if self._file_bytes >= self.max_file_bytes or (
+                self.max_file_records and self._file_records >= self.max_file_records
+            ):
+                self._finalize_file()
+
+    def _open_file(self) -> None:
+        """Open a new part file."""
+        self._sequence += 1
+        timestamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        name = (
+            f"{self.file_prefix}-{timestamp}-{os.getpid()}-{self._sequence:05d}-"
+            f"{uuid.uuid4().hex[:8]}{_file_extension(self.export_format, self.compress)}"
+        )
+        self._file_path = self.directory / name
+        part_path = self._file_path.with_name(name + _PART_SUFFIX)
+        self._file = gzip.open(part_path, "wb") if self.compress else open(part_path, "wb")
+        self._file_bytes = 0
+        self._file_records = 0
+
+    def _finalize_file(self) -> None:
+        """Close the current part file and publish it under its final name."""
+        if self._file is None:
+            return
+        self._file.close()
+        part_path = self._file_path.with_name(self._file_path.name + _PART_SUFFIX)
+        os.replace(part_path, self._file_path)
+        self.files_written.append(self._file_path)
+
+        logger.debug("Trace export file written", extra={
+            "path": str(self._file_path),
+            "records": self._file_records
+        })
+        self._file = None
+        self._file_path = None
+
+    def __enter__(self) -> 'FileTraceExporter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def list_export_files(paths: Union[str, Path, Iterable[Union[str, Path]]]) -> List[Path]:
+    """
+    Resolve files and directories into a sorted list of export files.
+
+    In-progress ``.part`` files are skipped.
+
+    Args:
+        paths: File or directory path, or several of them
+
+    Returns:
+        Export file paths in name order (which is creation order)
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    files: List[Path] = []
+    for path in paths:
+        path = Path(path).expanduser()
+        if path.is_dir():
+            files.extend(
+                p for p in sorted(path.iterdir())
+                if p.is_file() and not p.name.endswith(_PART_SUFFIX)
+                and (".ndjson" in p.suffixes or ".msgpack" in p.suffixes)
+            )
+        elif path.is_file():
+            files.append(path)
+        else:
+            raise SprintLensError(f"Export path not found: {path}")
+    return files
+
+
+def read_export_file(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream trace payloads from one export file.
+
+    Args:
+        path: NDJSON or msgpack file, optionally gzip-compressed
+
+    Yields:
+        Trace payload dictionaries
+    """
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+
+    with opener(path, "rb") as f:
+        if ".msgpack" in path.suffixes:
+            if not MSGPACK_AVAILABLE:
+                raise ImportError("msgpack is required to read msgpack trace exports")
+            for record in msgpack.Unpacker(f, raw=False, timestamp=3, strict_map_key=False):
+                yield record
+        else:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning("Skipping malformed export record", extra={
+                        "path": str(path),
+                        "line": line_number,
+                        "error": str(e)
+                    })
+
+
+def read_exported_traces(
+    paths: Union[str, Path, Iterable[Union[str, Path]]]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream trace payloads from export files or directories.
+
+    Args:
+        paths: File or directory path, or several of them
+
+    Yields:
+        Trace payload dictionaries
+    """
+    for path in list_export_files(paths):
+        yield from read_export_file(path)
@@ -0,0 +1,227 @@
+"""
+Adaptive overhead governor for Sprint Lens tracing.
+
+Tracks the time the SDK itself spends per second (decorator bookkeeping,
+input/output serialization and export enqueue) against a CPU budget and
+progressively reduces capture detail when the budget is exceeded:
+
+1. drop input capture
+2. drop output capture
+3. drop nested spans (only top-level spans are recorded)
+
+Detail is restored one level at a time once overhead falls well below the
+budget. Every level change is recorded on the traces it affects.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from enum import IntEnum
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+
+from ..utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from .trace import Trace
+
+logger = get_logger(__name__)
+
+GOVERNOR_METADATA_KEY = "overhead_governor"
+
+
+class DetailLevel(IntEnum):
+    """Capture detail levels, from full detail to most reduced."""
+    FULL = 0
+    NO_INPUT = 1
+    NO_INPUT_OUTPUT = 2
+    ROOT_SPANS_ONLY = 3
+
+
+class OverheadGovernor:
+    """
+    Keeps SDK overhead within a fraction of one CPU.
+
+    Example:
+        >>> governor = configure_governor(budget=0.01)  # 1% of a core
+        >>> # @track now captures less detail while the SDK is over budget
+    """
+
+    def __init__(
+        self,
+        budget: float = 0.01,
+        window_seconds: float = 1.0,
+        restore_ratio: float = 0.5,
+        max_history: int = 100
+    ):
+        """
+        Initialize the governor.
+
+        Args:
+            budget: Allowed SDK time per second of wall time (0.01 = 1%)
+            window_seconds: Measurement window length
+            restore_ratio: Restore detail when overhead drops below
+                budget * restore_ratio (hysteresis against flapping)
+            max_history: Number of level changes kept in history
+        """
+        if budget <= 0:
+            raise ValueError("budget must be positive")
+
+        self.budget = budget
+        self.window_seconds = window_seconds
+        self.restore_ratio = restore_ratio
+        self.max_history = max_history
+
+        self._lock = threading.Lock()
+        self._level = DetailLevel.FULL
+        self._window_start = time.perf_counter()
+        self._window_overhead = 0.0
+        self._last_ratio = 0.0
+        self._history: List[Dict[str, Any]] = []
+
+    @property
+    def level(self) -> DetailLevel:
+        """Current detail level, re-evaluated when a window has elapsed."""
+        now = time.perf_counter()
+        if now - self._window_start >= self.window_seconds:
+            self._evaluate(now)
+        return self._level
+
+    @property
+    def overhead_ratio(self) -> float:
+        """SDK time per wall second in the last completed window."""
+        return self._last_ratio
+
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """Recent level changes, oldest first."""
+        return list(self._history)
+
+    def record(self, seconds: float) -> None:
+        """
+        Account SDK time.
+
+        Args:
+            seconds: Time spent inside the SDK
+        """
+        with self._lock:
+            self._window_overhead += seconds
+
+    def _evaluate(self, now: float) -> None:
+        """Close the current window and adjust the detail level."""
+        with self._lock:
+            elapsed = now - self._window_start
+            if elapsed < self.window_seconds:
+                return
+            ratio = self._window_overhead / elapsed
+            self._window_start = now
+            self._window_overhead = 0.0
+            self._last_ratio = ratio
+
+            previous = self._level
+            if ratio > self.budget and previous < DetailLevel.ROOT_SPANS_ONLY:
+                self._level = DetailLevel(previous + 1)
+            elif ratio < self.budget * self.restore_ratio and previous > DetailLevel.FULL:
+                self._level = DetailLevel(previous - 1)
+            else:
+                return
+
+            change = {
+                "at": datetime.now(timezone.utc).isoformat(),
+                "from": previous.name.lower(),
+                "to": self._level.name.lower(),
+                "overhead_ratio": ratio,
+                "budget": self.budget,
+            }
+            self._history.append(change)
+            del self._history[:-self.max_history]
+
+        logger.info("Tracing detail level changed", extra=change)
+
+    def allows_input_capture(self, level: Optional[DetailLevel] = None) -> bool:
+        """Whether function inputs may be captured."""
+        return (self.level if level is None else level) < DetailLevel.NO_INPUT
+
+    def allows_output_capture(self, level: Optional[DetailLevel] = None) -> bool:
+        """Whether function outputs may be captured."""
+        return (self.level if level is None else level) < DetailLevel.NO_INPUT_OUTPUT
+
+    def allows_nested_spans(self, level: Optional[DetailLevel] = None) -> bool:
+        """Whether spans below a top-level span may be created."""
+        return (self.level if level is None else level) < DetailLevel.ROOT_SPANS_ONLY
+
+    def annotate_trace(self, trace: 'Trace', level: Optional[DetailLevel] = None) -> None:
+        """
+        Record the detail level in effect, and any change to it, on a trace.
+
+        Traces captured entirely at full detail are left untouched.
+
+        Args:
+            trace: Trace being captured
+            level: Level in effect (current level if not given)
+        """
+        level = self.level if level is None else level
+        name = level.name.lower()
+        info = trace.metadata.get(GOVERNOR_METADATA_KEY)
+
+        if info is None:
+            if level == DetailLevel.FULL:
+                return
+            # The change that led here happened before this trace started
+            info = {"detail_level": name, "changes": [], "dropped_spans": 0}
+            if self._history:
+                info["changes"].append(self._history[-1])
+            trace.metadata[GOVERNOR_METADATA_KEY] = info
+        elif info["detail_level"] != name:
+            info["changes"].append({
+                "at": datetime.now(timezone.utc).isoformat(),
+                "from": info["detail_level"],
+                "to": name,
+                "overhead_ratio": self._last_ratio,
+                "budget": self.budget,
+            })
+            info["detail_level"] = name
+
+    def note_dropped_span(self, trace: Optional['Trace']) -> None:
+        """Count a nested span skipped because of the detail level."""
+        if trace is None:
+            return
+        self.annotate_trace(trace)
+        info = trace.metadata.get(GOVERNOR_METADATA_KEY)
+        if info is not None:
+            info["dropped_spans"] += 1
+
+
+# Global governor (disabled unless configured)
+_global_governor: Optional[OverheadGovernor] = None
+
+
+def configure_governor(budget: Optional[float] = 0.01, **kwargs) -> Optional[OverheadGovernor]:
+    """
+    Enable the global overhead governor, or disable it with ``budget=None``.
+
+    Args:
+        budget: Allowed SDK time per second of wall time
+        **kwargs: Additional OverheadGovernor parameters
+
+    Returns:
+        The active governor, or None when disabled
+    """
+    global _global_governor
+    _global_governor = OverheadGovernor(budget=budget, **kwargs) if budget else None
+    return _global_governor
+
+
+def get_governor() -> Optional[OverheadGovernor]:
+    """Get the global overhead governor, if enabled."""
+    return _global_governor
+
+
+def record_overhead(started: float) -> None:
+    """
+    Account SDK time since ``started`` (a ``time.perf_counter()`` value).
+
+    A no-op when no governor is configured.
+    """
+    governor = _global_governor
+    if governor is not None:
+        governor.record(time.perf_counter() - started)
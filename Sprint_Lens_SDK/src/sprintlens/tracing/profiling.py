@@ -0,0 +1,231 @@
+"""
+Per-span resource profiling for Sprint Lens SDK.
+
+Captures where a span's wall-clock time went: CPU time for synchronous
+spans, sampled allocation statistics via tracemalloc, and for async spans
+the split between time spent running on the event loop and time spent
+awaiting.
+"""
+
+import random
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Awaitable, Union
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Reference count of spans currently sampling allocations, so tracemalloc is
+# only stopped by the profiler that started it once no sampled span is active.
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+
+
+@dataclass
+class ProfilingConfig:
+    """Configuration for per-span resource profiling."""
+    cpu: bool = True
+    memory: bool = False
+    memory_sample_rate: float = 0.1
+    async_steps: bool = True
+
+
+def resolve_profiling_config(
+    profile: Union[bool, ProfilingConfig, None]
+) -> Optional[ProfilingConfig]:
+    """
+    Normalize a ``profile`` argument into a ProfilingConfig.
+
+    Args:
+        profile: True for default profiling, a ProfilingConfig, or False/None
+
+    Returns:
+        ProfilingConfig or None if profiling is disabled
+    """
+    if isinstance(profile, ProfilingConfig):
+        return profile
+    if profile:
+        return ProfilingConfig()
+    return None
+
+
+def _acquire_tracemalloc() -> bool:
+    """
+    Start tracemalloc if needed.
+
+    Returns:
+        True if the profiler started tracing, False if the host application
+        did (its peak then predates the span and must not be reset)
+    """
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_owned = True
+        _tracemalloc_users += 1
+        return _tracemalloc_owned
+
+
+def _release_tracemalloc() -> None:
+    """Stop tracemalloc once the last sampled span finishes."""
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        _tracemalloc_users = max(0, _tracemalloc_users - 1)
+        if _tracemalloc_users == 0 and _tracemalloc_owned:
+            tracemalloc.stop()
+            _tracemalloc_owned = False
+
+
+class _StepTimedCoroutine:
+    """
+    Awaitable that drives a coroutine step by step, timing each step.
+
+    Every ``send``/``throw`` into the wrapped coroutine is one task step
+    executed on the loop; the time between steps is time spent awaiting.
+    """
+
+    def __init__(self, coro: Awaitable[Any], profiler: 'SpanResourceProfiler'):
+        self._coro = coro.__await__()
+        self._profiler = profiler
+
+    def __await__(self):
+        coro = self._coro
+        profiler = self._profiler
+        value: Any = None
+        error: Optional[BaseException] = None
+
+        while True:
+            wall_start = time.perf_counter_ns()
+            cpu_start = time.thread_time_ns()
+            try:
+                if error is not None:
+                    yielded = coro.throw(error)
+                else:
+                    yielded = coro.send(value)
+            except StopIteration as stop:
+                profiler._record_step(wall_start, cpu_start)
+                return stop.value
+            except BaseException:
+                profiler._record_step(wall_start, cpu_start)
+                raise
+            profiler._record_step(wall_start, cpu_start)
+
+            try:
+                value = yield yielded
+                error = None
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as e:
+                value = None
+                error = e
+
+
+class SpanResourceProfiler:
+    """
+    Collects resource usage for a single span.
+
+    Example:
+        >>> profiler = SpanResourceProfiler(ProfilingConfig(memory=True))
+        >>> profiler.start()
+        >>> do_work()
+        >>> resources = profiler.stop()
+    """
+
+    def __init__(self, config: ProfilingConfig):
+        """
+        Initialize the profiler.
+
+        Args:
+            config: Profiling configuration
+        """
+        self.config = config
+        self._wall_start = 0
+        self._thread_cpu_start = 0
+        self._process_cpu_start = 0
+        self._memory_sampled = False
+        self._peak_tracked = False
+        self._memory_start = 0
+
+        # Async step accounting
+        self._is_async = False
+        self._run_ns = 0
+        self._step_cpu_ns = 0
+        self._steps = 0
+
+    def start(self) -> None:
+        """Take the starting resource snapshot."""
+        if self.config.memory and random.random() < self.config.memory_sample_rate:
+            # A freshly started trace has no earlier peak to reset
+            self._peak_tracked = _acquire_tracemalloc()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+            self._memory_sampled = True
+
+        if self.config.cpu:
+            self._thread_cpu_start = time.thread_time_ns()
+            self._process_cpu_start = time.process_time_ns()
+        self._wall_start = time.perf_counter_ns()
+
+    def instrument(self, coro: Awaitable[Any]) -> Awaitable[Any]:
+        """
+        Wrap a coroutine so its run and await time are accounted separately.
+
+        Args:
+            coro: Coroutine executed inside the span
+
+        Returns:
+            Awaitable yielding the coroutine's result
+        """
+        if not self.config.async_steps:
+            return coro
+        self._is_async = True
+        return _StepTimedCoroutine(coro, self)
+
+    def _record_step(self, wall_start: int, cpu_start: int) -> None:
+        """Account for one task step of the instrumented coroutine."""
+        self._run_ns += time.perf_counter_ns() - wall_start
+        self._step_cpu_ns += time.thread_time_ns() - cpu_start
+        self._steps += 1
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        Take the final snapshot and compute resource deltas.
+
+        Returns:
+            Dictionary of resource measurements for span metadata
+        """
+        wall_ns = time.perf_counter_ns() - self._wall_start
+        resources: Dict[str, Any] = {"wall_time_ms": wall_ns / 1e6}
+
+        if self._is_async:
+            # Thread and process clocks include other tasks on the loop, so
+            # only CPU measured inside this coroutine's own steps is reported.
+            run_ns = min(self._run_ns, wall_ns)
+            resources.update({
+                "run_time_ms": run_ns / 1e6,
+                "await_time_ms": (wall_ns - run_ns) / 1e6,
+                "task_steps": self._steps,
+            })
+            if self.config.cpu:
+                resources["cpu_time_ms"] = self._step_cpu_ns / 1e6
+        elif self.config.cpu:
+            resources["cpu_time_ms"] = (time.thread_time_ns() - self._thread_cpu_start) / 1e6
+            resources["process_cpu_time_ms"] = (time.process_time_ns() - self._process_cpu_start) / 1e6
+
+        if "cpu_time_ms" in resources and wall_ns > 0:
+            resources["cpu_utilization"] = resources["cpu_time_ms"] / (wall_ns / 1e6)
+
+        if self._memory_sampled:
+            current, peak = tracemalloc.get_traced_memory()
+            resources["alloc_bytes"] = current - self._memory_start
+            if self._peak_tracked:
+                resources["alloc_peak_bytes"] = max(0, peak - self._memory_start)
+            resources["memory_sampled"] = True
+            _release_tracemalloc()
+            self._memory_sampled = False
+
+        return resources
@@ -0,0 +1,160 @@
+"""
+Replay exported traces into a Sprint Agent Lens backend.
+
+Reads files written by FileTraceExporter and bulk-ingests them through the
+batch traces endpoint at a configurable rate, e.g. to backfill after a
+backend outage or to ingest traces recorded during a load test.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable, Union, Callable, TYPE_CHECKING
+
+from .exporters import list_export_files, read_export_file
+from ..utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from ..core.client import SprintLensClient
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ReplayStats:
+    """Outcome of a replay run."""
+    files: int = 0
+    traces_sent: int = 0
+    traces_failed: int = 0
+    batches_sent: int = 0
+    batches_failed: int = 0
+    duration_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def traces_per_second(self) -> float:
+        """Achieved ingest rate."""
+        return self.traces_sent / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+
+class TraceReplayer:
+    """
+    Bulk-ingest exported trace payloads via the batch endpoint.
+
+    Example:
+        >>> async with SprintLensClient(url=..., api_key=...) as client:
+        ...     replayer = TraceReplayer(client, batch_size=200, rate_limit=500)
+        ...     stats = await replayer.replay("./traces")
+    """
+
+    def __init__(
+        self,
+        client: Optional['SprintLensClient'],
+        batch_size: int = 100,
+        rate_limit: Optional[float] = None,
+        max_retries: int = 3,
+        progress_callback: Optional[Callable[[ReplayStats], None]] = None
+    ):
+        """
+        Initialize the replayer.
+
+        Args:
+            client: Initialized Sprint Lens client (may be None for dry runs)
+            batch_size: Traces per batch request
+            rate_limit: Maximum traces per second (None for unlimited)
+            max_retries: Retries per batch before it is counted as failed
+            progress_callback: Called with running stats after each batch
+        """
+        self.client = client
+        self.batch_size = max(1, batch_size)
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.progress_callback = progress_callback
+
+    async def replay(
+        self,
+        paths: Union[str, Path, Iterable[Union[str, Path]]],
+        dry_run: bool = False
+    ) -> ReplayStats:
+        """
+        Replay all traces in the given files or directories.
+
+        Args:
+            paths: Export file or directory path, or several of them
+            dry_run: Read and count traces without sending them
+
+        Returns:
+            ReplayStats for the run
+        """
+        stats = ReplayStats()
+        files = list_export_files(paths)
+        stats.files = len(files)
+        started = time.monotonic()
+
+        batch: List[Dict[str, Any]] = []
+        for path in files:
+            for payload in read_export_file(path):
+                batch.append(payload)
+                if len(batch) >= self.batch_size:
+                    await self._send_batch(batch, stats, started, dry_run)
+                    batch = []
+        if batch:
+            await self._send_batch(batch, stats, started, dry_run)
+
+        stats.duration_seconds = time.monotonic() - started
+        logger.info("Trace replay finished", extra={
+            "files": stats.files,
+            "traces_sent": stats.traces_sent,
+            "traces_failed": stats.traces_failed,
+            "duration_seconds": stats.duration_seconds
+        })
+        return stats
+
+    async def _send_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        stats: ReplayStats,
+        started: float,
+        dry_run: bool
+    ) -> None:
+        """Send one batch, pacing to the configured rate."""
+        if self.rate_limit:
+            # Sleep until sending this batch keeps the average at the limit
+            earliest = started + (stats.traces_sent + stats.traces_failed) / self.rate_limit
+            delay = earliest - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        if dry_run:
+            stats.traces_sent += len(batch)
+            stats.batches_sent += 1
+        else:
+            await self._post_with_retries(batch, stats)
+
+        stats.duration_seconds = time.monotonic() - started
+        if self.progress_callback:
+            self.progress_callback(stats)
+
+    async def _post_with_retries(self, batch: List[Dict[str, Any]], stats: ReplayStats) -> None:
+        """Post a batch, retrying with exponential backoff."""
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.client.send_trace_batch(batch)
+                stats.traces_sent += len(batch)
+                stats.batches_sent += 1
+                return
+            except Exception as e:
+                last_error = e
+                if attempt < self.max_retries:
+                    await asyncio.sleep(min(30.0, 0.5 * (2 ** attempt)))
+
+        stats.traces_failed += len(batch)
+        stats.batches_failed += 1
+        stats.errors.append(str(last_error))
+        logger.error("Failed to replay trace batch", extra={
+            "batch_size": len(batch),
+            "error": str(last_error)
+        })
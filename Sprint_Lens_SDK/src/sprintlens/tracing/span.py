@@ -11,6 +11,7 @@ from typing import Optional, Dict, Any, Union, TYPE_CHECKING
 
 from .types import SpanData, SpanType, TraceStatus, InputOutput, MetricValue
 from .context import SpanContext
+from .profiling import ProfilingConfig, SpanResourceProfiler, resolve_profiling_config
 from ..utils.logging import get_logger
 from ..utils.serialization import serialize_safely, calculate_size
 
@@ -48,6 +49,7 @@ class Span:
         model: Optional[str] = None,
         provider: Optional[str] = None,
         version: Optional[str] = None,
+        profile: Union[bool, ProfilingConfig, None] = None,
         **kwargs
     ):
         """
@@ -65,6 +67,7 @@ class Span:
             model: Model name (for LLM operations)
             provider: Provider name (e.g., "openai", "anthropic")
             version: Model/API version
+            profile: Enable resource profiling (True or a ProfilingConfig)
             **kwargs: Additional span parameters
         """
         self.id = span_id or str(uuid.uuid4())
@@ -85,7 +88,7 @@ class Span:
         
         # Metadata
         self.tags = tags or {}
-        self.metadata = metadata or {}
+        self.metadata = dict(metadata) if metadata else {}
         self.metrics: Dict[str, MetricValue] = {}
         
         # Status
@@ -101,9 +104,16 @@ class Span:
         self.tokens_usage: Optional[Dict[str, int]] = None
         self.cost: Optional[float] = None
         
+        # Resource profiling (opt-in)
+        profiling_config = resolve_profiling_config(profile)
+        self._profiler: Optional[SpanResourceProfiler] = (
+            SpanResourceProfiler(profiling_config) if profiling_config else None
+        )
+        
         # State tracking
         self._started = False
         self._finished = False
+        self._context: Optional[SpanContext] = None
         
         logger.debug("Created span", extra={
             "span_id": self.id,
@@ -130,6 +140,9 @@ class Span:
         self.start_time = datetime.now(timezone.utc)
         self._started = True
         
+        if self._profiler:
+            self._profiler.start()
+        
         logger.debug("Span started", extra={
             "span_id": self.id,
             "trace_id": self.trace_id
@@ -146,6 +159,9 @@ class Span:
         self.end_time = datetime.now(timezone.utc)
         self.duration_ms = (self.end_time - self.start_time).total_seconds() * 1000
         
+        if self._profiler:
+            self.metadata["resources"] = self._profiler.stop()
+        
         # Set final status if not already set to error
         if self.status == TraceStatus.RUNNING:
             self.status = TraceStatus.COMPLETED
@@ -449,6 +465,11 @@ class Span:
         """
         self._finish()
 
+    @property
+    def profiler(self) -> Optional[SpanResourceProfiler]:
+        """Get the resource profiler, if profiling is enabled."""
+        return self._profiler
+
     @property
     def is_started(self) -> bool:
         """Check if span is started."""
@@ -471,19 +492,25 @@ class Span:
 
     def __enter__(self) -> 'Span':
         """Context manager entry."""
-        return SpanContext(self).__enter__()
+        self._context = SpanContext(self)
+        return self._context.__enter__()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        return SpanContext(self).__exit__(exc_type, exc_val, exc_tb)
+        context, self._context = self._context, None
+        if context is not None:
+            return context.__exit__(exc_type, exc_val, exc_tb)
 
     async def __aenter__(self) -> 'Span':
         """Async context manager entry."""
-        return await SpanContext(self).__aenter__()
+        self._context = SpanContext(self)
+        return await self._context.__aenter__()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        return await SpanContext(self).__aexit__(exc_type, exc_val, exc_tb)
+        context, self._context = self._context, None
+        if context is not None:
+            return await context.__aexit__(exc_type, exc_val, exc_tb)
 
     def __repr__(self) -> str:
         return (
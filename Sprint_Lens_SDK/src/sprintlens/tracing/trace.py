@@ -6,12 +6,14 @@ that track individual steps within the workflow.
 """
 
 import asyncio
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List, Union, TYPE_CHECKING
 
 from .types import TraceData, TraceStatus, InputOutput, MetricValue
 from .context import TraceContext, get_current_span
+from .governor import record_overhead
 from ..utils.logging import get_logger
 from ..utils.serialization import serialize_safely, calculate_size
 
@@ -506,6 +508,58 @@ class Trace:
         
         if total_cost > 0:
             self.add_metric("total_cost", total_cost, unit="USD")
+        
+        self._aggregate_resource_metrics()
+
+    def _aggregate_resource_metrics(self) -> None:
+        """
+        Roll up profiled span resources into trace metrics.
+        
+        Only profiled spans without a profiled ancestor are counted, since a
+        parent's measurements already include the work of its children.
+        """
+        totals = {
+            "cpu_time_ms": 0.0,
+            "run_time_ms": 0.0,
+            "await_time_ms": 0.0,
+            "alloc_bytes": 0,
+        }
+        peak_alloc = 0
+        profiled = 0
+        
+        for span in self._spans:
+            resources = span.metadata.get("resources")
+            if not resources or self._has_profiled_ancestor(span):
+                continue
+            profiled += 1
+            for key in totals:
+                totals[key] += resources.get(key, 0)
+            peak_alloc = max(peak_alloc, resources.get("alloc_peak_bytes", 0))
+        
+        if not profiled:
+            return
+        
+        self.add_metric("total_cpu_time_ms", totals["cpu_time_ms"], unit="ms")
+        if totals["run_time_ms"] or totals["await_time_ms"]:
+            self.add_metric("total_run_time_ms", totals["run_time_ms"], unit="ms")
+            self.add_metric("total_await_time_ms", totals["await_time_ms"], unit="ms")
+        if totals["alloc_bytes"] or peak_alloc:
+            self.add_metric("total_alloc_bytes", totals["alloc_bytes"], unit="bytes")
+            self.add_metric("max_alloc_peak_bytes", peak_alloc, unit="bytes")
+
+    def _has_profiled_ancestor(self, span: 'Span') -> bool:
+        """Check whether any ancestor of a span carries resource data."""
+        parent_id = span.parent_id
+        seen = set()
+        while parent_id and parent_id not in seen:
+            seen.add(parent_id)
+            parent = self._span_lookup.get(parent_id)
+            if parent is None:
+                return False
+            if parent.metadata.get("resources"):
+                return True
+            parent_id = parent.parent_id
+        return False
 
     async def flush(self) -> None:
         """
@@ -518,7 +572,9 @@ class Trace:
             return
         
         try:
+            serialize_started = time.perf_counter()
             trace_data = self.to_dict()
+            record_overhead(serialize_started)
             await self._client._add_trace_to_buffer(trace_data)
             self._flushed = True
             
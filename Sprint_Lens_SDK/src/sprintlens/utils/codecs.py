@@ -0,0 +1,226 @@
+"""
+Wire codecs for trace export.
+
+Provides a small pluggable encoding layer used when sending traces to the
+backend and when writing export files:
+
+- ``json``: JSON (the default), encoded with orjson when it is installed
+  and with the standard library otherwise
+- ``stdlib-json`` / ``orjson``: a specific JSON encoder
+- ``msgpack``: binary encoding with native timestamp and bytes types
+
+Codecs are selected by name or negotiated by content type.
+"""
+
+import base64
+import json
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Any, List, Optional, Sequence, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Content types accepted as aliases when negotiating
+_CONTENT_TYPE_ALIASES = {
+    "application/x-msgpack": MSGPACK_CONTENT_TYPE,
+    "application/vnd.msgpack": MSGPACK_CONTENT_TYPE,
+}
+
+
+def _to_builtin(obj: Any) -> Any:
+    """Fallback conversion for values JSON encoders do not handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(obj)).decode("ascii")
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    return str(obj)
+
+
+class Codec(ABC):
+    """Base class for wire codecs."""
+
+    name: str = ""
+    content_type: str = ""
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        """Encode an object to bytes."""
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decode bytes to an object."""
+        pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(content_type='{self.content_type}')"
+
+
+class JSONCodec(Codec):
+    """Standard library JSON codec."""
+
+    name = "json"
+    content_type = JSON_CONTENT_TYPE
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, default=_to_builtin, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+    content_type = JSON_CONTENT_TYPE
+
+    def __init__(self):
+        if not ORJSON_AVAILABLE:
+            raise ImportError("orjson is required for the orjson codec")
+        # Non-string keys are common in captured inputs; stdlib JSON coerces them too
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_to_builtin, option=self._options)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """
+    Binary msgpack codec.
+
+    Datetimes are encoded with the msgpack timestamp extension and bytes as
+    the native binary type, instead of being stringified as in JSON.
+    """
+
+    name = "msgpack"
+    content_type = MSGPACK_CONTENT_TYPE
+
+    def __init__(self):
+        if not MSGPACK_AVAILABLE:
+            raise ImportError("msgpack is required for the msgpack codec")
+
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, datetime):
+            if obj.tzinfo is None:
+                obj = obj.replace(tzinfo=timezone.utc)
+            return msgpack.Timestamp.from_datetime(obj)
+        if isinstance(obj, (bytearray, memoryview)):
+            return bytes(obj)
+        return _to_builtin(obj)
+
+    def encode(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, default=self._default, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, timestamp=3, strict_map_key=False)
+
+
+_CODECS = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "msgpack": MsgpackCodec,
+}
+
+
+def available_codecs() -> List[str]:
+    """Names of codecs whose dependencies are installed."""
+    names = ["json"]
+    if ORJSON_AVAILABLE:
+        names.append("orjson")
+    if MSGPACK_AVAILABLE:
+        names.append("msgpack")
+    return names
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """
+    Get a codec by name or content type.
+
+    ``None``, ``"auto"`` and ``"json"`` resolve to the fastest available
+    JSON codec (orjson when installed).
+
+    Args:
+        name: Codec name or content type
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If the codec is unknown
+        ImportError: If the codec's dependency is not installed
+    """
+    key = (name or "auto").lower().split(";")[0].strip()
+    key = _CONTENT_TYPE_ALIASES.get(key, key)
+
+    if key in ("auto", "json", JSON_CONTENT_TYPE):
+        return OrjsonCodec() if ORJSON_AVAILABLE else JSONCodec()
+    if key == "stdlib-json":
+        return JSONCodec()
+    if key == MSGPACK_CONTENT_TYPE:
+        key = "msgpack"
+    if key not in _CODECS:
+        raise ValueError(f"Unknown codec: {name}. Available: {available_codecs()}")
+    return _CODECS[key]()
+
+
+def negotiate_codec(
+    accepted: Union[str, Sequence[str], None],
+    preferred: Sequence[str] = ("msgpack", "json")
+) -> Codec:
+    """
+    Choose a codec both sides support.
+
+    Args:
+        accepted: Content types accepted by the peer, as a list or an
+            Accept-style comma separated header
+        preferred: Codec names in order of preference
+
+    Returns:
+        First preferred codec that the peer accepts and that is installed,
+        falling back to JSON
+    """
+    if isinstance(accepted, str):
+        accepted = accepted.split(",")
+    accepted_types = {
+        _CONTENT_TYPE_ALIASES.get(t.split(";")[0].strip().lower(), t.split(";")[0].strip().lower())
+        for t in (accepted or [])
+    }
+
+    for name in preferred:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        if codec.content_type in accepted_types or "*/*" in accepted_types:
+            return codec
+
+    return get_codec("json")
@@ -0,0 +1,54 @@
+"""
+Throughput benchmarks for trace wire codecs.
+
+Run with ``pytest -m performance -s`` to see the numbers.
+"""
+
+import time
+import pytest
+
+from sprintlens.utils.codecs import get_codec, available_codecs
+
+
+def _make_trace(n_spans: int = 20):
+    """Representative trace payload with nested spans."""
+    return {
+        "operationName": "agent-run",
+        "startTime": "2024-01-01T00:00:00+00:00",
+        "endTime": "2024-01-01T00:00:02+00:00",
+        "tags": {"env": "bench", "agent_id": "agent-1"},
+        "metadata": {"version": "1.0.0"},
+        "feedback_scores": {"total_tokens": {"value": 1234, "unit": None}},
+        "spans": [
+            {
+                "id": f"span-{i}",
+                "name": f"step-{i}",
+                "parent_id": None if i == 0 else "span-0",
+                "start_time": "2024-01-01T00:00:00.100000+00:00",
+                "end_time": "2024-01-01T00:00:00.900000+00:00",
+                "duration_ms": 800.0,
+                "input": {"data": {"prompt": "x" * 200}, "content_type": "application/json"},
+                "output": {"data": {"text": "y" * 400}, "content_type": "application/json"},
+                "tokens_usage": {"prompt": 50, "completion": 100},
+                "cost": 0.0012,
+            }
+            for i in range(n_spans)
+        ],
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("codec_name", ["stdlib-json"] + available_codecs()[1:])
+def test_codec_encode_throughput(codec_name):
+    """Encode throughput in traces per second for each installed codec."""
+    codec = get_codec(codec_name)
+    trace = _make_trace()
+    iterations = 300
+    
+    started = time.perf_counter()
+    for _ in range(iterations):
+        encoded = codec.encode(trace)
+    elapsed = time.perf_counter() - started
+    
+    print(f"\n{codec_name}: {iterations / elapsed:,.0f} traces/s, {len(encoded)} bytes/trace")
+    assert codec.decode(encoded)["operationName"] == "agent-run"
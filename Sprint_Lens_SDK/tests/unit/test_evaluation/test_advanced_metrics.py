@@ -0,0 +1,165 @@
+"""
+Unit tests for concurrent advanced metrics and the backend batch evaluator.
+"""
+
+import asyncio
+import json
+import httpx
+import pytest
+
+from sprintlens.evaluation import (
+    AdvancedMetricsClient, EnhancedRelevanceMetric, EnhancedHallucinationMetric, AdvancedBatchEvaluator
+)
+
+
+class FakeBackend:
+    """Mock /api/v1/llm/evaluate endpoint tracking concurrent requests."""
+
+    def __init__(self, delay=0.02, batch_status=404):
+        self.delay = delay
+        self.batch_status = batch_status
+        self.active = 0
+        self.max_active = 0
+        self.batch_requests = 0
+
+    async def handler(self, request):
+        payload = json.loads(request.content)
+        if request.url.path.endswith("/batch"):
+            self.batch_requests += 1
+            if self.batch_status != 200:
+                return httpx.Response(self.batch_status)
+            return httpx.Response(200, json={"data": [
+                {"score": len(item["actualOutput"]) / 10} for item in payload["items"]
+            ]})
+
+        if payload["actualOutput"] == "fail":
+            return httpx.Response(500)
+
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return httpx.Response(200, json={"success": True, "data": {
+            "score": len(payload["actualOutput"]) / 10, "reasoning": "ok", "confidence": 1.0,
+            "cost": 0.001, "latency": 20, "model": "judge"
+        }})
+
+
+def make_client(backend, **kwargs):
+    client = AdvancedMetricsClient(base_url="http://backend", **kwargs)
+    client.session = httpx.AsyncClient(base_url="http://backend", transport=httpx.MockTransport(backend.handler))
+    client._session_loop = asyncio.get_running_loop()
+    return client
+
+
+class TestConcurrentMetrics:
+    """Test bounded concurrency and connection reuse."""
+
+    @pytest.mark.asyncio
+    async def test_items_run_concurrently_in_order(self):
+        """Items are judged in parallel up to max_concurrency, results keep item order."""
+        backend = FakeBackend()
+        client = make_client(backend)
+        metric = EnhancedRelevanceMetric(metrics_client=client, max_concurrency=3)
+
+        predictions = ["a", "bb", "ccc", "dddd", "eeeee", "ffffff"]
+        result = await metric.evaluate_async(predictions, ["q"] * 6)
+
+        assert backend.max_active == 3
+        scores = [item["score"] for item in result.details["individual_results"]]
+        assert scores == [len(p) / 10 for p in predictions]
+        # The connection pool survives the evaluation
+        assert client.session is not None
+        await metric.close()
+        assert client.session is None
+
+    @pytest.mark.asyncio
+    async def test_batch_endpoint_with_fallback(self):
+        """The batch endpoint is used when available and dropped when missing."""
+        backend = FakeBackend(batch_status=200)
+        client = make_client(backend, batch_endpoint="/api/v1/llm/evaluate/batch")
+        metric = EnhancedRelevanceMetric(metrics_client=client)
+
+        result = await metric.evaluate_async(["ab", "abcd"], ["q", "q"])
+        assert backend.batch_requests == 1
+        assert backend.max_active == 0
+        assert result.value == pytest.approx(0.3)
+
+        backend.batch_status = 404
+        result = await metric.evaluate_async(["ab", "abcd"], ["q", "q"])
+        assert backend.batch_requests == 2
+        assert client.batch_endpoint is None
+        assert result.value == pytest.approx(0.3)
+        await metric.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_items_are_not_scored(self):
+        """Failed judge calls are left out of the average and reported."""
+        backend = FakeBackend(delay=0)
+        client = make_client(backend)
+        relevance = EnhancedRelevanceMetric(metrics_client=client)
+        hallucination = EnhancedHallucinationMetric(metrics_client=client)
+
+        result = await relevance.evaluate_async(["ab", "fail", "abcd"], ["q"] * 3)
+        assert result.value == pytest.approx(0.3)
+        assert result.details["failed_items"] == [1]
+        assert result.details["successful_evaluations"] == 2
+
+        result = await hallucination.evaluate_async(["ab", "fail", "abcd"], ["q"] * 3)
+        assert result.value == pytest.approx(0.7)
+
+        result = await relevance.evaluate_async(["fail", "fail"], ["q", "q"])
+        assert result.error is not None
+        assert result.details["failed_items"] == [0, 1]
+        await relevance.close()
+
+    def test_session_of_previous_loop_is_closed(self):
+        """A new event loop closes the session opened on the previous one."""
+        client = AdvancedMetricsClient(base_url="http://backend")
+        client._client = type("Client", (), {"config": type("Config", (), {"api_key": None})()})()
+
+        first = asyncio.run(client._get_session())
+        second = asyncio.run(client._get_session())
+
+        assert second is not first
+        assert first.is_closed
+        asyncio.run(client.close())
+
+
+class StatusClient:
+    """Fake metrics client reporting a job's progress."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    async def get_evaluation_status(self, experiment_id, job_id=None):
+        self.calls += 1
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return {"success": True, "data": {"status": status, "progress": 50}}
+
+
+class TestWaitForCompletion:
+    """Test adaptive polling of backend batch jobs."""
+
+    @pytest.mark.asyncio
+    async def test_returns_when_completed(self):
+        """A short job completes after a few quick polls."""
+        evaluator = AdvancedBatchEvaluator()
+        evaluator.metrics_client = StatusClient(["running", "running", "completed"])
+
+        job = await evaluator.wait_for_completion("exp", "job", initial_poll_interval=0.01)
+
+        assert job["status"] == "completed"
+        assert evaluator.metrics_client.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_times_out(self):
+        """A job that never finishes raises TimeoutError."""
+        evaluator = AdvancedBatchEvaluator()
+        evaluator.metrics_client = StatusClient(["running"])
+
+        with pytest.raises(TimeoutError):
+            await evaluator.wait_for_completion("exp", "job", timeout_seconds=0.1, initial_poll_interval=0.01)
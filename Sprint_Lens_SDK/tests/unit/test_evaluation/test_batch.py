@@ -0,0 +1,145 @@
+"""
+Unit tests for batched metric evaluation in BatchEvaluator.
+"""
+
+import asyncio
+import time
+import pytest
+
+from sprintlens.evaluation import Evaluator, BaseMetric
+from sprintlens.evaluation.batch import BatchEvaluator
+from sprintlens.evaluation.metrics import AccuracyMetric, ExactMatchMetric
+
+
+class CountingMetric(BaseMetric):
+    """Synchronous metric counting evaluate() and evaluate_batch() calls."""
+
+    def __init__(self):
+        super().__init__(name="counting")
+        self.evaluate_calls = 0
+        self.batch_calls = 0
+
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        self.evaluate_calls += 1
+        if predictions[0] is None:
+            raise ValueError("missing prediction")
+        return self._create_result(value=float(predictions[0] == ground_truth[0]))
+
+    def evaluate_batch(self, predictions, ground_truth, **kwargs):
+        self.batch_calls += 1
+        return super().evaluate_batch(predictions, ground_truth, **kwargs)
+
+
+class SlowJudgeMetric(BaseMetric):
+    """Async per-item metric simulating an LLM judge."""
+
+    def __init__(self, delay: float):
+        super().__init__(name="judge")
+        self.delay = delay
+
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        raise NotImplementedError
+
+    async def evaluate_async(self, predictions, ground_truth, **kwargs):
+        await asyncio.sleep(self.delay)
+        return self._create_result(value=0.5)
+
+
+class StallingJudgeMetric(BaseMetric):
+    """Async per-item judge that never answers for "slow" predictions."""
+
+    def __init__(self):
+        super().__init__(name="judge")
+
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        raise NotImplementedError
+
+    async def evaluate_async(self, predictions, ground_truth, **kwargs):
+        if predictions[0] == "slow":
+            await asyncio.sleep(5.0)
+        return self._create_result(value=1.0)
+
+
+class TestBatchInterface:
+    """Test the BaseMetric batch interface."""
+
+    def test_default_falls_back_to_per_item(self):
+        """Default evaluate_batch scores items separately and isolates errors."""
+        metric = CountingMetric()
+        results = metric.evaluate_batch(["a", None, "c"], ["a", "b", "x"])
+
+        assert [r.value for r in results] == [1.0, None, 0.0]
+        assert results[1].error == "missing prediction"
+        assert metric.evaluate_calls == 3
+
+    def test_builtin_vectorized_results(self):
+        """Accuracy and exact match score each item in one pass."""
+        preds, truth = ["Yes", "no", "maybe"], ["yes", "no", "no"]
+
+        assert [r.value for r in AccuracyMetric().evaluate_batch(preds, truth)] == [0.0, 1.0, 0.0]
+        assert [
+            r.value for r in ExactMatchMetric(case_sensitive=False).evaluate_batch(preds, truth)
+        ] == [1.0, 1.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_async_items_run_concurrently(self):
+        """Items of a batch are evaluated concurrently for async metrics."""
+        metric = SlowJudgeMetric(delay=0.1)
+
+        start = time.perf_counter()
+        results = await metric.evaluate_batch_async(["p"] * 10, ["g"] * 10)
+
+        assert len(results) == 10
+        assert time.perf_counter() - start < 0.5
+
+
+class TestBatchEvaluator:
+    """Test BatchEvaluator with batched metrics."""
+
+    @pytest.mark.asyncio
+    async def test_one_metric_call_per_batch(self):
+        """Each metric receives whole batches and scores aggregate correctly."""
+        metric = CountingMetric()
+        batch_evaluator = BatchEvaluator(Evaluator([metric]), batch_size=4, keep_item_results=True)
+
+        preds = ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"]
+        truth = ["a", "b", "x", "x", "e", "f", "x", "x", "i", "j"]
+        result = await batch_evaluator.evaluate_predictions_async(preds, truth)
+
+        assert metric.batch_calls == 3
+        assert result.successful_items == 10
+        assert result.get_metric_scores("counting") == [float(p == g) for p, g in zip(preds, truth)]
+        assert result.aggregated_metrics["counting"] == pytest.approx(0.6)
+        assert len(result.results) == 10
+        assert result.results[2].metadata["item_idx"] == 2
+
+    @pytest.mark.asyncio
+    async def test_without_item_results(self):
+        """By default per-item results live only in the columns and are rebuilt on demand."""
+        batch_evaluator = BatchEvaluator(Evaluator([AccuracyMetric()]), batch_size=2)
+        result = await batch_evaluator.evaluate_predictions_async(["a", "b", "c"], ["a", "b", "x"])
+
+        assert result.results == []
+        rebuilt = result.item_results()
+        assert [item.get_metric_score("accuracy") for item in rebuilt] == [1.0, 1.0, 0.0]
+        assert rebuilt[2].metadata["item_id"] == result.columns.row_ids[2]
+        assert result.get_metric_scores("accuracy") == [1.0, 1.0, 0.0]
+        assert result.get_metric_statistics("accuracy")["count"] == 3
+        assert result.aggregated_metrics["accuracy"] == pytest.approx(2 / 3)
+
+    @pytest.mark.asyncio
+    async def test_timed_out_items_are_left_out_of_aggregates(self):
+        """Timed-out items are failures, not scores of 0, in batch and streaming aggregates."""
+        predictions = ["a", "slow", "b", "slow"]
+        batch_evaluator = BatchEvaluator(
+            Evaluator([StallingJudgeMetric()], metric_timeout=0.05), batch_size=1
+        )
+
+        result = await batch_evaluator.evaluate_predictions_async(predictions, predictions)
+        assert result.aggregated_metrics["judge"] == pytest.approx(1.0)
+        assert result.get_metric_scores("judge") == [1.0, None, 1.0, None]
+        assert "timed out" in result.item_results()[1].metrics["judge"].error
+
+        streamed = await batch_evaluator.evaluate_stream_async(zip(predictions, predictions))
+        assert streamed.aggregated_metrics["judge"] == pytest.approx(1.0)
+        assert streamed.get_metric_statistics("judge")["errors"] == 2
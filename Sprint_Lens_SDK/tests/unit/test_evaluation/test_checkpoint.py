@@ -0,0 +1,158 @@
+"""
+Unit tests for checkpointing and resuming batch evaluations.
+"""
+
+import json
+import pytest
+
+from sprintlens.evaluation import Evaluator, BaseMetric, BatchEvaluator
+from sprintlens.evaluation.advanced_metrics import EnhancedHallucinationMetric, EvaluationModel
+from sprintlens.evaluation.checkpoint import (
+    CheckpointSession, JSONCheckpointStore, SQLiteCheckpointStore, metrics_fingerprint,
+    open_checkpoint_store
+)
+from sprintlens.evaluation.metrics.llm_based import LLMJudgeConfig, RelevanceMetric
+from sprintlens.evaluation.metrics import MetricResult
+
+
+class PaidJudgeMetric(BaseMetric):
+    """Synchronous metric counting scored items, optionally failing some."""
+
+    def __init__(self, fail_on=(), threshold: float = 0.5):
+        super().__init__(name="judge", threshold=threshold)
+        self.fail_on = set(fail_on)
+        self.scored = []
+
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        prediction = predictions[0]
+        self.scored.append(prediction)
+        if prediction in self.fail_on:
+            raise RuntimeError("rate limited")
+        return self._create_result(value=float(prediction == ground_truth[0]))
+
+
+class SwitchableJudgeMetric(PaidJudgeMetric):
+    """Metric whose judge model lives outside get_config()."""
+
+    def __init__(self, judge_model):
+        super().__init__()
+        self.judge_model = judge_model
+
+    def fingerprint_extra(self):
+        return {"judge": self.judge_model}
+
+
+PREDICTIONS = ["a", "b", "c", "d", "e", "f", "g"]
+GROUND_TRUTH = ["a", "x", "c", "x", "e", "x", "g"]
+
+
+def run(metric, checkpoint, resume=False):
+    batch_evaluator = BatchEvaluator(
+        Evaluator([metric]), batch_size=3, checkpoint=checkpoint, checkpoint_interval=0
+    )
+    return batch_evaluator.evaluate_predictions(PREDICTIONS, GROUND_TRUTH, resume=resume)
+
+
+class TestCheckpointResume:
+    """Test checkpoint persistence and resume."""
+
+    @pytest.mark.parametrize("filename", ["progress.json", "progress.db"])
+    def test_resume_skips_scored_items(self, tmp_path, filename):
+        """A resumed run reuses stored scores and only retries failed items."""
+        path = tmp_path / filename
+        first = run(PaidJudgeMetric(fail_on={"b", "e"}), path)
+        assert first.item_results()[1].metrics["judge"].error == "rate limited"
+
+        metric = PaidJudgeMetric()
+        second = run(metric, path, resume=True)
+
+        assert sorted(metric.scored) == ["b", "e"]
+        assert second.metadata["resumed_items"] == 5
+        assert second.get_metric_scores("judge") == [1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0]
+        assert second.item_results()[0].metrics["judge"].details == {"resumed": True}
+
+    def test_without_resume_starts_over(self, tmp_path):
+        """An existing checkpoint is discarded unless resume is requested."""
+        path = tmp_path / "progress.json"
+        run(PaidJudgeMetric(), path)
+
+        metric = PaidJudgeMetric()
+        run(metric, path)
+        assert len(metric.scored) == len(PREDICTIONS)
+
+    def test_metric_configuration_change_invalidates(self, tmp_path):
+        """Stored scores are not reused for a different metric configuration."""
+        path = tmp_path / "progress.json"
+        run(PaidJudgeMetric(), path)
+
+        metric = PaidJudgeMetric(threshold=0.9)
+        run(metric, path, resume=True)
+        assert len(metric.scored) == len(PREDICTIONS)
+
+    def test_judge_change_invalidates(self, tmp_path):
+        """Stored scores are not reused once the judge model changes."""
+        path = tmp_path / "progress.json"
+        run(SwitchableJudgeMetric("gpt-4o-mini"), path)
+
+        metric = SwitchableJudgeMetric("gpt-4o")
+        run(metric, path, resume=True)
+        assert len(metric.scored) == len(PREDICTIONS)
+
+        metric = SwitchableJudgeMetric("gpt-4o")
+        run(metric, path, resume=True)
+        assert metric.scored == []
+
+    def test_fingerprint_includes_judge_model(self):
+        """LLM metrics with the same config but different judges fingerprint differently."""
+        def hallucination(name):
+            return metrics_fingerprint([EnhancedHallucinationMetric(model=EvaluationModel(name=name))])
+
+        def relevance(name):
+            return metrics_fingerprint([RelevanceMetric(config=LLMJudgeConfig(model=name))])
+
+        assert hallucination("gpt-4o-mini") != hallucination("gpt-4o")
+        assert hallucination("gpt-4o") == hallucination("gpt-4o")
+        assert relevance("gpt-4o-mini") != relevance("gpt-4o")
+
+    def test_checkpoint_contents(self, tmp_path):
+        """Checkpoints record completed batches and partial aggregates."""
+        path = tmp_path / "progress.json"
+        run(PaidJudgeMetric(), path)
+
+        state = JSONCheckpointStore(path).load()
+        assert sorted(state.completed_batches) == [0, 1, 2]
+        assert state.aggregates["judge"] == {"sum": 4.0, "count": 7}
+        assert len(state.item_scores) == 7
+        assert sorted(tmp_path.iterdir()) == [path, tmp_path / "progress.json.journal"]
+
+    def test_saves_append_to_a_journal(self, tmp_path):
+        """Saves after the first append new items only; a torn last entry is ignored."""
+        path = tmp_path / "progress.json"
+        run(PaidJudgeMetric(), path)
+
+        snapshot = json.loads(path.read_text())
+        assert len(snapshot["item_scores"]) == 3
+        journal = (tmp_path / "progress.json.journal").read_text().splitlines()
+        assert [len(json.loads(line)["item_scores"]) for line in journal] == [3, 1]
+
+        with open(tmp_path / "progress.json.journal", "a") as f:
+            f.write('{"item_scores": {"trunc')
+        assert len(JSONCheckpointStore(path).load().item_scores) == 7
+
+    def test_rerecorded_items_are_counted_once(self, tmp_path):
+        """Recording an item or batch again replaces it instead of adding to the aggregates."""
+        metric = PaidJudgeMetric()
+        session = CheckpointSession(JSONCheckpointStore(tmp_path / "progress.json"), [metric], interval=3600)
+        failed = MetricResult(name="judge", value=None, error="rate limited")
+        session.record(0, ["k1", "k2"], {"judge": [MetricResult(name="judge", value=1.0), failed]})
+        session.record(0, ["k1", "k2"], {"judge": [MetricResult(name="judge", value=0.5)] * 2})
+
+        assert session.state.aggregates["judge"] == {"sum": 1.0, "count": 2}
+        assert session.state.completed_batches == [0]
+        assert session.state.item_scores["k1"] == {"judge": [0.5, None]}
+
+    def test_store_selection(self, tmp_path):
+        """SQLite is used for database suffixes."""
+        store = open_checkpoint_store(tmp_path / "run.sqlite")
+        assert isinstance(store, SQLiteCheckpointStore)
+        store.close()
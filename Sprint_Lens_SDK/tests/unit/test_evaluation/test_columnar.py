@@ -0,0 +1,122 @@
+"""
+Unit tests for columnar evaluation results.
+"""
+
+import math
+import pytest
+
+from sprintlens.evaluation import Evaluator, BatchEvaluator, ColumnarResults, MetricResult
+from sprintlens.evaluation.columnar import PYARROW_AVAILABLE, PANDAS_AVAILABLE
+from sprintlens.evaluation.metrics import ExactMatchMetric
+
+
+def make_columns():
+    columns = ColumnarResults()
+    columns.append_batch(
+        {
+            "accuracy": [
+                MetricResult(name="accuracy", value=1.0),
+                MetricResult(name="accuracy", value=None, error="timeout"),
+                MetricResult(name="accuracy", value=0.0, details={"reason": "mismatch"}),
+            ]
+        },
+        ["r1", "r2", "r3"]
+    )
+    columns.append_scores({"accuracy": [0.5], "f1": [0.25]}, ["r4"])
+    return columns
+
+
+class TestColumnarResults:
+    """Test storage and aggregates."""
+
+    def test_append_and_backfill(self):
+        """Rows are stored per metric; late metrics are back-filled as missing."""
+        columns = make_columns()
+
+        assert len(columns) == 4
+        assert columns.metric_names == ["accuracy", "f1"]
+        assert columns.scores("accuracy") == [1.0, None, 0.0, 0.5]
+        assert columns.scores("f1") == [None, None, None, 0.25]
+        assert columns.row_ids == ["r1", "r2", "r3", "r4"]
+        assert columns.column("accuracy").typecode == "d"
+
+    def test_sparse_errors_and_details(self):
+        """Only rows with errors or details store them."""
+        columns = make_columns()
+
+        assert columns.errors("accuracy") == {1: "timeout"}
+        assert columns.details("accuracy", 2) == {"reason": "mismatch"}
+        assert columns.details("accuracy", 0) == {}
+        assert columns.get_result("accuracy", 1).error == "timeout"
+        assert columns.get_result("accuracy", 1).value is None
+
+    def test_aggregates_skip_missing(self):
+        """Aggregates run on the stored scores, ignoring missing values."""
+        columns = make_columns()
+        stats = columns.aggregate("accuracy")
+
+        assert stats["count"] == 3
+        assert stats["mean"] == pytest.approx(0.5)
+        assert stats["min"] == 0.0 and stats["max"] == 1.0
+        assert stats["std"] == pytest.approx(0.5)
+        assert columns.quantile("accuracy", 0.5) == pytest.approx(0.5)
+        assert columns.mean("f1") == pytest.approx(0.25)
+        assert math.isnan(columns.column("f1")[0])
+
+    def test_batch_evaluator_builds_columns(self):
+        """BatchEvaluator collects scores into columns keyed by item id."""
+        batch_evaluator = BatchEvaluator(
+            Evaluator([ExactMatchMetric()]), batch_size=2, keep_item_results=False
+        )
+        result = batch_evaluator.evaluate_predictions(["a", "b", "c"], ["a", "x", "c"])
+
+        assert result.columns is not None
+        assert result.get_metric_scores("exact_match") == [1.0, 0.0, 1.0]
+        assert result.get_metric_statistics("exact_match")["mean"] == pytest.approx(2 / 3)
+        assert result.to_columnar() is result.columns
+        assert all(row_id is not None for row_id in result.columns.row_ids)
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+class TestArrowConversion:
+    """Test Arrow and Parquet round trips."""
+
+    def test_arrow_round_trip(self):
+        """Nulls, errors and details survive conversion to Arrow and back."""
+        table = make_columns().to_arrow()
+
+        assert table.column_names == ["row_id", "accuracy", "accuracy__error", "accuracy__details", "f1"]
+        assert table.column("accuracy").null_count == 1
+
+        restored = ColumnarResults.from_arrow(table)
+        assert restored.scores("accuracy") == [1.0, None, 0.0, 0.5]
+        assert restored.errors("accuracy") == {1: "timeout"}
+        assert restored.details("accuracy", 2) == {"reason": "mismatch"}
+
+    def test_appending_after_export_keeps_table_valid(self):
+        """Score buffers are shared with the table until the next append."""
+        columns = make_columns()
+        table = columns.to_arrow()
+        columns.append_scores({"accuracy": [1.0], "f1": [1.0]})
+
+        assert table.num_rows == 4
+        assert table.column("accuracy").to_pylist() == [1.0, None, 0.0, 0.5]
+        assert len(columns) == 5
+
+    def test_parquet_round_trip(self, tmp_path):
+        """write_parquet() and read_parquet() preserve the container."""
+        path = tmp_path / "results.parquet"
+        make_columns().write_parquet(path)
+        restored = ColumnarResults.read_parquet(path)
+
+        assert restored.row_ids == ["r1", "r2", "r3", "r4"]
+        assert restored.scores("f1") == [None, None, None, 0.25]
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    def test_to_pandas(self):
+        """DataFrames have float columns with NaN for missing scores."""
+        frame = make_columns().to_pandas()
+
+        assert list(frame["row_id"]) == ["r1", "r2", "r3", "r4"]
+        assert frame["accuracy"].isna().sum() == 1
+        assert frame["accuracy"].mean() == pytest.approx(0.5)
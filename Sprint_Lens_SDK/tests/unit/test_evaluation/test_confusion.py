@@ -0,0 +1,151 @@
+"""
+Unit tests for the confusion-matrix classification engine.
+"""
+
+import random
+import pytest
+
+from sprintlens.evaluation import (
+    Evaluator,
+    PrecisionMetric,
+    RecallMetric,
+    F1Metric,
+    ClassificationReportMetric,
+)
+from sprintlens.evaluation.metrics import confusion
+from sprintlens.evaluation.metrics.confusion import ConfusionMatrix
+
+
+def brute_force(predictions, ground_truth, average):
+    """Reference precision/recall/F1 computed by rescanning per class."""
+    classes = sorted(set(ground_truth) | set(predictions))
+    rows = {}
+    for cls in classes:
+        tp = sum(1 for p, g in zip(predictions, ground_truth) if p == cls and g == cls)
+        predicted = sum(1 for p in predictions if p == cls)
+        support = sum(1 for g in ground_truth if g == cls)
+        precision = tp / predicted if predicted else 0.0
+        recall = tp / support if support else 0.0
+        f1 = (
+            2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        )
+        rows[cls] = (precision, recall, f1, support)
+    if average == "micro":
+        accuracy = sum(p == g for p, g in zip(predictions, ground_truth)) / len(
+            predictions
+        )
+        return accuracy, accuracy, accuracy
+    if average == "macro":
+        return tuple(sum(row[i] for row in rows.values()) / len(rows) for i in range(3))
+    return tuple(
+        sum(row[i] * row[3] for row in rows.values()) / len(ground_truth)
+        for i in range(3)
+    )
+
+
+class TestConfusionMatrix:
+    """Test matrix construction and derived scores."""
+
+    def test_counts_and_report(self):
+        """Counts are laid out truth x prediction in sorted label order."""
+        matrix = ConfusionMatrix.from_labels(["a", "b", "b", "a"], ["a", "b", "a", "a"])
+
+        assert matrix.labels == ["a", "b"]
+        assert matrix.to_list() == [[2, 1], [0, 1]]
+        assert matrix.accuracy == pytest.approx(0.75)
+        report = matrix.report()
+        assert report["precision_macro"] == pytest.approx((1.0 + 0.5) / 2)
+        assert report["recall_weighted"] == pytest.approx(0.75)
+        assert report["per_class"]["b"]["f1"] == pytest.approx(2 / 3)
+
+    @pytest.mark.parametrize("average", ["micro", "macro", "weighted"])
+    def test_matches_brute_force(self, average):
+        """Averaged scores agree with a per-class rescan."""
+        rng = random.Random(7)
+        ground_truth = [rng.choice("abcdef") for _ in range(500)]
+        predictions = [
+            g if rng.random() < 0.6 else rng.choice("abcdefg") for g in ground_truth
+        ]
+
+        matrix = ConfusionMatrix.from_labels(predictions, ground_truth)
+        expected = brute_force(predictions, ground_truth, average)
+
+        assert matrix.precision(average) == pytest.approx(expected[0])
+        assert matrix.recall(average) == pytest.approx(expected[1])
+        assert matrix.f1(average) == pytest.approx(expected[2])
+
+    def test_explicit_labels_must_cover_the_data(self, monkeypatch):
+        """Values outside an explicit label list are rejected in both code paths."""
+        with pytest.raises(ValueError, match="'c'"):
+            ConfusionMatrix.from_labels(["a", "c"], ["a", "b"], labels=["a", "b"])
+        monkeypatch.setattr(confusion, "NUMPY_AVAILABLE", False)
+        with pytest.raises(ValueError, match="'c'"):
+            ConfusionMatrix.from_labels(["a", "c"], ["a", "b"], labels=["a", "b"])
+
+    def test_numpy_arrays_with_explicit_labels(self):
+        """The vectorized path counts arrays and validates their labels."""
+        np = pytest.importorskip("numpy")
+        matrix = ConfusionMatrix.from_labels(
+            np.array([2, 1, 1]), np.array([2, 2, 1]), labels=[1, 2, 3]
+        )
+
+        assert matrix.to_list() == [[1, 0, 0], [1, 1, 0], [0, 0, 0]]
+        with pytest.raises(ValueError, match="4"):
+            ConfusionMatrix.from_labels(
+                np.array([4, 1]), np.array([1, 1]), labels=[1, 2]
+            )
+
+    def test_metric_base_is_abstract(self):
+        """Subclasses must implement _compute."""
+        from sprintlens.evaluation.metrics.builtin import _ConfusionMatrixMetric
+
+        with pytest.raises(TypeError):
+            _ConfusionMatrixMetric(name="incomplete")
+
+
+class TestClassificationMetrics:
+    """Test metrics built on the engine."""
+
+    def test_metric_values_and_details(self):
+        """Precision and recall keep their result shape."""
+        predictions, ground_truth = ["a", "b", "b", "a"], ["a", "b", "a", "a"]
+
+        precision = PrecisionMetric(average="macro").evaluate(predictions, ground_truth)
+        recall = RecallMetric(average="macro").evaluate(predictions, ground_truth)
+
+        assert precision.value == pytest.approx(0.75)
+        assert precision.details["class_precisions"] == {"a": 1.0, "b": 0.5}
+        assert recall.value == pytest.approx((2 / 3 + 1.0) / 2)
+        assert recall.details["classes"] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_metrics_share_one_matrix(self, monkeypatch):
+        """An Evaluator builds a single matrix for all classification metrics."""
+        builds = []
+        original = ConfusionMatrix.from_labels.__func__
+
+        def counting_from_labels(cls, *args, **kwargs):
+            builds.append(1)
+            return original(cls, *args, **kwargs)
+
+        monkeypatch.setattr(
+            confusion.ConfusionMatrix, "from_labels", classmethod(counting_from_labels)
+        )
+        evaluator = Evaluator(
+            [
+                PrecisionMetric(),
+                RecallMetric(),
+                F1Metric(),
+                ClassificationReportMetric(),
+            ]
+        )
+
+        result = await evaluator.evaluate_async(
+            ["x", "y", "y", "z"], ["x", "y", "z", "z"]
+        )
+
+        assert len(builds) == 1
+        assert result.get_metric_score("f1") == pytest.approx(
+            result.get_metric_details("classification_report")["f1_weighted"]
+        )
+        evaluator.close()
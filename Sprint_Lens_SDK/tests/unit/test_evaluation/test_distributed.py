@@ -0,0 +1,277 @@
+"""
+Unit tests for distributed evaluation through a work queue.
+"""
+
+import asyncio
+import os
+import threading
+import time
+import pytest
+
+from sprintlens.evaluation import (
+    Evaluator, BaseMetric, BatchEvaluator, EvaluationDataset, EvaluationCoordinator,
+    EvaluationWorker, SQLiteWorkQueue, WorkQueue, open_work_queue
+)
+from sprintlens.evaluation.distributed import REDIS_AVAILABLE, RedisWorkQueue
+
+_slow_calls = []
+_slow_lock = threading.Lock()
+
+
+class PidMetric(BaseMetric):
+    """Exact match that records the scoring process."""
+
+    def __init__(self, name="pid_match", **kwargs):
+        super().__init__(name=name, **kwargs)
+
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        if predictions[0] == "slow":
+            with _slow_lock:
+                _slow_calls.append(threading.get_ident())
+                first = len(_slow_calls) == 1
+            if first:
+                time.sleep(2.0)
+        return self._create_result(value=float(predictions[0] == ground_truth[0]), details={"pid": os.getpid()})
+
+
+class StallingMetric(BaseMetric):
+    """Async judge that never answers for "slow" predictions."""
+
+    def __init__(self, name="stalling", **kwargs):
+        super().__init__(name=name, **kwargs)
+
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        raise NotImplementedError
+
+    async def evaluate_async(self, predictions, ground_truth, **kwargs):
+        if predictions[0] == "slow":
+            await asyncio.sleep(5.0)
+        return self._create_result(value=1.0)
+
+
+def make_dataset(predictions, ground_truths):
+    dataset = EvaluationDataset("distributed")
+    for prediction, ground_truth in zip(predictions, ground_truths):
+        dataset.add_item(prediction=prediction, ground_truth=ground_truth)
+    return dataset
+
+
+def start_workers(path, count):
+    workers = [
+        threading.Thread(target=EvaluationWorker(path, poll_interval=0.02).run, kwargs={"idle_timeout": 1.5})
+        for _ in range(count)
+    ]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+class TestSQLiteWorkQueue:
+    """Test leases, retries and speculation."""
+
+    def test_leases_are_exclusive(self, tmp_path):
+        """Each task is leased once until it completes or its lease expires."""
+        queue = SQLiteWorkQueue(tmp_path / "queue.db")
+        queue.create_job("job", b"spec", [b"t0", b"t1"])
+
+        first = queue.lease("w1", 60, "job")
+        second = queue.lease("w2", 60, "job")
+        assert (first.task_id, second.task_id) == (0, 1)
+        assert queue.lease("w3", 60, "job") is None
+
+        assert queue.complete(first, b"r0")
+        assert queue.progress("job").done == 1
+        results, cursor = queue.results_since("job", 0)
+        assert results == [(0, b"r0")]
+        assert queue.results_since("job", cursor) == ([], cursor)
+
+    def test_expired_and_failed_leases_are_retried(self, tmp_path):
+        """Expired or failed attempts return to the queue until attempts run out."""
+        queue = SQLiteWorkQueue(tmp_path / "queue.db")
+        queue.create_job("job", b"spec", [b"t0"], max_attempts=2)
+
+        expired = queue.lease("w1", 0.01, "job")
+        time.sleep(0.05)
+        retried = queue.lease("w2", 60, "job")
+        assert retried.task_id == 0 and retried.attempt == 2
+
+        # Late heartbeats and failure reports from the expired lease are ignored
+        assert not queue.heartbeat(expired, 60)
+        assert queue.heartbeat(retried, 60)
+        queue.fail(expired, "late")
+        assert queue.progress("job").leased == 1
+
+        queue.fail(retried, "scorer crashed")
+        assert queue.lease("w3", 60, "job") is None
+        assert queue.failed_tasks("job") == {0: "scorer crashed"}
+        assert queue.progress("job").finished
+
+    def test_speculative_copy_first_completion_wins(self, tmp_path):
+        """A speculated task is leased by a second worker; one completion is kept."""
+        queue = SQLiteWorkQueue(tmp_path / "queue.db")
+        queue.create_job("job", b"spec", [b"t0"])
+
+        original = queue.lease("w1", 60, "job")
+        assert queue.speculate("job", 0)
+        assert not queue.speculate("job", 0)
+        copy = queue.lease("w2", 60, "job")
+        assert copy.speculative and copy.task_id == 0
+        assert queue.lease("w3", 60, "job") is None
+
+        assert queue.complete(copy, b"fast")
+        assert not queue.complete(original, b"slow")
+        assert queue.results_since("job", 0)[0] == [(0, b"fast")]
+
+    def test_closed_jobs_are_not_leased(self, tmp_path):
+        """Closing a job stops handing out its tasks."""
+        queue = open_work_queue(f"sqlite:///{tmp_path / 'queue.db'}")
+        queue.create_job("job", b"spec", [b"t0"])
+        assert queue.open_jobs() == ["job"]
+
+        queue.close_job("job")
+        assert queue.get_job_spec("job") is None
+        assert queue.lease("w1", 60) is None
+
+    def test_prefixes_separate_queues(self, tmp_path):
+        """Queues with different prefixes share a file but not their jobs."""
+        path = tmp_path / "queue.db"
+        team_a = SQLiteWorkQueue(path, prefix="team_a_")
+        team_a.create_job("job", b"spec", [b"t0"])
+
+        assert SQLiteWorkQueue(path).open_jobs() == []
+        reopened = WorkQueue.from_spec(team_a.spec())
+        assert reopened.prefix == "team_a_"
+        assert reopened.open_jobs() == ["job"]
+        with pytest.raises(ValueError):
+            SQLiteWorkQueue(path, prefix="bad; DROP")
+
+    @pytest.mark.skipif(not REDIS_AVAILABLE, reason="redis not installed")
+    def test_redis_spec_keeps_prefix(self):
+        """A Redis queue reopened from its spec uses the same key prefix."""
+        queue = RedisWorkQueue("redis://localhost:6379/3", prefix="team_a")
+        reopened = open_work_queue(queue.spec())
+
+        assert isinstance(reopened, RedisWorkQueue)
+        assert (reopened.url, reopened.prefix) == ("redis://localhost:6379/3", "team_a")
+
+
+class TestEvaluationCoordinator:
+    """Test distributed dataset evaluation."""
+
+    def test_worker_threads_merge_results(self, tmp_path):
+        """Results from several workers are merged in dataset order."""
+        path = tmp_path / "queue.db"
+        batch_evaluator = BatchEvaluator(Evaluator([PidMetric()]), batch_size=2)
+        coordinator = EvaluationCoordinator(batch_evaluator, path, poll_interval=0.02)
+        workers = start_workers(path, 2)
+
+        result = coordinator.evaluate_dataset(make_dataset(list("abcde"), list("axcxe")), timeout=30)
+        for worker in workers:
+            worker.join()
+
+        assert result.get_metric_scores("pid_match") == [1.0, 0.0, 1.0, 0.0, 1.0]
+        assert result.aggregated_metrics["pid_match"] == pytest.approx(0.6)
+        assert result.successful_items == 5
+        assert len(result.item_results()) == 5
+        assert result.metadata["distributed"]["tasks"] == 3
+        # Finished jobs are removed from the queue
+        assert SQLiteWorkQueue(path).progress(result.batch_id).total == 0
+
+    def test_item_results_match_local_evaluation(self, tmp_path):
+        """Distributed item results carry the same batch and item indices as local ones."""
+        path = tmp_path / "queue.db"
+        dataset = make_dataset(list("abcde"), list("axcxe"))
+        batch_evaluator = BatchEvaluator(Evaluator([PidMetric()]), batch_size=2, keep_item_results=True)
+        local = batch_evaluator.evaluate_dataset(dataset)
+        coordinator = EvaluationCoordinator(batch_evaluator, path, poll_interval=0.02)
+        workers = start_workers(path, 2)
+
+        result = coordinator.evaluate_dataset(dataset, timeout=30)
+        for worker in workers:
+            worker.join()
+
+        def layout(batch_result):
+            return [
+                ({key: item.metadata[key] for key in ("batch_idx", "item_idx", "item_ids")}, item.overall_score)
+                for item in batch_result.item_results()
+            ]
+
+        assert layout(result) == layout(local)
+        assert [item.metadata["batch_idx"] for item in result.item_results()] == [0, 0, 1, 1, 2]
+
+    def test_failing_task_is_retried_then_reported(self, tmp_path):
+        """A task failing on every attempt counts its items as failed."""
+        path = tmp_path / "queue.db"
+        batch_evaluator = BatchEvaluator(Evaluator([PidMetric()]), batch_size=2)
+        coordinator = EvaluationCoordinator(batch_evaluator, path, max_attempts=2, poll_interval=0.02)
+        workers = start_workers(path, 1)
+
+        # Batch-level errors are isolated per item, so break the task payload instead
+        original = coordinator.queue.create_job
+
+        def create_job(job_id, spec, tasks, max_attempts=3):
+            original(job_id, spec, [tasks[0], b"corrupt"], max_attempts)
+
+        coordinator.queue.create_job = create_job
+        result = coordinator.evaluate_dataset(make_dataset(list("abcd"), list("abcd")), timeout=30)
+        for worker in workers:
+            worker.join()
+
+        assert result.successful_items == 2
+        assert result.failed_items == 2
+        assert result.metadata["distributed"]["failed_tasks"] == 1
+
+    def test_straggler_is_speculatively_re_executed(self, tmp_path):
+        """A task running far longer than the others is handed to an idle worker."""
+        _slow_calls.clear()
+        path = tmp_path / "queue.db"
+        batch_evaluator = BatchEvaluator(Evaluator([PidMetric()]), batch_size=1)
+        coordinator = EvaluationCoordinator(
+            batch_evaluator, path, speculative_factor=2.0, min_speculative_seconds=0.2, poll_interval=0.02
+        )
+        workers = start_workers(path, 2)
+
+        result = coordinator.evaluate_dataset(make_dataset(["slow", "a", "b"], ["slow", "a", "x"]), timeout=30)
+        for worker in workers:
+            worker.join()
+
+        assert result.get_metric_scores("pid_match") == [1.0, 1.0, 0.0]
+        assert result.metadata["distributed"]["speculative_tasks"] == 1
+        assert len(_slow_calls) == 2
+
+    def test_local_worker_processes(self, tmp_path):
+        """Spawned local worker processes score the dataset."""
+        batch_evaluator = BatchEvaluator(Evaluator([PidMetric()]), batch_size=2)
+        coordinator = EvaluationCoordinator(batch_evaluator, tmp_path / "queue.db", poll_interval=0.05)
+
+        result = coordinator.evaluate_dataset(
+            make_dataset(list("abcdef"), list("abcxef")), local_workers=2, timeout=120
+        )
+
+        assert result.get_metric_scores("pid_match") == [1.0, 1.0, 1.0, 0.0, 1.0, 1.0]
+        assert result.item_results()[0].metrics["pid_match"].details["pid"] != os.getpid()
+        assert result.metadata["distributed"]["workers"] >= 1
+
+    def test_local_workers_use_the_queue_prefix(self, tmp_path):
+        """Spawned workers reopen the queue with its non-default prefix."""
+        batch_evaluator = BatchEvaluator(Evaluator([PidMetric()]), batch_size=2)
+        queue = SQLiteWorkQueue(tmp_path / "queue.db", prefix="nightly_")
+        coordinator = EvaluationCoordinator(batch_evaluator, queue, poll_interval=0.05)
+
+        result = coordinator.evaluate_dataset(make_dataset(list("abcd"), list("abcx")), local_workers=1, timeout=120)
+
+        assert result.get_metric_scores("pid_match") == [1.0, 1.0, 1.0, 0.0]
+
+    def test_timed_out_items_are_left_out_of_aggregates(self, tmp_path):
+        """Partial aggregates from workers skip items whose metric timed out."""
+        path = tmp_path / "queue.db"
+        batch_evaluator = BatchEvaluator(Evaluator([StallingMetric()], metric_timeout=0.05), batch_size=1)
+        coordinator = EvaluationCoordinator(batch_evaluator, path, poll_interval=0.02)
+        workers = start_workers(path, 1)
+
+        result = coordinator.evaluate_dataset(make_dataset(["a", "slow", "b", "slow"], list("wxyz")), timeout=30)
+        for worker in workers:
+            worker.join()
+
+        assert result.aggregated_metrics["stalling"] == pytest.approx(1.0)
+        assert result.get_metric_scores("stalling") == [1.0, None, 1.0, None]
@@ -0,0 +1,123 @@
+"""
+Unit tests for local embeddings and embedding-based metrics.
+"""
+
+import pytest
+
+from sprintlens.evaluation import (
+    HashingEncoder, EmbeddingCache, SemanticSimilarityMetric, BertScoreMetric, embed_texts
+)
+from sprintlens.evaluation.embeddings import (
+    DEFAULT_SENTENCE_MODEL, embed_tokens, greedy_match, paired_cosine_similarity
+)
+
+
+class CountingEncoder(HashingEncoder):
+    """Hashing encoder that records every text it encodes."""
+
+    def __init__(self):
+        super().__init__(dimension=256)
+        self.encoded = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        return super().encode(texts)
+
+    def encode_tokens(self, texts):
+        self.encoded.extend(texts)
+        return super().encode_tokens(texts)
+
+
+class TestHashingEncoder:
+    """Test the download-free encoder."""
+
+    def test_vectors_are_normalized_and_stable(self):
+        """Identical texts map to identical unit vectors; related words score higher."""
+        encoder = HashingEncoder()
+        same = encoder.encode(["evaluation", "evaluation", "evaluating"])
+        related = paired_cosine_similarity([same[0]], [same[2]])[0]
+        unrelated = paired_cosine_similarity(encoder.encode(["evaluation"]), encoder.encode(["zebra"]))[0]
+
+        assert paired_cosine_similarity([same[0]], [same[1]])[0] == pytest.approx(1.0, abs=1e-6)
+        assert related > unrelated
+
+    def test_idf_changes_cache_identity(self):
+        """Fitting IDF weights gives the encoder a new cache namespace."""
+        encoder = HashingEncoder()
+        before = encoder.name
+        encoder.fit_idf(["the cat", "the dog"])
+
+        assert encoder.name != before
+
+    def test_greedy_match(self):
+        """Identical token sets match perfectly; empty inputs score zero."""
+        encoder = HashingEncoder()
+        tokens = encoder.encode_tokens(["the cat sat", "sat the cat"])
+
+        assert greedy_match(tokens[0], tokens[1])[2] == pytest.approx(1.0, abs=1e-6)
+        assert greedy_match(encoder.encode_tokens([""])[0], tokens[0]) == (0.0, 0.0, 0.0)
+
+
+class TestEmbeddingCache:
+    """Test that cached texts are never re-encoded."""
+
+    def test_duplicates_and_repeats_are_encoded_once(self, tmp_path):
+        """Duplicates in a batch and repeated runs reuse stored embeddings."""
+        encoder = CountingEncoder()
+        cache = EmbeddingCache(tmp_path / "embeddings.db")
+
+        embed_texts(["a", "b", "a"], encoder, cache)
+        embed_texts(["a", "b", "c"], encoder, cache)
+
+        assert encoder.encoded == ["a", "b", "c"]
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """A new cache over the same file serves token matrices from disk."""
+        path = tmp_path / "embeddings.db"
+        encoder = CountingEncoder()
+        metric = BertScoreMetric(encoder=encoder, cache=EmbeddingCache(path))
+        first = metric.evaluate(["the cat sat"], ["a cat sat down"])
+
+        reopened = EmbeddingCache(path)
+        second = BertScoreMetric(encoder=encoder, cache=reopened).evaluate(["the cat sat"], ["a cat sat down"])
+
+        assert encoder.encoded == ["the cat sat", "a cat sat down"]
+        assert reopened.stats.disk_hits == 2
+        assert second.value == pytest.approx(first.value, abs=1e-6)
+
+    def test_empty_token_matrix_round_trips(self, tmp_path):
+        """A text without tokens comes back from disk as a matrix with no rows."""
+        path = tmp_path / "embeddings.db"
+        encoder = CountingEncoder()
+        embed_tokens(["", "the cat"], encoder, EmbeddingCache(path))
+
+        reopened = EmbeddingCache(path)
+        empty, tokens = embed_tokens(["", "the cat"], encoder, reopened)
+
+        assert reopened.stats.disk_hits == 2
+        assert len(empty) == 0
+        assert len(tokens) == 2
+        assert greedy_match(empty, tokens) == (0.0, 0.0, 0.0)
+
+
+class TestEmbeddingMetrics:
+    """Test semantic similarity metrics."""
+
+    def test_semantic_similarity(self):
+        """Identical texts score 1.0 and rank above unrelated ones."""
+        metric = SemanticSimilarityMetric(encoder=HashingEncoder(), cache=EmbeddingCache())
+        result = metric.evaluate(["the weather is sunny", "stock prices fell"], ["the weather is sunny", "a cat sat"])
+
+        assert result.details["similarities"][0] == pytest.approx(1.0, abs=1e-6)
+        assert result.details["similarities"][1] < 0.5
+        assert result.details["encoder"].startswith("hashing:")
+
+    def test_bertscore_reports_precision_recall(self):
+        result = BertScoreMetric(encoder=HashingEncoder(), cache=EmbeddingCache()).evaluate(
+            ["the cat"], ["the cat sat on the mat"]
+        )
+
+        assert result.error is None
+        assert result.details["precision"] > result.details["recall"]
+        # The default model is the sentence-transformers model the encoder loads
+        assert result.details["model"] == DEFAULT_SENTENCE_MODEL
@@ -0,0 +1,109 @@
+"""
+Unit tests for concurrent metric execution in Evaluator.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+
+from sprintlens.evaluation import Evaluator, BaseMetric
+
+
+class SleepyMetric(BaseMetric):
+    """Async metric that waits before scoring."""
+    
+    running = 0
+    peak = 0
+    
+    def __init__(self, name: str, delay: float, value: float = 1.0, fail: bool = False):
+        super().__init__(name=name)
+        self.delay = delay
+        self.value = value
+        self.fail = fail
+    
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        raise NotImplementedError
+    
+    async def evaluate_async(self, predictions, ground_truth, **kwargs):
+        SleepyMetric.running += 1
+        SleepyMetric.peak = max(SleepyMetric.peak, SleepyMetric.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("judge unavailable")
+            return self._create_result(value=self.value)
+        finally:
+            SleepyMetric.running -= 1
+
+
+class ThreadMetric(BaseMetric):
+    """Synchronous metric recording the thread it ran on."""
+    
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        self.thread_name = threading.current_thread().name
+        return self._create_result(value=0.5)
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    """Reset the shared concurrency counters."""
+    SleepyMetric.running = 0
+    SleepyMetric.peak = 0
+
+
+class TestConcurrentEvaluation:
+    """Test concurrency, timeouts and error isolation."""
+    
+    @pytest.mark.asyncio
+    async def test_metrics_run_concurrently(self):
+        """Wall time is the slowest metric, not the sum."""
+        evaluator = Evaluator([SleepyMetric(f"m{i}", 0.1) for i in range(5)])
+        
+        started = time.perf_counter()
+        result = await evaluator.evaluate_async([1], [1])
+        elapsed = time.perf_counter() - started
+        
+        assert elapsed < 0.3
+        assert SleepyMetric.peak == 5
+        assert result.overall_score == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """No more than max_concurrency metrics run at once."""
+        evaluator = Evaluator([SleepyMetric(f"m{i}", 0.02) for i in range(6)], max_concurrency=2)
+        
+        await evaluator.evaluate_async([1], [1])
+        
+        assert SleepyMetric.peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_timeout_and_failure_are_isolated(self):
+        """A slow or failing metric does not sink the others."""
+        evaluator = Evaluator(
+            [
+                SleepyMetric("ok", 0.0, value=0.8),
+                SleepyMetric("slow", 5.0),
+                SleepyMetric("broken", 0.0, fail=True),
+            ],
+            metric_timeout={"slow": 0.05},
+        )
+        
+        result = await evaluator.evaluate_async([1], [1])
+        
+        assert result.get_metric_score("ok") == 0.8
+        assert "timed out" in result.metrics["slow"].error
+        assert result.metrics["broken"].error == "judge unavailable"
+        assert result.overall_score == 0.8
+    
+    @pytest.mark.asyncio
+    async def test_sync_metrics_use_dedicated_pool(self):
+        """Synchronous metrics run on the evaluator's own thread pool."""
+        metric = ThreadMetric(name="sync")
+        evaluator = Evaluator([metric], max_workers=2)
+        
+        result = await evaluator.evaluate_async([1], [1])
+        evaluator.close()
+        
+        assert result.get_metric_score("sync") == 0.5
+        assert metric.thread_name.startswith("sprintlens-metric")
@@ -0,0 +1,101 @@
+"""
+Unit tests for judge micro-batching.
+"""
+
+import json
+import re
+import pytest
+
+from sprintlens.evaluation import RelevanceMetric
+from sprintlens.evaluation.judge_batching import (
+    JudgeMicroBatcher, build_batch_prompt, parse_batch_response, enable_micro_batching
+)
+from sprintlens.llm.providers import LLMProvider
+
+
+class PackingProvider(LLMProvider):
+    """Fake judge answering packed prompts, optionally dropping items once."""
+
+    def __init__(self, drop_once=()):
+        self.prompts = []
+        self.drop_once = set(drop_once)
+
+    async def generate_async(self, messages, model=None, temperature=0.7, max_tokens=None, **kwargs):
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        ids = [int(i) for i in re.findall(r"^### Item (\d+)$", prompt, re.MULTILINE)]
+        if not ids:
+            return "Score: 3/5"
+        answers = [{"id": i, "response": "Score: 4/5"} for i in ids if i not in self.drop_once]
+        self.drop_once.clear()
+        return "Here you go:\n" + json.dumps(answers)
+
+
+class TestBatchProtocol:
+    """Test packing and response validation."""
+
+    def test_prompt_lists_indexed_items(self):
+        """Every item appears under its id."""
+        prompt = build_batch_prompt(["rate A", "rate B"], [1, 2])
+        assert "### Item 1\nrate A" in prompt
+        assert "### Item 2\nrate B" in prompt
+        assert "exactly 2 objects" in prompt
+
+    def test_parse_validates_ids(self):
+        """Unknown, repeated and malformed entries are rejected."""
+        content = json.dumps({"results": [
+            {"id": 1, "response": "ok"},
+            {"id": "2", "response": {"score": 1}},
+            {"id": 3, "response": "a"},
+            {"id": 3, "response": "b"},
+            {"id": 9, "response": "unknown"},
+            {"id": 4},
+        ]})
+        answers = parse_batch_response(content, [1, 2, 3, 4])
+
+        assert answers == {1: "ok", 2: '{"score": 1}'}
+        assert parse_batch_response("no json here", [1]) == {}
+
+
+class TestMicroBatchedMetric:
+    """Test micro-batching through LLMBasedMetric."""
+
+    @pytest.mark.asyncio
+    async def test_items_share_calls(self):
+        """Ten concurrent items with max_items=4 take three judge calls."""
+        provider = PackingProvider()
+        metric = RelevanceMetric(llm_provider=provider)
+        batcher = enable_micro_batching([metric], max_items=4)
+
+        result = await metric.evaluate_async([f"p{i}" for i in range(10)], [f"g{i}" for i in range(10)])
+
+        assert len(provider.prompts) == 3
+        assert result.value == pytest.approx(0.8)
+        assert batcher.stats.items == 10
+        assert batcher.stats.items_per_call == pytest.approx(10 / 3)
+
+    @pytest.mark.asyncio
+    async def test_missing_items_are_reasked(self):
+        """Only items missing from the response are asked again."""
+        provider = PackingProvider(drop_once={2, 3})
+        metric = RelevanceMetric(llm_provider=provider, batcher=JudgeMicroBatcher(max_items=4))
+
+        result = await metric.evaluate_async(["a", "b", "c", "d"], ["w", "x", "y", "z"])
+
+        assert len(provider.prompts) == 2
+        assert "### Item 1" not in provider.prompts[1]
+        assert "### Item 2" in provider.prompts[1] and "### Item 3" in provider.prompts[1]
+        assert result.value == pytest.approx(0.8)
+        assert metric.batcher.stats.reasked_items == 2
+
+    @pytest.mark.asyncio
+    async def test_token_budget_limits_packing(self):
+        """Items that do not fit the token budget go to a separate call."""
+        provider = PackingProvider()
+        batcher = JudgeMicroBatcher(max_items=8, max_prompt_tokens=200)
+        metric = RelevanceMetric(llm_provider=provider, batcher=batcher)
+
+        await metric.evaluate_async(["x" * 400] * 4, ["g"] * 4)
+
+        assert len(provider.prompts) >= 2
+        assert batcher.stats.items == 4
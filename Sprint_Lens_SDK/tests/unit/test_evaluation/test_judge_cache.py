@@ -0,0 +1,175 @@
+"""
+Unit tests for the LLM judge response cache.
+"""
+
+import asyncio
+import threading
+import pytest
+
+from sprintlens.evaluation import RelevanceMetric
+from sprintlens.evaluation.judge_cache import JudgeCache, judge_cache_key
+from sprintlens.llm.providers import LLMProvider, OpenAICompatibleProvider
+
+
+class CountingProvider(LLMProvider):
+    """Fake judge returning a fixed score and counting calls."""
+
+    def __init__(self, reply="Score: 4"):
+        self.calls = 0
+        self.reply = reply
+
+    async def generate_async(self, messages, model=None, temperature=0.7, max_tokens=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.reply
+
+
+class TestJudgeCache:
+    """Test cache tiers, limits and statistics."""
+
+    def test_key_is_stable_and_sensitive(self):
+        """Keys ignore dict ordering but change with any input."""
+        base = dict(model="gpt-4", provider="openai", prompt="p", metric="relevance")
+        assert judge_cache_key(**base, params={"a": 1, "b": 2}) == judge_cache_key(**base, params={"b": 2, "a": 1})
+        assert judge_cache_key(**base) != judge_cache_key(**base, metric_version="2")
+        assert judge_cache_key(**base) != judge_cache_key(**{**base, "prompt": "q"})
+
+    def test_memory_lru(self):
+        """The memory tier evicts the least recently used entry."""
+        cache = JudgeCache(max_memory_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats.memory_hits == 2
+        assert cache.stats.misses == 1
+
+    def test_disk_tier_persists(self, tmp_path):
+        """Entries survive across cache instances through SQLite."""
+        path = tmp_path / "judge.db"
+        cache = JudgeCache(path)
+        cache.set("key", {"score": 0.8})
+        cache.close()
+
+        reopened = JudgeCache(path)
+        assert reopened.get("key") == {"score": 0.8}
+        assert reopened.stats.disk_hits == 1
+        assert reopened.get("key") == {"score": 0.8}
+        assert reopened.stats.memory_hits == 1
+        reopened.close()
+
+    def test_ttl_expiry(self, tmp_path, monkeypatch):
+        """Expired entries are misses in both tiers."""
+        import sprintlens.evaluation.judge_cache as judge_cache
+
+        now = [1000.0]
+        monkeypatch.setattr(judge_cache.time, "time", lambda: now[0])
+        cache = JudgeCache(tmp_path / "judge.db", ttl=60)
+        cache.set("key", "value")
+
+        now[0] += 61
+        assert cache.get("key") is None
+        assert cache.stats.expired >= 1
+        cache.close()
+
+    def test_disk_size_limits(self, tmp_path):
+        """Disk entries beyond the limits are evicted oldest first."""
+        cache = JudgeCache(tmp_path / "judge.db", max_memory_entries=1, max_disk_entries=3)
+        for i in range(5):
+            cache.set(f"k{i}", i)
+
+        assert cache.stats.evictions == 2
+        assert cache.get("k0") is None
+        assert cache.get("k4") == 4
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        """Identical in-flight requests are computed once."""
+        cache = JudgeCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+        assert results == ["answer"] * 5
+        assert len(calls) == 1
+
+    def test_threads_with_own_loops_share_one_call(self):
+        """Sync callers running asyncio.run() in worker threads share an in-flight computation."""
+        cache = JudgeCache()
+        calls = []
+        results = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.2)
+            return "answer"
+
+        def worker():
+            results.append(asyncio.run(cache.get_or_compute("k", compute)))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["answer"] * 4
+        assert len(calls) == 1
+
+
+class TestLLMMetricCaching:
+    """Test caching in LLM-based metrics."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_run_uses_cache(self, tmp_path):
+        """A second run over the same items makes no judge calls."""
+        provider = CountingProvider()
+        cache = JudgeCache(tmp_path / "judge.db")
+        metric = RelevanceMetric(llm_provider=provider, cache=cache)
+
+        first = await metric.evaluate_async(["a", "b"], ["x", "y"])
+        second = await metric.evaluate_async(["a", "b"], ["x", "y"])
+
+        assert provider.calls == 2
+        assert first.value == second.value == pytest.approx(0.8)
+        assert cache.stats.hits == 2
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_key_separates_provider_endpoints(self, monkeypatch):
+        """Providers of the same class with different servers or models do not share entries."""
+        async def generate_async(self, messages, model=None, **kwargs):
+            return f"Score: {4 if 'local' in self.base_url else 2}"
+
+        monkeypatch.setattr(OpenAICompatibleProvider, "generate_async", generate_async)
+        cache = JudgeCache()
+        scores = []
+        for base_url, model in [("https://api.openai.com/v1", "gpt-4o"), ("http://localhost:8000/v1", "gpt-4o"),
+                                ("http://localhost:8000/v1", "llama-3")]:
+            provider = OpenAICompatibleProvider(base_url=base_url, model=model)
+            result = await RelevanceMetric(llm_provider=provider, cache=cache).evaluate_async(["a"], ["x"])
+            scores.append(result.value)
+
+        assert scores == pytest.approx([0.4, 0.8, 0.8])
+        assert cache.stats.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_unparseable_responses_are_not_cached(self):
+        """Replies without a score are retried on the next run instead of replayed."""
+        provider = CountingProvider(reply="I cannot rate this.")
+        cache = JudgeCache()
+        metric = RelevanceMetric(llm_provider=provider, cache=cache)
+
+        await metric.evaluate_async(["a"], ["x"])
+        await metric.evaluate_async(["a"], ["x"])
+
+        assert provider.calls == 2
+        assert cache.stats.writes == 0
@@ -0,0 +1,105 @@
+"""
+Unit tests for multi-metric judge prompt fusion.
+"""
+
+import json
+import pytest
+
+from sprintlens.evaluation import (
+    Evaluator, EvaluationModel, UsefulnessMetric, ModerationMetric, EnhancedHallucinationMetric
+)
+from sprintlens.evaluation.judge_fusion import JudgeFusionClient, parse_fused_response
+from sprintlens.evaluation.models import AgentLensBaseModel, ModelResponse
+
+
+SINGLE_PROMPT_KEYWORDS = [
+    ("usefulness", "usefulness"), ("hallucinated", "hallucination"), ("quality", "moderation")
+]
+
+
+class ScriptedJudge(AgentLensBaseModel):
+    """Fake judge answering fused prompts with fixed per-metric scores."""
+
+    def __init__(self, scores, fused_reply=None):
+        super().__init__("fake-judge")
+        self.scores = scores
+        self.fused_reply = fused_reply
+        self.prompts = []
+
+    async def generate_string(self, input_text, **kwargs):
+        return (await self.generate_provider_response([{"role": "user", "content": input_text}])).content
+
+    async def generate_provider_response(self, messages, **kwargs):
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        if "Criteria:" in prompt:
+            content = self.fused_reply if self.fused_reply is not None else json.dumps({
+                name: {"score": score, "reasoning": f"{name} ok", "confidence": 0.9}
+                for name, score in self.scores.items() if f'"{name}"' in prompt
+            })
+        else:
+            # Single-metric prompts (see AdvancedMetricsClient._build_basic_prompt)
+            name = next(name for keyword, name in SINGLE_PROMPT_KEYWORDS if keyword in prompt)
+            content = json.dumps({"score": self.scores[name], "reasoning": "single"})
+        return ModelResponse(content=content, model=self.model_name, cost=0.02)
+
+
+def make_metrics(judge):
+    model = EvaluationModel(name="fake-judge", custom_model=judge)
+    return [UsefulnessMetric(model=model), ModerationMetric(model=model), EnhancedHallucinationMetric(model=model)]
+
+
+class TestJudgeFusion:
+    """Test fused judge calls through the Evaluator."""
+
+    def test_parse_fused_response(self):
+        """Valid entries are parsed; missing or non-numeric scores are dropped."""
+        content = 'Result: {"usefulness": {"score": 0.7, "reasoning": "r"}, "moderation": {"score": "high"}}'
+        parsed = parse_fused_response(content, ["usefulness", "moderation", "hallucination"])
+
+        assert parsed == {"usefulness": {"score": 0.7, "reasoning": "r", "confidence": 1.0}}
+        assert parse_fused_response("not json", ["usefulness"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_one_call_per_item(self):
+        """Three judge metrics over two items cost two judge calls."""
+        judge = ScriptedJudge({"usefulness": 0.8, "moderation": 0.1, "hallucination": 0.9})
+        metrics = make_metrics(judge)
+        evaluator = Evaluator(metrics, fuse_judges=True)
+
+        result = await evaluator.evaluate_async(["answer a", "answer b"], ["q a", "q b"])
+
+        assert len(judge.prompts) == 2
+        assert result.get_metric_score("usefulness") == pytest.approx(0.8)
+        assert result.get_metric_score("moderation") == pytest.approx(0.1)
+        assert result.get_metric_score("enhanced_hallucination") == pytest.approx(0.1)
+        assert result.get_metric_details("usefulness")["total_cost"] == pytest.approx(2 * 0.02 / 3)
+
+        client = metrics[0].metrics_client
+        assert isinstance(client, JudgeFusionClient)
+        assert client.stats.fused_calls == 2
+        assert client.stats.calls_saved == 4
+
+    @pytest.mark.asyncio
+    async def test_fallback_on_unparseable_response(self):
+        """Metrics are judged separately when the fused answer cannot be parsed."""
+        judge = ScriptedJudge({"usefulness": 0.8, "moderation": 0.1}, fused_reply="I cannot comply")
+        metrics = make_metrics(judge)[:2]
+        evaluator = Evaluator(metrics, fuse_judges=True)
+
+        result = await evaluator.evaluate_async(["answer"], ["question"])
+
+        assert len(judge.prompts) == 3
+        assert result.get_metric_score("usefulness") == pytest.approx(0.8)
+        assert result.get_metric_score("moderation") == pytest.approx(0.1)
+        assert metrics[0].metrics_client.stats.fallbacks == 2
+
+    @pytest.mark.asyncio
+    async def test_fusion_is_opt_in(self):
+        """Without fuse_judges every metric keeps its own judge calls."""
+        judge = ScriptedJudge({"usefulness": 0.8, "moderation": 0.1})
+        evaluator = Evaluator(make_metrics(judge)[:2])
+
+        await evaluator.evaluate_async(["answer"], ["question"])
+
+        assert len(judge.prompts) == 2
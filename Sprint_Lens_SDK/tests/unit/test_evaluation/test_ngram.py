@@ -0,0 +1,88 @@
+"""
+Unit tests for BLEU and ROUGE scoring.
+
+Expected values were produced with sacreBLEU 2.x (default 13a tokenizer) and
+rouge-score 0.1.2 on the same inputs.
+"""
+
+import pytest
+
+from sprintlens.evaluation import BleuMetric, RougeMetric
+from sprintlens.evaluation.metrics.ngram import (
+    BleuStats, bleu_tokenize, sentence_bleu, corpus_bleu, rouge_scores, lcs_table_length
+)
+
+HYPOTHESES = ["the cat sat on the mat .", "a quick brown dog jumps over a lazy fox"]
+REFERENCES = ["the cat was sitting on the mat .", "the quick brown fox jumps over the lazy dog"]
+
+
+class TestBleu:
+    """Test BLEU against reference values."""
+
+    def test_corpus_and_sentence_scores(self):
+        """Corpus BLEU pools statistics; sentence BLEU uses exp smoothing."""
+        assert corpus_bleu(HYPOTHESES, REFERENCES) == pytest.approx(0.259286812231, abs=1e-9)
+        assert sentence_bleu(HYPOTHESES[0], REFERENCES[0]) == pytest.approx(0.423836562828, abs=1e-9)
+        assert sentence_bleu(HYPOTHESES[1], REFERENCES[1]) == pytest.approx(0.155100809850, abs=1e-9)
+
+    def test_13a_tokenization(self):
+        """Tokens and scores follow sacreBLEU's default 13a tokenizer."""
+        assert bleu_tokenize("don't stop 3.5 mg, 1,000 &amp; 3-4.") == (
+            "don't", "stop", "3.5", "mg", ",", "1,000", "&", "3", "-", "4", "."
+        )
+        # sacrebleu.sentence_bleu("don't stop 3.5 mg", ["do not stop 3.5 mg"]).score == 46.3078
+        assert sentence_bleu("don't stop 3.5 mg", ["do not stop 3.5 mg"]) == pytest.approx(0.463077716, abs=1e-9)
+
+    def test_incremental_statistics_merge(self):
+        """Statistics accumulated in parts give the same corpus score."""
+        first, second = BleuStats(), BleuStats()
+        first.add(HYPOTHESES[0], REFERENCES[0])
+        second.add(HYPOTHESES[1], REFERENCES[1])
+        first.merge(second)
+
+        assert first.score() == pytest.approx(corpus_bleu(HYPOTHESES, REFERENCES))
+
+    def test_multiple_references_and_edge_cases(self):
+        """Counts clip against the best reference; empty output scores zero."""
+        assert sentence_bleu("the cat sat", ["a dog sat", "the cat sat"]) == pytest.approx(1.0)
+        assert corpus_bleu([""], ["the cat"]) == 0.0
+        with pytest.raises(ValueError):
+            corpus_bleu(["a"], [])
+
+    def test_metric(self):
+        """BleuMetric reports corpus BLEU with per-item detail."""
+        result = BleuMetric().evaluate(HYPOTHESES, REFERENCES)
+
+        assert result.value == pytest.approx(0.259286812231, abs=1e-9)
+        assert len(result.details["sentence_scores"]) == 2
+        assert result.details["corpus_stats"]["hyp_len"] == 16
+
+
+class TestRouge:
+    """Test ROUGE against reference values."""
+
+    def test_summary_level_scores(self):
+        """ROUGE-1/2/L/Lsum F-measures, including multi-sentence Lsum."""
+        scores = rouge_scores("the cat sat on the mat .\nit was happy .", "the cat was sitting on the mat .\nthe cat looked happy .")
+
+        assert scores["rouge1"]["fmeasure"] == pytest.approx(0.7)
+        assert scores["rouge2"]["fmeasure"] == pytest.approx(1 / 3)
+        assert scores["rougeL"]["fmeasure"] == pytest.approx(0.6)
+        assert scores["rougeLsum"]["fmeasure"] == pytest.approx(0.7)
+
+    def test_lcs(self):
+        assert lcs_table_length("ABCBDAB", "BDCABA") == 4
+        assert lcs_table_length([], ["a"]) == 0
+
+    @pytest.mark.parametrize("rouge_type,expected", [("rouge-1", 0.571429), ("rouge-2", 0.166667), ("rouge-l", 0.428571)])
+    def test_metric(self, rouge_type, expected):
+        """RougeMetric averages the selected type's F-measure."""
+        result = RougeMetric(rouge_type=rouge_type).evaluate(["a quick brown dog jumps"], [REFERENCES[1]])
+
+        assert result.value == pytest.approx(expected, abs=1e-6)
+        assert result.details["scores"] == [pytest.approx(expected, abs=1e-6)]
+        assert 0.0 < result.details["precision"] <= 1.0
+
+    def test_unknown_type(self):
+        with pytest.raises(ValueError):
+            RougeMetric(rouge_type="rouge-w")
@@ -0,0 +1,151 @@
+"""
+Unit tests for the process-pool execution backend.
+"""
+
+import os
+import threading
+import time
+import pytest
+
+from sprintlens.evaluation import (
+    Evaluator, BaseMetric, BatchEvaluator, ProcessPoolBackend, get_shard_trace_context
+)
+from sprintlens.evaluation.process_pool import metric_payload, load_metric
+
+
+class PidMetric(BaseMetric):
+    """Exact match that records the scoring process and trace context."""
+
+    def __init__(self, name="pid_match", **kwargs):
+        super().__init__(name=name, **kwargs)
+
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        if predictions[0] == "boom":
+            raise RuntimeError("scorer crashed")
+        return self._create_result(
+            value=float(predictions[0] == ground_truth[0]),
+            details={"pid": os.getpid(), "trace": get_shard_trace_context()}
+        )
+
+    def evaluate_batch(self, predictions, ground_truth, **kwargs):
+        if "sleep" in predictions:
+            time.sleep(5.0)
+        if "boom" in predictions:
+            raise RuntimeError("scorer crashed")
+        return super().evaluate_batch(predictions, ground_truth, **kwargs)
+
+
+class LockedMetric(PidMetric):
+    """Metric holding an unpicklable lock; shipped by import path."""
+
+    def __init__(self, name="locked", **kwargs):
+        super().__init__(name=name, **kwargs)
+        self._lock = threading.Lock()
+
+
+class AsyncMetric(BaseMetric):
+    """I/O-bound metric that must stay in the parent process."""
+
+    def __init__(self):
+        super().__init__(name="async_pid")
+
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        return self._create_result(value=1.0, details={"pid": os.getpid()})
+
+    async def evaluate_async(self, predictions, ground_truth, **kwargs):
+        return self.evaluate(predictions, ground_truth)
+
+
+@pytest.fixture(scope="module")
+def backend():
+    with ProcessPoolBackend(max_workers=2) as pool:
+        yield pool
+
+
+class TestProcessPoolBackend:
+    """Test sharded evaluation in worker processes."""
+
+    def test_metrics_run_in_workers(self, backend):
+        """Sync metrics are scored in workers; async metrics stay local."""
+        metrics = [PidMetric(), LockedMetric(), AsyncMetric()]
+        batch_evaluator = BatchEvaluator(Evaluator(metrics), batch_size=2, process_pool=backend)
+
+        result = batch_evaluator.evaluate_predictions(["a", "b", "c", "d", "e"], ["a", "x", "c", "x", "e"])
+
+        assert result.get_metric_scores("pid_match") == [1.0, 0.0, 1.0, 0.0, 1.0]
+        assert result.get_metric_scores("locked") == [1.0, 0.0, 1.0, 0.0, 1.0]
+        pooled = result.item_results()[0].metrics["pid_match"].details
+        assert pooled["pid"] != os.getpid()
+        assert pooled["trace"] == {"trace_id": None, "span_id": None}
+        assert result.item_results()[0].metrics["async_pid"].details["pid"] == os.getpid()
+
+        stats = backend.stats.metric_stats["pid_match"]
+        assert stats.count == 5
+        assert stats.mean == pytest.approx(0.6)
+        assert backend.stats.shards == 3
+
+    def test_worker_failures_are_isolated(self, backend):
+        """A metric raising in a worker yields error results for its batch only."""
+        batch_evaluator = BatchEvaluator(Evaluator([PidMetric()]), batch_size=2, process_pool=backend)
+
+        result = batch_evaluator.evaluate_predictions(["a", "boom", "c"], ["a", "b", "c"])
+
+        assert result.item_results()[0].metrics["pid_match"].error == "scorer crashed"
+        assert result.item_results()[2].metrics["pid_match"].value == 1.0
+
+    def test_warm_up_starts_all_workers(self, backend):
+        """warm_up() starts every worker process."""
+        assert backend.warm_up([PidMetric()]) == 2
+
+    @pytest.mark.asyncio
+    async def test_timed_out_batch_does_not_block_the_pool(self):
+        """A batch still running at its timeout is abandoned with its pool."""
+        metrics = [PidMetric()]
+        with ProcessPoolBackend(max_workers=1) as pool:
+            pool.warm_up(metrics)
+            start = time.monotonic()
+            timed_out = await pool.evaluate_batch_async(metrics, ["sleep"], ["sleep"], timeout=0.5)
+            fresh = await pool.evaluate_batch_async(metrics, ["a"], ["a"], timeout=30)
+
+            assert timed_out["pid_match"][0].details["timeout"] == 0.5
+            assert fresh["pid_match"][0].value == 1.0
+            # The fresh batch did not wait for the sleeping worker
+            assert time.monotonic() - start < 4.5
+
+    def test_close_cancels_queued_batches(self, monkeypatch):
+        """close() cancels queued work without shutdown(cancel_futures=...), which needs 3.9."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        shutdown = ProcessPoolExecutor.shutdown
+        monkeypatch.setattr(ProcessPoolExecutor, "shutdown", lambda self, wait=True: shutdown(self, wait=wait))
+        pool = ProcessPoolBackend(max_workers=1)
+        executor = pool._get_pool(pool.select_metrics([PidMetric()]))
+        futures = [pool._submit(executor, time.sleep, 0.5) for _ in range(4)]
+        pool.close()
+
+        assert futures[-1].cancelled()
+        assert pool._pool is None
+
+
+class TestMetricPayload:
+    """Test shipping metric definitions."""
+
+    def test_pickle_and_import_path(self):
+        """Picklable metrics are pickled; others are rebuilt by import path."""
+        assert metric_payload(PidMetric())[0] == "pickle"
+
+        payload = metric_payload(LockedMetric(threshold=0.5))
+        assert payload[0] == "import"
+        rebuilt = load_metric(payload)
+        assert isinstance(rebuilt, LockedMetric)
+        assert rebuilt.config == {"threshold": 0.5}
+
+    def test_unshippable_metric_stays_local(self):
+        """Metrics that can be neither pickled nor rebuilt are not pooled."""
+        def make_local_metric():
+            class LocalMetric(LockedMetric):
+                pass
+            return LocalMetric()
+
+        backend = ProcessPoolBackend(max_workers=1)
+        assert backend.select_metrics([make_local_metric(), AsyncMetric()]) == []
@@ -0,0 +1,174 @@
+"""
+Unit tests for the adaptive judge rate limiter.
+"""
+
+import asyncio
+import time
+import pytest
+
+from sprintlens.evaluation import RelevanceMetric
+from sprintlens.evaluation.models import AgentLensBaseModel, ModelResponse
+from sprintlens.evaluation.rate_limiter import (
+    JudgeRateLimiter, TokenBucket, Priority, priority_scope,
+    configure_rate_limits, get_rate_limiter
+)
+from sprintlens.llm.providers import LLMProvider
+
+
+class RateLimitError(Exception):
+    """429 raised by the fake provider."""
+    status_code = 429
+
+
+class FakeLimitedModel(AgentLensBaseModel):
+    """Fake judge that rejects calls beyond its concurrency capacity."""
+
+    def __init__(self, capacity: int, latency: float = 0.01, **kwargs):
+        super().__init__("fake-judge", **kwargs)
+        self.capacity = capacity
+        self.latency = latency
+        self.active = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def generate_string(self, input_text, **kwargs):
+        return (await self.generate_provider_response([{"role": "user", "content": input_text}])).content
+
+    async def generate_provider_response(self, messages, **kwargs):
+        return await self._run_limited(self._complete, messages, 10, **kwargs)
+
+    async def _complete(self, messages, **kwargs):
+        if self.active >= self.capacity:
+            self.rejected += 1
+            raise RateLimitError("too many requests")
+        self.active += 1
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        self.completed += 1
+        return ModelResponse(content="Score: 1", model=self.model_name, usage={"total_tokens": 20})
+
+
+class ConcurrencyProvider(LLMProvider):
+    """Fake judge provider recording the calls in flight."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def generate_async(self, messages, model=None, temperature=0.7, max_tokens=None, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.active -= 1
+        return "Score: 4/5"
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_limits():
+    """Restore the default shared limiters between tests."""
+    yield
+    configure_rate_limits()
+
+
+class TestRateLimiter:
+    """Test token buckets, AIMD and priorities."""
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_requests(self):
+        """Requests beyond the burst wait for refill."""
+        bucket = TokenBucket(per_minute=600, burst=2)  # 10 per second
+
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        assert time.monotonic() - start >= 0.25
+
+    @pytest.mark.asyncio
+    async def test_aimd_backs_off_on_429(self):
+        """Concurrency shrinks on throttling and every call still completes."""
+        limiter = JudgeRateLimiter(initial_concurrency=16, max_retries=8, backoff_base=0.01)
+        model = FakeLimitedModel(capacity=4, rate_limiter=limiter)
+
+        await asyncio.gather(*(model.generate_provider_response([{"role": "user", "content": "q"}]) for _ in range(40)))
+
+        assert model.completed == 40
+        assert limiter.stats.throttled == model.rejected > 0
+        assert limiter.controller.limit < 16
+
+    @pytest.mark.asyncio
+    async def test_aimd_grows_on_success(self):
+        """The limit increases additively while calls succeed."""
+        limiter = JudgeRateLimiter(initial_concurrency=2, max_concurrency=8)
+        for _ in range(10):
+            await limiter.run(lambda: asyncio.sleep(0))
+        assert 2 < limiter.controller.limit <= 8
+
+    @pytest.mark.asyncio
+    async def test_interactive_admitted_before_batch(self):
+        """Waiting interactive calls are admitted ahead of earlier batch calls."""
+        limiter = JudgeRateLimiter(initial_concurrency=1, max_concurrency=1)
+        order = []
+        release = asyncio.Event()
+
+        async def blocker():
+            await release.wait()
+
+        async def record(name):
+            order.append(name)
+
+        first = asyncio.ensure_future(limiter.run(blocker))
+        await asyncio.sleep(0)
+        with priority_scope(Priority.BATCH):
+            batch = [asyncio.ensure_future(limiter.run(lambda i=i: record(f"batch-{i}"))) for i in range(3)]
+        await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(limiter.run(lambda: record("interactive"), priority=Priority.INTERACTIVE))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(first, interactive, *batch)
+        assert order[0] == "interactive"
+
+    @pytest.mark.asyncio
+    async def test_non_overload_errors_are_not_retried(self):
+        """Ordinary errors propagate immediately."""
+        limiter = JudgeRateLimiter(max_retries=3)
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            await limiter.run(failing)
+        assert len(calls) == 1
+
+    def test_shared_limiter_per_model(self):
+        """Configured limits give one limiter per model with overrides."""
+        default = get_rate_limiter("gpt-4")
+        assert default.request_bucket is None and default.token_bucket is None
+
+        configure_rate_limits(requests_per_minute=100, per_model={"gpt-4": {"requests_per_minute": 10}})
+        limiter = get_rate_limiter("gpt-4")
+        assert limiter is get_rate_limiter("gpt-4")
+        assert limiter.request_bucket.capacity == 10
+        assert get_rate_limiter("other").request_bucket.capacity == 100
+
+        configure_rate_limits(enabled=False)
+        assert get_rate_limiter("gpt-4") is None
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_judge_calls_are_bounded(self):
+        """Without configuration a metric's judge calls are still limited by AIMD."""
+        provider = ConcurrencyProvider()
+        metric = RelevanceMetric(llm_provider=provider)
+
+        result = await metric.evaluate_async(["answer"] * 60, ["question"] * 60)
+
+        assert result.error is None
+        limiter = get_rate_limiter(metric.llm_config.model)
+        assert limiter.stats.requests == 60
+        assert provider.max_active <= 16
@@ -0,0 +1,161 @@
+"""
+Unit tests for incremental re-evaluation with the result store.
+"""
+
+import pytest
+
+from sprintlens.evaluation import Evaluator, BaseMetric, BatchEvaluator, ResultStore, metric_config_hash
+from sprintlens.evaluation.advanced_metrics import EnhancedHallucinationMetric, EvaluationModel
+from sprintlens.evaluation.dataset import EvaluationDataset
+from sprintlens.utils.dataset_versioning import VersionDiff
+
+
+class CountingMetric(BaseMetric):
+    """Exact-match metric recording which predictions it scored."""
+
+    def __init__(self, name="judge", fail_on=(), **kwargs):
+        super().__init__(name=name, **kwargs)
+        self.fail_on = set(fail_on)
+        self.scored = []
+
+    def evaluate(self, predictions, ground_truth, **kwargs):
+        prediction = predictions[0]
+        self.scored.append(prediction)
+        if prediction in self.fail_on:
+            raise RuntimeError("rate limited")
+        return self._create_result(value=float(prediction == ground_truth[0]))
+
+
+class JudgedMetric(CountingMetric):
+    """Counting metric whose judge model lives outside get_config()."""
+
+    def __init__(self, judge_model):
+        super().__init__()
+        self.judge_model = judge_model
+
+    def fingerprint_extra(self):
+        return {"judge": self.judge_model}
+
+
+def run(store, metrics, predictions, ground_truth, model_id=""):
+    batch_evaluator = BatchEvaluator(
+        Evaluator(metrics), batch_size=2, result_store=store, model_id=model_id
+    )
+    return batch_evaluator.evaluate_predictions(predictions, ground_truth)
+
+
+class TestIncrementalEvaluation:
+    """Test that only new or changed items are scored."""
+
+    def test_only_new_items_are_scored(self, tmp_path):
+        """A grown dataset only scores the added rows, with merged aggregates."""
+        store = ResultStore(tmp_path / "results.db")
+        run(store, [CountingMetric()], ["a", "b", "c"], ["a", "x", "c"])
+
+        metric = CountingMetric()
+        result = run(store, [metric], ["a", "b", "c", "d"], ["a", "x", "c", "d"])
+
+        assert metric.scored == ["d"]
+        assert result.get_metric_scores("judge") == [1.0, 0.0, 1.0, 1.0]
+        assert result.aggregated_metrics["judge"] == pytest.approx(0.75)
+        assert result.metadata["cached_scores"] == 3
+        assert result.item_results()[0].metrics["judge"].details == {"cached": True}
+
+    def test_changed_items_and_failures_are_rescored(self):
+        """Changed inputs miss the store; failed scores are never stored."""
+        store = ResultStore()
+        run(store, [CountingMetric(fail_on={"b"})], ["a", "b", "c"], ["a", "b", "c"])
+
+        metric = CountingMetric()
+        run(store, [metric], ["a", "b", "c"], ["a", "b", "changed"])
+        assert sorted(metric.scored) == ["b", "c"]
+
+    def test_config_version_and_model_invalidate(self):
+        """Scores are keyed by metric configuration, version and model id."""
+        store = ResultStore()
+        run(store, [CountingMetric(threshold=0.5)], ["a", "b"], ["a", "b"], model_id="m1")
+
+        changed_config = CountingMetric(threshold=0.9)
+        run(store, [changed_config], ["a", "b"], ["a", "b"], model_id="m1")
+        assert changed_config.scored == ["a", "b"]
+
+        other_model = CountingMetric(threshold=0.5)
+        run(store, [other_model], ["a", "b"], ["a", "b"], model_id="m2")
+        assert other_model.scored == ["a", "b"]
+
+        bumped = CountingMetric(threshold=0.5)
+        bumped.metric_version = "2"
+        run(store, [bumped], ["a", "b"], ["a", "b"], model_id="m1")
+        assert bumped.scored == ["a", "b"]
+
+        assert store.prune([bumped]) == 6
+        assert store.count("judge") == 2
+
+    def test_judge_model_invalidates(self):
+        """Scores stored with one judge model are not served for another."""
+        store = ResultStore()
+        run(store, [JudgedMetric("gpt-4o-mini")], ["a", "b"], ["a", "b"])
+
+        other_judge = JudgedMetric("gpt-4o")
+        run(store, [other_judge], ["a", "b"], ["a", "b"])
+        assert other_judge.scored == ["a", "b"]
+
+        same_judge = JudgedMetric("gpt-4o")
+        run(store, [same_judge], ["a", "b"], ["a", "b"])
+        assert same_judge.scored == []
+
+        def hallucination(name):
+            return metric_config_hash(EnhancedHallucinationMetric(model=EvaluationModel(name=name)))
+
+        assert hallucination("gpt-4o-mini") != hallucination("gpt-4o")
+
+    def test_metrics_are_tracked_separately(self):
+        """A newly added metric scores everything; existing metrics stay cached."""
+        store = ResultStore()
+        run(store, [CountingMetric("judge")], ["a", "b"], ["a", "b"])
+
+        judge, extra = CountingMetric("judge"), CountingMetric("extra")
+        result = run(store, [judge, extra], ["a", "b"], ["a", "b"])
+
+        assert judge.scored == []
+        assert extra.scored == ["a", "b"]
+        assert result.aggregated_metrics["extra"] == 1.0
+
+
+class TestResultStoreMaintenance:
+    """Test diffing and invalidation helpers."""
+
+    def test_diff_reports_missing_items(self):
+        """diff() predicts which items a run would score."""
+        store = ResultStore()
+        metric = CountingMetric()
+        run(store, [metric], ["a", "b"], ["a", "b"])
+
+        dataset = EvaluationDataset.from_lists("ds", ["a", "b", "c"], ["a", "b", "c"])
+        diff = store.diff(dataset.items, [metric])
+
+        assert diff.cached == {"judge": 2}
+        assert diff.items_to_score == [2]
+        assert diff.to_dict()["items_to_score"] == 1
+
+    def test_apply_version_diff_forgets_removed_records(self):
+        """Removed and replaced records are dropped from the store."""
+        store = ResultStore()
+        run(store, [CountingMetric()], ["a", "b", "c"], ["a", "b", "c"])
+
+        diff = VersionDiff(
+            from_version_id="v1",
+            to_version_id="v2",
+            added_records=[{"id": "4", "prediction": "d", "ground_truth": "d"}],
+            removed_records=[{"id": "1", "prediction": "a", "ground_truth": "a"}],
+            modified_records=[{
+                "old": {"id": "2", "prediction": "b", "ground_truth": "b"},
+                "new": {"id": "2", "prediction": "b2", "ground_truth": "b"}
+            }],
+            schema_changes={},
+            summary={}
+        )
+
+        assert store.apply_version_diff(diff) == 2
+        assert store.count() == 1
+        assert store.invalidate("judge") == 1
@@ -0,0 +1,163 @@
+"""
+Unit tests for sequential A/B evaluation.
+"""
+
+import random
+import pytest
+
+from sprintlens.evaluation import (
+    Evaluator, BatchEvaluator, EvaluationDataset, SequentialABEvaluator, SequentialTest, stratified_order
+)
+from sprintlens.evaluation.metrics import ExactMatchMetric
+
+
+def make_sequential(**kwargs):
+    batch_evaluator = BatchEvaluator(Evaluator([ExactMatchMetric()]), batch_size=20)
+    return SequentialABEvaluator(batch_evaluator, metric="exact_match", seed=7, **kwargs)
+
+
+def variant(ground_truths, wrong):
+    """Predictions matching the ground truth except at the given indices."""
+    return [f"wrong-{i}" if i in wrong else truth for i, truth in enumerate(ground_truths)]
+
+
+class TestSequentialTest:
+    """Test the always-valid mSPRT."""
+
+    def test_error_rate_holds_under_continuous_monitoring(self):
+        """Looking after every observation keeps false rejections below alpha."""
+        rng = random.Random(1)
+        rejections = 0
+        for _ in range(200):
+            test = SequentialTest(confidence_level=0.95, tuning_samples=50)
+            for i in range(300):
+                test.add(rng.gauss(0.0, 1.0))
+                if i >= 10 and test.look()[1] <= test.alpha:
+                    rejections += 1
+                    break
+        assert rejections / 200 <= 0.06
+
+    def test_interval_and_p_value(self):
+        """The interval covers the mean and the p-value never increases."""
+        rng = random.Random(2)
+        test = SequentialTest(tuning_samples=100)
+        p_values = []
+        for _ in range(400):
+            test.add(rng.gauss(0.3, 1.0))
+            interval, p_value = test.look()
+            p_values.append(p_value)
+
+        assert interval[0] < test.mean < interval[1]
+        assert interval[0] > 0
+        assert p_values == sorted(p_values, reverse=True)
+        assert p_values[-1] < 0.05
+
+
+class TestStratifiedOrder:
+    """Test the evaluation order."""
+
+    def test_prefixes_are_balanced(self):
+        """Every prefix holds each stratum in proportion to its size."""
+        dataset = EvaluationDataset("strata")
+        for i in range(300):
+            dataset.add_item(prediction=i, ground_truth=i, metadata={"kind": "long" if i % 3 else "short"})
+
+        order = stratified_order(dataset.items, "kind", seed=3)
+        assert sorted(order) == list(range(300))
+        assert order == stratified_order(dataset.items, "kind", seed=3)
+        for prefix in (30, 90, 150):
+            short = sum(1 for i in order[:prefix] if i % 3 == 0)
+            assert abs(short - prefix / 3) <= 1
+
+
+class TestSequentialABEvaluator:
+    """Test early stopping of A/B comparisons."""
+
+    def test_decisive_difference_stops_early(self):
+        """A clearly better variant is detected after a fraction of the items."""
+        ground_truths = [f"answer-{i}" for i in range(1000)]
+        predictions_a = variant(ground_truths, {i for i in range(1000) if i % 2})
+        predictions_b = variant(ground_truths, {i for i in range(1000) if i % 10 == 0})
+
+        result = make_sequential().compare_predictions(
+            predictions_a, predictions_b, ground_truths, strata=[i % 4 for i in range(1000)]
+        )
+
+        assert result.decision == "b_better"
+        assert result.winner == "B"
+        assert result.stop_reason == "significant"
+        assert result.items_evaluated < 300
+        assert result.effective_sample_size == result.items_evaluated
+        assert result.confidence_interval[0] > 0
+        assert result.mean_b > result.mean_a
+        assert len(result.scores_a["exact_match"]) == result.items_evaluated
+        assert result.looks[-1].items == result.items_evaluated
+
+    def test_equivalence_and_precision_stops(self):
+        """Equal variants stop once the interval is inside the margin or narrow enough."""
+        ground_truths = [f"answer-{i}" for i in range(2000)]
+        predictions_a = variant(ground_truths, {i for i in range(2000) if i % 10 == 0})
+        predictions_b = variant(ground_truths, {i for i in range(2000) if i % 10 == 5})
+
+        equivalent = make_sequential(equivalence_margin=0.1).compare_predictions(
+            predictions_a, predictions_b, ground_truths
+        )
+        assert equivalent.stop_reason == "equivalent"
+        assert equivalent.decision == "equivalent"
+        assert equivalent.items_evaluated < 2000
+
+        precise = make_sequential(precision=0.1).compare_predictions(predictions_a, predictions_b, ground_truths)
+        assert precise.stop_reason == "precision"
+        assert precise.decision == "inconclusive"
+        half_width = (precise.confidence_interval[1] - precise.confidence_interval[0]) / 2
+        assert half_width <= 0.1
+
+    def test_failed_scores_are_not_paired(self):
+        """Items without a score for both variants do not count as samples."""
+        ground_truths = ["x"] * 40
+        predictions_a = ["x"] * 40
+        predictions_b = [None] * 10 + ["x"] * 30
+
+        result = make_sequential(min_items=5).compare_predictions(predictions_a, predictions_b, ground_truths)
+
+        assert result.items_evaluated == 40
+        assert result.stop_reason == "exhausted"
+        assert result.decision == "inconclusive"
+
+    def test_failed_batch_does_not_abort(self):
+        """A batch that fails to score is counted as failed and left unpaired; batches are numbered, not offset."""
+        ground_truths = [f"answer-{i}" for i in range(60)]
+        sequential = make_sequential(min_items=5)
+        run_metrics = sequential.batch_evaluator._run_metrics
+        seen_batches = []
+
+        async def flaky_run_metrics(predictions, ground_truths, metric_names=None, batch_idx=None):
+            seen_batches.append(batch_idx)
+            if batch_idx == 1:
+                raise RuntimeError("judge backend down")
+            return await run_metrics(predictions, ground_truths, metric_names=metric_names, batch_idx=batch_idx)
+
+        sequential.batch_evaluator._run_metrics = flaky_run_metrics
+        result = sequential.compare_predictions(ground_truths, ground_truths, ground_truths)
+
+        assert result.items_evaluated == 60
+        assert result.failed_items == 20
+        assert result.effective_sample_size == 40
+        assert result.scores_a["exact_match"].count(None) == 20
+        assert result.to_dict()["failed_items"] == 20
+        assert sorted(seen_batches) == [0, 0, 1, 1, 2, 2]
+
+    def test_max_items_and_validation(self):
+        """max_items caps the run; misaligned datasets and unknown metrics are rejected."""
+        ground_truths = [f"answer-{i}" for i in range(200)]
+        predictions = variant(ground_truths, {i for i in range(200) if i % 2})
+
+        result = make_sequential(max_items=50).compare_predictions(predictions, predictions, ground_truths)
+        assert result.items_evaluated == 50
+        assert result.stop_reason == "max_items"
+        assert result.fraction_evaluated == pytest.approx(0.25)
+
+        with pytest.raises(ValueError):
+            make_sequential().compare_predictions(predictions, predictions[:10], ground_truths)
+        with pytest.raises(ValueError):
+            SequentialABEvaluator(BatchEvaluator(Evaluator([ExactMatchMetric()])), metric="missing")
@@ -0,0 +1,92 @@
+"""
+Unit tests for the statistical analysis engine.
+"""
+
+import math
+import random
+import pytest
+
+from sprintlens.evaluation import StatisticalAnalyzer
+from sprintlens.evaluation.statistical import t_two_sided_p_value, t_critical_value, chi2_sf
+
+
+class TestDistributions:
+    """Test exact distribution functions against tabulated values."""
+
+    def test_student_t(self):
+        assert t_critical_value(0.95, 9) == pytest.approx(2.262157, abs=1e-6)
+        assert t_critical_value(0.99, 30) == pytest.approx(2.749996, abs=1e-6)
+        assert t_two_sided_p_value(2.262157, 9) == pytest.approx(0.05, abs=1e-6)
+        assert t_two_sided_p_value(1.959964, 1e6) == pytest.approx(0.05, abs=1e-5)
+
+    def test_chi_square(self):
+        assert chi2_sf(3.841459, 1) == pytest.approx(0.05, abs=1e-6)
+        assert chi2_sf(18.307038, 10) == pytest.approx(0.05, abs=1e-6)
+
+
+class TestDescriptiveStats:
+    """Test one-pass moments."""
+
+    def test_matches_direct_formulas(self):
+        """Moments and quartiles agree with a direct computation."""
+        rng = random.Random(5)
+        values = [rng.expovariate(1.0) for _ in range(501)]
+        stats = StatisticalAnalyzer().compute_descriptive_stats(values + [None])
+
+        n = len(values)
+        mean = sum(values) / n
+        std = math.sqrt(sum((v - mean) ** 2 for v in values) / (n - 1))
+        ordered = sorted(values)
+        assert stats.count == n
+        assert stats.mean == pytest.approx(mean)
+        assert stats.std_dev == pytest.approx(std)
+        assert stats.median == pytest.approx(ordered[250])
+        assert stats.skewness == pytest.approx(sum(((v - mean) / std) ** 3 for v in values) / n)
+        assert stats.kurtosis == pytest.approx(sum(((v - mean) / std) ** 4 for v in values) / n - 3)
+
+
+class TestResamplingTests:
+    """Test bootstrap and permutation tests."""
+
+    def test_bootstrap_interval_is_reproducible(self):
+        """A seeded bootstrap interval brackets the mean and is close to the t interval."""
+        rng = random.Random(1)
+        values = [rng.gauss(0.6, 0.1) for _ in range(400)]
+        analyzer = StatisticalAnalyzer(seed=3)
+
+        low, high = analyzer.bootstrap_confidence_interval(values, n_resamples=400)
+        t_low, t_high = analyzer.confidence_interval_mean(values)
+
+        assert low < sum(values) / len(values) < high
+        assert low == pytest.approx(t_low, abs=0.005)
+        assert high == pytest.approx(t_high, abs=0.005)
+        assert (low, high) == analyzer.bootstrap_confidence_interval(values, n_resamples=400)
+
+    def test_permutation_tests(self):
+        """A consistent shift is significant; identical runs are not."""
+        rng = random.Random(2)
+        base = [rng.random() for _ in range(200)]
+        shifted = [v + 0.05 + rng.gauss(0, 0.01) for v in base]
+        analyzer = StatisticalAnalyzer(seed=0, n_resamples=300)
+
+        paired = analyzer.permutation_test(shifted, base, paired=True)
+        unpaired = analyzer.permutation_test(base, list(reversed(base)))
+
+        assert paired.significant and paired.p_value == pytest.approx(1 / 301)
+        assert not unpaired.significant
+
+    def test_compare_runs(self):
+        """Paired comparison covers every shared metric, with McNemar for binary scores."""
+        rng = random.Random(4)
+        correct1 = [1.0 if rng.random() < 0.7 else 0.0 for _ in range(300)]
+        correct2 = [1.0 if rng.random() < 0.1 else c for c in correct1]
+        run1 = {"accuracy": correct1, "relevance": [rng.random() for _ in range(300)]}
+        run2 = {"accuracy": correct2, "relevance": [None] + run1["relevance"][1:]}
+
+        analyses = StatisticalAnalyzer(seed=0, n_resamples=200).compare_runs(run1, run2)
+
+        accuracy_tests = [test.test_name for test in analyses["accuracy"].statistical_tests]
+        assert accuracy_tests == ["Paired t-test", "Paired permutation test", "McNemar's test"]
+        assert analyses["accuracy"].confidence_interval_diff[1] < 0
+        assert analyses["relevance"].stats1.count == 299
+        assert analyses["relevance"].confidence_interval_diff == (0.0, 0.0)
@@ -0,0 +1,98 @@
+"""
+Unit tests for streaming, constant-memory evaluation.
+"""
+
+import random
+import statistics
+import pytest
+
+from sprintlens.evaluation import Evaluator, BatchEvaluator, AccuracyMetric
+from sprintlens.evaluation.streaming import RunningStats, P2Quantile, Reservoir
+
+
+class TestOnlineStatistics:
+    """Test the online aggregates."""
+
+    def test_running_stats_match_exact(self):
+        """Welford mean/std match the statistics module, also after merging."""
+        rng = random.Random(1)
+        values = [rng.gauss(10, 3) for _ in range(2000)]
+
+        stats, first, second = RunningStats(), RunningStats(), RunningStats()
+        for i, value in enumerate(values):
+            stats.add(value)
+            (first if i % 2 else second).add(value)
+        first.merge(second)
+
+        for s in (stats, first):
+            assert s.count == 2000
+            assert s.mean == pytest.approx(statistics.mean(values))
+            assert s.std == pytest.approx(statistics.stdev(values))
+            assert (s.min, s.max) == (min(values), max(values))
+
+    def test_p2_quantile_estimate(self):
+        """P-square estimates are close to the exact quantiles."""
+        rng = random.Random(2)
+        values = [rng.random() for _ in range(20000)]
+        estimators = {q: P2Quantile(q) for q in (0.5, 0.9, 0.99)}
+        for value in values:
+            for estimator in estimators.values():
+                estimator.add(value)
+
+        ordered = sorted(values)
+        for q, estimator in estimators.items():
+            assert estimator.value == pytest.approx(ordered[int(q * len(values))], abs=0.01)
+
+    def test_p2_exact_for_small_counts(self):
+        """Fewer than five observations give the exact quantile."""
+        estimator = P2Quantile(0.5)
+        for value in (3.0, 1.0, 2.0):
+            estimator.add(value)
+        assert estimator.value == 2.0
+
+    def test_reservoir_is_bounded(self):
+        """The reservoir keeps at most its size, sampled from the whole stream."""
+        reservoir = Reservoir(100, seed=3)
+        for i in range(10000):
+            reservoir.add(i)
+
+        assert reservoir.seen == 10000
+        assert len(reservoir.samples) == 100
+        assert max(reservoir.samples) > 5000
+
+
+class TestStreamingEvaluation:
+    """Test BatchEvaluator.evaluate_stream_async."""
+
+    @pytest.mark.asyncio
+    async def test_sync_generator(self):
+        """Generators are consumed lazily and aggregated online."""
+        def items():
+            for i in range(1000):
+                yield ("a", "a" if i % 4 else "b")
+
+        batch_evaluator = BatchEvaluator(Evaluator([AccuracyMetric()]), batch_size=64, max_concurrent=3)
+        result = await batch_evaluator.evaluate_stream_async(items(), reservoir_size=50, seed=0)
+
+        assert result.total_items == 1000
+        assert result.successful_items == 1000
+        assert result.aggregated_metrics["accuracy"] == pytest.approx(0.75)
+        stats = result.get_metric_statistics("accuracy")
+        assert stats["count"] == 1000
+        assert stats["quantiles"]["p50"] == pytest.approx(1.0)
+        assert len(result.samples) == 50
+        assert result.samples == sorted(result.samples, key=lambda s: s["index"])
+
+    @pytest.mark.asyncio
+    async def test_async_iterator(self):
+        """Async iterators of dicts are supported."""
+        async def items():
+            for i in range(10):
+                yield {"id": f"item-{i}", "prediction": i, "ground_truth": i if i < 5 else -1}
+
+        batch_evaluator = BatchEvaluator(Evaluator([AccuracyMetric()]), batch_size=3)
+        result = await batch_evaluator.evaluate_stream_async(items())
+
+        assert result.total_items == 10
+        assert result.aggregated_metrics["accuracy"] == pytest.approx(0.5)
+        assert [s["item_id"] for s in result.samples] == [f"item-{i}" for i in range(10)]
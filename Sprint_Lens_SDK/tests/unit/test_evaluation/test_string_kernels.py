@@ -0,0 +1,126 @@
+"""
+Unit tests for the string similarity kernels.
+"""
+
+import difflib
+import random
+import pytest
+
+from sprintlens.evaluation import LevenshteinDistanceMetric, SimilarityMetric
+from sprintlens.evaluation.metrics import string_kernels
+from sprintlens.evaluation.metrics.string_kernels import (
+    levenshtein_distance, levenshtein_distance_batch, lcs_length, indel_similarity,
+    jaro_winkler_similarity, token_set_ratio
+)
+
+
+def brute_force_distance(a, b):
+    """Reference Levenshtein distance from the full dynamic program."""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def random_pairs(count, seed=3):
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        a = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 80)))
+        b = list(a)
+        for _ in range(rng.randint(0, 10)):
+            if b:
+                b[rng.randrange(len(b))] = rng.choice("abcdz")
+        b = "".join(b)
+        pairs.append((a, b if rng.random() < 0.5 else b[::-1]))
+    return pairs
+
+
+class TestLevenshtein:
+    """Test the bit-parallel and banded kernels."""
+
+    def test_matches_brute_force(self):
+        """Exact distances agree with the dynamic program, including long strings."""
+        pairs = random_pairs(300) + [("kitten", "sitting"), ("", "abc"), ("x" * 200, "y" + "x" * 150)]
+        for a, b in pairs:
+            assert levenshtein_distance(a, b) == brute_force_distance(a, b)
+
+    @pytest.mark.parametrize("max_distance", [0, 2, 5, 40])
+    def test_threshold_early_exit(self, max_distance):
+        """Distances above the threshold are reported as max_distance + 1."""
+        for a, b in random_pairs(200, seed=max_distance):
+            expected = brute_force_distance(a, b)
+            assert levenshtein_distance(a, b, max_distance) == min(expected, max_distance + 1)
+
+    def test_batch(self):
+        """The batch API matches per-pair calls and validates lengths."""
+        pairs = random_pairs(50)
+        predictions, references = [a for a, _ in pairs], [b for _, b in pairs]
+        assert levenshtein_distance_batch(predictions, references) == [
+            brute_force_distance(a, b) for a, b in pairs
+        ]
+        with pytest.raises(ValueError):
+            levenshtein_distance_batch(["a"], [])
+
+
+class TestSimilarityRatios:
+    """Test LCS, Jaro-Winkler and token-set ratios."""
+
+    def test_indel_bounds_sequence_matcher(self):
+        """The exact LCS ratio is never below difflib's greedy matching."""
+        for a, b in random_pairs(100):
+            assert indel_similarity(a, b) >= difflib.SequenceMatcher(None, a, b, autojunk=False).ratio() - 1e-12
+        assert lcs_length("ABCBDAB", "BDCABA") == 4
+
+    def test_known_values(self):
+        """Classic reference values."""
+        assert jaro_winkler_similarity("MARTHA", "MARHTA") == pytest.approx(0.9611, abs=1e-4)
+        assert jaro_winkler_similarity("DWAYNE", "DUANE") == pytest.approx(0.84, abs=1e-4)
+        assert token_set_ratio("fuzzy was a bear", "fuzzy fuzzy was a bear") == 1.0
+        # rapidfuzz scores texts without tokens as 0
+        assert token_set_ratio("", "") == 0.0
+
+    def test_rapidfuzz_conventions(self):
+        """Values rapidfuzz produces, which the fallbacks must reproduce."""
+        # The Winkler prefix boost only applies above a Jaro score of 0.7
+        assert jaro_winkler_similarity("ab", "ac") == pytest.approx(2 / 3)
+        assert jaro_winkler_similarity("abcdef", "abxyzq") == pytest.approx(5 / 9)
+        # No case folding
+        assert token_set_ratio("Hello World", "hello world") == pytest.approx(9 / 11)
+
+    def test_fallbacks_match_rapidfuzz(self, monkeypatch):
+        """The pure-Python kernels agree with rapidfuzz on random inputs."""
+        pytest.importorskip("rapidfuzz")
+        pairs = random_pairs(200) + [("Hello World", "hello world"), ("ab", "ac"), ("", "x y")]
+        expected = [(jaro_winkler_similarity(a, b), token_set_ratio(a, b), indel_similarity(a, b)) for a, b in pairs]
+
+        monkeypatch.setattr(string_kernels, "RAPIDFUZZ_AVAILABLE", False)
+        actual = [(jaro_winkler_similarity(a, b), token_set_ratio(a, b), indel_similarity(a, b)) for a, b in pairs]
+        for got, want in zip(actual, expected):
+            assert got == pytest.approx(want)
+
+
+class TestTextMetrics:
+    """Test metrics built on the kernels."""
+
+    def test_levenshtein_metric(self):
+        """Distances and normalized similarities keep their result shape."""
+        result = LevenshteinDistanceMetric().evaluate(["kitten", ""], ["sitting", ""])
+
+        assert result.details["distances"] == [3, 0]
+        assert result.details["similarities"] == pytest.approx([1 - 3 / 7, 1.0])
+
+    @pytest.mark.parametrize("method", ["indel", "jaro_winkler", "token_set", "sequence_matcher"])
+    def test_similarity_methods(self, method):
+        """Every method scores identical texts as 1.0."""
+        result = SimilarityMetric(method=method).evaluate(["the cat sat"], ["the cat sat"])
+
+        assert result.value == pytest.approx(1.0)
+        assert result.details["method"] == method
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            SimilarityMetric(method="cosine")
@@ -0,0 +1,188 @@
+"""
+Unit tests for OpenAI-compatible LLM providers.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from sprintlens.evaluation.rate_limiter import JudgeRateLimiter
+from sprintlens.llm import (
+    OpenAIProvider, AzureOpenAIProvider, LLMProviderError, close_shared_http_client
+)
+
+
+def completion(content, prompt_tokens=10, completion_tokens=5):
+    return {
+        "model": "stub-model",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible /chat/completions server."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if body.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for piece in ["Score", ": 4", "/5"]:
+                chunk = {"choices": [{"index": 0, "delta": {"content": piece}}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            usage = {"choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": 3, "total_tokens": 10}}
+            self.wfile.write(f"data: {json.dumps(usage)}\n\ndata: [DONE]\n\n".encode())
+            return
+        payload = json.dumps(completion(f"echo: {body['messages'][-1]['content']}")).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+class TestOpenAICompatibleProvider:
+    """Test requests, streaming, retries and usage accounting."""
+
+    @pytest.mark.asyncio
+    async def test_completion_against_stub_server(self, stub_server):
+        """A real HTTP round trip is parsed into an LLMResponse with usage."""
+        provider = OpenAIProvider(api_key="test", base_url=stub_server, model="stub-model")
+
+        response = await provider.complete_async([{"role": "user", "content": "hi"}], max_tokens=20)
+        text = await provider.generate_async([{"role": "user", "content": "again"}])
+
+        assert response.content == "echo: hi"
+        assert response.finish_reason == "stop"
+        assert response.usage["total_tokens"] == 15
+        assert text == "echo: again"
+        assert provider.usage == {"prompt_tokens": 20, "completion_tokens": 10, "total_tokens": 30}
+        assert provider.request_count == 2
+        await close_shared_http_client()
+
+    @pytest.mark.asyncio
+    async def test_streaming(self, stub_server):
+        """Streamed deltas are yielded in order and final usage is recorded."""
+        provider = OpenAIProvider(api_key="test", base_url=stub_server)
+
+        chunks = [chunk async for chunk in provider.stream_async([{"role": "user", "content": "rate"}])]
+
+        assert "".join(chunks) == "Score: 4/5"
+        assert provider.usage["total_tokens"] == 10
+        await close_shared_http_client()
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self):
+        """5xx responses are retried; Retry-After is honoured."""
+        statuses = [500, 502, 200]
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            status = statuses.pop(0)
+            if status != 200:
+                return httpx.Response(status, headers={"retry-after": "0"})
+            return httpx.Response(200, json=completion("ok"))
+
+        provider = OpenAIProvider(api_key="k", transport=httpx.MockTransport(handler), backoff_base=0.001)
+        assert await provider.generate_async([{"role": "user", "content": "x"}]) == "ok"
+        assert len(seen) == 3
+        assert seen[0].headers["authorization"] == "Bearer k"
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_throttling_is_left_to_the_rate_limiter(self):
+        """429/503 surface at once, so a limited call makes one attempt per limiter retry."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, headers={"retry-after": "0"})
+
+        provider = OpenAIProvider(api_key="k", transport=httpx.MockTransport(handler), backoff_base=0.001)
+        limiter = JudgeRateLimiter(max_retries=3, backoff_base=0.001)
+        with pytest.raises(LLMProviderError) as exc_info:
+            await limiter.run(lambda: provider.generate_async([{"role": "user", "content": "x"}]))
+
+        assert exc_info.value.status_code == 429
+        assert len(calls) == 4
+        assert limiter.stats.throttled == 4
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_retry_throttled_without_a_limiter(self):
+        """Standalone providers can opt back into retrying 429/503."""
+        statuses = [429, 503, 200]
+
+        def handler(request):
+            status = statuses.pop(0)
+            if status != 200:
+                return httpx.Response(status, headers={"retry-after": "0"})
+            return httpx.Response(200, json=completion("ok"))
+
+        provider = OpenAIProvider(
+            api_key="k", transport=httpx.MockTransport(handler), backoff_base=0.001, retry_throttled=True
+        )
+        assert await provider.generate_async([{"role": "user", "content": "x"}]) == "ok"
+        assert statuses == []
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        """A 400 fails immediately with the status code attached."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(400, json={"error": {"message": "bad request"}})
+
+        provider = OpenAIProvider(api_key="k", transport=httpx.MockTransport(handler))
+        with pytest.raises(LLMProviderError) as exc_info:
+            await provider.generate_async([{"role": "user", "content": "x"}])
+
+        assert exc_info.value.status_code == 400
+        assert len(calls) == 1
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_azure_request_shape(self):
+        """Azure requests target the deployment URL with an api-key header."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json=completion("ok"))
+
+        provider = AzureOpenAIProvider(
+            api_key="azure-key", endpoint="https://res.openai.azure.com",
+            transport=httpx.MockTransport(handler)
+        )
+        await provider.generate_async([{"role": "user", "content": "x"}], model="judge-deployment")
+
+        url = str(seen[0].url)
+        assert url.startswith("https://res.openai.azure.com/openai/deployments/judge-deployment/chat/completions")
+        assert "api-version=2024-02-15-preview" in url
+        assert seen[0].headers["api-key"] == "azure-key"
+        await provider.close()
@@ -0,0 +1,107 @@
+"""
+Unit tests for trace performance analysis.
+"""
+
+import pytest
+
+from sprintlens.tracing import (
+    analyze_trace,
+    top_slowest_operations,
+    folded_stacks,
+)
+
+
+def _ts(ms: float) -> str:
+    """ISO timestamp at an offset in milliseconds from a fixed origin."""
+    seconds, millis = divmod(int(ms), 1000)
+    return f"2024-01-01T00:00:{seconds:02d}.{millis:03d}000+00:00"
+
+
+def _span(span_id, name, start, end, parent_id=None, span_type="custom"):
+    return {
+        "id": span_id,
+        "name": name,
+        "parent_id": parent_id,
+        "span_type": span_type,
+        "start_time": _ts(start),
+        "end_time": _ts(end),
+    }
+
+
+@pytest.fixture
+def agent_trace():
+    """
+    agent [0, 1000]
+      plan      [0, 100]
+      search    [100, 600]   parallel with
+      llm       [100, 900]
+        tokenize [100, 200]
+    """
+    return {
+        "id": "trace-1",
+        "name": "agent run",
+        "start_time": _ts(0),
+        "spans": [
+            _span("a", "agent", 0, 1000),
+            _span("p", "plan", 0, 100, "a"),
+            _span("s", "search", 100, 600, "a", "retrieval"),
+            _span("l", "llm", 100, 900, "a", "llm"),
+            _span("t", "tokenize", 100, 200, "l"),
+        ],
+    }
+
+
+class TestAnalyzeTrace:
+    """Test single-trace analysis."""
+    
+    def test_self_and_child_time(self, agent_trace):
+        """Self time excludes the union of overlapping children."""
+        analysis = analyze_trace(agent_trace)
+        
+        agent = analysis.spans["a"]
+        assert agent.child_time_ms == pytest.approx(900)
+        assert agent.self_time_ms == pytest.approx(100)
+        assert analysis.spans["l"].self_time_ms == pytest.approx(700)
+        assert analysis.spans["t"].depth == 2
+    
+    def test_critical_path_follows_last_finishing_child(self, agent_trace):
+        """The parallel search span is off the critical path."""
+        analysis = analyze_trace(agent_trace)
+        
+        assert analysis.critical_path == ["a", "p", "l", "t"]
+        assert not analysis.spans["s"].on_critical_path
+    
+    def test_parallelism_factor(self, agent_trace):
+        """Parallel children push the factor above one."""
+        analysis = analyze_trace(agent_trace)
+        
+        assert analysis.wall_time_ms == pytest.approx(1000)
+        assert analysis.parallelism_factor == pytest.approx(1.5)
+    
+    def test_orphan_spans_become_roots(self):
+        """Spans whose parent is missing are treated as roots."""
+        trace = {"id": "t", "name": "x", "spans": [_span("c", "child", 0, 10, "missing")]}
+        analysis = analyze_trace(trace)
+        
+        assert analysis.roots == ["c"]
+        assert analysis.spans["c"].self_time_ms == pytest.approx(10)
+
+
+class TestBatchAnalysis:
+    """Test analysis across traces."""
+    
+    def test_top_slowest_operations(self, agent_trace):
+        """Operations are aggregated by name across traces."""
+        stats = top_slowest_operations([agent_trace, agent_trace], n=2)
+        
+        assert [s.name for s in stats] == ["llm", "search"]
+        assert stats[0].count == 2
+        assert stats[0].total_ms == pytest.approx(1400)
+        assert stats[0].critical_path_count == 2
+    
+    def test_folded_stacks(self, agent_trace):
+        """Folded stacks carry self time in microseconds."""
+        lines = folded_stacks([agent_trace])
+        
+        assert "agent_run;agent;llm 700000" in lines
+        assert "agent_run;agent;llm;tokenize 100000" in lines
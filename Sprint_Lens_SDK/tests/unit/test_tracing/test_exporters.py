@@ -0,0 +1,162 @@
+"""
+Unit tests for the local trace file exporter and replay tool.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from sprintlens.core.client import build_trace_payload
+from sprintlens.core.exceptions import SprintLensError
+from sprintlens.tracing import (
+    FileTraceExporter,
+    read_exported_traces,
+    TraceReplayer,
+    analyze_trace,
+)
+
+
+def _trace_dict(i: int):
+    return {
+        "id": f"trace-{i}",
+        "name": f"op-{i}",
+        "start_time": "2024-01-01T00:00:00+00:00",
+        "end_time": "2024-01-01T00:00:01+00:00",
+        "tags": {"agent_id": "agent-1"},
+        "metadata": {},
+        "metrics": {},
+        "spans": [{
+            "id": f"span-{i}",
+            "name": "step",
+            "parent_id": None,
+            "start_time": "2024-01-01T00:00:00+00:00",
+            "end_time": "2024-01-01T00:00:01+00:00",
+        }],
+    }
+
+
+class TestFileTraceExporter:
+    """Test writing and reading export files."""
+    
+    def test_round_trip_with_rotation(self, tmp_path):
+        """Traces survive rotation across several compressed files."""
+        with FileTraceExporter(tmp_path, batch_size=3, max_file_records=4) as exporter:
+            for i in range(10):
+                exporter.export_trace(_trace_dict(i), default_project_name="proj")
+        
+        files = sorted(tmp_path.iterdir())
+        assert len(files) == 3
+        assert all(f.name.endswith(".ndjson.gz") for f in files)
+        
+        payloads = list(read_exported_traces(tmp_path))
+        assert [p["operationName"] for p in payloads] == [f"op-{i}" for i in range(10)]
+        assert payloads[0] == build_trace_payload(_trace_dict(0), "proj")
+    
+    def test_part_files_are_not_read(self, tmp_path):
+        """Files still being written are invisible to readers."""
+        exporter = FileTraceExporter(tmp_path, batch_size=1, compress=False)
+        exporter.export_trace(_trace_dict(0))
+        
+        assert list(read_exported_traces(tmp_path)) == []
+        exporter.close()
+        assert len(list(read_exported_traces(tmp_path))) == 1
+    
+    def test_exported_payload_is_analyzable(self, tmp_path):
+        """Exported records can be fed straight into trace analysis."""
+        with FileTraceExporter(tmp_path) as exporter:
+            exporter.export_trace(_trace_dict(0))
+        
+        analysis = analyze_trace(next(read_exported_traces(tmp_path)))
+        assert analysis.trace_name == "op-0"
+        assert analysis.wall_time_ms == pytest.approx(1000)
+    
+    @pytest.mark.asyncio
+    async def test_close_waits_for_pending_async_writes(self, tmp_path):
+        """Batches still being written when close() runs land in order before finalizing."""
+        exporter = FileTraceExporter(tmp_path, batch_size=2)
+        pending = [asyncio.ensure_future(exporter.export_async(_trace_dict(i))) for i in range(10)]
+        await asyncio.sleep(0)
+        exporter.close()
+        await asyncio.gather(*pending)
+        
+        assert not list(tmp_path.glob("*.part"))
+        assert [p["id"] for p in read_exported_traces(tmp_path)] == [f"trace-{i}" for i in range(10)]
+        with pytest.raises(SprintLensError):
+            await exporter.export_async(_trace_dict(10))
+    
+    @pytest.mark.asyncio
+    async def test_client_uses_exporter(self, tmp_path):
+        """A client with an exporter writes traces instead of posting them."""
+        from sprintlens.core.client import SprintLensClient
+        
+        exporter = FileTraceExporter(tmp_path)
+        client = SprintLensClient(
+            url="http://localhost:3000", api_key="key", exporter=exporter
+        )
+        await client._add_trace_to_buffer(_trace_dict(0))
+        await client.close()
+        
+        assert [p["agentId"] for p in read_exported_traces(tmp_path)] == ["agent-1"]
+    
+    @pytest.mark.asyncio
+    async def test_client_close_does_not_block_the_loop(self, tmp_path):
+        """The exporter is closed off the event loop."""
+        from sprintlens.core.client import SprintLensClient
+        
+        exporter = MagicMock()
+        exporter.close.side_effect = lambda: time.sleep(0.2)
+        client = SprintLensClient(
+            url="http://localhost:3000", api_key="key", exporter=exporter
+        )
+        ticks = 0
+        
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+        
+        ticker = asyncio.ensure_future(tick())
+        await asyncio.sleep(0)
+        await client.close()
+        ticker.cancel()
+        
+        exporter.close.assert_called_once()
+        assert ticks > 5
+
+
+class TestTraceReplayer:
+    """Test replaying exported traces."""
+    
+    @pytest.mark.asyncio
+    async def test_replay_batches(self, tmp_path):
+        """Traces are posted to the batch endpoint in batches."""
+        with FileTraceExporter(tmp_path, max_file_records=3) as exporter:
+            for i in range(7):
+                exporter.export_trace(_trace_dict(i))
+        
+        client = MagicMock()
+        client.send_trace_batch = AsyncMock()
+        
+        stats = await TraceReplayer(client, batch_size=5).replay(tmp_path)
+        
+        assert stats.files == 3
+        assert stats.traces_sent == 7
+        assert stats.batches_sent == 2
+        sent = client.send_trace_batch.call_args_list
+        assert [len(call.args[0]) for call in sent] == [5, 2]
+    
+    @pytest.mark.asyncio
+    async def test_failed_batches_are_counted(self, tmp_path):
+        """Batches that keep failing are reported, not raised."""
+        with FileTraceExporter(tmp_path) as exporter:
+            exporter.export_trace(_trace_dict(0))
+        
+        client = MagicMock()
+        client.send_trace_batch = AsyncMock(side_effect=RuntimeError("down"))
+        
+        stats = await TraceReplayer(client, max_retries=0).replay(tmp_path)
+        
+        assert stats.traces_failed == 1
+        assert stats.errors == ["down"]
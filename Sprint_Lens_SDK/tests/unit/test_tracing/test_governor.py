@@ -0,0 +1,105 @@
+"""
+Unit tests for the tracing overhead governor.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from sprintlens.tracing import (
+    Trace,
+    DetailLevel,
+    OverheadGovernor,
+    configure_governor,
+)
+from sprintlens.tracing.context import TraceContext
+from sprintlens.tracing.decorator import TrackDecorator
+from sprintlens.tracing.governor import GOVERNOR_METADATA_KEY
+
+
+@pytest.fixture
+def mock_client():
+    """Client stub sufficient for building traces locally."""
+    client = MagicMock()
+    client.config.project_name = "test_project"
+    return client
+
+
+@pytest.fixture
+def governor():
+    """Global governor with a window that closes on every check."""
+    governor = configure_governor(budget=0.01, window_seconds=0.0)
+    yield governor
+    configure_governor(budget=None)
+
+
+class TestOverheadGovernor:
+    """Test level transitions."""
+    
+    def test_escalates_one_level_per_window(self):
+        """Each window over budget drops one more level of detail."""
+        governor = OverheadGovernor(budget=0.01, window_seconds=0.0)
+        
+        for expected in (DetailLevel.NO_INPUT, DetailLevel.NO_INPUT_OUTPUT,
+                         DetailLevel.ROOT_SPANS_ONLY, DetailLevel.ROOT_SPANS_ONLY):
+            governor.record(10.0)
+            assert governor.level == expected
+    
+    def test_restores_when_load_subsides(self):
+        """Detail comes back once overhead is well under budget."""
+        governor = OverheadGovernor(budget=0.01, window_seconds=0.0)
+        governor.record(10.0)
+        assert governor.level == DetailLevel.NO_INPUT
+        
+        assert governor.level == DetailLevel.FULL
+        assert [c["to"] for c in governor.history] == ["no_input", "full"]
+
+
+class TestGovernedDecorator:
+    """Test the decorator honouring the detail level."""
+    
+    def test_input_dropped_and_change_recorded(self, mock_client, governor):
+        """Input capture stops and the trace records why."""
+        track = TrackDecorator(mock_client)
+        
+        @track()
+        def work(x):
+            return x * 2
+        
+        trace = Trace(name="governed", client=mock_client)
+        governor.record(10.0)
+        with TraceContext(trace):
+            assert work(21) == 42
+        
+        span = trace._spans[0]
+        assert span._input is None
+        assert span._output is not None
+        info = trace.metadata[GOVERNOR_METADATA_KEY]
+        assert info["detail_level"] == "no_input"
+        assert info["changes"][0]["to"] == "no_input"
+    
+    def test_nested_spans_dropped(self, mock_client, governor):
+        """At the lowest level only top-level spans are recorded."""
+        track = TrackDecorator(mock_client)
+        
+        @track()
+        def inner():
+            return 1
+        
+        @track()
+        def outer():
+            # Keep the next window over budget too
+            governor.record(10.0)
+            return inner() + 1
+        
+        trace = Trace(name="governed", client=mock_client)
+        for _ in range(3):
+            governor.record(10.0)
+            level = governor.level
+        assert level == DetailLevel.ROOT_SPANS_ONLY
+        
+        governor.record(10.0)
+        with TraceContext(trace):
+            assert outer() == 2
+        
+        assert [s.name for s in trace._spans] == ["outer"]
+        assert trace.metadata[GOVERNOR_METADATA_KEY]["dropped_spans"] == 1
@@ -0,0 +1,130 @@
+"""
+Unit tests for per-span resource profiling.
+"""
+
+import asyncio
+import tracemalloc
+import pytest
+from unittest.mock import MagicMock
+
+from sprintlens.tracing import Trace, ProfilingConfig
+from sprintlens.tracing.profiling import SpanResourceProfiler
+
+
+@pytest.fixture
+def mock_client():
+    """Client stub sufficient for building traces locally."""
+    client = MagicMock()
+    client.config.project_name = "test_project"
+    return client
+
+
+class TestSpanResourceProfiler:
+    """Test the standalone profiler."""
+    
+    def test_sync_cpu_measurement(self):
+        """CPU time is reported for synchronous work."""
+        profiler = SpanResourceProfiler(ProfilingConfig())
+        profiler.start()
+        sum(i * i for i in range(20000))
+        resources = profiler.stop()
+        
+        assert resources["wall_time_ms"] > 0
+        assert resources["cpu_time_ms"] >= 0
+        assert "await_time_ms" not in resources
+    
+    def test_memory_sampling(self):
+        """Allocations are captured when the span is sampled."""
+        profiler = SpanResourceProfiler(ProfilingConfig(memory=True, memory_sample_rate=1.0))
+        profiler.start()
+        data = [bytearray(1024) for _ in range(100)]
+        resources = profiler.stop()
+        
+        assert resources["memory_sampled"] is True
+        assert resources["alloc_peak_bytes"] >= 100 * 1024
+        del data
+    
+    def test_host_tracemalloc_is_left_alone(self):
+        """A tracemalloc session started by the application keeps its peak and keeps running."""
+        tracemalloc.start()
+        try:
+            spike = bytearray(4 * 1024 * 1024)
+            del spike
+            host_peak = tracemalloc.get_traced_memory()[1]
+            
+            profiler = SpanResourceProfiler(ProfilingConfig(memory=True, memory_sample_rate=1.0))
+            profiler.start()
+            data = [bytearray(1024) for _ in range(100)]
+            resources = profiler.stop()
+            
+            assert tracemalloc.is_tracing()
+            assert tracemalloc.get_traced_memory()[1] >= host_peak
+            assert resources["alloc_bytes"] >= 100 * 1024
+            assert "alloc_peak_bytes" not in resources
+            del data
+        finally:
+            tracemalloc.stop()
+    
+    @pytest.mark.asyncio
+    async def test_async_await_time(self):
+        """Time spent suspended is reported as await time, not run time."""
+        profiler = SpanResourceProfiler(ProfilingConfig())
+        
+        async def work():
+            await asyncio.sleep(0.05)
+            return 42
+        
+        profiler.start()
+        result = await profiler.instrument(work())
+        resources = profiler.stop()
+        
+        assert result == 42
+        assert resources["task_steps"] >= 2
+        assert resources["await_time_ms"] >= 40
+        assert resources["run_time_ms"] < resources["await_time_ms"]
+    
+    @pytest.mark.asyncio
+    async def test_async_exception_propagates(self):
+        """Exceptions from the instrumented coroutine are re-raised."""
+        profiler = SpanResourceProfiler(ProfilingConfig())
+        
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+        
+        profiler.start()
+        with pytest.raises(ValueError):
+            await profiler.instrument(fail())
+        assert profiler.stop()["task_steps"] >= 1
+
+
+class TestTraceResourceAggregation:
+    """Test rolling span resources up to trace metrics."""
+    
+    def test_nested_profiled_spans_not_double_counted(self, mock_client):
+        """Only outermost profiled spans contribute to trace totals."""
+        trace = Trace(name="profiled", client=mock_client)
+        
+        parent = trace.span("parent", profile=True)
+        with parent:
+            child = trace.span("child", parent=parent, profile=True)
+            with child:
+                sum(range(10000))
+        trace.finish()
+        
+        assert "resources" in parent.metadata
+        assert "resources" in child.metadata
+        total = trace.metrics["total_cpu_time_ms"]
+        total = getattr(total, "value", total)
+        assert total == pytest.approx(parent.metadata["resources"]["cpu_time_ms"])
+    
+    def test_unprofiled_spans_have_no_resources(self, mock_client):
+        """Profiling is opt-in."""
+        trace = Trace(name="plain", client=mock_client)
+        span = trace.span("plain")
+        with span:
+            pass
+        trace.finish()
+        
+        assert "resources" not in span.metadata
+        assert "total_cpu_time_ms" not in trace.metrics
@@ -0,0 +1,97 @@
+"""
+Unit tests for wire codecs.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from sprintlens.core.exceptions import SprintLensConnectionError
+from sprintlens.utils.codecs import (
+    JSONCodec,
+    get_codec,
+    negotiate_codec,
+    available_codecs,
+    ORJSON_AVAILABLE,
+    MSGPACK_AVAILABLE,
+    JSON_CONTENT_TYPE,
+)
+
+
+PAYLOAD = {
+    "operationName": "agent",
+    "startTime": datetime(2024, 1, 1, tzinfo=timezone.utc),
+    "tags": {"env": "test"},
+    "spans": [{"id": "s1", "tokens": 12, "score": 0.5}],
+    "raw": b"\x00\x01",
+}
+
+
+class TestCodecs:
+    """Test codec encoding and lookup."""
+    
+    def test_json_round_trip_stringifies_extended_types(self):
+        """Datetimes and bytes are converted to strings by JSON codecs."""
+        decoded = JSONCodec().decode(JSONCodec().encode(PAYLOAD))
+        
+        assert decoded["startTime"] == "2024-01-01T00:00:00+00:00"
+        assert decoded["raw"] == "AAE="
+        assert decoded["spans"] == PAYLOAD["spans"]
+    
+    @pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_json_uses_orjson_fast_path(self):
+        """The default JSON codec is orjson when installed, with the same output."""
+        codec = get_codec("json")
+        
+        assert codec.name == "orjson"
+        assert codec.decode(codec.encode(PAYLOAD)) == JSONCodec().decode(JSONCodec().encode(PAYLOAD))
+    
+    @pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack not installed")
+    def test_msgpack_native_types(self):
+        """msgpack keeps timestamps and bytes as native types."""
+        codec = get_codec("application/x-msgpack")
+        decoded = codec.decode(codec.encode(PAYLOAD))
+        
+        assert decoded["startTime"] == PAYLOAD["startTime"]
+        assert decoded["raw"] == PAYLOAD["raw"]
+    
+    def test_unknown_codec(self):
+        """Unknown codec names are rejected."""
+        with pytest.raises(ValueError):
+            get_codec("xml")
+
+
+class TestNegotiation:
+    """Test content type negotiation."""
+    
+    def test_falls_back_to_json(self):
+        """JSON is chosen when the peer accepts nothing better."""
+        codec = negotiate_codec("application/json; charset=utf-8")
+        assert codec.content_type == JSON_CONTENT_TYPE
+    
+    def test_prefers_msgpack_when_available(self):
+        """msgpack wins when both sides support it."""
+        codec = negotiate_codec(["application/msgpack", "application/json"])
+        if "msgpack" in available_codecs():
+            assert codec.name == "msgpack"
+        else:
+            assert codec.content_type == JSON_CONTENT_TYPE
+    
+    @pytest.mark.asyncio
+    async def test_client_falls_back_on_415(self):
+        """A 415 from the backend switches the client to JSON for good."""
+        from sprintlens.core.client import SprintLensClient
+        
+        client = SprintLensClient(url="http://localhost:3000", api_key="key")
+        client._codec = MagicMock(content_type="application/msgpack")
+        client._http_client = MagicMock()
+        client._http_client.post = AsyncMock(side_effect=[
+            SprintLensConnectionError("HTTP 415", status_code=415),
+            {"ok": True},
+        ])
+        client._check_and_reinitialize_client = AsyncMock()
+        
+        await client._send_trace_to_backend({"name": "t"})
+        
+        assert client._codec.content_type == JSON_CONTENT_TYPE
+        assert client._http_client.post.call_count == 2